@@ -9,15 +9,41 @@ Example matches:
 - "Apple Inc" vs "Apple, Inc."
 - "Microsoft Corporation" vs "Microsoft Corp"
 - "Berkshire Hathaway" vs "Berkshire Hathaway Inc"
+
+Batch scoring (similarity_one_to_many / similarity_many_to_many) runs on a
+pluggable backend, chosen by FUZZY_MATCH_BACKEND (default "auto"):
+- rapidfuzz: native Levenshtein with score cutoffs (if installed)
+- numpy:     Levenshtein DP vectorized across all candidates at once
+- python:    the pure-Python similarity_ratio below
 """
 
 import logging
+import os
 import re
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Try to import rapidfuzz (optional native backend)
+try:
+    from rapidfuzz import process as rf_process
+    from rapidfuzz.distance import Levenshtein as rf_levenshtein
+
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+    rf_process = None
+    rf_levenshtein = None
+
+BACKENDS = ("rapidfuzz", "numpy", "python")
+FUZZY_MATCH_BACKEND = os.getenv("FUZZY_MATCH_BACKEND", "auto")
+
+# Below this many candidates the per-call NumPy setup costs more than it saves
+_NUMPY_MIN_CANDIDATES = 8
+
 
 @dataclass
 class MatchResult:
@@ -94,6 +120,300 @@ def similarity_ratio(s1: str, s2: str) -> float:
     return 1.0 - (distance / max_len)
 
 
+# =============================================================================
+# BATCH SIMILARITY BACKENDS
+# =============================================================================
+
+
+def get_backend(backend: Optional[str] = None) -> str:
+    """
+    Resolve the batch similarity backend.
+
+    Args:
+        backend: "auto", "rapidfuzz", "numpy" or "python"
+            (None = FUZZY_MATCH_BACKEND env var)
+
+    Returns:
+        Concrete backend name; "rapidfuzz" falls back to "numpy" when the
+        package is not installed
+    """
+    backend = (backend or FUZZY_MATCH_BACKEND).lower()
+    if backend == "auto":
+        return "rapidfuzz" if RAPIDFUZZ_AVAILABLE else "numpy"
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown fuzzy match backend: {backend}")
+    if backend == "rapidfuzz" and not RAPIDFUZZ_AVAILABLE:
+        return "numpy"
+    return backend
+
+
+def _codes(s: str) -> np.ndarray:
+    """Unicode code points of a string as an int64 array."""
+    return np.frombuffer(s.encode("utf-32-le"), dtype=np.uint32).astype(np.int64)
+
+
+def _numpy_one_to_many(
+    query: str, candidates: Sequence[str], threshold: float
+) -> np.ndarray:
+    """
+    Levenshtein similarity of query against every candidate, vectorized.
+
+    Runs the edit-distance DP one query character at a time across all
+    candidates. Within a row, cur[j] = min(tmp[j], cur[j-1] + 1) is a running
+    minimum of (tmp[k] - k) shifted back by j, so each row is a handful of
+    array operations. Distances never decrease down the DP, so a candidate
+    whose row minimum exceeds its allowed distance is dropped, and the loop
+    stops once no candidate can still reach the threshold.
+    """
+    n = len(candidates)
+    scores = np.zeros(n, dtype=np.float64)
+    if n == 0:
+        return scores
+
+    q_len = len(query)
+    lens = np.fromiter((len(c) for c in candidates), dtype=np.int64, count=n)
+    if q_len == 0:
+        scores[lens == 0] = 1.0
+        return scores
+
+    longest = np.maximum(lens, q_len)
+    max_dist = np.floor((1.0 - threshold) * longest + 1e-9).astype(np.int64)
+
+    # Length difference is a lower bound on the edit distance
+    live = np.flatnonzero((lens > 0) & (np.abs(lens - q_len) <= max_dist))
+    if live.size == 0:
+        return scores
+
+    width = int(lens[live].max())
+    codes = np.full((live.size, width), -1, dtype=np.int64)
+    for row, idx in enumerate(live):
+        codes[row, : lens[idx]] = _codes(candidates[idx])
+
+    offsets = np.arange(width + 1, dtype=np.int64)
+    prev = np.broadcast_to(offsets, (live.size, width + 1)).copy()
+    live_max = max_dist[live]
+
+    for i, q_code in enumerate(_codes(query), start=1):
+        tmp = np.minimum(prev[:, 1:] + 1, prev[:, :-1] + (codes != q_code))
+        cur = np.empty_like(prev)
+        cur[:, 0] = i
+        cur[:, 1:] = tmp
+        cur = np.minimum.accumulate(cur - offsets, axis=1) + offsets
+
+        # Early termination: drop candidates that can no longer qualify
+        alive = cur.min(axis=1) <= live_max
+        if not alive.all():
+            if not alive.any():
+                return scores
+            live, codes, cur, live_max = live[alive], codes[alive], cur[alive], live_max[alive]
+        prev = cur
+
+    dist = prev[np.arange(live.size), lens[live]]
+    ok = dist <= live_max
+    hits = live[ok]
+    scores[hits] = 1.0 - dist[ok] / longest[hits]
+    return scores
+
+
+def similarity_one_to_many(
+    query: str,
+    candidates: Sequence[str],
+    threshold: float = 0.0,
+    backend: Optional[str] = None,
+) -> np.ndarray:
+    """
+    Similarity ratio of one string against many candidates.
+
+    Scores equal similarity_ratio(query, candidate) for every candidate at
+    or above ``threshold``; candidates below it score 0.0 (backends stop
+    work on them as soon as the threshold is out of reach).
+
+    Args:
+        query: String to score
+        candidates: Candidate strings
+        threshold: Minimum similarity of interest (0.0 = exact scores for all)
+        backend: Override FUZZY_MATCH_BACKEND
+
+    Returns:
+        float64 array of similarities, aligned with candidates
+    """
+    backend = get_backend(backend)
+    if backend == "numpy" and len(candidates) < _NUMPY_MIN_CANDIDATES:
+        backend = "python"
+
+    if backend == "rapidfuzz":
+        return rf_process.cdist(
+            [query],
+            candidates,
+            scorer=rf_levenshtein.normalized_similarity,
+            score_cutoff=threshold,
+            dtype=np.float64,
+        )[0]
+
+    if backend == "numpy":
+        return _numpy_one_to_many(query, candidates, threshold)
+
+    scores = np.fromiter(
+        (similarity_ratio(query, c) for c in candidates),
+        dtype=np.float64,
+        count=len(candidates),
+    )
+    scores[scores < threshold] = 0.0
+    return scores
+
+
+def similarity_many_to_many(
+    queries: Sequence[str],
+    candidates: Sequence[str],
+    threshold: float = 0.0,
+    backend: Optional[str] = None,
+) -> np.ndarray:
+    """
+    Similarity matrix of queries x candidates.
+
+    Same score semantics as similarity_one_to_many. The rapidfuzz backend
+    computes the matrix natively across all cores.
+
+    Returns:
+        float64 array of shape (len(queries), len(candidates))
+    """
+    backend = get_backend(backend)
+    if backend == "rapidfuzz":
+        return rf_process.cdist(
+            queries,
+            candidates,
+            scorer=rf_levenshtein.normalized_similarity,
+            score_cutoff=threshold,
+            dtype=np.float64,
+            workers=-1,
+        )
+
+    matrix = np.zeros((len(queries), len(candidates)), dtype=np.float64)
+    for row, query in enumerate(queries):
+        matrix[row] = similarity_one_to_many(query, candidates, threshold, backend)
+    return matrix
+
+
+# =============================================================================
+# GROUP KEY INDEX (deduplicate_batch)
+# =============================================================================
+
+
+def _qgrams(s: str, q: int) -> List[str]:
+    """Positional q-grams as a set-like list (repeats numbered: "ab", "ab#1")."""
+    seen: Dict[str, int] = {}
+    grams = []
+    for i in range(len(s) - q + 1):
+        gram = s[i : i + q]
+        n = seen.get(gram, 0)
+        seen[gram] = n + 1
+        grams.append(gram if n == 0 else f"{gram}#{n}")
+    return grams
+
+
+class _GroupKeyIndex:
+    """
+    Candidate lookup of group keys within a similarity threshold.
+
+    Two filters, both lossless for similarity_ratio >= threshold:
+
+    - Length band: the length difference is a lower bound on the edit
+      distance, so a key of length lb can only match names of length la
+      when |la - lb| <= (1 - threshold) * max(la, lb).
+    - q-gram prefix filter: within edit distance k, strings share at least
+      max(la, lb) - q + 1 - k*q positional q-grams. With grams ordered
+      rarest-first, two strings sharing tau grams must share one of their
+      first (grams - tau + 1). Only those prefix grams are indexed/probed.
+
+    Strings too short for the count bound (tau <= 0) are compared against
+    every key in their length band.
+    """
+
+    Q = 2
+
+    def __init__(self, names: Sequence[str], threshold: float):
+        self.threshold = threshold
+        self.keys: List[str] = []
+        self._postings: Dict[str, List[int]] = {}
+        self._by_length: Dict[int, List[int]] = {}
+        self._unfiltered_by_length: Dict[int, List[int]] = {}
+        self._tau_cache: Dict[int, int] = {}
+
+        # Global gram order: rarest first, ties by gram text (deterministic)
+        freq: Dict[str, int] = {}
+        for name in names:
+            for gram in _qgrams(name, self.Q):
+                freq[gram] = freq.get(gram, 0) + 1
+        self._rank = {
+            gram: r for r, gram in enumerate(sorted(freq, key=lambda g: (freq[g], g)))
+        }
+
+    def _band(self, length: int) -> range:
+        if self.threshold <= 0:
+            return range(0, max(self._by_length, default=0) + 1)
+        low = int(np.ceil(length * self.threshold - 1e-9))
+        high = int(length / self.threshold + 1e-9)
+        return range(low, high + 1)
+
+    def _min_common(self, length: int) -> int:
+        """Smallest shared-gram bound over every partner length in the band."""
+        if length not in self._tau_cache:
+            if self.threshold <= 0:
+                tau = 0
+            else:
+                tau = min(
+                    m - self.Q + 1 - int((1.0 - self.threshold) * m + 1e-9) * self.Q
+                    for m in range(length, int(length / self.threshold + 1e-9) + 1)
+                )
+            self._tau_cache[length] = tau
+        return self._tau_cache[length]
+
+    def _prefix(self, name: str) -> Optional[List[str]]:
+        tau = self._min_common(len(name))
+        grams = _qgrams(name, self.Q)
+        if tau <= 0 or not grams:
+            return None
+        grams.sort(key=lambda g: self._rank.get(g, -1))
+        return grams[: len(grams) - tau + 1]
+
+    def add(self, name: str) -> None:
+        """Register a new group key."""
+        idx = len(self.keys)
+        self.keys.append(name)
+        self._by_length.setdefault(len(name), []).append(idx)
+        prefix = self._prefix(name)
+        if prefix is None:
+            self._unfiltered_by_length.setdefault(len(name), []).append(idx)
+        else:
+            for gram in prefix:
+                self._postings.setdefault(gram, []).append(idx)
+
+    def find(self, name: str) -> Optional[str]:
+        """Earliest-added key with similarity_ratio >= threshold, if any."""
+        band = self._band(len(name))
+        prefix = self._prefix(name)
+        candidates = set()
+        if prefix is None:
+            for length in band:
+                candidates.update(self._by_length.get(length, ()))
+        else:
+            for gram in prefix:
+                candidates.update(self._postings.get(gram, ()))
+            for length in band:
+                candidates.update(self._unfiltered_by_length.get(length, ()))
+
+        ordered = sorted(i for i in candidates if len(self.keys[i]) in band)
+        if not ordered:
+            return None
+        scores = similarity_one_to_many(
+            name, [self.keys[i] for i in ordered], self.threshold
+        )
+        for i, score in zip(ordered, scores):
+            if score >= self.threshold:
+                return self.keys[i]
+        return None
+
+
 class CompanyNameMatcher:
     """
     Fuzzy matcher specialized for company names.
@@ -272,18 +592,20 @@ class CompanyNameMatcher:
             List of (candidate_name, similarity_score) tuples, sorted by similarity
         """
         norm_name = self.normalize(name)
-        matches = []
-
-        for candidate in candidates:
-            norm_candidate = self.normalize(candidate)
+        norm_candidates = [self.normalize(candidate) for candidate in candidates]
+        scores = similarity_one_to_many(
+            norm_name, norm_candidates, self.similarity_threshold
+        )
 
+        matches = []
+        for candidate, norm_candidate, similarity in zip(
+            candidates, norm_candidates, scores
+        ):
             if not norm_candidate:
                 continue
 
-            similarity = similarity_ratio(norm_name, norm_candidate)
-
             if similarity >= self.similarity_threshold:
-                matches.append((candidate, similarity))
+                matches.append((candidate, float(similarity)))
 
         # Sort by similarity (descending)
         matches.sort(key=lambda x: x[1], reverse=True)
@@ -302,6 +624,15 @@ class CompanyNameMatcher:
         """
         Deduplicate a batch of records using fuzzy matching.
 
+        Identical normalized names are grouped by hash. Distinct names are
+        then clustered in sorted order: each joins the earliest group whose
+        key name is within similarity_threshold, else starts a new group.
+        Candidate groups come from a length-banded, q-gram prefix-filtered
+        index (see _GroupKeyIndex), which never drops a group that could
+        pass the threshold, so the result matches comparing against every
+        group key while running in near-linear time. Grouping does not
+        depend on input order.
+
         Args:
             records: List of records with company names
             name_field: Field containing the company name
@@ -310,43 +641,38 @@ class CompanyNameMatcher:
                        If None, keeps the first record
 
         Returns:
-            Deduplicated list of records
+            Deduplicated list of records, in order of each group's first
+            record in the input
         """
         if not records:
             return []
 
-        # Group records by normalized name
-        groups: Dict[str, List[Dict[str, Any]]] = {}
-        group_keys: List[str] = []  # Track order
-
+        # Exact normalized-name hash (records keep input order)
+        by_name: Dict[str, List[Dict[str, Any]]] = {}
         for record in records:
             name = record.get(name_field, "")
             if not name:
                 continue
+            by_name.setdefault(self.normalize(name), []).append(record)
 
-            norm_name = self.normalize(name)
-
-            # Check if this matches any existing group
-            matched_group = None
-            for existing_key in group_keys:
-                if (
-                    similarity_ratio(norm_name, existing_key)
-                    >= self.similarity_threshold
-                ):
-                    matched_group = existing_key
-                    break
-
-            if matched_group:
-                groups[matched_group].append(record)
-            else:
-                groups[norm_name] = [record]
-                group_keys.append(norm_name)
+        # Fuzzy clustering of distinct names against group keys
+        index = _GroupKeyIndex(list(by_name), self.similarity_threshold)
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        for norm_name in sorted(by_name):
+            key = index.find(norm_name)
+            if key is None:
+                index.add(norm_name)
+                key = norm_name
+            groups.setdefault(key, []).extend(by_name[norm_name])
+
+        # Restore input order within and across groups
+        position = {id(record): i for i, record in enumerate(records)}
+        for group_records in groups.values():
+            group_records.sort(key=lambda r: position[id(r)])
 
         # Merge records in each group
         result = []
-        for key in group_keys:
-            group_records = groups[key]
-
+        for group_records in sorted(groups.values(), key=lambda g: position[id(g[0])]):
             if len(group_records) == 1:
                 result.append(group_records[0])
             else:
@@ -0,0 +1,416 @@
+"""
+Router registry for app.main.
+
+Every API router is listed here by module path instead of being imported by
+app.main, so the service can:
+- mount only the routers of a deployment profile (ROUTER_PROFILE):
+  "full" (default), "ingest" (core + data source / collection routers) or
+  "api" (core + analytics and intelligence routers)
+- defer importing routers until the first request under their path
+  (ROUTER_LOADING=lazy). A pod then starts in well under a second and pays
+  each router's import cost once, on first use.
+
+Each spec names the first path segments (under /api/v1) its routes use.
+Routers sharing a segment are mounted together, in registry order, so route
+precedence is the same as with eager loading. Requests for the OpenAPI
+schema or docs mount everything first.
+"""
+
+import importlib
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from fastapi import FastAPI
+
+logger = logging.getLogger(__name__)
+
+API_PREFIX = "/api/v1"
+
+# Router areas, combined into deployment profiles
+CORE = "core"      # auth, jobs, schedules, data quality, settings
+INGEST = "ingest"  # data source and collection routers
+API = "api"        # analytics, scoring and intelligence routers
+
+PROFILES: Dict[str, Set[str]] = {
+    "full": {CORE, INGEST, API},
+    "ingest": {CORE, INGEST},
+    "api": {CORE, API},
+}
+
+LOADING_EAGER = "eager"
+LOADING_LAZY = "lazy"
+
+
+@dataclass(frozen=True)
+class RouterSpec:
+    """One ``include_router`` call: where the router lives and where it mounts."""
+
+    module: str
+    segments: Tuple[str, ...]  # first path segments under ``prefix``
+    area: str
+    public: bool = False
+    tags: Tuple[str, ...] = ()
+    package: str = "app.api.v1"
+    attr: str = "router"
+    prefix: str = API_PREFIX
+
+    @property
+    def import_path(self) -> str:
+        return f"{self.package}.{self.module}"
+
+    @property
+    def paths(self) -> Tuple[str, ...]:
+        """Path prefixes served; the mount prefix itself when no segments are given."""
+        if not self.segments:
+            return (self.prefix,)
+        return tuple(f"{self.prefix}/{segment}" for segment in self.segments)
+
+
+# Registration order matters: it is the route matching order.
+ROUTERS: List[RouterSpec] = [
+    # Public routers (no auth required)
+    RouterSpec("auth", ("auth",), CORE, public=True),  # login/register must be public
+    RouterSpec("public", ("public",), CORE, public=True),  # has its own API key auth
+    RouterSpec("job_stream", ("job-queue",), CORE, public=True),  # SSE streaming
+    RouterSpec("jobs_monitor", ("jobs",), CORE),  # Jobs dashboard
+
+    # Protected routers
+    RouterSpec("sources", ("sources",), CORE),
+    RouterSpec("jobs", ("jobs",), CORE),
+    RouterSpec("census_geo", ("census",), INGEST),
+    RouterSpec("census_batch", ("census",), INGEST),
+    RouterSpec("metadata", ("census",), INGEST),
+    RouterSpec("geojson", ("geojson",), INGEST),
+    RouterSpec("fred", ("fred",), INGEST),
+    RouterSpec("eia", ("eia",), INGEST),
+    RouterSpec("sec", ("sec",), INGEST),
+    RouterSpec("realestate", ("realestate",), INGEST),
+    RouterSpec("family_offices", ("family-offices",), INGEST),
+    RouterSpec("family_office_contacts", ("family-offices",), INGEST, tags=("family_office_contacts",)),
+    RouterSpec("cms", ("cms",), INGEST),
+    RouterSpec("nppes", ("nppes",), INGEST),
+    RouterSpec("kaggle", ("kaggle",), INGEST),
+    RouterSpec("international_econ", ("international",), INGEST),
+    RouterSpec("fbi_crime", ("fbi-crime",), INGEST),
+    RouterSpec("bts", ("bts",), INGEST),
+    RouterSpec("bea", ("bea",), INGEST),
+    RouterSpec("fema", ("fema",), INGEST),
+    RouterSpec("data_commons", ("data-commons",), INGEST),
+    RouterSpec("yelp", ("yelp",), INGEST),
+    RouterSpec("us_trade", ("us-trade",), INGEST),
+    RouterSpec("cftc_cot", ("cftc-cot",), INGEST),
+    RouterSpec("usda", ("usda",), INGEST),
+    RouterSpec("bls", ("bls",), INGEST),
+    RouterSpec("afdc", ("afdc",), INGEST),
+    RouterSpec("investor_intelligence", ("investor",), API),
+    RouterSpec("econ_snapshot", ("econ-snapshot",), API),
+    RouterSpec("econ_dq", ("econ-dq",), API),
+    RouterSpec("pe_macro", ("pe",), API),
+    RouterSpec("metro_profiles", ("metro-profiles",), API),
+    RouterSpec("fcc_broadband", ("fcc-broadband",), INGEST),
+    RouterSpec("treasury", ("treasury",), INGEST),
+    RouterSpec("usaspending", ("usaspending",), INGEST),
+    RouterSpec("fdic", ("fdic",), INGEST),
+    RouterSpec("fda", ("fda",), INGEST),
+    RouterSpec("irs_soi", ("irs-soi",), INGEST),
+    RouterSpec("epa_echo", ("epa-echo",), INGEST),
+    RouterSpec("epa_ghg", ("epa-ghg",), INGEST),
+    RouterSpec("cms_hospitals", ("cms-hospitals",), INGEST),
+    RouterSpec("dot_grants", ("dot-grants",), INGEST),
+    RouterSpec("census_bfs", ("census-bfs",), INGEST),
+    RouterSpec("census_cbp", ("census-cbp",), INGEST),
+    RouterSpec("foot_traffic", ("foot-traffic",), INGEST),
+    RouterSpec("dunl", ("dunl",), INGEST),
+    RouterSpec("prediction_markets", ("prediction-markets",), INGEST),
+    RouterSpec("schedules", ("schedules",), CORE),
+    RouterSpec("webhooks", ("webhooks",), CORE),
+    RouterSpec("chains", ("chains",), CORE),
+    RouterSpec("rate_limits", ("rate-limits",), CORE),
+    RouterSpec("data_quality", ("data-quality",), CORE),
+    RouterSpec("dq_review", ("dq-review",), CORE),
+    RouterSpec("templates", ("templates",), CORE),
+    RouterSpec("lineage", ("lineage",), CORE),
+    RouterSpec("export", ("export",), CORE),
+    RouterSpec("uspto", ("uspto",), INGEST),
+    RouterSpec("agentic_research", ("agentic",), INGEST),
+    RouterSpec("alerts", ("alerts",), API),
+    RouterSpec("search", ("search",), API),
+    RouterSpec("discover", ("discover",), API),
+    RouterSpec("watchlists", ("searches", "watchlists"), API),
+    RouterSpec("analytics", ("analytics",), API),
+    RouterSpec("compare", ("compare",), API),
+    RouterSpec("api_keys", ("api-keys",), CORE),
+    RouterSpec("network", ("network",), API),
+    RouterSpec("trends", ("trends",), API),
+    RouterSpec("enrichment", ("enrichment",), INGEST),
+    RouterSpec("import_portfolio", ("import",), INGEST),
+    RouterSpec("news", ("news",), API),
+    RouterSpec("reports", ("reports",), API),
+    RouterSpec("deals", ("deals",), API),
+    RouterSpec("benchmarks", ("benchmarks",), API),
+    RouterSpec("workspaces", ("workspaces",), CORE),
+    RouterSpec("form_d", ("form-d",), INGEST),
+    RouterSpec("corporate_registry", ("corporate-registry",), INGEST),
+    RouterSpec("form_adv", ("form-adv",), INGEST),
+    RouterSpec("web_traffic", ("web-traffic",), INGEST),
+    RouterSpec("github", ("github",), INGEST),
+    RouterSpec("scores", ("scores",), API),
+    RouterSpec("entities", ("entities",), API),
+    RouterSpec("glassdoor", ("glassdoor",), INGEST),
+    RouterSpec("app_stores", ("app-stores",), INGEST),
+    RouterSpec("opencorporates", ("opencorporates",), INGEST),
+    RouterSpec("app_rankings", ("apps",), INGEST),
+    RouterSpec("predictions", ("predictions",), API),
+    RouterSpec("agents", ("agents",), API),
+    RouterSpec("diligence", ("diligence",), API),
+    RouterSpec("monitors", ("monitors",), API),
+    RouterSpec("competitive", ("competitive",), API),
+    RouterSpec("hunter", ("hunter",), INGEST),
+    RouterSpec("anomalies", ("anomalies",), API),
+    RouterSpec("market", ("market",), API),
+    RouterSpec("reports_gen", ("ai-reports",), API),
+    RouterSpec("lp_collection", ("lp-collection",), INGEST),
+    RouterSpec("fo_collection", ("fo-collection",), INGEST),
+
+    # PE Intelligence Platform
+    RouterSpec("pe_firms", ("pe",), API),
+    RouterSpec("pe_companies", ("pe",), API),
+    RouterSpec("pe_people", ("pe",), API),
+    RouterSpec("pe_deals", ("pe",), API),
+    RouterSpec("pe_collection", ("pe",), INGEST),
+    RouterSpec("pe_benchmarks", ("pe",), API),
+    RouterSpec("pe_import", ("pe",), INGEST),
+    RouterSpec("pe_conviction", ("pe",), API),
+    RouterSpec("macro_cascade", ("macro",), API),
+    RouterSpec("synthetic", ("synthetic",), API),
+    RouterSpec("diligence_composite", ("diligence",), API),
+    RouterSpec("gp_pipeline", ("pe",), API),
+    RouterSpec("exec_signals", ("exec-signals",), API),
+    RouterSpec("healthcare_intel", ("healthcare",), API),
+
+    # 13F Quarterly Analysis
+    RouterSpec("quarterly_diff", ("13f-analysis",), API),
+
+    # People & Org Chart Intelligence
+    RouterSpec("people", ("people",), API),
+    RouterSpec("companies_leadership", ("companies",), API),
+    RouterSpec("collection_jobs", ("collection-jobs",), INGEST),
+    RouterSpec("people_portfolios", ("people-portfolios",), API),
+    RouterSpec("peer_sets", ("peer-sets",), API),
+    RouterSpec("people_watchlists", ("people-watchlists",), API),
+    RouterSpec("people_analytics", ("people-analytics",), API),
+    RouterSpec("people_reports", ("people-reports",), API),
+    RouterSpec("people_data_quality", ("people-data-quality",), API),
+    RouterSpec("people_dedup", ("people-dedup",), API),
+    RouterSpec("people_jobs", ("people-jobs",), INGEST),
+    RouterSpec("board_interlocks", ("board-interlocks",), API),
+    RouterSpec("evals", ("evals",), API),
+
+    # Job Posting Intelligence
+    RouterSpec("job_postings", ("job-postings",), API),
+    RouterSpec("job_postings_velocity", ("job-postings",), API),
+
+    # Derived Data Scores
+    RouterSpec("health_scores", ("health-scores",), API),
+    RouterSpec("lp_allocation", ("lp-allocation",), API),
+    RouterSpec("exit_readiness", ("exit-readiness",), API),
+    RouterSpec("acquisition_targets", ("acquisition-targets",), API),
+    RouterSpec("zip_scores", ("zip-scores",), API),
+    RouterSpec("medspa_discovery", ("medspa-discovery",), API),
+    RouterSpec("deal_models", ("deal-models",), API),
+
+    # PE Intelligence Features
+    RouterSpec("labor_arbitrage", ("labor-arbitrage",), API),
+    RouterSpec("location_diligence", ("location-diligence",), API),
+    RouterSpec("rollup_intel", ("rollup-intel",), API),
+    RouterSpec("vertical_discovery", ("vertical-discovery",), API),
+
+    # Government & Legal Data Sources
+    RouterSpec("sam_gov", ("sam-gov",), INGEST),
+    RouterSpec("osha", ("osha",), INGEST),
+    RouterSpec("courtlistener", ("courtlistener",), INGEST),
+
+    # Site Intelligence Platform
+    RouterSpec("site_intel_power", ("site-intel",), API),
+    RouterSpec("site_intel_telecom", ("site-intel",), API),
+    RouterSpec("site_intel_transport", ("site-intel",), API),
+    RouterSpec("site_intel_labor", ("site-intel",), API),
+    RouterSpec("site_intel_risk", ("site-intel",), API),
+    RouterSpec("site_intel_incentives", ("site-intel",), API),
+    RouterSpec("site_intel_logistics", ("site-intel",), API),
+    RouterSpec("site_intel_water_utilities", ("site-intel",), API),
+    RouterSpec("site_intel_sites", ("site-intel",), API),
+    RouterSpec("datacenter_sites", ("datacenter-sites",), API),
+
+    # Deal Radar — Convergence Intelligence
+    RouterSpec("deal_radar", ("deal-radar",), API),
+
+    # Deal Probability Engine (PLAN_059 Phase 2)
+    RouterSpec("transaction_probability", ("txn-probability",), API),
+
+    # PE Intelligence Platform (PLAN_060)
+    RouterSpec("pe_ecosystem", ("pe",), API),
+    RouterSpec("capital_deployment", ("pe",), API),
+    RouterSpec("portfolio_ops", ("pe",), API),
+    RouterSpec("exit_strategy", ("pe",), API),
+
+    # Specialty Data Sources
+    RouterSpec("ffiec_banks", ("ffiec-banks",), INGEST),
+    RouterSpec("google_trends", ("google-trends",), INGEST),
+    RouterSpec("ferc_energy", ("ferc-energy",), INGEST),
+
+    # Collection Management
+    RouterSpec("source_configs", ("source-configs",), CORE),
+    RouterSpec("source_health", ("source-health",), CORE),
+    RouterSpec("audit", ("audit-trail",), CORE),
+
+    # Settings
+    RouterSpec("settings", ("settings",), CORE),
+
+    # LLM Cost Tracking
+    RouterSpec("llm_costs", ("llm-costs",), CORE),
+
+    # Data Freshness Dashboard
+    RouterSpec("freshness", ("datasets",), CORE),
+
+    # GraphQL API
+    RouterSpec(
+        "graphql", (), API, public=True, tags=("graphql",),
+        package="app", attr="graphql_app", prefix="/graphql",
+    ),
+]
+
+
+def select_routers(profile: str, routers: Sequence[RouterSpec] = ROUTERS) -> List[RouterSpec]:
+    """Routers mounted by a deployment profile."""
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown router profile {profile!r}; expected one of {sorted(PROFILES)}")
+    areas = PROFILES[profile]
+    return [spec for spec in routers if spec.area in areas]
+
+
+class RouterRegistry:
+    """
+    Mounts a set of RouterSpecs on an app, all at once or on demand.
+
+    Specs are grouped into components of routers that share a path segment;
+    a component is always mounted as a whole.
+    """
+
+    def __init__(self, specs: Iterable[RouterSpec], dependencies: Optional[List[Any]] = None):
+        self.specs = list(specs)
+        self.dependencies = list(dependencies or [])
+        self._mounted: Set[int] = set()
+        self._lock = threading.Lock()
+        self._components = self._group_by_segment()
+        self._by_path: Dict[str, int] = {
+            path: component
+            for component, members in enumerate(self._components)
+            for i in members
+            for path in self.specs[i].paths
+        }
+
+    def _group_by_segment(self) -> List[List[int]]:
+        parent = list(range(len(self.specs)))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        first_with_path: Dict[str, int] = {}
+        for i, spec in enumerate(self.specs):
+            for path in spec.paths:
+                j = first_with_path.setdefault(path, i)
+                parent[find(i)] = find(j)
+        groups: Dict[int, List[int]] = {}
+        for i in range(len(self.specs)):
+            groups.setdefault(find(i), []).append(i)
+        return sorted(groups.values())
+
+    @property
+    def pending(self) -> int:
+        """Number of routers not mounted yet."""
+        return len(self.specs) - len(self._mounted)
+
+    def _mount(self, app: FastAPI, indices: List[int]) -> None:
+        for i in indices:
+            if i in self._mounted:
+                continue
+            spec = self.specs[i]
+            router = getattr(importlib.import_module(spec.import_path), spec.attr)
+            kwargs: Dict[str, Any] = {"prefix": spec.prefix}
+            if spec.tags:
+                kwargs["tags"] = list(spec.tags)
+            if not spec.public:
+                kwargs["dependencies"] = self.dependencies
+            app.include_router(router, **kwargs)
+            self._mounted.add(i)
+        # Routes changed; regenerate the schema on next request
+        app.openapi_schema = None
+
+    def mount_all(self, app: FastAPI) -> None:
+        with self._lock:
+            if self.pending:
+                self._mount(app, list(range(len(self.specs))))
+
+    def mount_for_path(self, app: FastAPI, path: str) -> bool:
+        """Mount the routers serving ``path``; returns True if any were mounted."""
+        prefix, _, rest = path.partition(f"{API_PREFIX}/")
+        if prefix:
+            candidate = "/" + path.lstrip("/").split("/", 1)[0]
+        else:
+            candidate = f"{API_PREFIX}/{rest.split('/', 1)[0]}"
+        component = self._by_path.get(candidate)
+        if component is None:
+            return False
+        members = self._components[component]
+        if all(i in self._mounted for i in members):
+            return False
+        with self._lock:
+            self._mount(app, members)
+        logger.info(f"Mounted {len(members)} router(s) for {candidate}")
+        return True
+
+
+class LazyRouterMiddleware:
+    """ASGI middleware mounting routers on the first request to their path."""
+
+    def __init__(self, app, registry: RouterRegistry):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] in ("http", "websocket") and self.registry.pending:
+            fastapi_app = scope["app"]
+            path = scope["path"]
+            if path in (fastapi_app.openapi_url, fastapi_app.docs_url, fastapi_app.redoc_url):
+                self.registry.mount_all(fastapi_app)
+            else:
+                self.registry.mount_for_path(fastapi_app, path)
+        await self.app(scope, receive, send)
+
+
+def mount_routers(
+    app: FastAPI,
+    profile: str = "full",
+    loading: str = LOADING_EAGER,
+    dependencies: Optional[List[Any]] = None,
+    routers: Sequence[RouterSpec] = ROUTERS,
+) -> RouterRegistry:
+    """Mount the routers of ``profile`` now (eager) or on first use (lazy)."""
+    registry = RouterRegistry(select_routers(profile, routers), dependencies)
+    if loading == LOADING_LAZY:
+        app.add_middleware(LazyRouterMiddleware, registry=registry)
+    elif loading == LOADING_EAGER:
+        registry.mount_all(app)
+    else:
+        raise ValueError(f"Unknown router loading mode {loading!r}")
+    logger.info(
+        f"Router profile {profile!r} ({loading}): {len(registry.specs)} routers, "
+        f"{registry.pending} deferred"
+    )
+    return registry
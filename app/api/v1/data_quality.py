@@ -878,6 +878,8 @@ class ProfileSnapshotResponse(BaseModel):
     schema_snapshot: Optional[List[Dict[str, Any]]]
     profiled_at: str
     execution_time_ms: Optional[int]
+    profile_mode: Optional[str] = None
+    profile_cost: Optional[Dict[str, Any]] = None
 
 
 class ProfileColumnResponse(BaseModel):
@@ -1082,6 +1084,8 @@ def _snapshot_to_response(s: DataProfileSnapshot) -> ProfileSnapshotResponse:
         schema_snapshot=s.schema_snapshot,
         profiled_at=s.profiled_at.isoformat() if s.profiled_at else None,
         execution_time_ms=s.execution_time_ms,
+        profile_mode=s.profile_mode,
+        profile_cost=s.profile_cost,
     )
 
 
@@ -1116,10 +1120,16 @@ def profile_all_tables(db: Session = Depends(get_db)):
 def profile_table(
     table_name: str,
     source: Optional[str] = Query(default=None),
+    parallel: int = Query(
+        default=1, ge=1, le=data_profiling_service.MAX_PARALLEL_GROUPS,
+        description="Column groups profiled concurrently on separate connections",
+    ),
     db: Session = Depends(get_db),
 ) -> ProfileSnapshotResponse:
     """Profile a specific table on-demand."""
-    snapshot = data_profiling_service.profile_table(db, table_name, source=source)
+    snapshot = data_profiling_service.profile_table(
+        db, table_name, source=source, parallel_groups=parallel
+    )
     if not snapshot:
         raise HTTPException(status_code=409, detail="Profiling already in progress or table not found")
     return _snapshot_to_response(snapshot)
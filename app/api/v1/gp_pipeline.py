@@ -112,6 +112,17 @@ def get_full_graph(
     }
 
 
+@router.get("/graph/analytics")
+def get_graph_analytics(
+    limit: int = Query(20, ge=1, le=100),
+    method: str = Query("louvain", pattern="^(louvain|label_propagation)$"),
+    db: Session = Depends(get_db),
+):
+    """Network analytics over the LP→GP graph: PageRank, brokers, communities."""
+    builder = LPGPGraphBuilder(db)
+    return {"status": "ok", **builder.network_analytics(limit=limit, method=method)}
+
+
 @router.get("/graph/gp/{firm_id}")
 def get_gp_network(firm_id: int, db: Session = Depends(get_db)):
     """LP network for a specific GP — all LPs committed to this GP."""
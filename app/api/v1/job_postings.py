@@ -11,7 +11,7 @@ Provides endpoints for:
 - Skills extraction & backfill
 """
 
-import json
+import asyncio
 import logging
 from datetime import date, datetime
 from typing import Any, Dict, List, Optional
@@ -29,7 +29,7 @@ from app.sources.job_postings.metadata import (
     generate_create_job_posting_snapshots_sql,
     generate_create_job_posting_alerts_sql,
 )
-from app.sources.job_postings.skills_extractor import extract_skills
+from app.sources.job_postings.skills_extractor import backfill_requirements
 
 logger = logging.getLogger(__name__)
 
@@ -82,7 +82,8 @@ class SeedATSCompaniesRequest(BaseModel):
 
 class BackfillSkillsRequest(BaseModel):
     company_id: Optional[int] = Field(None, description="Limit to a single company")
-    limit: int = Field(1000, description="Max postings to process")
+    limit: Optional[int] = Field(1000, description="Max postings to process (null: all)")
+    processes: int = Field(1, ge=1, le=16, description="Extraction worker processes")
 
 
 # =============================================================================
@@ -945,7 +946,9 @@ def seed_ats_companies(
 # =============================================================================
 
 
-async def _run_backfill_skills(db_factory, job_id: int, company_id: Optional[int], limit: int):
+async def _run_backfill_skills(
+    db_factory, job_id: int, company_id: Optional[int], limit: Optional[int], processes: int
+):
     """Background task to backfill skills extraction on existing postings."""
     db = db_factory()
     try:
@@ -954,53 +957,33 @@ async def _run_backfill_skills(db_factory, job_id: int, company_id: Optional[int
             job.status = JobStatus.RUNNING
             db.commit()
 
-        # Fetch postings that don't have requirements yet
-        conditions = ["requirements IS NULL", "description_text IS NOT NULL"]
-        params: dict = {"lim": limit}
-        if company_id:
-            conditions.append("company_id = :cid")
-            params["cid"] = company_id
-
-        where = "WHERE " + " AND ".join(conditions)
-        rows = db.execute(
-            text(f"""
-                SELECT id, title, description_text
-                FROM job_postings
-                {where}
-                ORDER BY id
-                LIMIT :lim
-            """),
-            params,
-        ).fetchall()
-
-        extracted = 0
-        for row_id, title, desc in rows:
-            reqs = extract_skills(desc, title or "")
-            if reqs and reqs.get("skill_count", 0) > 0:
-                db.execute(
-                    text("UPDATE job_postings SET requirements = :reqs WHERE id = :id"),
-                    {"reqs": json.dumps(reqs), "id": row_id},
-                )
-                extracted += 1
-
-                # Commit in batches
-                if extracted % 100 == 0:
-                    db.commit()
-                    logger.info(f"Skills backfill: {extracted}/{len(rows)} processed")
+        def report(processed: int, enriched: int):
+            if job:
+                job.rows_committed = enriched
+                db.commit()
 
-        db.commit()
+        # Extraction is CPU-bound: keep it off the event loop
+        processed, extracted = await asyncio.to_thread(
+            backfill_requirements,
+            db,
+            company_id=company_id,
+            limit=limit,
+            processes=processes,
+            progress_callback=report,
+        )
 
         if job:
             job.status = JobStatus.SUCCESS
-            job.records_processed = len(rows)
+            job.records_processed = processed
             job.records_written = extracted
             db.commit()
 
-        logger.info(f"Skills backfill complete: {extracted}/{len(rows)} postings enriched")
+        logger.info(f"Skills backfill complete: {extracted}/{processed} postings enriched")
 
     except Exception as e:
         logger.error(f"Skills backfill failed: {e}", exc_info=True)
         try:
+            db.rollback()
             job = db.query(IngestionJob).filter(IngestionJob.id == job_id).first()
             if job:
                 job.status = JobStatus.FAILED
@@ -1024,13 +1007,14 @@ async def backfill_skills(
         "action": "backfill_skills",
         "company_id": body.company_id,
         "limit": body.limit,
+        "processes": body.processes,
     })
 
     from app.core.database import get_session_factory
     db_factory = get_session_factory()
 
     background_tasks.add_task(
-        _run_backfill_skills, db_factory, job.id, body.company_id, body.limit
+        _run_backfill_skills, db_factory, job.id, body.company_id, body.limit, body.processes
     )
 
     return {
@@ -33,6 +33,9 @@ class NodeResponse(BaseModel):
     centrality: float = 0.0
     cluster_id: Optional[int] = None
     is_center: Optional[bool] = None
+    pagerank: Optional[float] = None
+    betweenness: Optional[float] = None
+    hops: Optional[int] = None
 
 
 class EdgeResponse(BaseModel):
@@ -91,6 +94,14 @@ class ClusterResponse(BaseModel):
     avg_degree: float = 0.0
 
 
+class KHopResponse(BaseModel):
+    """k-hop neighborhood of one investor."""
+
+    investor: str
+    found: bool
+    neighbors: List[NodeResponse]
+
+
 class PathResponse(BaseModel):
     """Path between two investors."""
 
@@ -182,20 +193,26 @@ def get_investor_network(
     response_model=List[NodeResponse],
     summary="Get most connected investors",
     description="""
-    Returns investors ranked by their network centrality (connection strength).
+    Returns investors ranked by their network centrality.
 
-    Centrality is based on:
-    - Number of co-investor relationships
-    - Total weight of those relationships (# shared investments)
+    Use `by` to choose the measure:
+    - weighted_degree: number and total weight of co-investor relationships
+    - pagerank: weighted PageRank (connected to well-connected investors)
+    - betweenness: approximate betweenness (brokers between groups)
     """,
 )
 def get_central_investors(
     limit: int = Query(20, ge=1, le=100, description="Number of investors to return"),
+    by: str = Query(
+        "weighted_degree",
+        pattern="^(weighted_degree|pagerank|betweenness)$",
+        description="Centrality measure",
+    ),
     db: Session = Depends(get_db),
 ):
     """Get most central/connected investors."""
     engine = NetworkEngine(db)
-    return engine.get_central_investors(limit=limit)
+    return engine.get_central_investors(limit=limit, by=by)
 
 
 @router.get(
@@ -205,17 +222,58 @@ def get_central_investors(
     description="""
     Detects and returns investor clusters based on co-investment relationships.
 
-    A cluster is a group of investors who are connected through shared investments.
+    By default clusters are Louvain communities: groups of investors more
+    densely connected to each other than to the rest of the network.
+    `method=label_propagation` is faster on very large networks;
+    `method=components` returns plain connected components.
     Investors with no connections are not included in clusters.
     """,
 )
 def get_clusters(
     min_cluster_size: int = Query(2, ge=2, le=50, description="Minimum cluster size"),
+    method: str = Query(
+        "louvain",
+        pattern="^(louvain|label_propagation|components)$",
+        description="Clustering method",
+    ),
     db: Session = Depends(get_db),
 ):
     """Get detected investor clusters."""
     engine = NetworkEngine(db)
-    return engine.detect_clusters(min_cluster_size=min_cluster_size)
+    return engine.detect_clusters(min_cluster_size=min_cluster_size, method=method)
+
+
+@router.get(
+    "/k-hop",
+    response_model=List[KHopResponse],
+    summary="Get k-hop neighborhoods of several investors",
+    description="""
+    Returns every investor within `k` hops of each requested investor,
+    nearest first, computed in one batched traversal.
+
+    `investors` is a comma-separated list of node ids, e.g. `lp_12,family_office_3`.
+    """,
+)
+def get_k_hop(
+    investors: str = Query(..., description="Comma-separated node ids (lp_<id>, family_office_<id>)"),
+    k: int = Query(2, ge=1, le=3, description="Max hops"),
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Max neighbors per investor"),
+    include_external: bool = Query(False, description="Include external investors"),
+    db: Session = Depends(get_db),
+):
+    """Get k-hop neighborhoods for a batch of investors."""
+    engine = NetworkEngine(db)
+    parsed = []
+    for node in filter(None, (n.strip() for n in investors.split(","))):
+        investor_type, _, investor_id = node.rpartition("_")
+        if investor_type not in ("lp", "family_office") or not investor_id.isdigit():
+            raise HTTPException(status_code=400, detail=f"Invalid investor id: {node}")
+        parsed.append((int(investor_id), investor_type))
+    if not parsed or len(parsed) > 100:
+        raise HTTPException(status_code=400, detail="Provide between 1 and 100 investors")
+    return engine.get_k_hop_neighborhoods(
+        parsed, k=k, include_external=include_external, limit=limit
+    )
 
 
 @router.get(
@@ -1,9 +1,11 @@
 """
 Deal Probability Engine — REST API (SPEC 046, PLAN_059 Phase 2).
 
-10 endpoints exposing the TransactionProbabilityEngine:
+Endpoints exposing the TransactionProbabilityEngine:
 - POST /score/{company_id}   — score a single company
 - POST /scan                 — batch-score the universe
+- POST /scan/batches         — start/resume a sharded universe run
+- GET  /scan/batches/{id}    — run status with per-shard checkpoints
 - GET  /rankings             — top companies by probability
 - GET  /company/{id}         — latest detail + signal chain
 - GET  /company/{id}/history — signal time-series
@@ -16,7 +18,7 @@ Deal Probability Engine — REST API (SPEC 046, PLAN_059 Phase 2).
 
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
@@ -40,6 +42,11 @@ from app.ml.probability_weight_optimizer import (
     MIN_SAMPLES_FOR_OPTIMIZATION,
     SignalWeightOptimizer,
 )
+from app.services.probability_batch import (
+    DEFAULT_SHARD_SIZE,
+    get_batch_status,
+    start_universe_scan,
+)
 from app.services.probability_convergence import (
     CONVERGENCE_PATTERNS,
     ConvergenceDetector,
@@ -166,6 +173,51 @@ def scan_universe(
     return ScanResponse(**stats)
 
 
+@router.post(
+    "/scan/batches",
+    summary="Start or resume a sharded universe run",
+    description=(
+        "Split the universe into shards scored in parallel by workers "
+        "(WORKER_MODE) or in the background. Rankings switch to the run only "
+        "once every shard is done. Pass batch_id to resume a run — shards "
+        "already done are skipped."
+    ),
+)
+def start_scan_batch(
+    background_tasks: BackgroundTasks,
+    shard_size: int = Query(DEFAULT_SHARD_SIZE, ge=1, le=50000),
+    batch_id: Optional[str] = Query(None, description="Resume this run instead of starting a new one"),
+    build_universe_first: bool = Query(
+        default=False,
+        description="If true, refresh the company universe before a new run.",
+    ),
+    db: Session = Depends(get_db),
+) -> Dict:
+    if batch_id and get_batch_status(db, batch_id) is None:
+        raise HTTPException(status_code=404, detail=f"Batch {batch_id} not found")
+    if build_universe_first and not batch_id:
+        CompanyUniverseBuilder(db).refresh_universe()
+    try:
+        return start_universe_scan(
+            db, shard_size=shard_size, batch_id=batch_id,
+            background_tasks=background_tasks,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=409, detail=str(exc))
+
+
+@router.get(
+    "/scan/batches/{batch_id}",
+    summary="Universe run status",
+    description="Run status, totals and per-shard checkpoints.",
+)
+def get_scan_batch(batch_id: str, db: Session = Depends(get_db)) -> Dict:
+    status = get_batch_status(db, batch_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail=f"Batch {batch_id} not found")
+    return status
+
+
 @router.get(
     "/rankings",
     response_model=List[RankingEntry],
@@ -6,11 +6,15 @@ Provides reusable utilities for batch INSERT operations with:
 - ON CONFLICT handling (upsert)
 - Progress tracking
 - Error handling
+- COPY-based bulk loading for large datasets
 """
 
+import io
+import json
 import logging
-from typing import List, Dict, Any, Optional, Tuple, Callable
-from datetime import datetime
+import uuid
+from typing import List, Dict, Any, Optional, Set, Tuple, Callable
+from datetime import date, datetime
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 
@@ -18,6 +22,11 @@ from app.core.safe_sql import qi
 
 logger = logging.getLogger(__name__)
 
+# Rows per COPY + merge transaction when use_copy=True. Much larger than the
+# executemany batch size because each transaction is a single server-side
+# INSERT ... SELECT rather than one statement per row.
+DEFAULT_COPY_BATCH_SIZE = 50_000
+
 
 class BatchInsertResult:
     """Result of a batch insert operation."""
@@ -69,10 +78,18 @@ def batch_insert(
     progress_callback: Optional[Callable[[int, int], None]] = None,
     commit_per_batch: bool = True,
     job_id: Optional[int] = None,
+    use_copy: bool = False,
+    copy_batch_size: int = DEFAULT_COPY_BATCH_SIZE,
 ) -> BatchInsertResult:
     """
     Batch insert rows into a table with optional upsert support.
 
+    With ``use_copy=True`` rows are streamed into a temporary staging table
+    via the PostgreSQL COPY protocol and merged into the target with one
+    ``INSERT ... SELECT ... ON CONFLICT`` per ``copy_batch_size`` rows
+    (see ``copy_insert``). That path splits rows_inserted / rows_updated
+    from the merge; the executemany path counts every row as inserted.
+
     Args:
         db: SQLAlchemy session
         table_name: Target table name (will be quoted)
@@ -84,6 +101,8 @@ def batch_insert(
         progress_callback: Optional callback(current, total) for progress updates
         commit_per_batch: Whether to commit after each batch (default True)
         job_id: Optional ingestion job ID for rows_committed progress tracking
+        use_copy: Load via COPY into a staging table, then merge (default False)
+        copy_batch_size: Rows per COPY + merge transaction when use_copy=True
 
     Returns:
         BatchInsertResult with statistics
@@ -108,6 +127,20 @@ def batch_insert(
     if not columns:
         raise ValueError("columns list cannot be empty")
 
+    if use_copy:
+        return copy_insert(
+            db=db,
+            table_name=table_name,
+            rows=rows,
+            columns=columns,
+            batch_size=copy_batch_size,
+            conflict_columns=conflict_columns,
+            update_columns=update_columns,
+            progress_callback=progress_callback,
+            commit_per_batch=commit_per_batch,
+            job_id=job_id,
+        )
+
     # Build SQL
     sql = _build_insert_sql(
         table_name=table_name,
@@ -136,16 +169,7 @@ def batch_insert(
                     db.commit()
                     # Update rows_committed on the job record for progress visibility
                     if job_id:
-                        try:
-                            db.execute(
-                                text(
-                                    "UPDATE ingestion_jobs SET rows_committed = :rows WHERE id = :jid"
-                                ),
-                                {"rows": result.rows_inserted, "jid": job_id},
-                            )
-                            db.commit()
-                        except Exception:
-                            logger.debug(f"Could not update rows_committed for job {job_id}")
+                        update_rows_committed(db, job_id, result.rows_inserted)
 
                 if progress_callback:
                     progress_callback(min(i + batch_size, total_rows), total_rows)
@@ -190,6 +214,440 @@ def batch_insert(
     return result
 
 
+def copy_insert(
+    db: Session,
+    table_name: str,
+    rows: List[Dict[str, Any]],
+    columns: List[str],
+    batch_size: int = DEFAULT_COPY_BATCH_SIZE,
+    conflict_columns: Optional[List[str]] = None,
+    update_columns: Optional[List[str]] = None,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    commit_per_batch: bool = True,
+    job_id: Optional[int] = None,
+) -> BatchInsertResult:
+    """
+    Bulk load rows using COPY into a staging table followed by one merge.
+
+    For each chunk of ``batch_size`` rows:
+    1. CREATE TEMP TABLE (ON COMMIT DROP) shaped like the target columns
+    2. COPY the chunk into it over the psycopg2 copy protocol
+    3. INSERT INTO target SELECT ... FROM staging ON CONFLICT ...
+    4. Commit and update ingestion_jobs.rows_committed
+
+    Duplicate conflict keys within a chunk are collapsed to the last
+    occurrence, matching the executemany path where later rows win. The
+    merge reports inserted vs updated rows (``xmax = 0`` marks a fresh
+    insert); rows skipped by DO NOTHING are counted in neither.
+
+    Python lists load as PostgreSQL array literals for array columns and
+    as JSON for every other column type.
+
+    Args:
+        db: SQLAlchemy session (PostgreSQL / psycopg2)
+        table_name: Target table name
+        rows: List of row dictionaries (missing keys load as NULL)
+        columns: Column names to insert
+        batch_size: Rows per COPY + merge transaction
+        conflict_columns: Columns for ON CONFLICT (enables upsert)
+        update_columns: Columns to update on conflict (defaults to all non-conflict columns)
+        progress_callback: Optional callback(current, total) for progress updates
+        commit_per_batch: Whether to commit after each chunk (default True)
+        job_id: Optional ingestion job ID for rows_committed progress tracking
+
+    Returns:
+        BatchInsertResult with the same statistics as batch_insert
+    """
+    result = BatchInsertResult()
+
+    if not rows:
+        logger.warning("copy_insert called with empty rows list")
+        result.mark_complete()
+        return result
+
+    if not columns:
+        raise ValueError("columns list cannot be empty")
+
+    total_rows = len(rows)
+    logger.info(
+        f"Starting COPY load: {total_rows} rows into {table_name}, "
+        f"batch_size={batch_size}"
+    )
+
+    try:
+        array_columns = _array_columns(db, table_name, columns)
+        for i in range(0, total_rows, batch_size):
+            batch = rows[i : i + batch_size]
+            batch_num = i // batch_size + 1
+            staging_table = f"_copy_stage_{uuid.uuid4().hex[:12]}"
+
+            try:
+                for statement in _build_copy_staging_sql(
+                    table_name, staging_table, columns
+                ):
+                    db.execute(text(statement))
+
+                _copy_rows(db, staging_table, batch, columns, array_columns)
+
+                inserted, updated = db.execute(
+                    text(
+                        _build_copy_merge_sql(
+                            table_name=table_name,
+                            staging_table=staging_table,
+                            columns=columns,
+                            conflict_columns=conflict_columns,
+                            update_columns=update_columns,
+                        )
+                    )
+                ).fetchone()
+                db.execute(text(f"DROP TABLE IF EXISTS {qi(staging_table)}"))
+
+                result.rows_inserted += int(inserted or 0)
+                result.rows_updated += int(updated or 0)
+                result.batches_processed += 1
+
+                if commit_per_batch:
+                    db.commit()
+                    if job_id:
+                        update_rows_committed(db, job_id, result.total_rows)
+
+                if progress_callback:
+                    progress_callback(min(i + batch_size, total_rows), total_rows)
+
+                logger.info(
+                    f"COPY progress: {min(i + batch_size, total_rows)}/{total_rows} rows "
+                    f"({result.batches_processed} batches)"
+                )
+
+            except Exception as e:
+                logger.error(f"Error in COPY batch {batch_num}: {e}")
+                result.errors.append(
+                    {
+                        "batch": batch_num,
+                        "start_row": i,
+                        "end_row": i + len(batch),
+                        "error": str(e),
+                    }
+                )
+                db.rollback()
+                raise
+
+        if not commit_per_batch:
+            db.commit()
+
+    finally:
+        result.mark_complete()
+
+    logger.info(
+        f"COPY load complete: {result.rows_inserted} inserted, "
+        f"{result.rows_updated} updated in "
+        f"{result.duration_seconds:.2f}s ({result.batches_processed} batches)"
+    )
+
+    return result
+
+
+def copy_frame(
+    db: Session,
+    table_name: str,
+    frame: Any,
+    conflict_columns: Optional[List[str]] = None,
+    update_columns: Optional[List[str]] = None,
+    touch_columns: Optional[List[str]] = None,
+) -> Tuple[int, int]:
+    """
+    COPY a pandas DataFrame into a table through a staging table and one merge.
+
+    The columnar counterpart of one copy_insert chunk: the frame is
+    serialized column by column (no per-row dicts), streamed over the
+    psycopg2 copy protocol in CSV format and merged with the same
+    INSERT ... SELECT ... ON CONFLICT as copy_insert. NaN / None load as
+    NULL. The caller owns the transaction (nothing is committed here).
+
+    Args:
+        db: SQLAlchemy session (PostgreSQL / psycopg2)
+        table_name: Target table name
+        frame: pandas DataFrame whose columns are target column names
+        conflict_columns: Columns for ON CONFLICT (enables upsert)
+        update_columns: Columns to update on conflict (defaults to all non-conflict columns)
+        touch_columns: Columns set to NOW() on conflict
+
+    Returns:
+        (inserted, updated) row counts from the merge
+    """
+    if frame.empty:
+        return 0, 0
+
+    columns = [str(c) for c in frame.columns]
+    staging_table = f"_copy_stage_{uuid.uuid4().hex[:12]}"
+    for statement in _build_copy_staging_sql(table_name, staging_table, columns):
+        db.execute(text(statement))
+
+    cols = ", ".join(qi(c) for c in columns)
+    copy_sql = f"COPY {qi(staging_table)} ({cols}) FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.copy_expert(copy_sql, _frame_to_copy_buffer(frame))
+    finally:
+        cursor.close()
+
+    inserted, updated = db.execute(
+        text(
+            _build_copy_merge_sql(
+                table_name=table_name,
+                staging_table=staging_table,
+                columns=columns,
+                conflict_columns=conflict_columns,
+                update_columns=update_columns,
+                touch_columns=touch_columns,
+            )
+        )
+    ).fetchone()
+    db.execute(text(f"DROP TABLE IF EXISTS {qi(staging_table)}"))
+    return int(inserted or 0), int(updated or 0)
+
+
+def _frame_to_copy_buffer(frame: Any) -> io.StringIO:
+    """
+    Serialize a DataFrame to COPY CSV format (NULL written as ``\\N``).
+
+    Each column becomes an array of ready-made CSV fields, then rows are
+    joined in one pass. Categorical columns format each category once and
+    take by code; integer columns with a narrow value range do the same
+    through a lookup table. Other columns are formatted value by value.
+    ``_copy_seq`` is not written: the staging table numbers rows itself.
+    """
+    import numpy as np
+    import pandas as pd
+
+    fields = []
+    for name in frame.columns:
+        series = frame[name]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            table = [_csv_field(v) for v in series.cat.categories] + ["\\N"]
+            fields.append(np.array(table, dtype=object)[series.cat.codes.to_numpy()])
+            continue
+        values = series.to_numpy()
+        if values.dtype.kind == "b":
+            fields.append(np.where(values, "t", "f").astype(object))
+            continue
+        if values.dtype.kind in "iu" and len(values):
+            low, high = int(values.min()), int(values.max())
+            if high - low <= len(values):
+                table = np.array([str(v) for v in range(low, high + 1)], dtype=object)
+                fields.append(table[values - low])
+                continue
+        values = series.astype(object).to_numpy()
+        missing = pd.isna(values)
+        fields.append(np.array(
+            ["\\N" if null else _csv_field(v) for v, null in zip(values, missing)],
+            dtype=object,
+        ))
+
+    buffer = io.StringIO()
+    buffer.write("\n".join(map(",".join, zip(*fields))))
+    buffer.write("\n")
+    buffer.seek(0)
+    return buffer
+
+
+def _csv_field(value: Any) -> str:
+    """Format a single value as a COPY CSV field (quoted when needed)."""
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (dict, list)):
+        value = json.dumps(value, default=str)
+    value = str(value)
+    if value == "\\N" or any(c in value for c in ',"\n\r'):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+def update_rows_committed(db: Session, job_id: int, rows: int) -> None:
+    """Best-effort update of ingestion_jobs.rows_committed for progress visibility."""
+    try:
+        db.execute(
+            text("UPDATE ingestion_jobs SET rows_committed = :rows WHERE id = :jid"),
+            {"rows": rows, "jid": job_id},
+        )
+        db.commit()
+    except Exception:
+        logger.debug(f"Could not update rows_committed for job {job_id}")
+
+
+def _build_copy_staging_sql(
+    table_name: str, staging_table: str, columns: List[str]
+) -> List[str]:
+    """
+    Build statements that create a temp staging table for a COPY load.
+
+    The staging table copies the target's column types for ``columns`` and
+    adds a ``_copy_seq`` ordinal used to keep the last duplicate on merge
+    (numbered in load order when the COPY does not supply it).
+    Temp tables are never WAL-logged and are dropped at commit.
+    """
+    cols = ", ".join(qi(c) for c in columns)
+    return [
+        f"CREATE TEMP TABLE {qi(staging_table)} ON COMMIT DROP AS "
+        f"SELECT {cols} FROM {qi(table_name)} WITH NO DATA",
+        f"ALTER TABLE {qi(staging_table)} ADD COLUMN _copy_seq BIGINT "
+        "GENERATED BY DEFAULT AS IDENTITY",
+    ]
+
+
+def _build_copy_merge_sql(
+    table_name: str,
+    staging_table: str,
+    columns: List[str],
+    conflict_columns: Optional[List[str]] = None,
+    update_columns: Optional[List[str]] = None,
+    touch_columns: Optional[List[str]] = None,
+) -> str:
+    """
+    Build the INSERT ... SELECT that merges a staging table into the target.
+
+    When conflict columns are given, rows are de-duplicated on them with
+    DISTINCT ON (keeping the highest ``_copy_seq``) so a single statement
+    never touches the same target row twice. ``touch_columns`` are set to
+    NOW() on conflict (e.g. ``ingested_at``) without being loaded.
+
+    The statement returns one row: (inserted, updated) counts, split on
+    ``xmax = 0`` of the affected rows.
+    """
+    cols = ", ".join(qi(c) for c in columns)
+
+    if conflict_columns:
+        conflict_cols = ", ".join(qi(c) for c in conflict_columns)
+        select_sql = (
+            f"SELECT DISTINCT ON ({conflict_cols}) {cols} "
+            f"FROM {qi(staging_table)} ORDER BY {conflict_cols}, _copy_seq DESC"
+        )
+    else:
+        select_sql = f"SELECT {cols} FROM {qi(staging_table)} ORDER BY _copy_seq"
+
+    sql = f"INSERT INTO {qi(table_name)} ({cols}) {select_sql}"
+
+    if conflict_columns:
+        if update_columns is None:
+            update_columns = [c for c in columns if c not in conflict_columns]
+
+        assignments = [f"{qi(col)} = EXCLUDED.{qi(col)}" for col in update_columns]
+        assignments += [f"{qi(col)} = NOW()" for col in touch_columns or []]
+        if assignments:
+            set_clause = ", ".join(assignments)
+            sql += f" ON CONFLICT ({conflict_cols}) DO UPDATE SET {set_clause}"
+        else:
+            sql += f" ON CONFLICT ({conflict_cols}) DO NOTHING"
+
+    return (
+        f"WITH merged AS ({sql} RETURNING (xmax = 0) AS inserted) "
+        "SELECT COUNT(*) FILTER (WHERE inserted), COUNT(*) FILTER (WHERE NOT inserted) "
+        "FROM merged"
+    )
+
+
+def _array_columns(db: Session, table_name: str, columns: List[str]) -> Set[str]:
+    """Columns of the target table with a PostgreSQL array type."""
+    rows = db.execute(
+        text("""
+            SELECT a.attname FROM pg_attribute a
+            JOIN pg_type t ON t.oid = a.atttypid
+            WHERE a.attrelid = CAST(:table AS regclass)
+              AND a.attnum > 0 AND NOT a.attisdropped
+              AND t.typcategory = 'A'
+        """),
+        {"table": qi(table_name)},
+    ).fetchall()
+    return {r[0] for r in rows} & set(columns)
+
+
+def _copy_rows(
+    db: Session,
+    staging_table: str,
+    rows: List[Dict[str, Any]],
+    columns: List[str],
+    array_columns: Optional[Set[str]] = None,
+) -> None:
+    """COPY rows into the staging table using the raw psycopg2 cursor."""
+    buffer = _rows_to_copy_buffer(rows, columns, array_columns)
+    cols = ", ".join(qi(c) for c in columns + ["_copy_seq"])
+    copy_sql = f"COPY {qi(staging_table)} ({cols}) FROM STDIN"
+
+    raw_conn = db.connection().connection
+    cursor = raw_conn.cursor()
+    try:
+        cursor.copy_expert(copy_sql, buffer)
+    finally:
+        cursor.close()
+
+
+def _rows_to_copy_buffer(
+    rows: List[Dict[str, Any]],
+    columns: List[str],
+    array_columns: Optional[Set[str]] = None,
+) -> io.StringIO:
+    """
+    Serialize rows to PostgreSQL COPY text format.
+
+    Each line carries the requested columns followed by the row's ordinal
+    (``_copy_seq``). NULL is written as ``\\N``. Lists in ``array_columns``
+    are written as array literals, other lists and dicts as JSON.
+    """
+    array_columns = array_columns or set()
+    as_array = [col in array_columns for col in columns]
+    buffer = io.StringIO()
+    for seq, row in enumerate(rows):
+        fields = [_copy_value(row.get(col), arr) for col, arr in zip(columns, as_array)]
+        fields.append(str(seq))
+        buffer.write("\t".join(fields))
+        buffer.write("\n")
+    buffer.seek(0)
+    return buffer
+
+
+def _array_literal(values: Any) -> str:
+    """PostgreSQL array literal, e.g. ``{"a","b c",NULL}`` (nested lists nest)."""
+    items = []
+    for item in values:
+        if item is None:
+            items.append("NULL")
+        elif isinstance(item, (list, tuple)):
+            items.append(_array_literal(item))
+        else:
+            if isinstance(item, bool):
+                item = "t" if item else "f"
+            elif isinstance(item, (datetime, date)):
+                item = item.isoformat()
+            elif isinstance(item, dict):
+                item = json.dumps(item, default=str)
+            escaped = str(item).replace("\\", "\\\\").replace('"', '\\"')
+            items.append(f'"{escaped}"')
+    return "{" + ",".join(items) + "}"
+
+
+def _copy_value(value: Any, as_array: bool = False) -> str:
+    """Format a single Python value for COPY text format."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if as_array and isinstance(value, (list, tuple)):
+        value = _array_literal(value)
+    elif isinstance(value, (dict, list)):
+        value = json.dumps(value, default=str)
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
 def batch_insert_with_returning(
     db: Session,
     table_name: str,
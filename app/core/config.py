@@ -146,6 +146,21 @@ class Settings(BaseSettings):
         description="Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)",
     )
 
+    # API startup
+    router_profile: str = Field(
+        default="full",
+        description="Routers to mount: full, ingest (core + data sources) or api (core + analytics)",
+    )
+    router_loading: str = Field(
+        default="eager",
+        description="eager: import all routers at startup; lazy: on first request to their path",
+    )
+    run_migrations_on_startup: bool = Field(
+        default=True,
+        description="Create tables and apply migrations in the API lifespan "
+        "(disable when `python -m app.core.migrate` runs before deploy)",
+    )
+
     # Testing
     run_integration_tests: bool = Field(
         default=False,
@@ -177,6 +192,25 @@ class Settings(BaseSettings):
             raise ValueError(f"log_level must be one of {valid_levels}")
         return v_upper
 
+    @field_validator("router_profile")
+    @classmethod
+    def validate_router_profile(cls, v: str) -> str:
+        """Validate the router profile is a known deployment profile."""
+        valid_profiles = {"full", "ingest", "api"}
+        v_lower = v.lower()
+        if v_lower not in valid_profiles:
+            raise ValueError(f"router_profile must be one of {valid_profiles}")
+        return v_lower
+
+    @field_validator("router_loading")
+    @classmethod
+    def validate_router_loading(cls, v: str) -> str:
+        """Validate the router loading mode."""
+        v_lower = v.lower()
+        if v_lower not in {"eager", "lazy"}:
+            raise ValueError("router_loading must be 'eager' or 'lazy'")
+        return v_lower
+
     def require_census_api_key(self) -> str:
         """
         Get Census API key, raising clear error if missing.
@@ -0,0 +1,41 @@
+"""
+Offload hook for CPU-bound stages in async ingestion code.
+
+Collectors and ingestors mark CPU-heavy stages (HTML cleaning, XBRL
+parsing) with ``await run_cpu_bound(func, *args)``. By default this is a
+plain synchronous call. A host process that owns a process pool - the job
+worker, see app/worker/process_lane.py - installs a runner with
+set_cpu_runner() so those stages run off its event loop.
+
+Keeping the hook here means source modules never import the worker.
+"""
+
+from typing import Any, Awaitable, Callable, Optional
+
+CpuRunner = Callable[..., Awaitable[Any]]
+
+_runner: Optional[CpuRunner] = None
+
+
+def set_cpu_runner(runner: Optional[CpuRunner]) -> None:
+    """Install (or with None, remove) the runner used by run_cpu_bound."""
+    global _runner
+    _runner = runner
+
+
+def get_cpu_runner() -> Optional[CpuRunner]:
+    return _runner
+
+
+async def run_cpu_bound(func: Callable, *args, **kwargs) -> Any:
+    """
+    Run a CPU-bound stage through the installed runner, else inline.
+
+    ``func`` and its arguments must be picklable (module-level functions or
+    methods of picklable objects), since a runner may send them to another
+    process.
+    """
+    runner = _runner
+    if runner is None:
+        return func(*args, **kwargs)
+    return await runner(func, *args, **kwargs)
@@ -3,21 +3,30 @@ Data Profiling Engine.
 
 Auto-profiles database tables after ingestion, computing per-column statistics
 and storing snapshots for historical comparison and drift detection.
+
+Incremental mode (used by the post-ingestion hook) keeps mergeable column
+sketches on each snapshot and only reads rows past the previous snapshot's
+watermark, falling back to a full sketch of the table periodically or when
+the row counts no longer reconcile (deletes, schema changes).
 """
 
 import logging
 import time
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
 
+import pandas as pd
 from sqlalchemy import text
-from sqlalchemy.orm import Session
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session, sessionmaker
 
 from app.core.models import (
     DataProfileSnapshot,
     DataProfileColumn,
     DatasetRegistry,
 )
+from app.core.profile_sketches import ColumnSketch
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +34,25 @@ logger = logging.getLogger(__name__)
 SAMPLE_THRESHOLD = 1_000_000
 SAMPLE_PCT = 10  # BERNOULLI percentage for large tables
 
+# Wide-scan planner: columns aggregated by one query, cap on the pooled
+# connections one table may hold, and default time budget per profile
+MAX_COLUMNS_PER_SCAN = 32
+MAX_PARALLEL_GROUPS = 4
+PROFILE_TIME_BUDGET_S = 300.0
+
+# Profile modes stored on DataProfileSnapshot.profile_mode
+PROFILE_MODE_FULL = "full"
+PROFILE_MODE_FULL_SKETCH = "full_sketch"
+PROFILE_MODE_INCREMENTAL = "incremental"
+
+# Incremental profiling: re-sketch the whole table at least this often
+FULL_PROFILE_MAX_AGE = timedelta(days=7)
+FULL_PROFILE_EVERY = 50  # incremental runs between full sketches
+STREAM_CHUNK_ROWS = 50_000
+
+# Insert-time columns usable as a watermark when there is no serial key
+WATERMARK_COLUMNS = ("ingested_at", "created_at")
+
 
 # =============================================================================
 # Column type classification
@@ -91,7 +119,8 @@ def _get_schema_info(db: Session, table_name: str) -> List[Dict[str, Any]]:
     rows = db.execute(
         text("""
             SELECT column_name, data_type, is_nullable,
-                   udt_name, character_maximum_length
+                   udt_name, character_maximum_length,
+                   column_default, is_identity
             FROM information_schema.columns
             WHERE table_name = :table
               AND table_schema = 'public'
@@ -107,94 +136,333 @@ def _get_schema_info(db: Session, table_name: str) -> List[Dict[str, Any]]:
             "udt_name": r[3],
             "nullable": r[2] == "YES",
             "max_length": r[4],
+            "default": r[5],
+            "identity": r[6] == "YES",
         }
         for r in rows
     ]
 
 
-def _build_numeric_stats_sql(col: str, from_clause: str) -> str:
-    """Build SQL for numeric column statistics."""
+def _column_aggregates(col: str, kind: str) -> List[str]:
+    """Aggregate expressions for one column in a wide scan.
+
+    Always starts with COUNT(col); comparable columns add COUNT(DISTINCT col)
+    followed by the type-specific stats (numeric moments and percentiles,
+    string lengths, temporal range).
+    """
     safe_col = f'"{col}"'
-    return f"""
-        SELECT
-            COUNT(*) AS total,
-            COUNT({safe_col}) AS non_null,
-            COUNT(*) - COUNT({safe_col}) AS null_count,
-            COUNT(DISTINCT {safe_col}) AS distinct_count,
-            MIN({safe_col}::numeric) AS min_val,
-            MAX({safe_col}::numeric) AS max_val,
-            AVG({safe_col}::numeric) AS mean_val,
-            STDDEV({safe_col}::numeric) AS stddev_val,
-            PERCENTILE_CONT(0.25) WITHIN GROUP (ORDER BY {safe_col}::numeric) AS p25,
-            PERCENTILE_CONT(0.50) WITHIN GROUP (ORDER BY {safe_col}::numeric) AS median_val,
-            PERCENTILE_CONT(0.75) WITHIN GROUP (ORDER BY {safe_col}::numeric) AS p75
-        FROM {from_clause}
+    if kind == "skip":
+        return [f"COUNT({safe_col})"]
+    aggregates = [f"COUNT({safe_col})", f"COUNT(DISTINCT {safe_col})"]
+    if kind == "numeric":
+        aggregates += [
+            f"MIN({safe_col}::numeric)",
+            f"MAX({safe_col}::numeric)",
+            f"AVG({safe_col}::numeric)",
+            f"STDDEV({safe_col}::numeric)",
+            f"PERCENTILE_CONT(0.25) WITHIN GROUP (ORDER BY {safe_col}::numeric)",
+            f"PERCENTILE_CONT(0.50) WITHIN GROUP (ORDER BY {safe_col}::numeric)",
+            f"PERCENTILE_CONT(0.75) WITHIN GROUP (ORDER BY {safe_col}::numeric)",
+        ]
+    elif kind == "string":
+        aggregates += [
+            f"MIN(LENGTH({safe_col}::text))",
+            f"MAX(LENGTH({safe_col}::text))",
+            f"AVG(LENGTH({safe_col}::text))",
+        ]
+    elif kind == "temporal":
+        aggregates += [
+            f"MIN({safe_col})",
+            f"MAX({safe_col})",
+            f"EXTRACT(DAY FROM MAX({safe_col}) - MIN({safe_col}))",
+        ]
+    return aggregates
+
+
+def _build_wide_stats_sql(
+    group: List[Dict[str, Any]], from_clause: str
+) -> Tuple[str, List[Tuple[int, int]]]:
+    """Build one aggregate query covering every column in the group.
+
+    Returns the SQL and, per column, the (offset, width) of its aggregates in
+    the result row. Column 0 of the row is COUNT(*).
     """
+    select = ["COUNT(*)"]
+    layout = []
+    for col_info in group:
+        aggregates = _column_aggregates(col_info["name"], col_info["kind"])
+        layout.append((len(select), len(aggregates)))
+        select.extend(aggregates)
+    sql = "SELECT\n    " + ",\n    ".join(select) + f"\nFROM {from_clause}"
+    return sql, layout
+
+
+def _get_top_values_multi(
+    db: Session, cols: List[str], from_clause: str, limit: int = 10
+) -> Dict[str, List[Dict]]:
+    """Top N most frequent values for several columns in one scan.
+
+    Uses GROUPING SETS so the table is read once for all columns; the column
+    each group belongs to is recovered from GROUPING().
+    """
+    if not cols:
+        return {}
+    safe_cols = [f'"{c}"' for c in cols]
+    col_idx = "CASE " + " ".join(
+        f"WHEN GROUPING({c}) = 0 THEN {i}" for i, c in enumerate(safe_cols)
+    ) + " END"
+    val = "COALESCE(" + ", ".join(f"{c}::text" for c in safe_cols) + ")"
+    if len(safe_cols) == 1:
+        val = f"{safe_cols[0]}::text"
+    grouping_sets = ", ".join(f"({c})" for c in safe_cols)
+    rows = db.execute(
+        text(f"""
+            SELECT col_idx, val, cnt FROM (
+                SELECT col_idx, val, cnt,
+                       ROW_NUMBER() OVER (PARTITION BY col_idx ORDER BY cnt DESC) AS rn
+                FROM (
+                    SELECT {col_idx} AS col_idx, {val} AS val, COUNT(*) AS cnt
+                    FROM {from_clause}
+                    GROUP BY GROUPING SETS ({grouping_sets})
+                ) grouped
+                WHERE val IS NOT NULL
+            ) ranked
+            WHERE rn <= :lim
+            ORDER BY col_idx, cnt DESC
+        """),
+        {"lim": limit},
+    ).fetchall()
+    top_values: Dict[str, List[Dict]] = {c: [] for c in cols}
+    for r in rows:
+        top_values[cols[int(r[0])]].append({"value": r[1], "count": int(r[2])})
+    return top_values
+
+
+def _parse_column_stats(
+    col_info: Dict[str, Any], total: int, values: List[Any]
+) -> Dict[str, Any]:
+    """Turn one column's slice of a wide-scan row into a column profile."""
+    kind = col_info["kind"]
+    non_null = int(values[0]) if values[0] else 0
+    null_count = total - non_null
+    profile = {
+        "column_name": col_info["name"],
+        "data_type": col_info["type"],
+        "classified_type": kind,
+        "null_count": null_count,
+        "null_pct": round((null_count / total * 100) if total > 0 else 0, 2),
+        "distinct_count": None,
+        "cardinality_ratio": None,
+        "stats": {},
+    }
+    if kind == "skip":
+        return profile
+
+    distinct_count = int(values[1]) if values[1] else 0
+    profile["distinct_count"] = distinct_count
+    profile["cardinality_ratio"] = round((distinct_count / non_null) if non_null > 0 else 0, 4)
+
+    if kind == "numeric":
+        keys = ("min", "max", "mean", "stddev", "p25", "median", "p75")
+        profile["stats"] = {
+            k: float(v) if v is not None else None for k, v in zip(keys, values[2:])
+        }
+    elif kind == "string":
+        profile["stats"] = {
+            "min_length": int(values[2]) if values[2] is not None else None,
+            "max_length": int(values[3]) if values[3] is not None else None,
+            "avg_length": float(values[4]) if values[4] is not None else None,
+            "top_values": [],
+        }
+    elif kind == "temporal":
+        profile["stats"] = {
+            "min_date": str(values[2]) if values[2] is not None else None,
+            "max_date": str(values[3]) if values[3] is not None else None,
+            "date_range_days": float(values[4]) if values[4] is not None else None,
+        }
+    return profile
 
 
-def _build_string_stats_sql(col: str, from_clause: str) -> str:
-    """Build SQL for string column statistics."""
-    safe_col = f'"{col}"'
-    return f"""
-        SELECT
-            COUNT(*) AS total,
-            COUNT({safe_col}) AS non_null,
-            COUNT(*) - COUNT({safe_col}) AS null_count,
-            COUNT(DISTINCT {safe_col}) AS distinct_count,
-            MIN(LENGTH({safe_col}::text)) AS min_length,
-            MAX(LENGTH({safe_col}::text)) AS max_length,
-            AVG(LENGTH({safe_col}::text)) AS avg_length
-        FROM {from_clause}
-    """
+# =============================================================================
+# Wide-scan planner
+# =============================================================================
 
+def _plan_column_groups(
+    columns: List[Dict[str, Any]], max_columns: Optional[int] = None
+) -> List[List[Dict[str, Any]]]:
+    """Split a table's columns into groups profiled by one wide scan each.
 
-def _build_temporal_stats_sql(col: str, from_clause: str) -> str:
-    """Build SQL for temporal column statistics."""
-    safe_col = f'"{col}"'
-    return f"""
-        SELECT
-            COUNT(*) AS total,
-            COUNT({safe_col}) AS non_null,
-            COUNT(*) - COUNT({safe_col}) AS null_count,
-            COUNT(DISTINCT {safe_col}) AS distinct_count,
-            MIN({safe_col}) AS min_date,
-            MAX({safe_col}) AS max_date,
-            EXTRACT(DAY FROM MAX({safe_col}) - MIN({safe_col})) AS date_range_days
-        FROM {from_clause}
+    Each column dict is copied with its classified "kind". Numeric columns
+    (three percentile sorts each) are dealt round-robin across groups so no
+    single scan carries all the expensive aggregates.
     """
+    classified = [
+        {**c, "kind": _classify_column_type(c.get("udt_name") or c["type"])}
+        for c in columns
+    ]
+    max_columns = max_columns or MAX_COLUMNS_PER_SCAN
+    n_groups = max(1, -(-len(classified) // max_columns))
+    groups: List[List[Dict[str, Any]]] = [[] for _ in range(n_groups)]
+    numeric = [c for c in classified if c["kind"] == "numeric"]
+    rest = [c for c in classified if c["kind"] != "numeric"]
+    for i, col in enumerate(numeric):
+        groups[i % n_groups].append(col)
+    for col in rest:
+        min(groups, key=len).append(col)
+    return [g for g in groups if g]
+
+
+def _set_statement_timeout(db: Session, timeout_ms: Optional[int]) -> None:
+    """Bound the next queries of this transaction (PostgreSQL only)."""
+    if db.get_bind().dialect.name != "postgresql":
+        return
+    value = "DEFAULT" if timeout_ms is None else str(max(1, int(timeout_ms)))
+    db.execute(text(f"SET LOCAL statement_timeout = {value}"))
+
+
+def _profile_column_group(
+    db: Session,
+    group: List[Dict[str, Any]],
+    from_clause: str,
+    deadline: Optional[float],
+    cost: Dict[str, Any],
+) -> Tuple[Optional[int], List[Dict[str, Any]]]:
+    """Profile a column group with one wide scan plus one top-values scan.
+
+    If the wide scan fails (e.g. one column can't be aggregated) the group
+    is retried column by column so a single bad column only loses itself.
+    Columns not reached before the deadline are added to
+    cost["skipped_columns"]. Returns (scanned row count, column profiles).
+    """
+    if deadline is not None and time.time() >= deadline:
+        cost["budget_exhausted"] = True
+        cost["skipped_columns"].extend(c["name"] for c in group)
+        return None, []
 
+    group_start = time.time()
+    try:
+        if deadline is not None:
+            _set_statement_timeout(db, (deadline - time.time()) * 1000)
+        sql, layout = _build_wide_stats_sql(group, from_clause)
+        row = db.execute(text(sql)).fetchone()
+        cost["queries"] += 1
+        total = int(row[0]) if row[0] else 0
+        profiles = [
+            _parse_column_stats(col_info, total, list(row[offset:offset + width]))
+            for col_info, (offset, width) in zip(group, layout)
+        ]
+
+        string_cols = [c["name"] for c in group if c["kind"] == "string"]
+        if string_cols:
+            try:
+                top_values = _get_top_values_multi(db, string_cols, from_clause)
+                cost["queries"] += 1
+                for profile in profiles:
+                    if profile["column_name"] in top_values:
+                        profile["stats"]["top_values"] = top_values[profile["column_name"]]
+            except Exception as e:
+                db.rollback()
+                logger.warning(f"Error fetching top values for {string_cols}: {e}")
+        cost["group_ms"].append(int((time.time() - group_start) * 1000))
+        return total, profiles
 
-def _build_basic_stats_sql(col: str, from_clause: str) -> str:
-    """Build SQL for columns with unknown type (basic null/distinct counts)."""
-    safe_col = f'"{col}"'
-    return f"""
-        SELECT
-            COUNT(*) AS total,
-            COUNT({safe_col}) AS non_null,
-            COUNT(*) - COUNT({safe_col}) AS null_count,
-            COUNT(DISTINCT {safe_col}) AS distinct_count
-        FROM {from_clause}
-    """
+    except Exception as e:
+        db.rollback()  # Recover from failed SQL transaction
+        cost["queries"] += 1
+        if deadline is not None and time.time() >= deadline:
+            cost["budget_exhausted"] = True
+            cost["skipped_columns"].extend(c["name"] for c in group)
+            return None, []
+        if len(group) == 1:
+            logger.warning(f"Error profiling column {group[0]['name']}: {e}")
+            return None, []
+        logger.warning(f"Wide profiling scan failed ({len(group)} columns), retrying per column: {e}")
+        total, profiles = None, []
+        for col_info in group:
+            col_total, col_profiles = _profile_column_group(
+                db, [col_info], from_clause, deadline, cost
+            )
+            total = col_total if col_total is not None else total
+            profiles.extend(col_profiles)
+        return total, profiles
 
 
-def _get_top_values(db: Session, table_name: str, col: str, from_clause: str, limit: int = 10) -> List[Dict]:
-    """Get top N most frequent values for a column."""
-    safe_col = f'"{col}"'
-    try:
-        rows = db.execute(
-            text(f"""
-                SELECT {safe_col}::text AS val, COUNT(*) AS cnt
-                FROM {from_clause}
-                WHERE {safe_col} IS NOT NULL
-                GROUP BY {safe_col}
-                ORDER BY cnt DESC
-                LIMIT :lim
-            """),
-            {"lim": limit},
-        ).fetchall()
-        return [{"value": r[0], "count": int(r[1])} for r in rows]
-    except Exception:
-        return []
+def _profile_groups_parallel(
+    db: Session,
+    groups: List[List[Dict[str, Any]]],
+    from_clause: str,
+    deadline: Optional[float],
+    cost: Dict[str, Any],
+    workers: int,
+) -> Tuple[Optional[int], List[Dict[str, Any]]]:
+    """Run column groups concurrently, each on its own pooled connection."""
+    SessionFactory = sessionmaker(bind=db.get_bind(), autocommit=False, autoflush=False)
+
+    def run(group: List[Dict[str, Any]]) -> Tuple[Optional[int], List[Dict[str, Any]], Dict[str, Any]]:
+        group_cost = _new_cost()
+        session = SessionFactory()
+        try:
+            total, profiles = _profile_column_group(session, group, from_clause, deadline, group_cost)
+            session.rollback()  # read-only; ends the transaction and its timeout
+            return total, profiles, group_cost
+        finally:
+            session.close()
+
+    total, by_name = None, {}
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="profile") as pool:
+        for group_total, profiles, group_cost in pool.map(run, groups):
+            total = group_total if group_total is not None else total
+            by_name.update((p["column_name"], p) for p in profiles)
+            cost["queries"] += group_cost["queries"]
+            cost["group_ms"].extend(group_cost["group_ms"])
+            cost["skipped_columns"].extend(group_cost["skipped_columns"])
+            cost["budget_exhausted"] |= group_cost["budget_exhausted"]
+    ordered = [by_name[c["name"]] for g in groups for c in g if c["name"] in by_name]
+    return total, ordered
+
+
+def _new_cost() -> Dict[str, Any]:
+    return {"queries": 0, "group_ms": [], "skipped_columns": [], "budget_exhausted": False}
+
+
+def _profile_columns(
+    db: Session,
+    table_name: str,
+    columns: List[Dict[str, Any]],
+    from_clause: str,
+    start_time: float,
+    time_budget_s: Optional[float],
+    parallel_groups: int,
+) -> Tuple[Optional[int], List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Profile all columns with a few wide scans instead of ~2 queries per column.
+
+    Returns (scanned row count or None, column profiles, cost metrics). The
+    cost dict is stored on the snapshot as profile_cost.
+    """
+    groups = _plan_column_groups(columns)
+    deadline = start_time + time_budget_s if time_budget_s is not None else None
+    workers = max(1, min(parallel_groups, MAX_PARALLEL_GROUPS, len(groups)))
+    cost = _new_cost()
+    cost.update(column_groups=len(groups), parallel=workers, time_budget_s=time_budget_s)
+
+    if workers > 1:
+        total, profiles = _profile_groups_parallel(db, groups, from_clause, deadline, cost, workers)
+    else:
+        total, profiles = None, []
+        for group in groups:
+            group_total, group_profiles = _profile_column_group(db, group, from_clause, deadline, cost)
+            total = group_total if group_total is not None else total
+            profiles.extend(group_profiles)
+        if deadline is not None:
+            _set_statement_timeout(db, None)
+
+    if cost["budget_exhausted"]:
+        logger.warning(
+            f"Profiling time budget ({time_budget_s}s) exhausted for {table_name}: "
+            f"{len(cost['skipped_columns'])} columns not profiled"
+        )
+    return total, profiles, cost
 
 
 # =============================================================================
@@ -207,12 +475,29 @@ def profile_table(
     job_id: Optional[int] = None,
     source: Optional[str] = None,
     domain: Optional[str] = None,
+    incremental: bool = False,
+    time_budget_s: Optional[float] = PROFILE_TIME_BUDGET_S,
+    parallel_groups: int = 1,
 ) -> Optional[DataProfileSnapshot]:
     """
     Profile a single table. Computes per-column statistics and stores a snapshot.
 
     Uses TABLESAMPLE BERNOULLI(10) for tables > 1M rows.
     Uses pg_try_advisory_lock to prevent concurrent profiling of same table.
+
+    Columns are profiled by a few wide aggregate scans (see _profile_columns)
+    rather than one query per column. parallel_groups > 1 runs the column
+    groups on separate pooled connections (capped at MAX_PARALLEL_GROUPS).
+    Columns not reached within time_budget_s are left out of the snapshot and
+    listed in its profile_cost.
+
+    With incremental=True, tables that have a watermark column (serial key or
+    ingested_at/created_at) are profiled from mergeable sketches: only rows
+    past the previous snapshot's watermark are read (see
+    _profile_with_sketches). Other tables get the regular full profile.
+    A sketch pass can't keep partial columns, so if it runs past
+    time_budget_s nothing is stored and None is returned; the previous
+    sketches stay in place for the next run.
     """
     start_time = time.time()
 
@@ -247,6 +532,19 @@ def profile_table(
             logger.warning(f"No columns found for {table_name}")
             return None
 
+        if incremental:
+            try:
+                snapshot = _profile_with_sketches(
+                    db, table_name, columns, job_id, source, domain, start_time,
+                    time_budget_s=time_budget_s,
+                )
+            except SketchBudgetExceeded as e:
+                db.rollback()
+                logger.warning(f"Profiling time budget ({time_budget_s}s) exhausted for {table_name}: {e}")
+                return None
+            if snapshot is not None:
+                return snapshot
+
         # Determine if sampling is needed
         estimated_rows = _get_table_row_count_estimate(db, table_name)
         use_sampling = estimated_rows > SAMPLE_THRESHOLD
@@ -256,156 +554,28 @@ def profile_table(
             else f'"{table_name}"'
         )
 
-        # Get actual row count
-        row_count_result = db.execute(
-            text(f'SELECT COUNT(*) FROM "{table_name}"')
-        ).scalar()
-        row_count = int(row_count_result) if row_count_result else 0
-
-        # Profile each column
-        column_profiles = []
-        total_null_count = 0
-
-        for col_info in columns:
-            col_name = col_info["name"]
-            col_type = _classify_column_type(col_info.get("udt_name", col_info["type"]))
-
-            # Skip non-comparable types (json, jsonb, xml, etc.)
-            if col_type == "skip":
-                # Only count nulls for these columns
-                try:
-                    safe_col = f'"{col_name}"'
-                    null_result = db.execute(
-                        text(f'SELECT COUNT(*) - COUNT({safe_col}) FROM {from_clause}')
-                    ).scalar()
-                    nc = int(null_result) if null_result else 0
-                    total_null_count += nc
-                    column_profiles.append({
-                        "column_name": col_name,
-                        "data_type": col_info["type"],
-                        "classified_type": col_type,
-                        "null_count": nc,
-                        "null_pct": round((nc / row_count * 100) if row_count > 0 else 0, 2),
-                        "distinct_count": None,
-                        "cardinality_ratio": None,
-                        "stats": {},
-                    })
-                except Exception:
-                    db.rollback()
-                continue
-
-            try:
-                if col_type == "numeric":
-                    sql = _build_numeric_stats_sql(col_name, from_clause)
-                elif col_type == "string":
-                    sql = _build_string_stats_sql(col_name, from_clause)
-                elif col_type == "temporal":
-                    sql = _build_temporal_stats_sql(col_name, from_clause)
-                else:
-                    sql = _build_basic_stats_sql(col_name, from_clause)
-
-                result = db.execute(text(sql)).fetchone()
-                if not result:
-                    continue
-
-                total = int(result[0]) if result[0] else 0
-                non_null = int(result[1]) if result[1] else 0
-                null_count = int(result[2]) if result[2] else 0
-                distinct_count = int(result[3]) if result[3] else 0
-
-                total_null_count += null_count
-                null_pct = (null_count / total * 100) if total > 0 else 0
-                cardinality = (distinct_count / non_null) if non_null > 0 else 0
-
-                # Build type-specific stats
-                stats = {}
-                if col_type == "numeric" and len(result) >= 11:
-                    stats = {
-                        "min": float(result[4]) if result[4] is not None else None,
-                        "max": float(result[5]) if result[5] is not None else None,
-                        "mean": float(result[6]) if result[6] is not None else None,
-                        "stddev": float(result[7]) if result[7] is not None else None,
-                        "p25": float(result[8]) if result[8] is not None else None,
-                        "median": float(result[9]) if result[9] is not None else None,
-                        "p75": float(result[10]) if result[10] is not None else None,
-                    }
-                elif col_type == "string" and len(result) >= 7:
-                    stats = {
-                        "min_length": int(result[4]) if result[4] is not None else None,
-                        "max_length": int(result[5]) if result[5] is not None else None,
-                        "avg_length": float(result[6]) if result[6] is not None else None,
-                        "top_values": _get_top_values(db, table_name, col_name, from_clause),
-                    }
-                elif col_type == "temporal" and len(result) >= 7:
-                    stats = {
-                        "min_date": str(result[4]) if result[4] is not None else None,
-                        "max_date": str(result[5]) if result[5] is not None else None,
-                        "date_range_days": float(result[6]) if result[6] is not None else None,
-                    }
-
-                column_profiles.append({
-                    "column_name": col_name,
-                    "data_type": col_info["type"],
-                    "classified_type": col_type,
-                    "null_count": null_count,
-                    "null_pct": round(null_pct, 2),
-                    "distinct_count": distinct_count,
-                    "cardinality_ratio": round(cardinality, 4),
-                    "stats": stats,
-                })
-
-            except Exception as e:
-                db.rollback()  # Recover from failed SQL transaction
-                logger.warning(f"Error profiling column {col_name} in {table_name}: {e}")
-                continue
-
-        # Compute overall completeness
-        total_cells = row_count * len(columns) if columns else 1
-        overall_completeness = ((total_cells - total_null_count) / total_cells * 100) if total_cells > 0 else 0
-
-        execution_time_ms = int((time.time() - start_time) * 1000)
-
-        # Create snapshot
-        snapshot = DataProfileSnapshot(
-            table_name=table_name,
-            source=source,
-            domain=domain,
-            job_id=job_id,
-            row_count=row_count,
-            column_count=len(columns),
-            total_null_count=total_null_count,
-            overall_completeness_pct=round(overall_completeness, 2),
-            schema_snapshot=[
-                {"name": c["name"], "type": c["type"], "nullable": c["nullable"]}
-                for c in columns
-            ],
-            profiled_at=datetime.utcnow(),
-            execution_time_ms=execution_time_ms,
+        scanned_rows, column_profiles, cost = _profile_columns(
+            db, table_name, columns, from_clause, start_time,
+            time_budget_s=time_budget_s, parallel_groups=parallel_groups,
         )
-        db.add(snapshot)
-        db.flush()  # Get the ID
-
-        # Create column profiles
-        for cp in column_profiles:
-            col_record = DataProfileColumn(
-                snapshot_id=snapshot.id,
-                column_name=cp["column_name"],
-                data_type=cp["data_type"],
-                null_count=cp["null_count"],
-                null_pct=cp["null_pct"],
-                distinct_count=cp["distinct_count"],
-                cardinality_ratio=cp["cardinality_ratio"],
-                stats=cp["stats"],
-            )
-            db.add(col_record)
-
-        db.commit()
-
-        logger.info(
-            f"Profiled {table_name}: {row_count} rows, {len(columns)} columns, "
-            f"{overall_completeness:.1f}% complete ({execution_time_ms}ms)"
+        cost["sampled"] = use_sampling
+
+        # Sampled scans don't see every row; count them separately
+        if use_sampling or scanned_rows is None:
+            row_count_result = db.execute(
+                text(f'SELECT COUNT(*) FROM "{table_name}"')
+            ).scalar()
+            row_count = int(row_count_result) if row_count_result else 0
+            cost["queries"] += 1
+        else:
+            row_count = scanned_rows
+
+        return _store_snapshot(
+            db, table_name, columns, column_profiles, row_count,
+            job_id=job_id, source=source, domain=domain,
+            start_time=start_time, profile_mode=PROFILE_MODE_FULL,
+            profile_cost=cost,
         )
-        return snapshot
 
     except Exception as e:
         db.rollback()
@@ -416,6 +586,445 @@ def profile_table(
         db.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": lock_key})
 
 
+def _store_snapshot(
+    db: Session,
+    table_name: str,
+    columns: List[Dict[str, Any]],
+    column_profiles: List[Dict[str, Any]],
+    row_count: int,
+    job_id: Optional[int],
+    source: Optional[str],
+    domain: Optional[str],
+    start_time: float,
+    profile_mode: str,
+    watermark: Optional[Dict[str, Any]] = None,
+    profile_cost: Optional[Dict[str, Any]] = None,
+) -> DataProfileSnapshot:
+    """Store a snapshot and its column profiles, and commit."""
+    total_null_count = sum(cp["null_count"] for cp in column_profiles)
+
+    # Compute overall completeness
+    total_cells = row_count * len(columns) if columns else 1
+    overall_completeness = ((total_cells - total_null_count) / total_cells * 100) if total_cells > 0 else 0
+
+    execution_time_ms = int((time.time() - start_time) * 1000)
+
+    # Create snapshot
+    snapshot = DataProfileSnapshot(
+        table_name=table_name,
+        source=source,
+        domain=domain,
+        job_id=job_id,
+        row_count=row_count,
+        column_count=len(columns),
+        total_null_count=total_null_count,
+        overall_completeness_pct=round(overall_completeness, 2),
+        schema_snapshot=[
+            {"name": c["name"], "type": c["type"], "nullable": c["nullable"]}
+            for c in columns
+        ],
+        profiled_at=datetime.utcnow(),
+        execution_time_ms=execution_time_ms,
+        profile_mode=profile_mode,
+        watermark=watermark,
+        profile_cost=profile_cost,
+    )
+    db.add(snapshot)
+    db.flush()  # Get the ID
+
+    # Create column profiles
+    for cp in column_profiles:
+        col_record = DataProfileColumn(
+            snapshot_id=snapshot.id,
+            column_name=cp["column_name"],
+            data_type=cp["data_type"],
+            null_count=cp["null_count"],
+            null_pct=cp["null_pct"],
+            distinct_count=cp["distinct_count"],
+            cardinality_ratio=cp["cardinality_ratio"],
+            stats=cp["stats"],
+            sketch=cp.get("sketch"),
+        )
+        db.add(col_record)
+
+    db.commit()
+
+    logger.info(
+        f"Profiled {table_name} ({profile_mode}): {row_count} rows, {len(columns)} columns, "
+        f"{overall_completeness:.1f}% complete ({execution_time_ms}ms)"
+    )
+    return snapshot
+
+
+# =============================================================================
+# Incremental (sketch-based) profiling
+# =============================================================================
+
+def _column_kind(col_info: Dict[str, Any]) -> str:
+    return _classify_column_type(col_info.get("udt_name") or col_info["type"])
+
+
+def _find_watermark_column(columns: List[Dict[str, Any]]) -> Optional[str]:
+    """Pick a column that only grows for new rows: a serial/identity key,
+    else an insert-time timestamp."""
+    for col in columns:
+        default = str(col.get("default") or "")
+        if _column_kind(col) == "numeric" and (col.get("identity") or default.startswith("nextval(")):
+            return col["name"]
+    by_name = {c["name"]: c for c in columns}
+    for name in WATERMARK_COLUMNS:
+        if name in by_name and _column_kind(by_name[name]) == "temporal":
+            return name
+    return None
+
+
+class SketchBudgetExceeded(Exception):
+    """A sketch profile ran past its time budget and was abandoned."""
+
+
+def _bound_by_deadline(db: Session, deadline: Optional[float], step: str) -> None:
+    """Cap the next statements at the time left before deadline.
+
+    Raises SketchBudgetExceeded once the deadline has passed.
+    """
+    if deadline is None:
+        return
+    remaining = deadline - time.time()
+    if remaining <= 0:
+        raise SketchBudgetExceeded(f"out of time before {step}")
+    _set_statement_timeout(db, remaining * 1000)
+
+
+def _is_timeout(error: DBAPIError, deadline: Optional[float]) -> bool:
+    """Whether a failed statement was cancelled by the budget's statement_timeout."""
+    if deadline is None:
+        return False
+    return getattr(error.orig, "pgcode", None) == "57014" or time.time() >= deadline
+
+
+def _sketch_rows(
+    db: Session,
+    table_name: str,
+    columns: List[Dict[str, Any]],
+    watermark_column: str,
+    low: Any,
+    high: Any,
+    sample_pct: Optional[int] = None,
+    deadline: Optional[float] = None,
+) -> Tuple[Dict[str, ColumnSketch], int]:
+    """Stream rows with low < watermark <= high through fresh column sketches.
+
+    low=None sketches every row up to high, including rows whose watermark
+    is NULL. Non-comparable columns are read as "IS NULL" flags only. With
+    sample_pct only a BERNOULLI sample of those rows is read; the returned
+    count is the number of sampled rows. Raises SketchBudgetExceeded if the
+    scan is still running at deadline.
+    """
+    names = [c["name"] for c in columns]
+    kinds = {c["name"]: _column_kind(c) for c in columns}
+    select = ", ".join(
+        f'("{name}" IS NULL) AS "{name}"' if kinds[name] == "skip" else f'"{name}"'
+        for name in names
+    )
+    wm = f'"{watermark_column}"'
+    conditions, params = [], {}
+    if low is not None:
+        conditions.append(f"{wm} > :low")
+        params["low"] = low
+    if high is not None:
+        conditions.append(f"({wm} <= :high OR {wm} IS NULL)")
+        params["high"] = high
+    where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+
+    from_clause = f'"{table_name}"'
+    if sample_pct:
+        from_clause += f" TABLESAMPLE BERNOULLI({int(sample_pct)})"
+
+    sketches = {name: ColumnSketch(kinds[name]) for name in names}
+    row_count = 0
+    _bound_by_deadline(db, deadline, "sketch scan")
+    try:
+        result = db.execute(
+            text(f"SELECT {select} FROM {from_clause}{where}"),
+            params,
+            execution_options={"stream_results": True},
+        )
+        while True:
+            rows = result.fetchmany(STREAM_CHUNK_ROWS)
+            if not rows:
+                break
+            frame = pd.DataFrame.from_records(rows, columns=names)
+            for name in names:
+                sketches[name].update(frame[name])
+            row_count += len(rows)
+            if deadline is not None and time.time() >= deadline:
+                result.close()
+                raise SketchBudgetExceeded(f"sketch scan stopped after {row_count} rows")
+    except DBAPIError as e:
+        if _is_timeout(e, deadline):
+            raise SketchBudgetExceeded(f"sketch scan timed out after {row_count} rows") from e
+        raise
+    return sketches, row_count
+
+
+def _sketch_sample_pct(db: Session, table_name: str) -> Optional[int]:
+    """BERNOULLI percentage for a full sketch, or None to read every row.
+
+    Same threshold as the SQL profile; TABLESAMPLE is PostgreSQL only.
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        return None
+    if _get_table_row_count_estimate(db, table_name) > SAMPLE_THRESHOLD:
+        return SAMPLE_PCT
+    return None
+
+
+def _count_rows(
+    db: Session,
+    table_name: str,
+    watermark_column: str,
+    low: Any,
+    high: Any,
+    deadline: Optional[float] = None,
+) -> int:
+    """Exact number of rows with low < watermark <= high (low=None: all up to high)."""
+    wm = f'"{watermark_column}"'
+    conditions, params = [f"({wm} <= :high OR {wm} IS NULL)"], {"high": high}
+    if low is not None:
+        conditions = [f"{wm} > :low", f"{wm} <= :high"]
+        params["low"] = low
+    _bound_by_deadline(db, deadline, "row count")
+    try:
+        count = db.execute(
+            text(f'SELECT COUNT(*) FROM "{table_name}" WHERE {" AND ".join(conditions)}'),
+            params,
+        ).scalar()
+    except DBAPIError as e:
+        if _is_timeout(e, deadline):
+            raise SketchBudgetExceeded("row count timed out") from e
+        raise
+    return int(count or 0)
+
+
+def _latest_sketch_snapshot(db: Session, table_name: str) -> Optional[DataProfileSnapshot]:
+    return (
+        db.query(DataProfileSnapshot)
+        .filter(
+            DataProfileSnapshot.table_name == table_name,
+            DataProfileSnapshot.profile_mode.in_(
+                [PROFILE_MODE_FULL_SKETCH, PROFILE_MODE_INCREMENTAL]
+            ),
+        )
+        .order_by(DataProfileSnapshot.profiled_at.desc(), DataProfileSnapshot.id.desc())
+        .first()
+    )
+
+
+def _load_sketches(
+    db: Session, snapshot: DataProfileSnapshot, columns: List[Dict[str, Any]]
+) -> Optional[Dict[str, ColumnSketch]]:
+    """Sketches stored on a snapshot, or None if any column lacks a usable one."""
+    stored = {
+        c.column_name: c.sketch
+        for c in db.query(DataProfileColumn).filter(DataProfileColumn.snapshot_id == snapshot.id)
+    }
+    sketches = {}
+    for col in columns:
+        data = stored.get(col["name"])
+        if not data:
+            return None
+        try:
+            sketch = ColumnSketch.from_dict(data)
+        except (KeyError, ValueError, TypeError):
+            return None
+        if sketch.kind != _column_kind(col):
+            return None
+        sketches[col["name"]] = sketch
+    return sketches
+
+
+def _full_profile_reason(
+    db: Session,
+    previous: Optional[DataProfileSnapshot],
+    columns: List[Dict[str, Any]],
+    watermark_column: str,
+) -> Optional[str]:
+    """Why the previous sketches can't be extended (None if they can)."""
+    if previous is None:
+        return "no previous sketches"
+    watermark = previous.watermark or {}
+    if watermark.get("column") != watermark_column or watermark.get("value") is None:
+        return "no usable watermark"
+    schema = [(c["name"], c["type"]) for c in columns]
+    if [(c["name"], c["type"]) for c in previous.schema_snapshot or []] != schema:
+        return "schema changed"
+
+    last_full = (
+        db.query(DataProfileSnapshot)
+        .filter(
+            DataProfileSnapshot.table_name == previous.table_name,
+            DataProfileSnapshot.profile_mode == PROFILE_MODE_FULL_SKETCH,
+        )
+        .order_by(DataProfileSnapshot.profiled_at.desc(), DataProfileSnapshot.id.desc())
+        .first()
+    )
+    if last_full is None or last_full.profiled_at < datetime.utcnow() - FULL_PROFILE_MAX_AGE:
+        return "periodic full re-profile (age)"
+    since_full = (
+        db.query(DataProfileSnapshot)
+        .filter(
+            DataProfileSnapshot.table_name == previous.table_name,
+            DataProfileSnapshot.profile_mode == PROFILE_MODE_INCREMENTAL,
+            DataProfileSnapshot.id > last_full.id,
+        )
+        .count()
+    )
+    if since_full >= FULL_PROFILE_EVERY:
+        return "periodic full re-profile (runs)"
+    return None
+
+
+def _sketch_profiles(
+    columns: List[Dict[str, Any]], sketches: Dict[str, ColumnSketch], row_count: int
+) -> List[Dict[str, Any]]:
+    """Column profiles (same shape as the SQL path) derived from sketches.
+
+    Sketches built from a sample hold fewer rows than row_count: null counts
+    are scaled up, while ratios and distinct counts describe the sample (as
+    on the sampled SQL path).
+    """
+    profiles = []
+    for col in columns:
+        sketch = sketches[col["name"]]
+        sample_nulls, distinct_count, stats = sketch.summarize()
+        sampled = sketch.rows
+        null_pct = (sample_nulls / sampled * 100) if sampled > 0 else 0
+        null_count = sample_nulls
+        if sampled and sampled != row_count:
+            null_count = int(round(sample_nulls * row_count / sampled))
+        non_null = sampled - sample_nulls
+        cardinality = None
+        if distinct_count is not None:
+            cardinality = round(distinct_count / non_null, 4) if non_null > 0 else 0
+        profiles.append({
+            "column_name": col["name"],
+            "data_type": col["type"],
+            "classified_type": sketch.kind,
+            "null_count": null_count,
+            "null_pct": round(null_pct, 2),
+            "distinct_count": distinct_count,
+            "cardinality_ratio": cardinality,
+            "stats": stats,
+            "sketch": sketch.to_dict(),
+        })
+    return profiles
+
+
+def _profile_with_sketches(
+    db: Session,
+    table_name: str,
+    columns: List[Dict[str, Any]],
+    job_id: Optional[int],
+    source: Optional[str],
+    domain: Optional[str],
+    start_time: float,
+    time_budget_s: Optional[float] = None,
+) -> Optional[DataProfileSnapshot]:
+    """
+    Sketch-based profile: merge rows past the previous watermark into the
+    previous snapshot's sketches, or sketch the whole table when that isn't
+    safe (first run, schema change, periodic refresh, counts don't reconcile).
+
+    Returns None when the table has no watermark column. Scans and counts
+    run under a statement_timeout of the time left in time_budget_s
+    (measured from start_time); SketchBudgetExceeded is raised, before
+    anything is stored, once that runs out.
+
+    The count check catches deletes and late-committed rows below the
+    watermark; in-place updates of already-profiled rows are only picked up
+    by the periodic full sketch.
+
+    Tables above SAMPLE_THRESHOLD are sketched from a SAMPLE_PCT BERNOULLI
+    sample, recorded on the watermark; later increments sample new rows at
+    the same rate so the merged sketches stay one uniform sample, and row
+    counts come from COUNT(*).
+    """
+    watermark_column = _find_watermark_column(columns)
+    if watermark_column is None:
+        return None
+    deadline = start_time + time_budget_s if time_budget_s is not None else None
+    wm = f'"{watermark_column}"'
+    _bound_by_deadline(db, deadline, "watermark lookup")
+    high = db.execute(text(f'SELECT MAX({wm}) FROM "{table_name}"')).scalar()
+    if high is not None and not isinstance(high, (int, float)):
+        high = str(high)
+
+    previous = _latest_sketch_snapshot(db, table_name)
+    rows_read = 0
+    reason = _full_profile_reason(db, previous, columns, watermark_column)
+    sketches = None
+    if reason is None:
+        sketches = _load_sketches(db, previous, columns)
+        if sketches is None:
+            reason = "previous sketches unusable"
+
+    sample_pct = None
+    if reason is None:
+        low = previous.watermark["value"]
+        sample_pct = previous.watermark.get("sample_pct")
+        delta, delta_rows = _sketch_rows(
+            db, table_name, columns, watermark_column, low, high, sample_pct, deadline=deadline
+        )
+        rows_read = delta_rows
+        if sample_pct and high is not None:
+            delta_rows = _count_rows(db, table_name, watermark_column, low, high, deadline=deadline)
+        row_count = previous.row_count + delta_rows
+        expected = _count_rows(
+            db, table_name, watermark_column, None, high if high is not None else low,
+            deadline=deadline,
+        )
+        if expected == row_count:
+            for name, sketch in delta.items():
+                sketches[name].merge(sketch)
+            mode = PROFILE_MODE_INCREMENTAL
+            if high is None:
+                high = low
+        else:
+            reason = f"row count drift ({expected} rows, {row_count} profiled)"
+
+    if reason is not None:
+        sample_pct = _sketch_sample_pct(db, table_name)
+        logger.info(
+            f"Full sketch profile of {table_name}: {reason}"
+            + (f" ({sample_pct}% sample)" if sample_pct else "")
+        )
+        sketches, row_count = _sketch_rows(
+            db, table_name, columns, watermark_column, None, high, sample_pct, deadline=deadline
+        )
+        rows_read += row_count
+        if sample_pct:
+            row_count = _count_rows(db, table_name, watermark_column, None, high, deadline=deadline)
+        mode = PROFILE_MODE_FULL_SKETCH
+
+    if deadline is not None:
+        _set_statement_timeout(db, None)
+
+    watermark = {"column": watermark_column, "value": high}
+    if sample_pct:
+        watermark["sample_pct"] = sample_pct
+    return _store_snapshot(
+        db, table_name, columns, _sketch_profiles(columns, sketches, row_count), row_count,
+        job_id=job_id, source=source, domain=domain, start_time=start_time,
+        profile_mode=mode, watermark=watermark,
+        profile_cost={
+            "rows_read": rows_read,
+            "full_profile_reason": reason,
+            "sampled": bool(sample_pct),
+            "time_budget_s": time_budget_s,
+        },
+    )
+
+
 def profile_all_tables(db: Session) -> List[DataProfileSnapshot]:
     """Profile all tables in the dataset registry."""
     registries = db.query(DatasetRegistry).all()
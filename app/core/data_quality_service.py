@@ -3,13 +3,16 @@ Data quality rules engine service.
 
 Provides functionality for defining, evaluating, and reporting on data quality rules.
 Supports various rule types including range checks, null checks, freshness, regex patterns.
+
+Rules targeting the same table are compiled into one aggregate query
+(COUNT(*) FILTER (WHERE ...) per rule) — see evaluate_rules_for_table.
 """
 
 import logging
 import re
 import time
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
 from sqlalchemy.orm import Session
 from sqlalchemy import text
@@ -22,7 +25,7 @@ from app.core.models import (
     RuleSeverity,
     IngestionJob,
 )
-from app.core.safe_sql import qi, safe_operator, safe_int
+from app.core.safe_sql import ALLOWED_OPERATORS, qi, safe_operator, safe_int
 
 logger = logging.getLogger(__name__)
 
@@ -51,31 +54,58 @@ class RuleEvaluationResult:
 
 
 # =============================================================================
-# Rule Evaluators
+# Rule Compiler
 # =============================================================================
+#
+# Column rules are compiled to aggregate expressions over their table so that
+# every rule targeting the same table is answered by ONE scan:
+#
+#   SELECT COUNT("price") AS a0,
+#          COUNT(*) FILTER (WHERE "price" < :r0_min_val) AS a1,
+#          COUNT(*) FILTER (WHERE "state" IS NULL) AS a2, ...
+#   FROM "table"
+#
+# Sample failures are fetched afterwards, only for rules that failed.
+# Regex rules are checked in Python (portable semantics) and share one
+# separate scan per table; custom SQL rules run on their own.
 
 
-def evaluate_range_rule(
-    db: Session, rule: DataQualityRule, table_name: str, column_name: str
-) -> RuleEvaluationResult:
-    """
-    Evaluate a range rule (value must be within min/max).
+@dataclass
+class _CompiledRule:
+    """A rule lowered to aggregates; ``finish`` turns their values into a result."""
+
+    rule: DataQualityRule
+    aggregates: List[str]
+    params: Dict[str, Any]
+    finish: Callable[[Session, List[Any]], RuleEvaluationResult]
+
+
+def _config_error(rule: DataQualityRule, message: str) -> RuleEvaluationResult:
+    return RuleEvaluationResult(
+        rule_id=rule.id,
+        rule_name=rule.name,
+        passed=False,
+        severity=rule.severity,
+        message=message,
+    )
 
-    Parameters:
-        min: Minimum allowed value (optional)
-        max: Maximum allowed value (optional)
-    """
-    start_time = time.time()
+
+def _compile_range(
+    rule: DataQualityRule, table_name: str, column_name: str, p: str = ""
+) -> Union[_CompiledRule, RuleEvaluationResult]:
     params = rule.parameters or {}
     min_val = params.get("min")
     max_val = params.get("max")
+    col = qi(column_name)
 
-    # Build query to check range violations
     conditions = []
+    bind_params = {}
     if min_val is not None:
-        conditions.append(f'{qi(column_name)} < :min_val')
+        conditions.append(f"{col} < :{p}min_val")
+        bind_params[f"{p}min_val"] = min_val
     if max_val is not None:
-        conditions.append(f'{qi(column_name)} > :max_val')
+        conditions.append(f"{col} > :{p}max_val")
+        bind_params[f"{p}max_val"] = max_val
 
     if not conditions:
         return RuleEvaluationResult(
@@ -84,36 +114,20 @@ def evaluate_range_rule(
             passed=True,
             severity=rule.severity,
             message="No range constraints specified",
-            execution_time_ms=int((time.time() - start_time) * 1000),
         )
 
     where_clause = " OR ".join(conditions)
-    query = text(f"""
-        SELECT COUNT(*) as total,
-               SUM(CASE WHEN {where_clause} THEN 1 ELSE 0 END) as violations
-        FROM {qi(table_name)}
-        WHERE {qi(column_name)} IS NOT NULL
-    """)
-
-    try:
-        bind_params = {}
-        if min_val is not None:
-            bind_params["min_val"] = min_val
-        if max_val is not None:
-            bind_params["max_val"] = max_val
-
-        result = db.execute(query, bind_params).fetchone()
-        total = result[0] or 0
-        violations = result[1] or 0
+    expected = f"[{min_val or '-inf'}, {max_val or '+inf'}]"
 
+    def finish(db: Session, values: List[Any]) -> RuleEvaluationResult:
+        total = values[0] or 0
+        violations = values[1] or 0
         passed = violations == 0
-        expected = f"[{min_val or '-inf'}, {max_val or '+inf'}]"
 
-        # Get sample failures if any
         sample_failures = None
         if violations > 0:
             sample_query = text(f"""
-                SELECT {qi(column_name)} FROM {qi(table_name)}
+                SELECT {col} FROM {qi(table_name)}
                 WHERE {where_clause}
                 LIMIT 5
             """)
@@ -134,40 +148,22 @@ def evaluate_range_rule(
             rows_passed=total - violations,
             rows_failed=violations,
             sample_failures=sample_failures,
-            execution_time_ms=int((time.time() - start_time) * 1000),
         )
 
-    except Exception as e:
-        logger.error(f"Error evaluating range rule: {e}")
-        return RuleEvaluationResult(
-            rule_id=rule.id,
-            rule_name=rule.name,
-            passed=False,
-            severity=rule.severity,
-            message=f"Error evaluating rule: {str(e)}",
-            execution_time_ms=int((time.time() - start_time) * 1000),
-        )
-
-
-def evaluate_not_null_rule(
-    db: Session, rule: DataQualityRule, table_name: str, column_name: str
-) -> RuleEvaluationResult:
-    """
-    Evaluate a not-null rule (value must not be null).
-    """
-    start_time = time.time()
-
-    query = text(f"""
-        SELECT COUNT(*) as total,
-               SUM(CASE WHEN {qi(column_name)} IS NULL THEN 1 ELSE 0 END) as nulls
-        FROM {qi(table_name)}
-    """)
+    return _CompiledRule(
+        rule,
+        [f"COUNT({col})", f"COUNT(*) FILTER (WHERE {where_clause})"],
+        bind_params,
+        finish,
+    )
 
-    try:
-        result = db.execute(query).fetchone()
-        total = result[0] or 0
-        nulls = result[1] or 0
 
+def _compile_not_null(
+    rule: DataQualityRule, table_name: str, column_name: str, p: str = ""
+) -> _CompiledRule:
+    def finish(db: Session, values: List[Any]) -> RuleEvaluationResult:
+        total = values[0] or 0
+        nulls = values[1] or 0
         passed = nulls == 0
 
         return RuleEvaluationResult(
@@ -183,52 +179,34 @@ def evaluate_not_null_rule(
             rows_checked=total,
             rows_passed=total - nulls,
             rows_failed=nulls,
-            execution_time_ms=int((time.time() - start_time) * 1000),
-        )
-
-    except Exception as e:
-        logger.error(f"Error evaluating not-null rule: {e}")
-        return RuleEvaluationResult(
-            rule_id=rule.id,
-            rule_name=rule.name,
-            passed=False,
-            severity=rule.severity,
-            message=f"Error evaluating rule: {str(e)}",
-            execution_time_ms=int((time.time() - start_time) * 1000),
         )
 
+    return _CompiledRule(
+        rule,
+        ["COUNT(*)", f"COUNT(*) FILTER (WHERE {qi(column_name)} IS NULL)"],
+        {},
+        finish,
+    )
 
-def evaluate_unique_rule(
-    db: Session, rule: DataQualityRule, table_name: str, column_name: str
-) -> RuleEvaluationResult:
-    """
-    Evaluate a uniqueness rule (values must be unique).
-    """
-    start_time = time.time()
 
-    query = text(f"""
-        SELECT COUNT(*) as total,
-               COUNT(DISTINCT {qi(column_name)}) as unique_count
-        FROM {qi(table_name)}
-        WHERE {qi(column_name)} IS NOT NULL
-    """)
+def _compile_unique(
+    rule: DataQualityRule, table_name: str, column_name: str, p: str = ""
+) -> _CompiledRule:
+    col = qi(column_name)
 
-    try:
-        result = db.execute(query).fetchone()
-        total = result[0] or 0
-        unique_count = result[1] or 0
+    def finish(db: Session, values: List[Any]) -> RuleEvaluationResult:
+        total = values[0] or 0
+        unique_count = values[1] or 0
         duplicates = total - unique_count
-
         passed = duplicates == 0
 
-        # Get sample duplicates
         sample_failures = None
         if duplicates > 0:
             dup_query = text(f"""
-                SELECT {qi(column_name)}, COUNT(*) as cnt
+                SELECT {col}, COUNT(*) as cnt
                 FROM {qi(table_name)}
-                WHERE {qi(column_name)} IS NOT NULL
-                GROUP BY {qi(column_name)}
+                WHERE {col} IS NOT NULL
+                GROUP BY {col}
                 HAVING COUNT(*) > 1
                 LIMIT 5
             """)
@@ -249,41 +227,20 @@ def evaluate_unique_rule(
             rows_passed=unique_count,
             rows_failed=duplicates,
             sample_failures=sample_failures,
-            execution_time_ms=int((time.time() - start_time) * 1000),
-        )
-
-    except Exception as e:
-        logger.error(f"Error evaluating unique rule: {e}")
-        return RuleEvaluationResult(
-            rule_id=rule.id,
-            rule_name=rule.name,
-            passed=False,
-            severity=rule.severity,
-            message=f"Error evaluating rule: {str(e)}",
-            execution_time_ms=int((time.time() - start_time) * 1000),
         )
 
+    return _CompiledRule(rule, [f"COUNT({col})", f"COUNT(DISTINCT {col})"], {}, finish)
 
-def evaluate_row_count_rule(
-    db: Session, rule: DataQualityRule, table_name: str
-) -> RuleEvaluationResult:
-    """
-    Evaluate a row count rule (min/max row count).
 
-    Parameters:
-        min: Minimum required rows (optional)
-        max: Maximum allowed rows (optional)
-    """
-    start_time = time.time()
+def _compile_row_count(
+    rule: DataQualityRule, table_name: str, p: str = ""
+) -> _CompiledRule:
     params = rule.parameters or {}
     min_rows = params.get("min")
     max_rows = params.get("max")
 
-    query = text(f'SELECT COUNT(*) FROM {qi(table_name)}')
-
-    try:
-        result = db.execute(query).fetchone()
-        row_count = result[0] or 0
+    def finish(db: Session, values: List[Any]) -> RuleEvaluationResult:
+        row_count = values[0] or 0
 
         passed = True
         messages = []
@@ -309,68 +266,35 @@ def evaluate_row_count_rule(
             actual_value=str(row_count),
             expected_value=expected,
             rows_checked=row_count,
-            execution_time_ms=int((time.time() - start_time) * 1000),
         )
 
-    except Exception as e:
-        logger.error(f"Error evaluating row count rule: {e}")
-        return RuleEvaluationResult(
-            rule_id=rule.id,
-            rule_name=rule.name,
-            passed=False,
-            severity=rule.severity,
-            message=f"Error evaluating rule: {str(e)}",
-            execution_time_ms=int((time.time() - start_time) * 1000),
-        )
+    return _CompiledRule(rule, ["COUNT(*)"], {}, finish)
 
 
-def evaluate_enum_rule(
-    db: Session, rule: DataQualityRule, table_name: str, column_name: str
-) -> RuleEvaluationResult:
-    """
-    Evaluate an enum rule (value must be in allowed list).
-
-    Parameters:
-        allowed: List of allowed values
-    """
-    start_time = time.time()
+def _compile_enum(
+    rule: DataQualityRule, table_name: str, column_name: str, p: str = ""
+) -> Union[_CompiledRule, RuleEvaluationResult]:
     params = rule.parameters or {}
     allowed = params.get("allowed", [])
 
     if not allowed:
-        return RuleEvaluationResult(
-            rule_id=rule.id,
-            rule_name=rule.name,
-            passed=False,
-            severity=rule.severity,
-            message="No allowed values specified in rule parameters",
-            execution_time_ms=int((time.time() - start_time) * 1000),
-        )
+        return _config_error(rule, "No allowed values specified in rule parameters")
 
-    # Build parameterized query
-    placeholders = ", ".join([f":val_{i}" for i in range(len(allowed))])
-    query = text(f"""
-        SELECT COUNT(*) as total,
-               SUM(CASE WHEN {qi(column_name)} NOT IN ({placeholders}) THEN 1 ELSE 0 END) as violations
-        FROM {qi(table_name)}
-        WHERE {qi(column_name)} IS NOT NULL
-    """)
-
-    try:
-        bind_params = {f"val_{i}": v for i, v in enumerate(allowed)}
-        result = db.execute(query, bind_params).fetchone()
-        total = result[0] or 0
-        violations = result[1] or 0
+    col = qi(column_name)
+    placeholders = ", ".join([f":{p}val_{i}" for i in range(len(allowed))])
+    bind_params = {f"{p}val_{i}": v for i, v in enumerate(allowed)}
 
+    def finish(db: Session, values: List[Any]) -> RuleEvaluationResult:
+        total = values[0] or 0
+        violations = values[1] or 0
         passed = violations == 0
 
-        # Get sample invalid values
         sample_failures = None
         if violations > 0:
             sample_query = text(f"""
-                SELECT DISTINCT {qi(column_name)} FROM {qi(table_name)}
-                WHERE {qi(column_name)} IS NOT NULL
-                  AND {qi(column_name)} NOT IN ({placeholders})
+                SELECT DISTINCT {col} FROM {qi(table_name)}
+                WHERE {col} IS NOT NULL
+                  AND {col} NOT IN ({placeholders})
                 LIMIT 5
             """)
             samples = db.execute(sample_query, bind_params).fetchall()
@@ -390,32 +314,19 @@ def evaluate_enum_rule(
             rows_passed=total - violations,
             rows_failed=violations,
             sample_failures=sample_failures,
-            execution_time_ms=int((time.time() - start_time) * 1000),
         )
 
-    except Exception as e:
-        logger.error(f"Error evaluating enum rule: {e}")
-        return RuleEvaluationResult(
-            rule_id=rule.id,
-            rule_name=rule.name,
-            passed=False,
-            severity=rule.severity,
-            message=f"Error evaluating rule: {str(e)}",
-            execution_time_ms=int((time.time() - start_time) * 1000),
-        )
+    return _CompiledRule(
+        rule,
+        [f"COUNT({col})", f"COUNT(*) FILTER (WHERE {col} NOT IN ({placeholders}))"],
+        bind_params,
+        finish,
+    )
 
 
-def evaluate_freshness_rule(
-    db: Session, rule: DataQualityRule, table_name: str, column_name: str
-) -> RuleEvaluationResult:
-    """
-    Evaluate a freshness rule (data must be recent).
-
-    Parameters:
-        max_age_hours: Maximum age in hours
-        max_age_days: Maximum age in days (alternative)
-    """
-    start_time = time.time()
+def _compile_freshness(
+    rule: DataQualityRule, table_name: str, column_name: str, p: str = ""
+) -> Union[_CompiledRule, RuleEvaluationResult]:
     params = rule.parameters or {}
     max_age_hours = params.get("max_age_hours")
     max_age_days = params.get("max_age_days")
@@ -424,35 +335,14 @@ def evaluate_freshness_rule(
         max_age_hours = max_age_days * 24
 
     if not max_age_hours:
-        return RuleEvaluationResult(
-            rule_id=rule.id,
-            rule_name=rule.name,
-            passed=False,
-            severity=rule.severity,
-            message="No max_age_hours or max_age_days specified",
-            execution_time_ms=int((time.time() - start_time) * 1000),
-        )
+        return _config_error(rule, "No max_age_hours or max_age_days specified")
 
-    cutoff_time = datetime.utcnow() - timedelta(hours=max_age_hours)
-
-    query = text(f"""
-        SELECT MAX({qi(column_name)}) as latest
-        FROM {qi(table_name)}
-    """)
-
-    try:
-        result = db.execute(query).fetchone()
-        latest = result[0]
+    def finish(db: Session, values: List[Any]) -> RuleEvaluationResult:
+        latest = values[0]
+        cutoff_time = datetime.utcnow() - timedelta(hours=max_age_hours)
 
         if latest is None:
-            return RuleEvaluationResult(
-                rule_id=rule.id,
-                rule_name=rule.name,
-                passed=False,
-                severity=rule.severity,
-                message="No data found in table",
-                execution_time_ms=int((time.time() - start_time) * 1000),
-            )
+            return _config_error(rule, "No data found in table")
 
         # Handle different date formats
         if isinstance(latest, str):
@@ -473,20 +363,281 @@ def evaluate_freshness_rule(
             + (" (stale)" if not passed else " (fresh)"),
             actual_value=f"{age_hours:.1f} hours",
             expected_value=f"<= {max_age_hours} hours",
-            execution_time_ms=int((time.time() - start_time) * 1000),
         )
 
-    except Exception as e:
-        logger.error(f"Error evaluating freshness rule: {e}")
+    return _CompiledRule(rule, [f"MAX({qi(column_name)})"], {}, finish)
+
+
+def _compile_comparison(
+    rule: DataQualityRule, table_name: str, column_name: str, p: str = ""
+) -> Union[_CompiledRule, RuleEvaluationResult]:
+    params = rule.parameters or {}
+    operator = params.get("operator")
+    compare_column = params.get("compare_column")
+
+    if not operator or operator not in ALLOWED_OPERATORS:
+        return _config_error(
+            rule, f"Invalid or missing operator. Must be one of: {ALLOWED_OPERATORS}"
+        )
+
+    if not compare_column:
+        return _config_error(rule, "Missing compare_column parameter")
+
+    col, other = qi(column_name), qi(compare_column)
+    both_present = f"{col} IS NOT NULL AND {other} IS NOT NULL"
+    violated = f"NOT ({col} {safe_operator(operator)} {other})"
+
+    def finish(db: Session, values: List[Any]) -> RuleEvaluationResult:
+        total = values[0] or 0
+        violations = values[1] or 0
+        passed = violations == 0
+
+        sample_failures = None
+        if violations > 0:
+            sample_query = text(f"""
+                SELECT {col}, {other}
+                FROM {qi(table_name)}
+                WHERE {both_present}
+                  AND {violated}
+                LIMIT 5
+            """)
+            samples = db.execute(sample_query).fetchall()
+            sample_failures = [
+                f"{column_name}={s[0]}, {compare_column}={s[1]}" for s in samples
+            ]
+
         return RuleEvaluationResult(
             rule_id=rule.id,
             rule_name=rule.name,
-            passed=False,
+            passed=passed,
             severity=rule.severity,
-            message=f"Error evaluating rule: {str(e)}",
-            execution_time_ms=int((time.time() - start_time) * 1000),
+            message=f"Found {violations} rows where {column_name} {operator} {compare_column} is false"
+            if not passed
+            else f"All {total} rows satisfy {column_name} {operator} {compare_column}",
+            actual_value=f"{violations} violations",
+            expected_value=f"{column_name} {operator} {compare_column}",
+            rows_checked=total,
+            rows_passed=total - violations,
+            rows_failed=violations,
+            sample_failures=sample_failures,
         )
 
+    return _CompiledRule(
+        rule,
+        [
+            f"COUNT(*) FILTER (WHERE {both_present})",
+            f"COUNT(*) FILTER (WHERE {both_present} AND {violated})",
+        ],
+        {},
+        finish,
+    )
+
+
+# Rule types answered by the fused aggregate scan; all need column_name
+# except ROW_COUNT.
+_COLUMN_COMPILERS = {
+    RuleType.RANGE: _compile_range,
+    RuleType.NOT_NULL: _compile_not_null,
+    RuleType.UNIQUE: _compile_unique,
+    RuleType.ENUM: _compile_enum,
+    RuleType.FRESHNESS: _compile_freshness,
+    RuleType.COMPARISON: _compile_comparison,
+}
+
+
+def _compile_rule(
+    rule: DataQualityRule, table_name: str, p: str = ""
+) -> Union[_CompiledRule, RuleEvaluationResult, None]:
+    """Compile a rule for the fused scan, or None if it cannot be fused."""
+    if rule.rule_type == RuleType.ROW_COUNT:
+        return _compile_row_count(rule, table_name, p)
+    compiler = _COLUMN_COMPILERS.get(rule.rule_type)
+    if compiler is None or not rule.column_name:
+        return None
+    return compiler(rule, table_name, rule.column_name, p)
+
+
+def _scan(
+    db: Session, table_name: str, compiled: List[_CompiledRule]
+) -> List[List[Any]]:
+    """Run all aggregates in one statement; returns each rule's values."""
+    aggregates: List[str] = []
+    bind_params: Dict[str, Any] = {}
+    spans = []
+    for c in compiled:
+        spans.append((len(aggregates), len(aggregates) + len(c.aggregates)))
+        aggregates.extend(c.aggregates)
+        bind_params.update(c.params)
+
+    select_list = ",\n               ".join(
+        f"{agg} AS a{i}" for i, agg in enumerate(aggregates)
+    )
+    row = db.execute(
+        text(f"SELECT {select_list}\n        FROM {qi(table_name)}"), bind_params
+    ).fetchone()
+    return [list(row[start:end]) for start, end in spans]
+
+
+def _evaluate_compiled(
+    db: Session,
+    rule: DataQualityRule,
+    compile_fn: Callable[[], Union[_CompiledRule, RuleEvaluationResult]],
+    table_name: str,
+    label: str,
+) -> RuleEvaluationResult:
+    """Evaluate one rule through its compiler (single-rule scan)."""
+    start_time = time.time()
+    try:
+        compiled = compile_fn()
+        if isinstance(compiled, RuleEvaluationResult):
+            result = compiled
+        else:
+            result = compiled.finish(db, _scan(db, table_name, [compiled])[0])
+    except Exception as e:
+        logger.error(f"Error evaluating {label} rule: {e}")
+        result = _config_error(rule, f"Error evaluating rule: {str(e)}")
+    result.execution_time_ms = int((time.time() - start_time) * 1000)
+    return result
+
+
+# =============================================================================
+# Rule Evaluators
+# =============================================================================
+
+
+def evaluate_range_rule(
+    db: Session, rule: DataQualityRule, table_name: str, column_name: str
+) -> RuleEvaluationResult:
+    """
+    Evaluate a range rule (value must be within min/max).
+
+    Parameters:
+        min: Minimum allowed value (optional)
+        max: Maximum allowed value (optional)
+    """
+    return _evaluate_compiled(
+        db, rule, lambda: _compile_range(rule, table_name, column_name), table_name, "range"
+    )
+
+
+def evaluate_not_null_rule(
+    db: Session, rule: DataQualityRule, table_name: str, column_name: str
+) -> RuleEvaluationResult:
+    """
+    Evaluate a not-null rule (value must not be null).
+    """
+    return _evaluate_compiled(
+        db, rule, lambda: _compile_not_null(rule, table_name, column_name), table_name, "not-null"
+    )
+
+
+def evaluate_unique_rule(
+    db: Session, rule: DataQualityRule, table_name: str, column_name: str
+) -> RuleEvaluationResult:
+    """
+    Evaluate a uniqueness rule (values must be unique).
+    """
+    return _evaluate_compiled(
+        db, rule, lambda: _compile_unique(rule, table_name, column_name), table_name, "unique"
+    )
+
+
+def evaluate_row_count_rule(
+    db: Session, rule: DataQualityRule, table_name: str
+) -> RuleEvaluationResult:
+    """
+    Evaluate a row count rule (min/max row count).
+
+    Parameters:
+        min: Minimum required rows (optional)
+        max: Maximum allowed rows (optional)
+    """
+    return _evaluate_compiled(
+        db, rule, lambda: _compile_row_count(rule, table_name), table_name, "row count"
+    )
+
+
+def evaluate_enum_rule(
+    db: Session, rule: DataQualityRule, table_name: str, column_name: str
+) -> RuleEvaluationResult:
+    """
+    Evaluate an enum rule (value must be in allowed list).
+
+    Parameters:
+        allowed: List of allowed values
+    """
+    return _evaluate_compiled(
+        db, rule, lambda: _compile_enum(rule, table_name, column_name), table_name, "enum"
+    )
+
+
+def evaluate_freshness_rule(
+    db: Session, rule: DataQualityRule, table_name: str, column_name: str
+) -> RuleEvaluationResult:
+    """
+    Evaluate a freshness rule (data must be recent).
+
+    Parameters:
+        max_age_hours: Maximum age in hours
+        max_age_days: Maximum age in days (alternative)
+    """
+    return _evaluate_compiled(
+        db, rule, lambda: _compile_freshness(rule, table_name, column_name), table_name, "freshness"
+    )
+
+
+def _scan_regex(
+    db: Session, table_name: str, checks: List[Tuple[DataQualityRule, str, "re.Pattern"]]
+) -> List[RuleEvaluationResult]:
+    """
+    Check regex rules with Python's re (more portable than DB-specific regex).
+
+    All columns are read in one scan of the table; each rule only looks at
+    rows where its own column is non-null.
+    """
+    columns = list(dict.fromkeys(column for _, column, _ in checks))
+    position = {column: i for i, column in enumerate(columns)}
+    query = text(f"""
+        SELECT {", ".join(qi(c) for c in columns)} FROM {qi(table_name)}
+        WHERE {" OR ".join(f"{qi(c)} IS NOT NULL" for c in columns)}
+    """)
+
+    totals = [0] * len(checks)
+    violations = [0] * len(checks)
+    samples: List[List[str]] = [[] for _ in checks]
+    for row in db.execute(query):
+        for i, (_, column, compiled_pattern) in enumerate(checks):
+            raw = row[position[column]]
+            if raw is None:
+                continue
+            totals[i] += 1
+            value = str(raw)
+            if not compiled_pattern.match(value):
+                violations[i] += 1
+                if len(samples[i]) < 5:
+                    samples[i].append(value)
+
+    results = []
+    for i, (rule, _, compiled_pattern) in enumerate(checks):
+        total, failed = totals[i], violations[i]
+        passed = failed == 0
+        results.append(RuleEvaluationResult(
+            rule_id=rule.id,
+            rule_name=rule.name,
+            passed=passed,
+            severity=rule.severity,
+            message=f"Found {failed} values not matching pattern"
+            if not passed
+            else f"All {total} values match pattern",
+            actual_value=f"{failed} mismatches",
+            expected_value=f"Pattern: {compiled_pattern.pattern}",
+            rows_checked=total,
+            rows_passed=total - failed,
+            rows_failed=failed,
+            sample_failures=samples[i] if samples[i] else None,
+        ))
+    return results
+
 
 def evaluate_regex_rule(
     db: Session, rule: DataQualityRule, table_name: str, column_name: str
@@ -511,45 +662,11 @@ def evaluate_regex_rule(
             execution_time_ms=int((time.time() - start_time) * 1000),
         )
 
-    # Fetch values and check with Python regex (more portable than DB-specific regex)
-    query = text(f"""
-        SELECT {qi(column_name)} FROM {qi(table_name)}
-        WHERE {qi(column_name)} IS NOT NULL
-    """)
-
     try:
         compiled_pattern = re.compile(pattern)
-        result = db.execute(query).fetchall()
-
-        total = len(result)
-        violations = 0
-        sample_failures = []
-
-        for row in result:
-            value = str(row[0])
-            if not compiled_pattern.match(value):
-                violations += 1
-                if len(sample_failures) < 5:
-                    sample_failures.append(value)
-
-        passed = violations == 0
-
-        return RuleEvaluationResult(
-            rule_id=rule.id,
-            rule_name=rule.name,
-            passed=passed,
-            severity=rule.severity,
-            message=f"Found {violations} values not matching pattern"
-            if not passed
-            else f"All {total} values match pattern",
-            actual_value=f"{violations} mismatches",
-            expected_value=f"Pattern: {pattern}",
-            rows_checked=total,
-            rows_passed=total - violations,
-            rows_failed=violations,
-            sample_failures=sample_failures if sample_failures else None,
-            execution_time_ms=int((time.time() - start_time) * 1000),
-        )
+        result = _scan_regex(db, table_name, [(rule, column_name, compiled_pattern)])[0]
+        result.execution_time_ms = int((time.time() - start_time) * 1000)
+        return result
 
     except re.error as e:
         return RuleEvaluationResult(
@@ -679,88 +796,9 @@ def evaluate_comparison_rule(
         operator: One of <, >, <=, >=, =, !=
         compare_column: Column to compare against
     """
-    start_time = time.time()
-    params = rule.parameters or {}
-    operator = params.get("operator")
-    compare_column = params.get("compare_column")
-
-    if not operator or operator not in ALLOWED_OPERATORS:
-        return RuleEvaluationResult(
-            rule_id=rule.id,
-            rule_name=rule.name,
-            passed=False,
-            severity=rule.severity,
-            message=f"Invalid or missing operator. Must be one of: {ALLOWED_OPERATORS}",
-            execution_time_ms=int((time.time() - start_time) * 1000),
-        )
-
-    if not compare_column:
-        return RuleEvaluationResult(
-            rule_id=rule.id,
-            rule_name=rule.name,
-            passed=False,
-            severity=rule.severity,
-            message="Missing compare_column parameter",
-            execution_time_ms=int((time.time() - start_time) * 1000),
-        )
-
-    # Count rows where the comparison is NOT true (both columns non-null)
-    query = text(f"""
-        SELECT COUNT(*) as total,
-               SUM(CASE WHEN NOT ({qi(column_name)} {safe_operator(operator)} {qi(compare_column)}) THEN 1 ELSE 0 END) as violations
-        FROM {qi(table_name)}
-        WHERE {qi(column_name)} IS NOT NULL AND {qi(compare_column)} IS NOT NULL
-    """)
-
-    try:
-        result = db.execute(query).fetchone()
-        total = result[0] or 0
-        violations = result[1] or 0
-
-        passed = violations == 0
-
-        # Get sample failures
-        sample_failures = None
-        if violations > 0:
-            sample_query = text(f"""
-                SELECT {qi(column_name)}, {qi(compare_column)}
-                FROM {qi(table_name)}
-                WHERE {qi(column_name)} IS NOT NULL AND {qi(compare_column)} IS NOT NULL
-                  AND NOT ({qi(column_name)} {safe_operator(operator)} {qi(compare_column)})
-                LIMIT 5
-            """)
-            samples = db.execute(sample_query).fetchall()
-            sample_failures = [
-                f"{column_name}={s[0]}, {compare_column}={s[1]}" for s in samples
-            ]
-
-        return RuleEvaluationResult(
-            rule_id=rule.id,
-            rule_name=rule.name,
-            passed=passed,
-            severity=rule.severity,
-            message=f"Found {violations} rows where {column_name} {operator} {compare_column} is false"
-            if not passed
-            else f"All {total} rows satisfy {column_name} {operator} {compare_column}",
-            actual_value=f"{violations} violations",
-            expected_value=f"{column_name} {operator} {compare_column}",
-            rows_checked=total,
-            rows_passed=total - violations,
-            rows_failed=violations,
-            sample_failures=sample_failures,
-            execution_time_ms=int((time.time() - start_time) * 1000),
-        )
-
-    except Exception as e:
-        logger.error(f"Error evaluating comparison rule: {e}")
-        return RuleEvaluationResult(
-            rule_id=rule.id,
-            rule_name=rule.name,
-            passed=False,
-            severity=rule.severity,
-            message=f"Error evaluating rule: {str(e)}",
-            execution_time_ms=int((time.time() - start_time) * 1000),
-        )
+    return _evaluate_compiled(
+        db, rule, lambda: _compile_comparison(rule, table_name, column_name), table_name, "comparison"
+    )
 
 
 # =============================================================================
@@ -933,6 +971,105 @@ def evaluate_rule(
         )
 
 
+def _savepoint_error(rule: DataQualityRule, exc: Exception) -> RuleEvaluationResult:
+    logger.error(f"Error evaluating rule {rule.id}: {exc}")
+    return _config_error(rule, f"Error evaluating rule: {str(exc)}")
+
+
+def evaluate_rules_for_table(
+    db: Session, rules: List[DataQualityRule], table_name: str
+) -> List[RuleEvaluationResult]:
+    """
+    Evaluate several rules against one table, scanning it once.
+
+    Fusable rules (range, not_null, unique, enum, freshness, comparison,
+    row_count) are answered by a single aggregate query; samples are then
+    fetched only for rules that failed. Regex rules share one extra scan
+    and custom SQL rules run individually. If the fused query fails (e.g.
+    one rule names a missing column) each rule is re-run on its own inside
+    a savepoint so one broken rule cannot fail its neighbours.
+
+    Returns results in the order of ``rules``, identical to calling
+    evaluate_rule for each.
+    """
+    results: List[Optional[RuleEvaluationResult]] = [None] * len(rules)
+    fused: List[Tuple[int, _CompiledRule]] = []
+    regex_checks: List[Tuple[int, Tuple[DataQualityRule, str, "re.Pattern"]]] = []
+    individual: List[int] = []
+
+    for i, rule in enumerate(rules):
+        try:
+            compiled = _compile_rule(rule, table_name, f"r{i}_")
+        except Exception:
+            compiled = None  # e.g. invalid identifier: evaluate_rule reports it
+
+        if isinstance(compiled, _CompiledRule):
+            fused.append((i, compiled))
+        elif isinstance(compiled, RuleEvaluationResult):
+            compiled.execution_time_ms = 0
+            results[i] = compiled
+        elif rule.rule_type == RuleType.REGEX and rule.column_name and _valid_regex(rule):
+            pattern = re.compile((rule.parameters or {})["pattern"])
+            regex_checks.append((i, (rule, rule.column_name, pattern)))
+        else:
+            individual.append(i)
+
+    if fused:
+        scan_start = time.time()
+        try:
+            with db.begin_nested():
+                values = _scan(db, table_name, [c for _, c in fused])
+        except Exception as e:
+            logger.warning(
+                f"Fused scan of {table_name} failed, evaluating {len(fused)} rules one by one: {e}"
+            )
+            values = None
+        scan_ms = int((time.time() - scan_start) * 1000)
+
+        for n, (i, compiled) in enumerate(fused):
+            rule_start = time.time()
+            try:
+                with db.begin_nested():
+                    if values is None:
+                        rule_values = _scan(db, table_name, [compiled])[0]
+                    else:
+                        rule_values = values[n]
+                    result = compiled.finish(db, rule_values)
+            except Exception as e:
+                result = _savepoint_error(compiled.rule, e)
+            result.execution_time_ms = scan_ms + int((time.time() - rule_start) * 1000)
+            results[i] = result
+
+    if regex_checks:
+        scan_start = time.time()
+        try:
+            with db.begin_nested():
+                regex_results = _scan_regex(db, table_name, [c for _, c in regex_checks])
+        except Exception as e:
+            regex_results = [_savepoint_error(rule, e) for _, (rule, _, _) in regex_checks]
+        scan_ms = int((time.time() - scan_start) * 1000)
+        for (i, _), result in zip(regex_checks, regex_results):
+            result.execution_time_ms = scan_ms
+            results[i] = result
+
+    # Last: custom SQL may SET LOCAL a timeout or roll the session back
+    for i in individual:
+        results[i] = evaluate_rule(db, rules[i], table_name)
+
+    return results
+
+
+def _valid_regex(rule: DataQualityRule) -> bool:
+    pattern = (rule.parameters or {}).get("pattern")
+    if not pattern:
+        return False
+    try:
+        re.compile(pattern)
+    except re.error:
+        return False
+    return True
+
+
 def evaluate_rules_for_job(
     db: Session, job: IngestionJob, table_name: str
 ) -> DataQualityReport:
@@ -978,14 +1115,11 @@ def evaluate_rules_for_job(
     db.commit()
     db.refresh(report)
 
-    # Evaluate each rule
-    results = []
+    # Evaluate all rules with one scan of the table
+    results = evaluate_rules_for_table(db, rules, table_name)
     failed_rules = []
 
-    for rule in rules:
-        eval_result = evaluate_rule(db, rule, table_name)
-        results.append(eval_result)
-
+    for rule, eval_result in zip(rules, results):
         # Save result
         db_result = DataQualityResult(
             rule_id=rule.id,
@@ -1147,8 +1281,9 @@ def evaluate_all_rules(db: Session) -> Dict[str, Any]:
     Evaluate all enabled rules against their target tables.
 
     For each rule, resolves target tables from DatasetRegistry
-    (by rule.source + rule.dataset_pattern regex), evaluates each
-    (rule, table) pair, stores results, and creates a DataQualityReport.
+    (by rule.source + rule.dataset_pattern regex), then evaluates all
+    rules of a table together with evaluate_rules_for_table (one scan
+    per table), stores results, and creates a DataQualityReport.
 
     Returns:
         Summary dict with total/passed/failed counts
@@ -1190,9 +1325,9 @@ def evaluate_all_rules(db: Session) -> Dict[str, Any]:
     total_errors = 0
     failed_rules_list = []
 
-    # Build evaluation plan as plain dicts so we don't depend on ORM objects
-    # surviving across rollbacks
-    eval_plan = []
+    # Build evaluation plan (table -> rule ids, in priority order) from plain
+    # ids so we don't depend on ORM objects surviving across rollbacks
+    eval_plan: Dict[str, List[int]] = {}
     for rule in rules:
         if rule.source:
             candidate_tables = table_by_source.get(rule.source, [])
@@ -1210,23 +1345,35 @@ def evaluate_all_rules(db: Session) -> Dict[str, Any]:
                 continue
 
         for table_name in candidate_tables:
-            eval_plan.append((rule.id, table_name))
+            eval_plan.setdefault(table_name, []).append(rule.id)
 
-    # Set per-rule statement timeout to prevent long-running queries
+    # Set per-table statement timeout to prevent long-running queries
     # from blocking the API (e.g., 58M-row m5_sales table)
     RULE_TIMEOUT_S = 60
+    uncommitted = 0
 
-    for rule_id, table_name in eval_plan:
+    for table_name, rule_ids in eval_plan.items():
         try:
-            # Re-fetch rule each iteration to survive rollbacks
-            rule = db.query(DataQualityRule).get(rule_id)
-            if not rule:
+            # Re-fetch rules each table to survive rollbacks
+            by_id = {
+                r.id: r
+                for r in db.query(DataQualityRule).filter(DataQualityRule.id.in_(rule_ids))
+            }
+            table_rules = [by_id[rid] for rid in rule_ids if rid in by_id]
+            if not table_rules:
                 continue
 
             db.execute(
                 text(f"SET LOCAL statement_timeout = '{safe_int(RULE_TIMEOUT_S, 'RULE_TIMEOUT_S') * 1000}'")
             )
-            eval_result = evaluate_rule(db, rule, table_name)
+            eval_results = evaluate_rules_for_table(db, table_rules, table_name)
+        except Exception as e:
+            total_errors += len(rule_ids)
+            logger.error(f"Error evaluating rules {rule_ids} on {table_name}: {e}")
+            db.rollback()
+            continue
+
+        for rule, eval_result in zip(table_rules, eval_results):
             total_evaluations += 1
 
             # Store result
@@ -1260,17 +1407,12 @@ def evaluate_all_rules(db: Session) -> Dict[str, Any]:
                     {"id": rule.id, "name": rule.name, "table": table_name}
                 )
             rule.last_evaluated_at = datetime.utcnow()
+            uncommitted += 1
 
-            # Periodic commit every 50 evaluations to avoid huge transactions
-            if total_evaluations % 50 == 0:
-                db.commit()
-
-        except Exception as e:
-            total_errors += 1
-            logger.error(
-                f"Error evaluating rule {rule_id} on {table_name}: {e}"
-            )
-            db.rollback()
+        # Periodic commit every ~50 evaluations to avoid huge transactions
+        if uncommitted >= 50:
+            db.commit()
+            uncommitted = 0
 
     # Create report record
     exec_ms = int((time.time() - start_time) * 1000)
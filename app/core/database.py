@@ -80,6 +80,7 @@ def create_tables(engine=None):
 
     # Run schema migrations for new columns (idempotent)
     _apply_schema_migrations(engine)
+    _apply_search_indexes(engine)
 
 
 def _apply_schema_migrations(engine) -> None:
@@ -90,6 +91,10 @@ def _apply_schema_migrations(engine) -> None:
     migrations = [
         "ALTER TABLE lp_fund ADD COLUMN IF NOT EXISTS lp_tier INTEGER",
         "ALTER TABLE ingestion_jobs ADD COLUMN IF NOT EXISTS data_origin VARCHAR(16) NOT NULL DEFAULT 'real'",
+        "ALTER TABLE data_profile_snapshots ADD COLUMN IF NOT EXISTS profile_mode VARCHAR(20)",
+        "ALTER TABLE data_profile_snapshots ADD COLUMN IF NOT EXISTS watermark JSON",
+        "ALTER TABLE data_profile_columns ADD COLUMN IF NOT EXISTS sketch JSON",
+        "ALTER TABLE data_profile_snapshots ADD COLUMN IF NOT EXISTS profile_cost JSON",
     ]
     with engine.connect() as conn:
         for sql in migrations:
@@ -102,6 +107,111 @@ def _apply_schema_migrations(engine) -> None:
                 logger.error(f"Migration FAILED: {sql} -- {e}")
 
 
+# Trigram (pg_trgm) GIN indexes backing EntityResolver name-only matching.
+# Built CONCURRENTLY so startup never blocks writes to large alias tables.
+_SEARCH_INDEXES = [
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_alias_normalized_trgm "
+    "ON entity_aliases USING GIN (normalized_alias gin_trgm_ops)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_canonical_normalized_trgm "
+    "ON canonical_entities USING GIN (normalized_name gin_trgm_ops)",
+]
+
+
+def _apply_search_indexes(engine) -> None:
+    """
+    Create pg_trgm and the trigram search indexes (PostgreSQL only).
+
+    CREATE INDEX CONCURRENTLY cannot run inside a transaction, so this uses
+    an AUTOCOMMIT connection. Failures (no privilege for CREATE EXTENSION,
+    tables not created yet) are logged; readers fall back to slower paths
+    until the indexes exist.
+    """
+    if engine.dialect.name != "postgresql":
+        return
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        for sql in ["CREATE EXTENSION IF NOT EXISTS pg_trgm"] + _SEARCH_INDEXES:
+            try:
+                conn.execute(text(sql))
+            except Exception as e:
+                logger.warning(f"Search index not created: {sql} -- {e}")
+
+
+def run_migrations(engine=None) -> None:
+    """
+    Bring the schema up to date: create_tables() plus the ingestion_jobs
+    batch-metadata migration and backfill.
+
+    Runs from the API lifespan unless RUN_MIGRATIONS_ON_STARTUP=false, in
+    which case `python -m app.core.migrate` is expected to run before deploy.
+    """
+    if engine is None:
+        engine = get_engine()
+    create_tables(engine)
+    try:
+        _apply_batch_metadata_migration(engine)
+        logger.info("Batch metadata columns + backfill applied to ingestion_jobs")
+    except Exception as e:
+        logger.warning(f"Batch metadata migration skipped: {e}")
+
+
+def _apply_batch_metadata_migration(engine) -> None:
+    """Batch metadata columns on ingestion_jobs, legacy batch backfill, stale job cleanup."""
+    with engine.begin() as conn:
+        # Add new columns (idempotent)
+        conn.execute(text(
+            "ALTER TABLE ingestion_jobs ADD COLUMN IF NOT EXISTS "
+            "batch_run_id VARCHAR(50)"
+        ))
+        conn.execute(text(
+            "ALTER TABLE ingestion_jobs ADD COLUMN IF NOT EXISTS "
+            "trigger VARCHAR(20)"
+        ))
+        conn.execute(text(
+            "ALTER TABLE ingestion_jobs ADD COLUMN IF NOT EXISTS "
+            "tier INTEGER"
+        ))
+
+        # Partial index on batch_run_id (only non-null rows)
+        conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_ingestion_jobs_batch_run_id
+            ON ingestion_jobs (batch_run_id)
+            WHERE batch_run_id IS NOT NULL
+        """))
+
+        # Rename legacy nightly_batch table → batch_runs (idempotent)
+        conn.execute(text("""
+            DO $$
+            BEGIN
+                IF EXISTS (SELECT 1 FROM information_schema.tables
+                           WHERE table_name = 'nightly_batch') THEN
+                    ALTER TABLE nightly_batch RENAME TO batch_runs;
+                END IF;
+            END $$
+        """))
+
+        # Backfill from legacy batch_runs records
+        conn.execute(text("""
+            UPDATE ingestion_jobs
+            SET batch_run_id = 'legacy_batch_' || nb.id::text,
+                trigger = 'batch'
+            FROM batch_runs nb
+            WHERE ingestion_jobs.id = ANY(
+                SELECT jsonb_array_elements_text(nb.job_ids::jsonb)::int
+            )
+            AND ingestion_jobs.batch_run_id IS NULL
+        """))
+
+        # Auto-resolve stale RUNNING jobs (>2 hours old)
+        conn.execute(text("""
+            UPDATE ingestion_jobs
+            SET status = 'failed',
+                error_message = 'Stale job auto-resolved on startup',
+                completed_at = NOW()
+            WHERE status = 'running'
+            AND started_at < NOW() - INTERVAL '2 hours'
+        """))
+
+
 def get_session_factory():
     """Get the shared session factory (singleton)."""
     global _SessionLocal
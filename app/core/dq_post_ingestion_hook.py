@@ -3,7 +3,7 @@ Post-ingestion DQ hook.
 
 Lightweight, non-blocking hook called after complete_job() marks a job as
 SUCCESS. Runs four steps in sequence:
-  1. Profile the ingested table
+  1. Profile the ingested table (only rows past the last profile's watermark)
   2. Detect anomalies from the new profile
   3. Evaluate matching DQ rules
   4. Run the domain-specific BaseQualityProvider for the affected entity
@@ -26,6 +26,10 @@ from sqlalchemy.orm import Session
 
 logger = logging.getLogger(__name__)
 
+# Profiling in the hook runs on one connection and gives up on columns it
+# hasn't reached after this long, so it can't hold pool connections for long
+PROFILE_TIME_BUDGET_S = 120.0
+
 
 # ---------------------------------------------------------------------------
 # Source → provider routing
@@ -114,10 +118,13 @@ async def _run_post_ingestion_checks(
         from app.core.data_profiling_service import profile_table
 
         logger.info(f"[DQ Hook] Profiling table '{table_name}' (job {job_id})")
-        snapshot = profile_table(db, table_name, job_id=job_id, source=source)
+        snapshot = profile_table(
+            db, table_name, job_id=job_id, source=source, incremental=True,
+            time_budget_s=PROFILE_TIME_BUDGET_S,
+        )
 
         if not snapshot:
-            logger.info(f"[DQ Hook] Profiling skipped for '{table_name}' (lock or error)")
+            logger.info(f"[DQ Hook] Profiling skipped for '{table_name}' (lock, error or time budget)")
             return
 
         # 2. Detect anomalies against new profile
@@ -0,0 +1,275 @@
+"""
+Blocked pairwise duplicate discovery for canonical entities.
+
+Comparing every pair of entities is O(n^2) Levenshtein calls. This module
+only compares entities that share at least one blocking key:
+
+- tok:  significant name tokens ("harbor", "granite", ...)
+- snd:  Soundex of the first two tokens (spelling variants)
+- pre/suf: leading / trailing 4-gram of the space-free name (typos)
+- cik/crd/ticker/cusip/lei: exact identifiers
+- dom:  website domain
+
+Blocks larger than ``max_block_size`` are skipped (a token like "capital"
+carries no signal and would reintroduce the quadratic blow-up). Each pair
+is emitted once, from the smallest active key the two entities share, so
+no global "seen pairs" set is needed. Pairs are scored in chunks, optionally
+across a process pool, and the best ``limit`` are kept in a bounded heap
+so the result is the top candidates regardless of ID order.
+"""
+
+import heapq
+import logging
+import multiprocessing
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+from app.agentic.fuzzy_matcher import similarity_ratio
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BLOCK_SIZE = 500
+DEFAULT_CHUNK_SIZE = 20_000
+
+# Tokens too common in entity names to be useful blocking keys
+_STOP_TOKENS = {
+    "and", "the", "of", "for", "fund", "funds", "capital", "partners",
+    "group", "holdings", "management", "investment", "investments",
+    "ventures", "associates", "international", "services", "company",
+    "trust", "advisors", "global", "equity", "financial",
+}
+
+_SOUNDEX_CODES = {
+    **dict.fromkeys("bfpv", "1"),
+    **dict.fromkeys("cgjkqsxz", "2"),
+    **dict.fromkeys("dt", "3"),
+    "l": "4",
+    **dict.fromkeys("mn", "5"),
+    "r": "6",
+}
+
+# (entity_a_id, entity_b_id, similarity)
+ScoredPair = Tuple[int, int, float]
+
+
+@dataclass(frozen=True)
+class EntityRecord:
+    """The fields of a canonical entity used for blocking and scoring."""
+
+    id: int
+    normalized_name: str
+    state: Optional[str] = None
+    domain: Optional[str] = None
+    identifiers: Tuple[str, ...] = ()  # e.g. ("cik:0001067983", "ticker:BRK")
+
+
+def soundex(word: str) -> str:
+    """American Soundex code for a word ("" for non-alphabetic input)."""
+    letters = [c for c in word.lower() if c.isalpha()]
+    if not letters:
+        return ""
+
+    code = letters[0].upper()
+    last = _SOUNDEX_CODES.get(letters[0], "")
+    for c in letters[1:]:
+        digit = _SOUNDEX_CODES.get(c, "")
+        if digit and digit != last:
+            code += digit
+            if len(code) == 4:
+                break
+        # h and w do not separate letters with the same code
+        if c not in "hw":
+            last = digit
+    return code.ljust(4, "0")
+
+
+def blocking_keys(record: EntityRecord) -> Set[str]:
+    """All blocking keys for an entity."""
+    keys: Set[str] = set(record.identifiers)
+    if record.domain:
+        keys.add(f"dom:{record.domain}")
+
+    name = record.normalized_name or ""
+    tokens = name.split()
+    for token in tokens:
+        if len(token) >= 3 and token not in _STOP_TOKENS and not token.isdigit():
+            keys.add(f"tok:{token}")
+
+    if tokens:
+        keys.add("snd:" + " ".join(soundex(t) for t in tokens[:2]))
+
+    compact = name.replace(" ", "")
+    if len(compact) >= 4:
+        keys.add(f"pre:{compact[:4]}")
+        keys.add(f"suf:{compact[-4:]}")
+
+    return keys
+
+
+def score_pairs(
+    pairs: Sequence[Tuple[int, str, int, str]], min_confidence: float
+) -> List[ScoredPair]:
+    """
+    Score candidate pairs with similarity_ratio.
+
+    Module-level so it can run in a process pool. Pairs whose length or
+    character-multiset difference (both lower bounds on the edit distance)
+    already rules out ``min_confidence`` are skipped without computing the
+    edit distance.
+    """
+    scored = []
+    for a_id, a_name, b_id, b_name in pairs:
+        longest = max(len(a_name), len(b_name))
+        if not longest:
+            continue
+        max_distance = (1.0 - min_confidence) * longest + 1e-9
+        if abs(len(a_name) - len(b_name)) > max_distance:
+            continue
+        a_chars, b_chars = Counter(a_name), Counter(b_name)
+        unmatched = max(
+            sum((a_chars - b_chars).values()), sum((b_chars - a_chars).values())
+        )
+        if unmatched > max_distance:
+            continue
+        sim = similarity_ratio(a_name, b_name)
+        if sim >= min_confidence:
+            scored.append((a_id, b_id, sim))
+    return scored
+
+
+class BlockedDuplicateFinder:
+    """
+    Candidate generation and ranked scoring of duplicate entity pairs.
+
+    Args:
+        max_block_size: Blocks with more members are skipped
+        chunk_size: Candidate pairs scored per task
+        workers: Scoring processes (1 scores inline)
+    """
+
+    def __init__(
+        self,
+        max_block_size: int = DEFAULT_MAX_BLOCK_SIZE,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        workers: int = 1,
+    ):
+        self.max_block_size = max_block_size
+        self.chunk_size = chunk_size
+        self.workers = max(1, workers)
+        self.stats: Dict[str, int] = {}
+
+    def candidate_pairs(self, records: Sequence[EntityRecord]) -> Iterator[Tuple[int, int]]:
+        """
+        Yield (i, j) index pairs (i < j) of records sharing a blocking key.
+
+        Each pair is yielded exactly once.
+        """
+        record_keys = [blocking_keys(r) for r in records]
+        blocks: Dict[str, List[int]] = defaultdict(list)
+        for idx, keys in enumerate(record_keys):
+            for key in keys:
+                blocks[key].append(idx)
+
+        active = {
+            key for key, members in blocks.items()
+            if 1 < len(members) <= self.max_block_size
+        }
+        self.stats = {
+            "records": len(records),
+            "blocks": len(active),
+            "oversized_blocks": sum(1 for m in blocks.values() if len(m) > self.max_block_size),
+            "candidate_pairs": 0,
+        }
+
+        for key in sorted(active):
+            members = blocks[key]
+            for pos, i in enumerate(members):
+                keys_i = record_keys[i]
+                for j in members[pos + 1:]:
+                    # Emit from the smallest shared active key only
+                    if min(k for k in keys_i & record_keys[j] if k in active) != key:
+                        continue
+                    self.stats["candidate_pairs"] += 1
+                    yield i, j
+
+    def _chunks(
+        self, records: Sequence[EntityRecord]
+    ) -> Iterator[List[Tuple[int, str, int, str]]]:
+        chunk = []
+        for i, j in self.candidate_pairs(records):
+            a, b = records[i], records[j]
+            if a.id > b.id:
+                a, b = b, a
+            chunk.append((a.id, a.normalized_name, b.id, b.normalized_name))
+            if len(chunk) >= self.chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def _scored_chunks(
+        self, records: Sequence[EntityRecord], min_confidence: float
+    ) -> Iterator[List[ScoredPair]]:
+        chunks = self._chunks(records)
+        if self.workers == 1:
+            for chunk in chunks:
+                yield score_pairs(chunk, min_confidence)
+            return
+
+        # Bounded submission keeps memory flat for very large scans
+        with ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            pending = deque()
+            for chunk in chunks:
+                pending.append(pool.submit(score_pairs, chunk, min_confidence))
+                if len(pending) >= self.workers * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def find(
+        self,
+        records: Sequence[EntityRecord],
+        min_confidence: float = 0.70,
+        max_confidence: float = 0.90,
+        limit: int = 50,
+        on_batch: Optional[Callable[[List[ScoredPair]], None]] = None,
+    ) -> List[ScoredPair]:
+        """
+        Rank duplicate pairs with min_confidence <= similarity < max_confidence.
+
+        Args:
+            records: Entities to compare
+            min_confidence: Minimum similarity (inclusive)
+            max_confidence: Maximum similarity (exclusive)
+            limit: Number of top pairs returned
+            on_batch: Called with the in-range pairs of each scored chunk
+                (e.g. to persist them incrementally)
+
+        Returns:
+            Top ``limit`` (entity_a_id, entity_b_id, similarity) tuples,
+            highest similarity first, ties by entity IDs
+        """
+        # Min-heap of (similarity, -a, -b): the root is the worst kept pair
+        top: List[Tuple[float, int, int]] = []
+        for scored in self._scored_chunks(records, min_confidence):
+            in_range = [p for p in scored if p[2] < max_confidence]
+            if on_batch and in_range:
+                on_batch(in_range)
+            for a_id, b_id, sim in in_range:
+                item = (sim, -a_id, -b_id)
+                if len(top) < limit:
+                    heapq.heappush(top, item)
+                elif item > top[0]:
+                    heapq.heapreplace(top, item)
+
+        logger.info(
+            f"Blocked duplicate scan: {self.stats.get('records', 0)} entities, "
+            f"{self.stats.get('candidate_pairs', 0)} candidate pairs in "
+            f"{self.stats.get('blocks', 0)} blocks "
+            f"({self.stats.get('oversized_blocks', 0)} oversized skipped)"
+        )
+        return [(-a, -b, sim) for sim, a, b in sorted(top, reverse=True)]
@@ -13,6 +13,7 @@ Features:
 """
 
 import logging
+import time
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
@@ -31,15 +32,36 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     UniqueConstraint,
+    bindparam,
     func,
+    text,
 )
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
+from app.core.batch_operations import batch_insert
+from app.core.entity_dedup import (
+    DEFAULT_MAX_BLOCK_SIZE,
+    BlockedDuplicateFinder,
+    EntityRecord,
+)
 from app.core.models import Base
-from app.agentic.fuzzy_matcher import CompanyNameMatcher, similarity_ratio
+from app.agentic.fuzzy_matcher import CompanyNameMatcher, similarity_one_to_many
 
 logger = logging.getLogger(__name__)
 
+# Trigram (pg_trgm) GIN indexes backing name-only candidate retrieval. They
+# are created at startup (app.core.database._apply_search_indexes); resolve()
+# only checks that they exist and are valid.
+_NAME_TRGM_INDEXES = ("idx_alias_normalized_trgm", "idx_canonical_normalized_trgm")
+
+# Seconds before a "no index" answer is checked again (a concurrent build
+# may finish while the process is running).
+NAME_INDEX_RECHECK_S = 300.0
+
+# Per-engine result of ensure_name_index(): (ready, checked_at).
+_name_index_ready: Dict[str, Tuple[bool, float]] = {}
+
 
 # =============================================================================
 # ENUMS
@@ -227,6 +249,45 @@ class EntityMergeHistory(Base):
         return f"<EntityMergeHistory(id={self.id}, action={self.action}, at={self.performed_at})>"
 
 
+class EntityDuplicateCandidate(Base):
+    """
+    Ranked duplicate pairs found by find_duplicates(persist=True).
+
+    Pairs are upserted as each scoring chunk completes, so long scans
+    surface candidates for review before they finish.
+    """
+
+    __tablename__ = "entity_duplicate_candidates"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    entity_a_id = Column(
+        Integer,
+        ForeignKey("canonical_entities.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    entity_b_id = Column(
+        Integer,
+        ForeignKey("canonical_entities.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    confidence = Column(Float, nullable=False)
+    match_method = Column(String(50), nullable=True)
+    status = Column(String(20), nullable=False, default="pending")  # pending, merged, dismissed
+    detected_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        UniqueConstraint("entity_a_id", "entity_b_id", name="uq_duplicate_pair"),
+        Index("idx_duplicate_status_confidence", "status", "confidence"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<EntityDuplicateCandidate(a={self.entity_a_id}, b={self.entity_b_id}, "
+            f"confidence={self.confidence})>"
+        )
+
+
 # =============================================================================
 # DATA CLASSES
 # =============================================================================
@@ -287,6 +348,11 @@ class EntityResolver:
     - Auto-merge: confidence >= 0.90
     - Review queue: 0.70 <= confidence < 0.90
     - No match: confidence < 0.70
+
+    Name-only matching retrieves the top NAME_CANDIDATE_LIMIT aliases and
+    canonical names by pg_trgm similarity and scores only those with
+    Levenshtein. Without pg_trgm (or on non-Postgres databases) it falls
+    back to scanning every alias of the entity type.
     """
 
     # Confidence thresholds
@@ -306,11 +372,17 @@ class EntityResolver:
         MatchMethod.MANUAL: 1.0,
     }
 
+    # Trigram candidates fetched per source (aliases, canonical names) for
+    # name-only matching; only these are scored with Levenshtein.
+    NAME_CANDIDATE_LIMIT = 50
+
     def __init__(
         self,
         db: Session,
         name_matcher: Optional[CompanyNameMatcher] = None,
         fuzzy_threshold: float = 0.85,
+        use_name_index: bool = True,
+        name_candidate_limit: int = NAME_CANDIDATE_LIMIT,
     ):
         """
         Initialize the resolver.
@@ -319,12 +391,17 @@ class EntityResolver:
             db: Database session
             name_matcher: Optional custom name matcher
             fuzzy_threshold: Threshold for fuzzy name matching
+            use_name_index: Use pg_trgm candidate retrieval for name-only
+                matching (False forces the exhaustive alias scan)
+            name_candidate_limit: Top-K trigram candidates scored per source
         """
         self.db = db
         self.name_matcher = name_matcher or CompanyNameMatcher(
             similarity_threshold=fuzzy_threshold
         )
         self.fuzzy_threshold = fuzzy_threshold
+        self.use_name_index = use_name_index
+        self.name_candidate_limit = name_candidate_limit
 
     # -------------------------------------------------------------------------
     # NORMALIZATION
@@ -679,9 +756,13 @@ class EntityResolver:
         candidates = query.limit(500).all()
 
         # Score by name similarity
+        scores = similarity_one_to_many(
+            normalized_name,
+            [c.normalized_name or "" for c in candidates],
+            self.fuzzy_threshold,
+        )
         matches = []
-        for candidate in candidates:
-            sim = similarity_ratio(normalized_name, candidate.normalized_name)
+        for candidate, sim in zip(candidates, scores.tolist()):
             if sim >= self.fuzzy_threshold:
                 # Boost confidence for location match
                 confidence = min(sim + 0.05, 1.0)
@@ -694,7 +775,125 @@ class EntityResolver:
     def _match_by_name_only(
         self, entity_type: str, normalized_name: str
     ) -> List[Tuple[CanonicalEntity, float]]:
-        """Match by fuzzy name only."""
+        """Match by fuzzy name only (trigram candidates, else exhaustive scan)."""
+        if self.use_name_index and normalized_name and self.ensure_name_index():
+            try:
+                return self._match_by_name_indexed(entity_type, normalized_name)
+            except SQLAlchemyError as e:
+                logger.warning(f"Trigram name lookup failed, scanning aliases: {e}")
+                self.db.rollback()
+        return self._match_by_name_exhaustive(entity_type, normalized_name)
+
+    def ensure_name_index(self) -> bool:
+        """
+        Check that the name trigram indexes exist and are valid.
+
+        No DDL runs here: the indexes are built at startup. The answer is
+        cached per engine (a negative one for NAME_INDEX_RECHECK_S), and the
+        check uses a separate connection so a failure never aborts the
+        session's transaction.
+
+        Returns:
+            True if trigram candidate retrieval can be used
+        """
+        bind = self.db.get_bind()
+        key = str(bind.url)
+        cached = _name_index_ready.get(key)
+        if cached is not None and (
+            cached[0] or time.monotonic() - cached[1] < NAME_INDEX_RECHECK_S
+        ):
+            return cached[0]
+
+        ready = False
+        if bind.dialect.name == "postgresql":
+            try:
+                with bind.connect() as conn:
+                    valid = conn.execute(
+                        text("""
+                            SELECT COUNT(*) FROM pg_index i
+                            JOIN pg_class c ON c.oid = i.indexrelid
+                            WHERE c.relname IN :names AND i.indisvalid
+                        """).bindparams(bindparam("names", expanding=True)),
+                        {"names": list(_NAME_TRGM_INDEXES)},
+                    ).scalar()
+                ready = valid == len(_NAME_TRGM_INDEXES)
+                if not ready:
+                    logger.info("pg_trgm name indexes not built yet, using exhaustive alias scan")
+            except SQLAlchemyError as e:
+                logger.warning(
+                    f"pg_trgm name index check failed, using exhaustive alias scan: {e}"
+                )
+
+        _name_index_ready[key] = (ready, time.monotonic())
+        return ready
+
+    def _match_by_name_indexed(
+        self, entity_type: str, normalized_name: str
+    ) -> List[Tuple[CanonicalEntity, float]]:
+        """
+        Match by fuzzy name using trigram candidate retrieval.
+
+        The GIN trigram indexes return the top-K aliases and canonical names
+        by pg_trgm similarity (above the pg_trgm.similarity_threshold GUC,
+        default 0.3 - well below what a 0.85 Levenshtein ratio implies).
+        Only those candidates are scored with Levenshtein similarity; each
+        entity keeps its best-scoring name.
+        """
+        rows = self.db.execute(
+            text("""
+                SELECT entity_id, candidate FROM (
+                    SELECT a.canonical_entity_id AS entity_id,
+                           a.normalized_alias AS candidate
+                    FROM entity_aliases a
+                    JOIN canonical_entities e ON e.id = a.canonical_entity_id
+                    WHERE e.entity_type = :entity_type
+                      AND a.normalized_alias % :name
+                    ORDER BY similarity(a.normalized_alias, :name) DESC
+                    LIMIT :k
+                ) alias_candidates
+                UNION ALL
+                SELECT entity_id, candidate FROM (
+                    SELECT id AS entity_id, normalized_name AS candidate
+                    FROM canonical_entities
+                    WHERE entity_type = :entity_type
+                      AND normalized_name % :name
+                    ORDER BY similarity(normalized_name, :name) DESC
+                    LIMIT :k
+                ) name_candidates
+            """),
+            {
+                "entity_type": entity_type,
+                "name": normalized_name,
+                "k": self.name_candidate_limit,
+            },
+        ).fetchall()
+
+        scores = similarity_one_to_many(
+            normalized_name, [candidate for _, candidate in rows], self.fuzzy_threshold
+        )
+        best: Dict[int, float] = {}
+        for (entity_id, _), sim in zip(rows, scores.tolist()):
+            if sim >= self.fuzzy_threshold and sim > best.get(entity_id, -1.0):
+                best[entity_id] = sim
+
+        if not best:
+            return []
+
+        entities = (
+            self.db.query(CanonicalEntity)
+            .filter(CanonicalEntity.id.in_(list(best)))
+            .all()
+        )
+        matches = [(entity, best[entity.id]) for entity in entities]
+
+        # Sort by confidence descending (id breaks ties deterministically)
+        matches.sort(key=lambda x: (-x[1], x[0].id))
+        return matches
+
+    def _match_by_name_exhaustive(
+        self, entity_type: str, normalized_name: str
+    ) -> List[Tuple[CanonicalEntity, float]]:
+        """Match by fuzzy name against every alias and canonical name."""
         # Check aliases first (more comprehensive)
         alias_matches = (
             self.db.query(EntityAlias, CanonicalEntity)
@@ -708,11 +907,15 @@ class EntityResolver:
         matches = []
         seen_ids = set()
 
-        for alias, entity in alias_matches:
+        alias_scores = similarity_one_to_many(
+            normalized_name,
+            [alias.normalized_alias for alias, _ in alias_matches],
+            self.fuzzy_threshold,
+        )
+        for (alias, entity), sim in zip(alias_matches, alias_scores.tolist()):
             if entity.id in seen_ids:
                 continue
 
-            sim = similarity_ratio(normalized_name, alias.normalized_alias)
             if sim >= self.fuzzy_threshold:
                 matches.append((entity, sim))
                 seen_ids.add(entity.id)
@@ -724,11 +927,15 @@ class EntityResolver:
             .all()
         )
 
-        for entity in entities:
+        name_scores = similarity_one_to_many(
+            normalized_name,
+            [entity.normalized_name for entity in entities],
+            self.fuzzy_threshold,
+        )
+        for entity, sim in zip(entities, name_scores.tolist()):
             if entity.id in seen_ids:
                 continue
 
-            sim = similarity_ratio(normalized_name, entity.normalized_name)
             if sim >= self.fuzzy_threshold:
                 matches.append((entity, sim))
                 seen_ids.add(entity.id)
@@ -1143,69 +1350,129 @@ class EntityResolver:
         min_confidence: float = 0.70,
         max_confidence: float = 0.90,
         limit: int = 50,
+        *,
+        workers: int = 1,
+        max_block_size: int = DEFAULT_MAX_BLOCK_SIZE,
+        persist: bool = False,
     ) -> List[DuplicateCandidate]:
         """
         Find potential duplicate entities for review.
 
-        Returns pairs with confidence in the review range.
+        Only entities sharing a blocking key (name token, Soundex, name
+        4-gram, identifier or domain) are compared; see app.core.entity_dedup.
+
+        Args:
+            entity_type: Restrict to one entity type
+            min_confidence: Minimum name similarity (inclusive)
+            max_confidence: Maximum name similarity (exclusive)
+            limit: Number of top-ranked pairs returned
+            workers: Processes used to score candidate pairs
+            max_block_size: Blocks with more entities are skipped
+            persist: Upsert every in-range pair into
+                entity_duplicate_candidates as chunks are scored
+
+        Returns:
+            Highest-confidence pairs in the review range
         """
-        query = self.db.query(CanonicalEntity)
+        query = self.db.query(
+            CanonicalEntity.id,
+            CanonicalEntity.normalized_name,
+            CanonicalEntity.state,
+            CanonicalEntity.domain,
+            CanonicalEntity.cik,
+            CanonicalEntity.crd,
+            CanonicalEntity.ticker,
+            CanonicalEntity.cusip,
+            CanonicalEntity.lei,
+        )
 
         if entity_type:
             query = query.filter(CanonicalEntity.entity_type == entity_type)
 
-        entities = query.order_by(CanonicalEntity.id).all()
-
-        duplicates = []
-        seen_pairs = set()
-
-        for i, entity_a in enumerate(entities):
-            if len(duplicates) >= limit:
-                break
-
-            for entity_b in entities[i + 1 :]:
-                if len(duplicates) >= limit:
-                    break
-
-                # Skip if already seen
-                pair_key = (
-                    min(entity_a.id, entity_b.id),
-                    max(entity_a.id, entity_b.id),
+        records = []
+        states: Dict[int, Optional[str]] = {}
+        for row in query.order_by(CanonicalEntity.id).yield_per(10000):
+            identifiers = tuple(
+                f"{name}:{value}"
+                for name, value in zip(
+                    ("cik", "crd", "ticker", "cusip", "lei"), row[4:]
                 )
-                if pair_key in seen_pairs:
-                    continue
-                seen_pairs.add(pair_key)
-
-                # Calculate similarity
-                sim = similarity_ratio(
-                    entity_a.normalized_name, entity_b.normalized_name
+                if value
+            )
+            records.append(
+                EntityRecord(
+                    id=row[0],
+                    normalized_name=row[1] or "",
+                    state=row[2],
+                    domain=row[3],
+                    identifiers=identifiers,
                 )
+            )
+            states[row[0]] = row[2]
+
+        def _method(a_id: int, b_id: int) -> str:
+            # Determine match method
+            if states[a_id] and states[a_id] == states[b_id]:
+                return MatchMethod.NAME_LOCATION_MATCH.value
+            return MatchMethod.NAME_ONLY_MATCH.value
+
+        def _persist(pairs: List[Tuple[int, int, float]]) -> None:
+            detected_at = datetime.utcnow()
+            batch_insert(
+                self.db,
+                EntityDuplicateCandidate.__tablename__,
+                [
+                    {
+                        "entity_a_id": a_id,
+                        "entity_b_id": b_id,
+                        "confidence": sim,
+                        "match_method": _method(a_id, b_id),
+                        "status": "pending",
+                        "detected_at": detected_at,
+                    }
+                    for a_id, b_id, sim in pairs
+                ],
+                columns=[
+                    "entity_a_id",
+                    "entity_b_id",
+                    "confidence",
+                    "match_method",
+                    "status",
+                    "detected_at",
+                ],
+                conflict_columns=["entity_a_id", "entity_b_id"],
+                update_columns=["confidence", "match_method", "detected_at"],
+            )
 
-                if min_confidence <= sim < max_confidence:
-                    # Determine match method
-                    if (
-                        entity_a.state
-                        and entity_b.state
-                        and entity_a.state == entity_b.state
-                    ):
-                        method = MatchMethod.NAME_LOCATION_MATCH.value
-                    else:
-                        method = MatchMethod.NAME_ONLY_MATCH.value
-
-                    duplicates.append(
-                        DuplicateCandidate(
-                            entity_a_id=entity_a.id,
-                            entity_a_name=entity_a.canonical_name,
-                            entity_b_id=entity_b.id,
-                            entity_b_name=entity_b.canonical_name,
-                            confidence=sim,
-                            match_method=method,
-                        )
-                    )
+        finder = BlockedDuplicateFinder(max_block_size=max_block_size, workers=workers)
+        ranked = finder.find(
+            records,
+            min_confidence=min_confidence,
+            max_confidence=max_confidence,
+            limit=limit,
+            on_batch=_persist if persist else None,
+        )
 
-        # Sort by confidence descending
-        duplicates.sort(key=lambda x: x.confidence, reverse=True)
-        return duplicates[:limit]
+        names: Dict[int, str] = {}
+        if ranked:
+            ids = {entity_id for a_id, b_id, _ in ranked for entity_id in (a_id, b_id)}
+            names = dict(
+                self.db.query(CanonicalEntity.id, CanonicalEntity.canonical_name)
+                .filter(CanonicalEntity.id.in_(ids))
+                .all()
+            )
+
+        return [
+            DuplicateCandidate(
+                entity_a_id=a_id,
+                entity_a_name=names.get(a_id, ""),
+                entity_b_id=b_id,
+                entity_b_name=names.get(b_id, ""),
+                confidence=sim,
+                match_method=_method(a_id, b_id),
+            )
+            for a_id, b_id, sim in ranked
+        ]
 
     # -------------------------------------------------------------------------
     # LOOKUP
@@ -3,17 +3,34 @@ Base HTTP client with unified retry logic, rate limiting, and error handling.
 
 Provides a reusable foundation for all external API clients in the application.
 Implements bounded concurrency, exponential backoff, and standardized error handling.
+
+Connections are pooled per process, not per client: every client built on
+shared_transport() borrows from one pool per origin (scheme, host, port),
+so jobs hitting the same API reuse warm TCP/TLS connections. Pools speak
+HTTP/2 where the server negotiates it (requires the optional ``h2``
+package) and cap connections per host; pool_stats() reports reuse and
+time spent waiting for a connection.
 """
 
 import asyncio
 import logging
 import os
 import random
+import time
+import weakref
 from abc import ABC
+from dataclasses import asdict, dataclass
 from typing import Dict, List, Optional, Any, Callable, TypeVar
 from urllib.parse import urlparse
 import httpx
 
+try:
+    import h2  # noqa: F401 — enables HTTP/2 in httpx
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 from app.core.api_errors import (
     APIError,
     RetryableError,
@@ -30,6 +47,158 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T")
 
 
+# =============================================================================
+# Shared per-host connection pools
+# =============================================================================
+
+# Per-origin limits, shared by every client in the process
+POOL_MAX_CONNECTIONS_PER_HOST = int(os.getenv("HTTP_POOL_MAX_CONNECTIONS_PER_HOST", "20"))
+POOL_MAX_KEEPALIVE_PER_HOST = int(os.getenv("HTTP_POOL_MAX_KEEPALIVE_PER_HOST", "10"))
+POOL_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_POOL_KEEPALIVE_EXPIRY", "30"))
+
+
+@dataclass
+class PoolStats:
+    """Counters for one origin's pool."""
+
+    requests: int = 0
+    connections_opened: int = 0
+    reused: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+    http2: bool = False
+
+
+class _HostPool:
+    """One origin's connection pool plus its stats."""
+
+    def __init__(self, http2: bool):
+        self.transport = httpx.AsyncHTTPTransport(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=POOL_MAX_CONNECTIONS_PER_HOST,
+                max_keepalive_connections=POOL_MAX_KEEPALIVE_PER_HOST,
+                keepalive_expiry=POOL_KEEPALIVE_EXPIRY,
+            ),
+        )
+        self.stats = PoolStats(http2=http2)
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        """
+        Send through the pool, using httpcore trace events to tell a fresh
+        connection from a reused one and to time the wait for a free slot
+        (request start to first header write, minus connect/TLS time).
+        """
+        started = time.perf_counter()
+        state = {"opened": False, "connect_s": 0.0, "step": None, "sent": None}
+        outer = request.extensions.get("trace")
+
+        async def trace(event: str, info: Dict[str, Any]) -> None:
+            now = time.perf_counter()
+            if event in ("connection.connect_tcp.started", "connection.start_tls.started"):
+                state["opened"] = True
+                state["step"] = now
+            elif event in ("connection.connect_tcp.complete", "connection.start_tls.complete"):
+                if state["step"] is not None:
+                    state["connect_s"] += now - state["step"]
+                    state["step"] = None
+            elif event.endswith("send_request_headers.started") and state["sent"] is None:
+                state["sent"] = now
+            if outer is not None:
+                await outer(event, info)
+
+        request.extensions = {**request.extensions, "trace": trace}
+        try:
+            return await self.transport.handle_async_request(request)
+        finally:
+            stats = self.stats
+            stats.requests += 1
+            if state["opened"]:
+                stats.connections_opened += 1
+            elif state["sent"] is not None:
+                stats.reused += 1
+            if state["sent"] is not None:
+                wait = max(state["sent"] - started - state["connect_s"], 0.0)
+                stats.wait_seconds_total += wait
+                stats.wait_seconds_max = max(stats.wait_seconds_max, wait)
+
+
+class _PoolRegistry:
+    """
+    Host pools keyed by event loop, then origin.
+
+    Connections belong to the loop that opened them, so each loop (the
+    worker's, or each asyncio.run in scripts and tests) gets its own pools;
+    they are dropped with the loop.
+    """
+
+    def __init__(self):
+        self._pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, _HostPool]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def pool_for(self, url: httpx.URL) -> _HostPool:
+        pools = self._pools.setdefault(asyncio.get_running_loop(), {})
+        port = url.port or (443 if url.scheme == "https" else 80)
+        origin = f"{url.scheme}://{url.host}:{port}"
+        pool = pools.get(origin)
+        if pool is None:
+            pool = pools[origin] = _HostPool(http2=HTTP2_AVAILABLE and url.scheme == "https")
+        return pool
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        merged: Dict[str, PoolStats] = {}
+        for pools in list(self._pools.values()):
+            for origin, pool in pools.items():
+                total = merged.setdefault(origin, PoolStats(http2=pool.stats.http2))
+                total.requests += pool.stats.requests
+                total.connections_opened += pool.stats.connections_opened
+                total.reused += pool.stats.reused
+                total.wait_seconds_total += pool.stats.wait_seconds_total
+                total.wait_seconds_max = max(total.wait_seconds_max, pool.stats.wait_seconds_max)
+        return {origin: asdict(stats) for origin, stats in sorted(merged.items())}
+
+    async def aclose(self) -> None:
+        """Close the running loop's pools."""
+        pools = self._pools.pop(asyncio.get_running_loop(), {})
+        for pool in pools.values():
+            await pool.transport.aclose()
+
+
+_registry = _PoolRegistry()
+
+
+class SharedPoolTransport(httpx.AsyncBaseTransport):
+    """
+    Transport that routes each request to the process-wide pool for its
+    origin. Closing a client that uses it leaves the pools open.
+    """
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await _registry.pool_for(request.url).handle(request)
+
+    async def aclose(self) -> None:
+        pass
+
+
+_shared_transport = SharedPoolTransport()
+
+
+def shared_transport() -> SharedPoolTransport:
+    """Transport for httpx.AsyncClient(transport=...) backed by the shared pools."""
+    return _shared_transport
+
+
+def pool_stats() -> Dict[str, Dict[str, Any]]:
+    """Per-origin request, connection reuse and wait-time counters."""
+    return _registry.stats()
+
+
+async def close_shared_pools() -> None:
+    """Close the current event loop's shared pools (e.g. on worker shutdown)."""
+    await _registry.aclose()
+
+
 class BaseAPIClient(ABC):
     """
     Base class for all external API clients.
@@ -39,7 +208,7 @@ class BaseAPIClient(ABC):
     - Exponential backoff with jitter
     - Rate limiting via semaphore
     - Standardized error classification
-    - Connection pooling
+    - Connection pooling (process-wide, per host; see shared_transport)
 
     Subclasses should:
     - Set SOURCE_NAME and BASE_URL class attributes
@@ -108,20 +277,17 @@ class BaseAPIClient(ABC):
         )
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create the HTTP client with connection pooling."""
+        """Get or create the HTTP client (connections come from the shared pools)."""
         if self._client is None:
             self._client = httpx.AsyncClient(
                 timeout=httpx.Timeout(self.timeout, connect=self.connect_timeout),
                 follow_redirects=True,
-                limits=httpx.Limits(
-                    max_connections=self.max_concurrency * 2,
-                    max_keepalive_connections=self.max_concurrency,
-                ),
+                transport=shared_transport(),
             )
         return self._client
 
     async def close(self) -> None:
-        """Close the HTTP client and release resources."""
+        """Close the HTTP client; pooled connections stay open for other clients."""
         if self._client:
             await self._client.aclose()
             self._client = None
@@ -6,23 +6,34 @@ Provides reusable logic for:
 - Dataset registry management
 - Job status tracking
 - Common ingestion patterns
+- Streaming fetch -> parse -> insert pipelines with bounded memory
 """
 
+import asyncio
 import logging
 from abc import ABC
-from typing import Dict, Any, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, AsyncIterator, Callable
 from datetime import datetime
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, sessionmaker
 
 from app.core.models import DatasetRegistry, IngestionJob, JobStatus
 from app.core.batch_operations import (
     batch_insert,
     BatchInsertResult,
     create_table_if_not_exists,
+    update_rows_committed,
 )
 
 logger = logging.getLogger(__name__)
 
+# Pages buffered between pipeline stages. Peak memory of a streaming
+# ingestion is roughly 2 * STREAM_QUEUE_SIZE pages (raw + parsed).
+DEFAULT_STREAM_QUEUE_SIZE = 4
+
+# Sentinel marking the end of a pipeline stage's output
+_STREAM_END = object()
+
 
 class BaseSourceIngestor(ABC):
     """
@@ -277,10 +288,14 @@ class BaseSourceIngestor(ABC):
         update_columns: Optional[List[str]] = None,
         batch_size: int = 1000,
         job_id: Optional[int] = None,
+        use_copy: bool = False,
     ) -> BatchInsertResult:
         """
         Insert rows into table using batch operations.
 
+        Large loads can opt into ``use_copy`` to stream rows through COPY
+        into a staging table and merge them in a single statement per chunk.
+
         Args:
             table_name: Target table
             rows: Data rows
@@ -289,6 +304,7 @@ class BaseSourceIngestor(ABC):
             update_columns: Columns to update on conflict
             batch_size: Rows per batch
             job_id: Optional ingestion job ID for progress tracking
+            use_copy: Load via COPY + staging-table merge
 
         Returns:
             BatchInsertResult with statistics
@@ -310,7 +326,137 @@ class BaseSourceIngestor(ABC):
             conflict_columns=conflict_columns,
             update_columns=update_columns,
             job_id=job_id,
+            use_copy=use_copy,
+        )
+
+    async def stream_insert_rows(
+        self,
+        pages: AsyncIterator[Any],
+        parse_func: Callable[[Any], List[Dict[str, Any]]],
+        table_name: str,
+        columns: List[str],
+        conflict_columns: Optional[List[str]] = None,
+        update_columns: Optional[List[str]] = None,
+        batch_size: int = 1000,
+        job_id: Optional[int] = None,
+        use_copy: bool = False,
+        queue_size: int = DEFAULT_STREAM_QUEUE_SIZE,
+    ) -> BatchInsertResult:
+        """
+        Insert rows from a paged source with fetch, parse and insert overlapping.
+
+        Three stages are connected by bounded queues:
+        1. fetch: iterates ``pages`` (an async iterator of raw pages)
+        2. parse: runs ``parse_func`` on each page in a worker thread
+        3. insert: writes each page's rows via batch_insert on a dedicated
+           thread with its own Session (self.db stays on the caller's thread)
+
+        ``parse_func`` must be thread-safe and must not touch self.db.
+
+        Only ``queue_size`` raw pages and ``queue_size`` parsed pages are held
+        at once, so peak memory is bounded by queue depth instead of dataset
+        size. A failure in any stage cancels the others and is re-raised.
+
+        Args:
+            pages: Async iterator yielding raw pages (e.g. API responses)
+            parse_func: Function that parses one raw page into row dicts
+            table_name: Target table
+            columns: Column names
+            conflict_columns: Columns for ON CONFLICT (upsert)
+            update_columns: Columns to update on conflict
+            batch_size: Rows per batch within a page
+            job_id: Optional ingestion job ID; rows_committed is updated per page
+            use_copy: Load via COPY + staging-table merge
+            queue_size: Max pages buffered between adjacent stages
+
+        Returns:
+            BatchInsertResult aggregated across all pages
+        """
+        raw_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        row_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        total = BatchInsertResult()
+
+        async def _fetch():
+            async for page in pages:
+                await raw_queue.put(page)
+            await raw_queue.put(_STREAM_END)
+
+        async def _parse():
+            while True:
+                page = await raw_queue.get()
+                if page is _STREAM_END:
+                    break
+                rows = await asyncio.to_thread(parse_func, page)
+                if rows:
+                    await row_queue.put(rows)
+            await row_queue.put(_STREAM_END)
+
+        # Inserts run on one thread that owns its Session for the whole stream
+        insert_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="stream-insert")
+        SessionFactory = sessionmaker(bind=self.db.get_bind(), autocommit=False, autoflush=False)
+        insert_db: List[Session] = []
+
+        def _insert_page(rows: List[Dict[str, Any]]) -> BatchInsertResult:
+            if not insert_db:
+                insert_db.append(SessionFactory())
+            db = insert_db[0]
+            result = batch_insert(
+                db=db,
+                table_name=table_name,
+                rows=rows,
+                columns=columns,
+                batch_size=batch_size,
+                conflict_columns=conflict_columns,
+                update_columns=update_columns,
+                use_copy=use_copy,
+            )
+            if job_id:
+                update_rows_committed(
+                    db, job_id, total.rows_inserted + result.rows_inserted
+                )
+            return result
+
+        def _close_insert_db() -> None:
+            for db in insert_db:
+                db.close()
+
+        async def _insert():
+            while True:
+                rows = await row_queue.get()
+                if rows is _STREAM_END:
+                    break
+                result = await loop.run_in_executor(insert_pool, _insert_page, rows)
+                total.rows_inserted += result.rows_inserted
+                total.rows_updated += result.rows_updated
+                total.batches_processed += result.batches_processed
+
+        loop = asyncio.get_running_loop()
+        tasks = [
+            asyncio.create_task(_fetch()),
+            asyncio.create_task(_parse()),
+            asyncio.create_task(_insert()),
+        ]
+        try:
+            done, pending = await asyncio.wait(
+                tasks, return_when=asyncio.FIRST_EXCEPTION
+            )
+            for task in done:
+                if task.exception():
+                    raise task.exception()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await loop.run_in_executor(insert_pool, _close_insert_db)
+            insert_pool.shutdown(wait=False)
+            total.mark_complete()
+
+        logger.info(
+            f"Streamed {total.rows_inserted} rows into {table_name} "
+            f"({total.batches_processed} batches)"
         )
+        return total
 
 
 class SimpleIngestor(BaseSourceIngestor):
@@ -336,6 +482,7 @@ class SimpleIngestor(BaseSourceIngestor):
         description: Optional[str] = None,
         source_metadata: Optional[Dict[str, Any]] = None,
         batch_size: int = 1000,
+        use_copy: bool = False,
     ) -> Dict[str, Any]:
         """
         Run a complete ingestion workflow.
@@ -354,6 +501,7 @@ class SimpleIngestor(BaseSourceIngestor):
             description: Dataset description
             source_metadata: Additional metadata
             batch_size: Rows per batch
+            use_copy: Load via COPY + staging-table merge (large datasets)
 
         Returns:
             Dict with ingestion results
@@ -388,6 +536,7 @@ class SimpleIngestor(BaseSourceIngestor):
                 conflict_columns=conflict_columns,
                 update_columns=update_columns,
                 batch_size=batch_size,
+                use_copy=use_copy,
             )
 
             # 6. Complete job
@@ -407,6 +556,92 @@ class SimpleIngestor(BaseSourceIngestor):
             self.fail_job(job_id, e)
             raise
 
+    async def run_streaming_ingestion(
+        self,
+        job_id: int,
+        dataset_id: str,
+        table_name: str,
+        create_sql: str,
+        fetch_pages_func: Callable[[], AsyncIterator[Any]],
+        parse_page_func: Callable[[Any], List[Dict[str, Any]]],
+        columns: List[str],
+        conflict_columns: Optional[List[str]] = None,
+        update_columns: Optional[List[str]] = None,
+        display_name: Optional[str] = None,
+        description: Optional[str] = None,
+        source_metadata: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1000,
+        use_copy: bool = False,
+        queue_size: int = DEFAULT_STREAM_QUEUE_SIZE,
+    ) -> Dict[str, Any]:
+        """
+        Run a complete ingestion workflow as a streaming pipeline.
+
+        Same contract as run_ingestion, except fetch yields pages and parse
+        runs per page, so the whole dataset is never materialized.
+
+        Args:
+            job_id: Ingestion job ID
+            dataset_id: Dataset identifier
+            table_name: Target table name
+            create_sql: CREATE TABLE SQL
+            fetch_pages_func: Callable returning an async iterator of raw pages
+            parse_page_func: Function that parses one raw page into row dicts
+            columns: Column names for insert
+            conflict_columns: Columns for ON CONFLICT
+            update_columns: Columns to update on conflict
+            display_name: Human-readable name
+            description: Dataset description
+            source_metadata: Additional metadata
+            batch_size: Rows per batch
+            use_copy: Load via COPY + staging-table merge (large datasets)
+            queue_size: Max pages buffered between pipeline stages
+
+        Returns:
+            Dict with ingestion results
+        """
+        try:
+            self.start_job(job_id)
+
+            self.prepare_table(
+                dataset_id=dataset_id,
+                table_name=table_name,
+                create_sql=create_sql,
+                display_name=display_name,
+                description=description,
+                source_metadata=source_metadata,
+            )
+
+            logger.info(f"Streaming data for {dataset_id}")
+            result = await self.stream_insert_rows(
+                pages=fetch_pages_func(),
+                parse_func=parse_page_func,
+                table_name=table_name,
+                columns=columns,
+                conflict_columns=conflict_columns,
+                update_columns=update_columns,
+                batch_size=batch_size,
+                job_id=job_id,
+                use_copy=use_copy,
+                queue_size=queue_size,
+            )
+
+            self.complete_job(job_id, result.rows_inserted)
+
+            return {
+                "status": "success",
+                "table_name": table_name,
+                "dataset_id": dataset_id,
+                "rows_inserted": result.rows_inserted,
+                "batches_processed": result.batches_processed,
+                "duration_seconds": result.duration_seconds,
+            }
+
+        except Exception as e:
+            logger.error(f"Streaming ingestion failed for {dataset_id}: {e}", exc_info=True)
+            self.fail_job(job_id, e)
+            raise
+
 
 def create_ingestion_job(
     db: Session, source: str, config: Dict[str, Any]
@@ -4,7 +4,8 @@ Job queue submission service.
 Provides submit_job() — the single entry point for all collection endpoints.
 
 When WORKER_MODE is enabled:
-    Inserts a row into job_queue with status='pending'.
+    Inserts a row into job_queue with status='pending' and sends a
+    NOTIFY on JOB_QUEUE_CHANNEL so idle workers wake up immediately.
     A separate worker process claims and executes it.
 
 When WORKER_MODE is disabled (default):
@@ -24,6 +25,30 @@ logger = logging.getLogger(__name__)
 
 WORKER_MODE = os.getenv("WORKER_MODE", "") in ("1", "true", "True")
 
+# PG NOTIFY channels that signal claimable work to idle workers
+JOB_QUEUE_CHANNEL = "job_queue"
+JOBS_PROMOTED_CHANNEL = "jobs_promoted"
+
+
+def notify_job_available(db: Session, job_type: str, job_id: Optional[int] = None) -> None:
+    """
+    Wake idle workers via pg_notify after a job becomes claimable.
+
+    Must be called after the job row is committed. Best-effort: workers
+    still poll on a fallback interval if the notification is lost.
+    """
+    from sqlalchemy import text
+
+    job_type_value = job_type.value if hasattr(job_type, "value") else job_type
+    try:
+        db.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {"channel": JOB_QUEUE_CHANNEL, "payload": f"{job_type_value}:{job_id or ''}"},
+        )
+        db.commit()
+    except Exception:
+        db.rollback()  # pg_notify is best-effort
+
 
 def submit_job(
     db: Session,
@@ -70,6 +95,9 @@ def submit_job(
         db.commit()
         db.refresh(job)
 
+        if job.status == QueueJobStatus.PENDING:
+            notify_job_available(db, job_type, job.id)
+
         logger.info(f"Job queued: id={job.id} type={job_type} priority={priority}")
         return {"mode": "queued", "job_queue_id": job.id}
 
@@ -286,8 +314,8 @@ def promote_blocked_jobs(db: Session, batch_id: str) -> int:
         db.commit()
         # Wake workers via pg_notify
         try:
-            db.execute(text("SELECT pg_notify('jobs_promoted', :batch_id)"),
-                       {"batch_id": batch_id})
+            db.execute(text("SELECT pg_notify(:channel, :batch_id)"),
+                       {"channel": JOBS_PROMOTED_CHANNEL, "batch_id": batch_id})
             db.commit()
         except Exception:
             pass  # pg_notify is best-effort
@@ -0,0 +1,24 @@
+"""
+Apply database migrations outside the API process.
+
+Run once per deploy (e.g. as a Kubernetes init container) and start the API
+with RUN_MIGRATIONS_ON_STARTUP=false, so pods don't repeat create_all and
+the ALTER TABLE / backfill statements before serving:
+
+    python -m app.core.migrate
+"""
+
+import logging
+
+from app.core.database import run_migrations
+
+
+def main() -> None:
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+    run_migrations()
+
+
+if __name__ == "__main__":
+    main()
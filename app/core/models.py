@@ -2466,6 +2466,15 @@ class DataProfileSnapshot(Base):
     profiled_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     execution_time_ms = Column(Integer, nullable=True)
 
+    # Incremental profiling: "full" (SQL stats), "full_sketch" (all rows
+    # sketched) or "incremental" (new rows merged into the previous sketches)
+    profile_mode = Column(String(20), nullable=True)
+    watermark = Column(JSON, nullable=True)  # {column, value} covered so far
+
+    # Profiling cost: {queries, column_groups, parallel, group_ms,
+    # budget_exhausted, skipped_columns, ...} or {rows_read} for sketches
+    profile_cost = Column(JSON, nullable=True)
+
     __table_args__ = (
         Index("idx_profile_snap_table_date", "table_name", "profiled_at"),
     )
@@ -2506,6 +2515,9 @@ class DataProfileColumn(Base):
     # Temporal: {min_date, max_date, date_range_days}
     stats = Column(JSON, nullable=True)
 
+    # Mergeable sketch state (app.core.profile_sketches.ColumnSketch.to_dict)
+    sketch = Column(JSON, nullable=True)
+
     __table_args__ = (
         Index("idx_profile_col_snapshot", "snapshot_id"),
     )
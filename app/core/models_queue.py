@@ -45,6 +45,7 @@ class QueueJobType(str, enum.Enum):
     AGENTIC = "agentic"
     FOOT_TRAFFIC = "foot_traffic"
     INGESTION = "ingestion"
+    TXN_PROBABILITY = "txn_probability"
 
 
 class JobQueue(Base):
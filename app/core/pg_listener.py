@@ -5,6 +5,9 @@ Runs as an asyncio task inside the API process. Listens on the
 'job_events' PostgreSQL channel and republishes received events
 into the in-memory EventBus so SSE clients get live updates.
 
+Also provides ChannelWakeupListener, used by workers to block on
+LISTEN for new queue work instead of polling job_queue.
+
 Uses psycopg2 raw connection (not SQLAlchemy) because LISTEN
 requires a persistent, non-pooled connection.
 """
@@ -13,19 +16,24 @@ import asyncio
 import json
 import logging
 import select
-from typing import Optional
+import threading
+from typing import Iterable, Optional
 
 import psycopg2
 
 from app.core.config import get_settings
 from app.core.event_bus import EventBus
 from app.core.pg_notify import CHANNEL
+from app.core.safe_sql import qi
 
 logger = logging.getLogger(__name__)
 
 # How often to poll for notifications (seconds)
 _POLL_INTERVAL = 0.5
 
+# Delay before reconnecting a dropped wakeup listener (seconds)
+_RECONNECT_DELAY = 5.0
+
 _listener_task: Optional[asyncio.Task] = None
 
 
@@ -130,3 +138,82 @@ async def stop_pg_listener():
             pass
         _listener_task = None
         logger.info("PG listener stopped")
+
+
+class ChannelWakeupListener:
+    """
+    LISTEN on one or more channels and set an asyncio.Event on each NOTIFY.
+
+    The blocking psycopg2 connection lives in a daemon thread that
+    reconnects after errors. ``connected`` reports whether LISTEN is
+    currently active so callers can fall back to faster polling while
+    the listener is down.
+
+    Usage:
+        wakeup = asyncio.Event()
+        listener = ChannelWakeupListener(["job_queue"], wakeup)
+        listener.start()
+        ...
+        await asyncio.wait_for(wakeup.wait(), timeout=30)
+        ...
+        listener.stop()
+    """
+
+    def __init__(
+        self,
+        channels: Iterable[str],
+        wakeup: asyncio.Event,
+        dsn: Optional[str] = None,
+    ):
+        self.channels = list(channels)
+        self.wakeup = wakeup
+        self.dsn = dsn
+        self.connected = False
+        self.notifications_received = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def start(self) -> None:
+        """Start the listener thread (must be called from the event loop)."""
+        self._loop = asyncio.get_running_loop()
+        self.dsn = self.dsn or _get_raw_dsn()
+        self._thread = threading.Thread(
+            target=self._run, name="pg-wakeup-listener", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Signal the listener thread to exit (it closes within _POLL_INTERVAL)."""
+        self._stop.set()
+
+    def _notify(self) -> None:
+        self.notifications_received += 1
+        self.wakeup.set()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            conn = None
+            try:
+                conn = psycopg2.connect(self.dsn)
+                conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+                cur = conn.cursor()
+                for channel in self.channels:
+                    cur.execute(f"LISTEN {qi(channel)};")
+                self.connected = True
+                logger.info(f"Wakeup listener connected, channels={self.channels}")
+
+                while not self._stop.is_set():
+                    if select.select([conn], [], [], _POLL_INTERVAL) == ([], [], []):
+                        continue
+                    conn.poll()
+                    if conn.notifies:
+                        conn.notifies.clear()
+                        self._loop.call_soon_threadsafe(self._notify)
+            except Exception as e:
+                logger.warning(f"Wakeup listener error, falling back to polling: {e}")
+            finally:
+                self.connected = False
+                if conn and not conn.closed:
+                    conn.close()
+            self._stop.wait(_RECONNECT_DELAY)
@@ -1,13 +1,14 @@
 """
 Deal Probability Engine — Database Models (SPEC 045, PLAN_059 Phase 1).
 
-Six tables that power the P(transaction within 6-12 months) scoring system:
+Tables that power the P(transaction within 6-12 months) scoring system:
 - txn_prob_companies: Universe of scored companies (sourced from PE portfolio, industrial, Form D filers)
 - txn_prob_signals: Per-company per-signal time-series snapshots with velocity/acceleration
 - txn_prob_scores: Composite probability per company per run, with full signal chain
 - txn_prob_outcomes: Ground truth labels for the learning loop
 - txn_prob_alerts: Threshold-crossing alerts (probability spike, convergence, grade change)
 - sector_signal_weights: Sector-specific weight overrides with version tracking
+- txn_prob_batches / txn_prob_batch_shards: Universe scoring runs, publish state and shard checkpoints
 """
 
 from sqlalchemy import (
@@ -338,3 +339,90 @@ class SectorSignalWeight(Base):
             "sector", "signal_type", "version", name="uq_sector_signal_weights_key"
         ),
     )
+
+
+# Universe scoring run / shard statuses
+BATCH_RUNNING = "running"
+BATCH_PUBLISHED = "published"
+SHARD_PENDING = "pending"
+SHARD_RUNNING = "running"
+SHARD_DONE = "done"
+SHARD_FAILED = "failed"
+
+
+class TxnProbBatch(Base):
+    """
+    One universe scoring run; batch_id is shared by its signals and scores.
+
+    Scores of a run stay out of rankings until the run is published (a
+    single-row status flip), so readers never see a half-written batch.
+    Scores whose batch_id has no row here (ad-hoc score_company calls)
+    are always visible.
+    """
+
+    __tablename__ = "txn_prob_batches"
+
+    batch_id = Column(String(60), primary_key=True)
+    status = Column(String(20), nullable=False, default=BATCH_RUNNING)  # running|published
+    shard_size = Column(Integer)
+    total_shards = Column(Integer, default=0)
+    total_companies = Column(Integer, default=0)
+    succeeded = Column(Integer, default=0)
+    failed = Column(Integer, default=0)
+    created_at = Column(DateTime, server_default=func.now())
+    published_at = Column(DateTime)
+
+    def to_dict(self):
+        return {
+            "batch_id": self.batch_id,
+            "status": self.status,
+            "shard_size": self.shard_size,
+            "total_shards": self.total_shards,
+            "total_companies": self.total_companies,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "published_at": self.published_at.isoformat() if self.published_at else None,
+        }
+
+
+class TxnProbBatchShard(Base):
+    """
+    Checkpoint for one shard of a distributed universe scoring run.
+
+    company_ids is fixed when the run is created, so a resumed run scores
+    exactly the same universe. A shard marked done is skipped on rerun.
+    """
+
+    __tablename__ = "txn_prob_batch_shards"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    batch_id = Column(
+        String(60), ForeignKey("txn_prob_batches.batch_id", ondelete="CASCADE"), nullable=False
+    )
+    shard_index = Column(Integer, nullable=False)
+    company_ids = Column(JSON, nullable=False)
+    status = Column(String(20), nullable=False, default=SHARD_PENDING)  # pending|running|done|failed
+    succeeded = Column(Integer, default=0)
+    failed = Column(Integer, default=0)
+    job_queue_id = Column(Integer)
+    error_message = Column(Text)
+    started_at = Column(DateTime)
+    completed_at = Column(DateTime)
+
+    __table_args__ = (
+        UniqueConstraint("batch_id", "shard_index", name="uq_txn_prob_batch_shard"),
+    )
+
+    def to_dict(self):
+        return {
+            "shard_index": self.shard_index,
+            "status": self.status,
+            "company_count": len(self.company_ids or []),
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "job_queue_id": self.job_queue_id,
+            "error_message": self.error_message,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+        }
@@ -0,0 +1,454 @@
+"""
+Mergeable column sketches for incremental data profiling.
+
+Each sketch summarises one column in bounded space and can be merged with a
+sketch of other rows, so a profile can be maintained by sketching only newly
+ingested rows and folding them into the previous snapshot's sketches:
+
+- HyperLogLog: distinct counts (exact below SPARSE_MAX distinct values)
+- KLLSketch: quantiles (p25 / median / p75)
+- TopK: Misra-Gries heavy hitters for top_values
+- ColumnSketch: counts, min/max, mean/stddev (Chan's parallel moments),
+  string lengths, plus the three sketches above
+
+All sketches round-trip through plain JSON (to_dict / from_dict) so they can
+be stored on DataProfileColumn.sketch.
+"""
+
+import base64
+import math
+import zlib
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+SKETCH_VERSION = 1
+
+
+def hash_values(values: pd.Series, kind: str) -> np.ndarray:
+    """Deterministic 64-bit hashes of non-null values.
+
+    Numeric values are hashed as float64 so int/float/Decimal chunks of the
+    same column hash identically; everything else is hashed by its text.
+    """
+    if kind == "numeric":
+        arr = pd.to_numeric(values, errors="coerce").to_numpy(dtype="float64")
+        return pd.util.hash_array(arr[~np.isnan(arr)])
+    return pd.util.hash_array(_as_text(values).to_numpy(dtype=object))
+
+
+def _as_text(values: pd.Series) -> pd.Series:
+    # map(str) rather than astype(str): datetime64 columns would otherwise
+    # drop the time part for chunks that happen to be all-midnight
+    return values.map(str)
+
+
+# =============================================================================
+# HyperLogLog
+# =============================================================================
+
+
+class HyperLogLog:
+    """HyperLogLog distinct counter with an exact sparse mode.
+
+    Keeps the exact set of hashes until it exceeds SPARSE_MAX entries, then
+    switches to 2**p registers (~1.6% standard error at p=12).
+    """
+
+    SPARSE_MAX = 256
+
+    def __init__(self, p: int = 12):
+        self.p = p
+        self.m = 1 << p
+        self.sparse: Optional[set] = set()
+        self.registers: Optional[np.ndarray] = None
+
+    def add_hashes(self, hashes: np.ndarray) -> None:
+        if len(hashes) == 0:
+            return
+        if self.sparse is not None:
+            self.sparse.update(int(h) for h in np.unique(hashes))
+            if len(self.sparse) > self.SPARSE_MAX:
+                self._densify()
+            return
+        self._add_dense(hashes)
+
+    def _densify(self) -> None:
+        self.registers = np.zeros(self.m, dtype=np.uint8)
+        hashes = np.fromiter(self.sparse, dtype=np.uint64, count=len(self.sparse))
+        self.sparse = None
+        self._add_dense(hashes)
+
+    def _add_dense(self, hashes: np.ndarray) -> None:
+        hashes = hashes.astype(np.uint64, copy=False)
+        width = 64 - self.p
+        idx = (hashes >> np.uint64(width)).astype(np.int64)
+        rest = hashes & np.uint64((1 << width) - 1)
+        # rest < 2**52 fits a float64 mantissa exactly, so frexp yields its
+        # bit length; rank = position of the leftmost 1-bit
+        _, bit_length = np.frexp(rest.astype(np.float64))
+        rank = (width - bit_length + 1).astype(np.uint8)
+        np.maximum.at(self.registers, idx, rank)
+
+    def merge(self, other: "HyperLogLog") -> None:
+        if other.p != self.p:
+            raise ValueError(f"Cannot merge HyperLogLog p={other.p} into p={self.p}")
+        if other.sparse is not None:
+            if other.sparse:
+                self.add_hashes(np.fromiter(other.sparse, dtype=np.uint64, count=len(other.sparse)))
+            return
+        if self.sparse is not None:
+            self._densify()
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def estimate(self) -> int:
+        if self.sparse is not None:
+            return len(self.sparse)
+        m = self.m
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros:
+            return int(round(m * math.log(m / zeros)))
+        return int(round(raw))
+
+    def to_dict(self) -> Dict[str, Any]:
+        if self.sparse is not None:
+            return {"p": self.p, "sparse": sorted(self.sparse)}
+        packed = base64.b64encode(zlib.compress(self.registers.tobytes())).decode("ascii")
+        return {"p": self.p, "registers": packed}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "HyperLogLog":
+        hll = cls(p=data.get("p", 12))
+        if "registers" in data:
+            raw = zlib.decompress(base64.b64decode(data["registers"]))
+            hll.registers = np.frombuffer(raw, dtype=np.uint8).copy()
+            hll.sparse = None
+        else:
+            hll.sparse = set(int(h) for h in data.get("sparse", []))
+        return hll
+
+
+# =============================================================================
+# KLL quantile sketch
+# =============================================================================
+
+
+class KLLSketch:
+    """KLL quantile sketch with deterministic (alternating) compaction.
+
+    Level h holds items of weight 2**h. While nothing has been compacted the
+    sketch is exact and quantiles interpolate like PERCENTILE_CONT.
+    """
+
+    def __init__(self, k: int = 128):
+        self.k = k
+        self.n = 0
+        self.levels: List[np.ndarray] = [np.empty(0)]
+        self._coin = 0
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(2, int(math.ceil(self.k * (2.0 / 3.0) ** depth)))
+
+    def update(self, values: np.ndarray) -> None:
+        values = np.asarray(values, dtype=np.float64)
+        if len(values) == 0:
+            return
+        self.n += len(values)
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+
+    def _compress(self) -> None:
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                items = np.sort(items)
+                # keep an odd leftover at this level so weights stay exact
+                carry = items[: len(items) % 2]
+                pairs = items[len(carry):]
+                promoted = pairs[self._coin::2]
+                self._coin ^= 1
+                self.levels[level] = carry
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+
+    def merge(self, other: "KLLSketch") -> None:
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.n += other.n
+        self._compress()
+
+    def quantiles(self, qs: List[float]) -> List[Optional[float]]:
+        if self.n == 0:
+            return [None for _ in qs]
+        if len(self.levels) == 1:
+            return [float(v) for v in np.percentile(self.levels[0], [q * 100 for q in qs])]
+        items = np.concatenate(self.levels)
+        weights = np.concatenate(
+            [np.full(len(lvl), 2 ** h, dtype=np.float64) for h, lvl in enumerate(self.levels)]
+        )
+        order = np.argsort(items, kind="mergesort")
+        items, cum = items[order], np.cumsum(weights[order])
+        total = cum[-1]
+        out = []
+        for q in qs:
+            pos = int(np.searchsorted(cum, q * total, side="left"))
+            out.append(float(items[min(pos, len(items) - 1)]))
+        return out
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "k": self.k,
+            "n": self.n,
+            "coin": self._coin,
+            "levels": [lvl.tolist() for lvl in self.levels],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "KLLSketch":
+        kll = cls(k=data.get("k", 128))
+        kll.n = data.get("n", 0)
+        kll._coin = data.get("coin", 0)
+        kll.levels = [np.asarray(lvl, dtype=np.float64) for lvl in data.get("levels", [[]])]
+        return kll
+
+
+# =============================================================================
+# Top-k heavy hitters
+# =============================================================================
+
+
+class TopK:
+    """Misra-Gries frequent items summary.
+
+    Exact while the column has at most `capacity` distinct values; beyond that
+    counts are lower bounds (undercounted by at most n / capacity).
+    """
+
+    def __init__(self, capacity: int = 64):
+        self.capacity = capacity
+        self.counts: Dict[str, int] = {}
+
+    def update(self, values: pd.Series) -> None:
+        if len(values) == 0:
+            return
+        for value, count in _as_text(values).value_counts().items():
+            self.counts[value] = self.counts.get(value, 0) + int(count)
+        self._reduce()
+
+    def merge(self, other: "TopK") -> None:
+        for value, count in other.counts.items():
+            self.counts[value] = self.counts.get(value, 0) + count
+        self._reduce()
+
+    def _reduce(self) -> None:
+        if len(self.counts) <= self.capacity:
+            return
+        ranked = sorted(self.counts.items(), key=lambda kv: (-kv[1], kv[0]))
+        cutoff = ranked[self.capacity][1]
+        self.counts = {v: c - cutoff for v, c in ranked[: self.capacity] if c > cutoff}
+
+    def top(self, limit: int = 10) -> List[Dict[str, Any]]:
+        ranked = sorted(self.counts.items(), key=lambda kv: (-kv[1], kv[0]))
+        return [{"value": v, "count": c} for v, c in ranked[:limit]]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"capacity": self.capacity, "counts": self.counts}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TopK":
+        topk = cls(capacity=data.get("capacity", 64))
+        topk.counts = {str(v): int(c) for v, c in data.get("counts", {}).items()}
+        return topk
+
+
+# =============================================================================
+# Column sketch
+# =============================================================================
+
+
+class ColumnSketch:
+    """Mergeable summary of one column, by classified type.
+
+    kind is one of numeric / string / temporal / other / skip (the
+    classification used by data_profiling_service). For "skip" columns only
+    null counts are kept and update() expects a boolean "is null" series.
+    """
+
+    def __init__(self, kind: str):
+        self.kind = kind
+        self.rows = 0
+        self.nulls = 0
+        self.min: Any = None
+        self.max: Any = None
+        # numeric moments
+        self.mean = 0.0
+        self.m2 = 0.0
+        # string lengths
+        self.min_length: Optional[int] = None
+        self.max_length: Optional[int] = None
+        self.sum_length = 0
+        self.hll = HyperLogLog() if kind != "skip" else None
+        self.kll = KLLSketch() if kind == "numeric" else None
+        self.topk = TopK() if kind == "string" else None
+
+    @property
+    def non_null(self) -> int:
+        return self.rows - self.nulls
+
+    def update(self, values: pd.Series) -> None:
+        """Add a chunk of raw column values (None/NaN for NULL)."""
+        self.rows += len(values)
+        if self.kind == "skip":
+            self.nulls += int(values.astype(bool).sum())
+            return
+
+        present = values.dropna()
+        self.nulls += len(values) - len(present)
+        if len(present) == 0:
+            return
+        self.hll.add_hashes(hash_values(present, self.kind))
+
+        if self.kind == "numeric":
+            arr = pd.to_numeric(present, errors="coerce").to_numpy(dtype="float64")
+            # +/-Infinity can't be stored in JSON; they still count as distinct
+            arr = arr[np.isfinite(arr)]
+            if len(arr):
+                # counts are kept on rows/nulls; moments use the numeric values
+                self._merge_moments(len(arr), float(arr.mean()), float(((arr - arr.mean()) ** 2).sum()))
+                self._merge_bounds(float(arr.min()), float(arr.max()))
+                self.kll.update(arr)
+        elif self.kind == "string":
+            text = _as_text(present)
+            lengths = text.str.len()
+            self.min_length = _min(self.min_length, int(lengths.min()))
+            self.max_length = _max(self.max_length, int(lengths.max()))
+            self.sum_length += int(lengths.sum())
+            self.topk.update(text)
+        elif self.kind == "temporal":
+            # str() of one temporal type sorts chronologically
+            text = _as_text(present)
+            self._merge_bounds(text.min(), text.max())
+
+    def _merge_bounds(self, lo: Any, hi: Any) -> None:
+        self.min = _min(self.min, lo)
+        self.max = _max(self.max, hi)
+
+    def _moment_count(self) -> int:
+        return self.kll.n if self.kll is not None else 0
+
+    def _merge_moments(self, n_b: int, mean_b: float, m2_b: float) -> None:
+        n_a = self._moment_count()
+        n = n_a + n_b
+        delta = mean_b - self.mean
+        self.mean += delta * n_b / n
+        self.m2 += m2_b + delta * delta * n_a * n_b / n
+
+    def merge(self, other: "ColumnSketch") -> None:
+        if other.kind != self.kind:
+            raise ValueError(f"Cannot merge {other.kind} sketch into {self.kind}")
+        if self.kind == "numeric" and other._moment_count():
+            self._merge_moments(other._moment_count(), other.mean, other.m2)
+            self.kll.merge(other.kll)
+        self.rows += other.rows
+        self.nulls += other.nulls
+        if other.min is not None:
+            self._merge_bounds(other.min, other.max)
+        if other.min_length is not None:
+            self.min_length = _min(self.min_length, other.min_length)
+            self.max_length = _max(self.max_length, other.max_length)
+        self.sum_length += other.sum_length
+        if self.hll is not None:
+            self.hll.merge(other.hll)
+        if self.topk is not None:
+            self.topk.merge(other.topk)
+
+    def summarize(self) -> Tuple[int, Optional[int], Dict[str, Any]]:
+        """Return (null_count, distinct_count, stats) in the profile's shapes."""
+        if self.kind == "skip":
+            return self.nulls, None, {}
+        distinct = min(self.hll.estimate(), self.non_null)
+        stats: Dict[str, Any] = {}
+        if self.kind == "numeric":
+            n = self._moment_count()
+            p25, median, p75 = self.kll.quantiles([0.25, 0.5, 0.75])
+            stats = {
+                "min": self.min,
+                "max": self.max,
+                "mean": self.mean if n else None,
+                "stddev": math.sqrt(self.m2 / (n - 1)) if n > 1 else None,
+                "p25": p25,
+                "median": median,
+                "p75": p75,
+            }
+        elif self.kind == "string":
+            stats = {
+                "min_length": self.min_length,
+                "max_length": self.max_length,
+                "avg_length": self.sum_length / self.non_null if self.non_null else None,
+                "top_values": self.topk.top(10),
+            }
+        elif self.kind == "temporal":
+            days = None
+            if self.min is not None:
+                days = float((pd.Timestamp(self.max) - pd.Timestamp(self.min)).days)
+            stats = {"min_date": self.min, "max_date": self.max, "date_range_days": days}
+        return self.nulls, distinct, stats
+
+    def to_dict(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {
+            "v": SKETCH_VERSION,
+            "kind": self.kind,
+            "rows": self.rows,
+            "nulls": self.nulls,
+            "min": self.min,
+            "max": self.max,
+        }
+        if self.kind == "numeric":
+            data.update(mean=self.mean, m2=self.m2, kll=self.kll.to_dict())
+        if self.kind == "string":
+            data.update(
+                min_length=self.min_length, max_length=self.max_length,
+                sum_length=self.sum_length, topk=self.topk.to_dict(),
+            )
+        if self.hll is not None:
+            data["hll"] = self.hll.to_dict()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ColumnSketch":
+        if data.get("v") != SKETCH_VERSION:
+            raise ValueError(f"Unsupported sketch version: {data.get('v')}")
+        sketch = cls(data["kind"])
+        sketch.rows = data["rows"]
+        sketch.nulls = data["nulls"]
+        sketch.min = data.get("min")
+        sketch.max = data.get("max")
+        if sketch.kind == "numeric":
+            sketch.mean = data["mean"]
+            sketch.m2 = data["m2"]
+            sketch.kll = KLLSketch.from_dict(data["kll"])
+        if sketch.kind == "string":
+            sketch.min_length = data.get("min_length")
+            sketch.max_length = data.get("max_length")
+            sketch.sum_length = data.get("sum_length", 0)
+            sketch.topk = TopK.from_dict(data["topk"])
+        if "hll" in data:
+            sketch.hll = HyperLogLog.from_dict(data["hll"])
+        return sketch
+
+
+def _min(a: Any, b: Any) -> Any:
+    return b if a is None else min(a, b)
+
+
+def _max(a: Any, b: Any) -> Any:
+    return b if a is None else max(a, b)
@@ -186,6 +186,34 @@ DEFAULT_RATE_LIMITS: Dict[str, Dict[str, Any]] = {
         "concurrent_limit": 3,
         "description": "Real estate data sources",
     },
+    # Job posting ATS APIs, keyed by host; one token per company crawl
+    # (app/sources/job_postings/collector.py). Workday tenants and company
+    # career sites are held to the default's concurrent limit by the
+    # collector itself and never get a bucket here.
+    "boards-api.greenhouse.io": {
+        "requests_per_second": 2.0,
+        "burst_capacity": 5,
+        "concurrent_limit": 4,
+        "description": "Greenhouse job board API: public, no published limit",
+    },
+    "api.lever.co": {
+        "requests_per_second": 2.0,
+        "burst_capacity": 5,
+        "concurrent_limit": 4,
+        "description": "Lever postings API: public, no published limit",
+    },
+    "api.ashbyhq.com": {
+        "requests_per_second": 1.0,
+        "burst_capacity": 5,
+        "concurrent_limit": 3,
+        "description": "Ashby job board API: public, no published limit",
+    },
+    "api.smartrecruiters.com": {
+        "requests_per_second": 1.0,
+        "burst_capacity": 5,
+        "concurrent_limit": 3,
+        "description": "SmartRecruiters postings API: public, be respectful",
+    },
     # Default fallback
     "default": {
         "requests_per_second": 1.0,
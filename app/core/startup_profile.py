@@ -0,0 +1,46 @@
+"""
+Startup phase timing for the API process.
+
+Startup code calls ``startup_profile.mark("phase")`` at the end of each
+phase; the time since the previous mark (or since this module was imported)
+is attributed to that phase. The lifespan logs the report once the app is
+ready to serve and keeps it on ``app.state.startup_report``.
+"""
+
+import logging
+import time
+from typing import Any, Dict, List, Tuple
+
+
+class StartupProfile:
+    """Wall-clock time per named startup phase."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self._last = self.started
+        self.phases: List[Tuple[str, float]] = []
+
+    def mark(self, phase: str) -> float:
+        """Close ``phase`` at the current time; returns its duration in seconds."""
+        now = time.perf_counter()
+        elapsed = now - self._last
+        self.phases.append((phase, elapsed))
+        self._last = now
+        return elapsed
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "total_seconds": round(self._last - self.started, 3),
+            "phases": [
+                {"phase": phase, "seconds": round(seconds, 3)}
+                for phase, seconds in self.phases
+            ],
+        }
+
+    def log(self, logger: logging.Logger) -> None:
+        report = self.report()
+        summary = ", ".join(f"{p['phase']}={p['seconds']:.2f}s" for p in report["phases"])
+        logger.info(f"Startup took {report['total_seconds']:.2f}s: {summary}")
+
+
+startup_profile = StartupProfile()
@@ -14,202 +14,8 @@ from fastapi.responses import JSONResponse
 
 from app.core.config import get_settings
 from app.api.v1.auth import get_current_user
-from app.api.v1 import (
-    jobs,
-    census_geo,
-    census_batch,
-    metadata,
-    fred,
-    eia,
-    sec,
-    realestate,
-    geojson,
-    family_offices,
-    family_office_contacts,
-    cms,
-    kaggle,
-    international_econ,
-    fbi_crime,
-    bts,
-    bea,
-    fema,
-    data_commons,
-    yelp,
-    us_trade,
-    cftc_cot,
-    usda,
-    bls,
-    fcc_broadband,
-    treasury,
-    fdic,
-    irs_soi,
-    agentic_research,
-    foot_traffic,
-    prediction_markets,
-    schedules,
-    webhooks,
-    chains,
-    rate_limits,
-    data_quality,
-    dq_review,
-    templates,
-    lineage,
-    export,
-    uspto,
-    alerts,
-    search,
-    discover,
-    watchlists,
-    analytics,
-    compare,
-    api_keys,
-    public,
-    network,
-    trends,
-    enrichment,
-    import_portfolio,
-    news,
-    reports,
-    deals,
-    benchmarks,
-    auth,
-    workspaces,
-    form_d,
-    corporate_registry,
-    form_adv,
-    web_traffic,
-    github,
-    scores,
-    entities,
-    glassdoor,
-    app_rankings,
-    predictions,
-    agents,
-    diligence,
-    monitors,
-    competitive,
-    hunter,
-    anomalies,
-    market,
-    reports_gen,
-    lp_collection,
-    fo_collection,
-    pe_firms,
-    pe_companies,
-    pe_people,
-    pe_deals,
-    pe_collection,
-    pe_benchmarks,
-    pe_import,
-    pe_conviction,
-    macro_cascade,
-    app_stores,
-    opencorporates,
-    people,
-    companies_leadership,
-    collection_jobs,
-    people_portfolios,
-    peer_sets,
-    people_watchlists,
-    people_analytics,
-    people_reports,
-    people_data_quality,
-    people_dedup,
-    people_jobs,
-    board_interlocks,
-    evals,
-
-    llm_costs,
-    freshness,
-    dunl,
-    job_postings,
-    job_postings_velocity,
-    health_scores,
-    lp_allocation,
-    exit_readiness,
-    acquisition_targets,
-    quarterly_diff,
-    zip_scores,
-    medspa_discovery,
-    deal_models,
-    sources,
-    nppes,
-    usaspending,
-    fda,
-    sam_gov,
-    osha,
-    courtlistener,
-    epa_echo,
-    epa_ghg,
-    cms_hospitals,
-    dot_grants,
-    census_bfs,
-    census_cbp,
-    ffiec_banks,
-    google_trends,
-    ferc_energy,
-)
-
-# PE Intelligence Features
-from app.api.v1 import (
-    labor_arbitrage,
-    location_diligence,
-    rollup_intel,
-    vertical_discovery,
-)
-
-# Job Queue Streaming & Monitor
-from app.api.v1 import job_stream, jobs_monitor
-
-# Site Intelligence Platform
-from app.api.v1 import (
-    site_intel_power,
-    site_intel_telecom,
-    site_intel_transport,
-    site_intel_labor,
-    site_intel_risk,
-    site_intel_incentives,
-    site_intel_logistics,
-    site_intel_water_utilities,
-    site_intel_sites,
-    datacenter_sites,
-    deal_radar,
-    transaction_probability,
-)
-
-# PE Intelligence Platform (PLAN_060)
-from app.api.v1 import pe_ecosystem, capital_deployment, portfolio_ops, exit_strategy
-
-# Investor Intelligence (PLAN_039)
-from app.api.v1 import afdc, investor_intelligence
-
-# Economic Intelligence + DQ + PE Macro (PLAN_046/047/048)
-from app.api.v1 import econ_snapshot, econ_dq, pe_macro
-
-# Metro Development Profiles (PLAN_051)
-from app.api.v1 import metro_profiles
-
-# Synthetic Data API (PLAN_052 Phase A / SPEC_042)
-from app.api.v1 import synthetic as synthetic_router
-
-# Company Diligence Composite (PLAN_052 Chain 2)
-from app.api.v1 import diligence_composite
-
-# GP Pipeline + LP→GP Graph (PLAN_052 Chain 3)
-from app.api.v1 import gp_pipeline
-
-# Executive Signals (PLAN_052 Chain 4)
-from app.api.v1 import exec_signals
-
-# Healthcare Intelligence (PLAN_052 Chain 7)
-from app.api.v1 import healthcare_intel
-
-# Collection Management
-from app.api.v1 import source_configs, audit, source_health
-
-# Settings
-from app.api.v1 import settings as settings_router
-from app.graphql import graphql_app
+from app.api.router_registry import mount_routers
+from app.core.startup_profile import startup_profile
 
 # Configure logging
 logging.basicConfig(
@@ -231,80 +37,22 @@ async def lifespan(app: FastAPI):
     logger.info(f"Log level: {settings.log_level}")
     logger.info(f"Max concurrency: {settings.max_concurrency}")
 
-    # Ensure all tables exist (create_all is idempotent — skips existing tables)
-    try:
-        from app.core.database import get_engine, create_tables
-        engine = get_engine()
-        create_tables(engine)
-        logger.info("Database tables verified via create_all()")
-    except Exception as e:
-        logger.error(f"create_tables failed: {e}")
-        raise
+    startup_profile.mark("server_start")
 
-    # --- Batch metadata columns on ingestion_jobs ---
-    try:
-        from app.core.database import get_engine
-        from sqlalchemy import text as sa_text
+    # Ensure all tables exist and migrations are applied (idempotent). Skipped
+    # when `python -m app.core.migrate` runs before deploy instead.
+    if settings.run_migrations_on_startup:
+        try:
+            from app.core.database import run_migrations
 
-        engine = get_engine()
-        with engine.begin() as conn:
-            # Add new columns (idempotent)
-            conn.execute(sa_text(
-                "ALTER TABLE ingestion_jobs ADD COLUMN IF NOT EXISTS "
-                "batch_run_id VARCHAR(50)"
-            ))
-            conn.execute(sa_text(
-                "ALTER TABLE ingestion_jobs ADD COLUMN IF NOT EXISTS "
-                "trigger VARCHAR(20)"
-            ))
-            conn.execute(sa_text(
-                "ALTER TABLE ingestion_jobs ADD COLUMN IF NOT EXISTS "
-                "tier INTEGER"
-            ))
-
-            # Partial index on batch_run_id (only non-null rows)
-            conn.execute(sa_text("""
-                CREATE INDEX IF NOT EXISTS ix_ingestion_jobs_batch_run_id
-                ON ingestion_jobs (batch_run_id)
-                WHERE batch_run_id IS NOT NULL
-            """))
-
-            # Rename legacy nightly_batch table → batch_runs (idempotent)
-            conn.execute(sa_text("""
-                DO $$
-                BEGIN
-                    IF EXISTS (SELECT 1 FROM information_schema.tables
-                               WHERE table_name = 'nightly_batch') THEN
-                        ALTER TABLE nightly_batch RENAME TO batch_runs;
-                    END IF;
-                END $$
-            """))
-
-            # Backfill from legacy batch_runs records
-            conn.execute(sa_text("""
-                UPDATE ingestion_jobs
-                SET batch_run_id = 'legacy_batch_' || nb.id::text,
-                    trigger = 'batch'
-                FROM batch_runs nb
-                WHERE ingestion_jobs.id = ANY(
-                    SELECT jsonb_array_elements_text(nb.job_ids::jsonb)::int
-                )
-                AND ingestion_jobs.batch_run_id IS NULL
-            """))
-
-            # Auto-resolve stale RUNNING jobs (>2 hours old)
-            conn.execute(sa_text("""
-                UPDATE ingestion_jobs
-                SET status = 'failed',
-                    error_message = 'Stale job auto-resolved on startup',
-                    completed_at = NOW()
-                WHERE status = 'running'
-                AND started_at < NOW() - INTERVAL '2 hours'
-            """))
-
-        logger.info("Batch metadata columns + backfill applied to ingestion_jobs")
-    except Exception as e:
-        logger.warning(f"Batch metadata migration skipped: {e}")
+            run_migrations()
+            logger.info("Database tables verified via create_all()")
+        except Exception as e:
+            logger.error(f"create_tables failed: {e}")
+            raise
+    else:
+        logger.info("Skipping startup migrations (RUN_MIGRATIONS_ON_STARTUP=false)")
+    startup_profile.mark("migrations")
 
     # Start scheduler (optional - can be started manually via API)
     try:
@@ -712,6 +460,7 @@ async def lifespan(app: FastAPI):
 
     except Exception as e:
         logger.warning(f"Failed to start scheduler: {e}")
+    startup_profile.mark("scheduler")
 
     # Seed distributed rate limit buckets (idempotent — only creates missing rows)
     try:
@@ -728,6 +477,7 @@ async def lifespan(app: FastAPI):
             seed_db.close()
     except Exception as e:
         logger.warning(f"Failed to seed rate limit buckets: {e}")
+    startup_profile.mark("rate_limit_buckets")
 
     # Start PG LISTEN → EventBus bridge for live job progress
     try:
@@ -737,6 +487,7 @@ async def lifespan(app: FastAPI):
         logger.info("PG listener started for job event streaming")
     except Exception as e:
         logger.warning(f"Failed to start PG listener: {e}")
+    startup_profile.mark("pg_listener")
 
     # Eval Builder scheduled runs — P1 daily, P2 weekly, P3 monthly
     try:
@@ -754,6 +505,10 @@ async def lifespan(app: FastAPI):
         logger.info("Eval Builder scheduled: P1 daily 05:00, P2 weekly Mon 05:30, P3 monthly 1st 06:00")
     except Exception as e:
         logger.warning(f"Failed to register eval schedules: {e}")
+    startup_profile.mark("eval_schedules")
+
+    app.state.startup_report = startup_profile.report()
+    startup_profile.log(logger)
 
     yield
 
@@ -1460,221 +1215,17 @@ async def _unhandled_exception_handler(request: Request, exc: Exception):
 _require_auth = os.getenv("REQUIRE_AUTH", "false").lower() == "true"
 _auth = [Depends(get_current_user)] if _require_auth else []
 
-# Public routers (no auth required)
-app.include_router(auth.router, prefix="/api/v1")  # login/register must be public
-app.include_router(public.router, prefix="/api/v1")  # has its own API key auth
-app.include_router(job_stream.router, prefix="/api/v1")  # SSE streaming
-app.include_router(jobs_monitor.router, prefix="/api/v1", dependencies=_auth)  # Jobs dashboard
-
-# Protected routers
-app.include_router(sources.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(jobs.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(census_geo.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(census_batch.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(metadata.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(geojson.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(fred.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(eia.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(sec.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(realestate.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(family_offices.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(
-    family_office_contacts.router,
-    prefix="/api/v1",
-    tags=["family_office_contacts"],
+# Routers are listed in app/api/router_registry.py. ROUTER_PROFILE picks
+# which ones this process serves; ROUTER_LOADING=lazy defers each import to
+# the first request under its path.
+_settings = get_settings()
+router_registry = mount_routers(
+    app,
+    profile=_settings.router_profile,
+    loading=_settings.router_loading,
     dependencies=_auth,
 )
-app.include_router(cms.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(nppes.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(kaggle.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(international_econ.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(fbi_crime.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(bts.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(bea.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(fema.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(data_commons.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(yelp.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(us_trade.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(cftc_cot.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(usda.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(bls.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(afdc.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(investor_intelligence.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(econ_snapshot.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(econ_dq.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(pe_macro.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(metro_profiles.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(fcc_broadband.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(treasury.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(usaspending.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(fdic.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(fda.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(irs_soi.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(epa_echo.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(epa_ghg.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(cms_hospitals.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(dot_grants.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(census_bfs.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(census_cbp.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(foot_traffic.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(dunl.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(prediction_markets.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(schedules.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(webhooks.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(chains.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(rate_limits.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(data_quality.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(dq_review.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(templates.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(lineage.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(export.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(uspto.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(agentic_research.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(alerts.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(search.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(discover.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(watchlists.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(analytics.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(compare.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(api_keys.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(network.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(trends.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(enrichment.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(import_portfolio.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(news.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(reports.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(deals.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(benchmarks.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(workspaces.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(form_d.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(corporate_registry.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(form_adv.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(web_traffic.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(github.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(scores.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(entities.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(glassdoor.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(app_stores.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(opencorporates.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(app_rankings.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(predictions.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(agents.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(diligence.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(monitors.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(competitive.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(hunter.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(anomalies.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(market.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(reports_gen.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(lp_collection.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(fo_collection.router, prefix="/api/v1", dependencies=_auth)
-
-# PE Intelligence Platform
-app.include_router(pe_firms.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(pe_companies.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(pe_people.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(pe_deals.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(pe_collection.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(pe_benchmarks.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(pe_import.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(pe_conviction.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(macro_cascade.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(synthetic_router.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(diligence_composite.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(gp_pipeline.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(exec_signals.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(healthcare_intel.router, prefix="/api/v1", dependencies=_auth)
-
-# 13F Quarterly Analysis
-app.include_router(quarterly_diff.router, prefix="/api/v1", dependencies=_auth)
-
-# People & Org Chart Intelligence
-app.include_router(people.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(companies_leadership.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(collection_jobs.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(people_portfolios.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(peer_sets.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(people_watchlists.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(people_analytics.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(people_reports.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(people_data_quality.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(people_dedup.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(people_jobs.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(board_interlocks.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(evals.router, prefix="/api/v1", dependencies=_auth)
-
-# Job Posting Intelligence
-app.include_router(job_postings.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(job_postings_velocity.router, prefix="/api/v1", dependencies=_auth)
-
-# Derived Data Scores
-app.include_router(health_scores.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(lp_allocation.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(exit_readiness.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(acquisition_targets.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(zip_scores.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(medspa_discovery.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(deal_models.router, prefix="/api/v1", dependencies=_auth)
-
-# PE Intelligence Features
-app.include_router(labor_arbitrage.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(location_diligence.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(rollup_intel.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(vertical_discovery.router, prefix="/api/v1", dependencies=_auth)
-
-# Government & Legal Data Sources
-app.include_router(sam_gov.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(osha.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(courtlistener.router, prefix="/api/v1", dependencies=_auth)
-
-# Site Intelligence Platform
-app.include_router(site_intel_power.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(site_intel_telecom.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(site_intel_transport.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(site_intel_labor.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(site_intel_risk.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(site_intel_incentives.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(site_intel_logistics.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(
-    site_intel_water_utilities.router, prefix="/api/v1", dependencies=_auth
-)
-app.include_router(site_intel_sites.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(datacenter_sites.router, prefix="/api/v1", dependencies=_auth)
-
-# Deal Radar — Convergence Intelligence
-app.include_router(deal_radar.router, prefix="/api/v1", dependencies=_auth)
-
-# Deal Probability Engine (PLAN_059 Phase 2)
-app.include_router(transaction_probability.router, prefix="/api/v1", dependencies=_auth)
-
-# PE Intelligence Platform (PLAN_060)
-app.include_router(pe_ecosystem.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(capital_deployment.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(portfolio_ops.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(exit_strategy.router, prefix="/api/v1", dependencies=_auth)
-
-# Specialty Data Sources
-app.include_router(ffiec_banks.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(google_trends.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(ferc_energy.router, prefix="/api/v1", dependencies=_auth)
-
-# Collection Management
-app.include_router(source_configs.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(source_health.router, prefix="/api/v1", dependencies=_auth)
-app.include_router(audit.router, prefix="/api/v1", dependencies=_auth)
-
-# Settings
-app.include_router(settings_router.router, prefix="/api/v1", dependencies=_auth)
-
-
-# LLM Cost Tracking
-app.include_router(llm_costs.router, prefix="/api/v1", dependencies=_auth)
-
-# Data Freshness Dashboard
-app.include_router(freshness.router, prefix="/api/v1", dependencies=_auth)
-
-# GraphQL API
-app.include_router(graphql_app, prefix="/graphql", tags=["graphql"])
+startup_profile.mark("import_routers")
 
 
 @app.get("/", tags=["Root"])
@@ -1781,3 +1332,25 @@ def health_check():
         logger.warning(f"Database health check failed: {e}")
 
     return health_status
+
+
+@app.get("/health/startup")
+def startup_report():
+    """
+    Startup phase timings (imports, migrations, scheduler, ...) and how many
+    routers are still waiting for their first request.
+    """
+    report = getattr(app.state, "startup_report", None) or startup_profile.report()
+    return {**report, "routers_pending": router_registry.pending}
+
+
+@app.get("/health/http-pools")
+def http_pool_stats():
+    """
+    This process's shared HTTP pools: requests, connections opened vs
+    reused, and time spent waiting for a free connection, per origin.
+    Workers publish the same counters as worker_http_pools events.
+    """
+    from app.core.http_client import pool_stats
+
+    return {"pools": pool_stats()}
@@ -4,6 +4,16 @@ Co-investor network analysis module.
 Provides network graph analysis for investor relationships.
 """
 
+from app.network.analytics import GraphAnalytics, WeightedGraph, get_analytics
 from app.network.graph import NetworkEngine
+from app.network.store import CoInvestorGraph, get_graph, invalidate_graph_cache
 
-__all__ = ["NetworkEngine"]
+__all__ = [
+    "NetworkEngine",
+    "CoInvestorGraph",
+    "get_graph",
+    "invalidate_graph_cache",
+    "GraphAnalytics",
+    "WeightedGraph",
+    "get_analytics",
+]
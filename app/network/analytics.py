@@ -0,0 +1,461 @@
+"""
+Array-backed graph analytics for investor networks.
+
+Works on any undirected weighted graph in CSR form (WeightedGraph): the
+co-investor network (app.network.store) and the LP→GP bipartite graph
+(app.services.lp_gp_graph) both convert to it.
+
+- pagerank: weighted PageRank by power iteration (dangling mass spread
+  uniformly)
+- betweenness: Brandes betweenness over hop-count shortest paths, exact or
+  estimated from k sampled sources; BFS levels are expanded frontier-wide
+  with NumPy instead of node by node
+- communities: Louvain modularity optimisation, or weighted label
+  propagation for very large graphs
+- k_hop: batched multi-source neighborhoods up to k hops
+
+Results are memoised on the GraphAnalytics instance, and get_analytics()
+keeps one instance per (graph name, version), so repeated requests against
+an unchanged graph are served from memory.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+DEFAULT_DAMPING = 0.85
+DEFAULT_BETWEENNESS_SAMPLES = 64
+LOUVAIN_MAX_LEVELS = 10
+LOUVAIN_MAX_PASSES = 20
+LPA_MAX_ITER = 30
+CACHE_MAX_GRAPHS = 8
+
+
+# ---------------------------------------------------------------------------
+# Graph representation
+# ---------------------------------------------------------------------------
+
+
+class WeightedGraph(NamedTuple):
+    """Undirected weighted graph as symmetric CSR arrays.
+
+    Every undirected edge {u, v} appears in both rows u and v with the same
+    weight; a self-loop appears once. labels[i] is the public id of node i.
+    """
+
+    name: str
+    version: Any
+    indptr: np.ndarray
+    indices: np.ndarray
+    weights: np.ndarray
+    labels: List[str]
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.indptr) - 1
+
+    @property
+    def num_edges(self) -> int:
+        """Undirected edge count (self-loops counted once)."""
+        loops = int(np.count_nonzero(self.indices == self.rows()))
+        return (len(self.indices) - loops) // 2 + loops
+
+    def rows(self) -> np.ndarray:
+        """Row (source node) of every adjacency slot."""
+        return np.repeat(np.arange(self.num_nodes, dtype=np.int64), np.diff(self.indptr))
+
+    @classmethod
+    def from_edges(
+        cls,
+        name: str,
+        version: Any,
+        num_nodes: int,
+        source: np.ndarray,
+        target: np.ndarray,
+        weight: Optional[np.ndarray] = None,
+        labels: Optional[List[str]] = None,
+    ) -> "WeightedGraph":
+        """Build from an undirected edge list; parallel edges are summed."""
+        source = np.asarray(source, dtype=np.int64)
+        target = np.asarray(target, dtype=np.int64)
+        weight = (
+            np.ones(len(source), dtype=np.float64)
+            if weight is None
+            else np.asarray(weight, dtype=np.float64)
+        )
+        loops = source == target
+        rows = np.concatenate([source, target[~loops]])
+        cols = np.concatenate([target, source[~loops]])
+        vals = np.concatenate([weight, weight[~loops]])
+
+        keys, inverse = np.unique(rows * num_nodes + cols, return_inverse=True)
+        summed = np.bincount(inverse, weights=vals, minlength=len(keys))
+        rows, cols = keys // num_nodes, keys % num_nodes
+        indptr = np.concatenate(
+            [[0], np.cumsum(np.bincount(rows, minlength=num_nodes))]
+        ).astype(np.int64)
+        if labels is None:
+            labels = [str(i) for i in range(num_nodes)]
+        return cls(name, version, indptr, cols.astype(np.int64), summed, labels)
+
+
+def _expand(graph: WeightedGraph, frontier: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Adjacency slots of all frontier nodes at once.
+
+    Returns (position in frontier, slot) for every slot, so callers can map
+    each neighbor graph.indices[slot] back to the frontier entry it came from.
+    """
+    starts = graph.indptr[frontier]
+    counts = graph.indptr[frontier + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty
+    block_starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    slots = np.repeat(starts - block_starts, counts) + np.arange(total, dtype=np.int64)
+    return np.repeat(np.arange(len(frontier), dtype=np.int64), counts), slots
+
+
+# ---------------------------------------------------------------------------
+# Algorithms
+# ---------------------------------------------------------------------------
+
+
+def pagerank(
+    graph: WeightedGraph,
+    damping: float = DEFAULT_DAMPING,
+    tol: float = 1e-10,
+    max_iter: int = 100,
+) -> np.ndarray:
+    """Weighted PageRank; returns scores summing to 1."""
+    n = graph.num_nodes
+    if n == 0:
+        return np.zeros(0)
+    rows = graph.rows()
+    strength = np.bincount(rows, weights=graph.weights, minlength=n)
+    dangling = strength == 0
+    inv_strength = np.divide(1.0, strength, out=np.zeros(n), where=~dangling)
+    slot_share = graph.weights * inv_strength[rows]
+
+    rank = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        spread = np.bincount(graph.indices, weights=slot_share * rank[rows], minlength=n)
+        new = damping * (spread + rank[dangling].sum() / n) + (1.0 - damping) / n
+        delta = np.abs(new - rank).sum()
+        rank = new
+        if delta < n * tol:
+            break
+    return rank / rank.sum()
+
+
+def _brandes_source(graph: WeightedGraph, source: int) -> np.ndarray:
+    """Dependency of every node on shortest paths from one source."""
+    n = graph.num_nodes
+    dist = np.full(n, -1, dtype=np.int64)
+    sigma = np.zeros(n)
+    dist[source] = 0
+    sigma[source] = 1.0
+
+    levels: List[Tuple[np.ndarray, np.ndarray]] = []
+    frontier = np.array([source], dtype=np.int64)
+    depth = 0
+    while len(frontier):
+        pos, slots = _expand(graph, frontier)
+        u, v = frontier[pos], graph.indices[slots]
+        fresh = dist[v] < 0
+        dist[v[fresh]] = depth + 1
+        on_dag = dist[v] == depth + 1
+        u, v = u[on_dag], v[on_dag]
+        sigma += np.bincount(v, weights=sigma[u], minlength=n)
+        levels.append((u, v))
+        frontier = np.unique(v)
+        depth += 1
+
+    delta = np.zeros(n)
+    for u, v in reversed(levels):
+        delta += np.bincount(u, weights=sigma[u] / sigma[v] * (1.0 + delta[v]), minlength=n)
+    delta[source] = 0.0
+    return delta
+
+
+def betweenness(
+    graph: WeightedGraph,
+    samples: Optional[int] = DEFAULT_BETWEENNESS_SAMPLES,
+    normalized: bool = True,
+    seed: int = 0,
+) -> np.ndarray:
+    """
+    Betweenness centrality over hop-count shortest paths.
+
+    Exact when samples is None or >= num_nodes; otherwise estimated from
+    that many uniformly sampled sources and scaled by n / samples.
+    """
+    n = graph.num_nodes
+    if n == 0:
+        return np.zeros(0)
+    if samples is None or samples >= n:
+        sources = np.arange(n)
+    else:
+        sources = np.random.default_rng(seed).choice(n, size=samples, replace=False)
+
+    scores = np.zeros(n)
+    for s in sources.tolist():
+        scores += _brandes_source(graph, s)
+    scores *= n / len(sources)
+    scores /= 2.0  # every undirected pair is counted from both ends
+    if normalized and n > 2:
+        scores /= (n - 1) * (n - 2) / 2.0
+    return scores
+
+
+def modularity(graph: WeightedGraph, labels: np.ndarray, resolution: float = 1.0) -> float:
+    """Newman modularity of a partition."""
+    total = graph.weights.sum()
+    if total == 0:
+        return 0.0
+    rows = graph.rows()
+    internal = np.bincount(
+        labels[rows], weights=graph.weights * (labels[rows] == labels[graph.indices]),
+    )
+    tot = np.bincount(labels[rows], weights=graph.weights)
+    return float((internal / total - resolution * (tot / total) ** 2).sum())
+
+
+def _louvain_level(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    weights: np.ndarray,
+    resolution: float,
+    rng: np.random.Generator,
+) -> Tuple[np.ndarray, bool]:
+    """Local moving phase: greedily move nodes to the best neighbor community."""
+    n = len(indptr) - 1
+    strength = np.bincount(
+        np.repeat(np.arange(n), np.diff(indptr)), weights=weights, minlength=n
+    )
+    two_m = weights.sum()
+    nbrs = [indices[indptr[i]:indptr[i + 1]].tolist() for i in range(n)]
+    wts = [weights[indptr[i]:indptr[i + 1]].tolist() for i in range(n)]
+    comm = list(range(n))
+    tot_l = strength.tolist()
+    k = strength.tolist()
+    scale = resolution / two_m
+
+    moved_any = False
+    for _ in range(LOUVAIN_MAX_PASSES):
+        moved = 0
+        for i in rng.permutation(n).tolist():
+            ci = comm[i]
+            links: Dict[int, float] = {}
+            for j, w in zip(nbrs[i], wts[i]):
+                if j != i:
+                    links[comm[j]] = links.get(comm[j], 0.0) + w
+            tot_l[ci] -= k[i]
+            best, best_gain = ci, links.get(ci, 0.0) - tot_l[ci] * k[i] * scale
+            for c, w_in in links.items():
+                gain = w_in - tot_l[c] * k[i] * scale
+                if gain > best_gain + 1e-12:
+                    best, best_gain = c, gain
+            tot_l[best] += k[i]
+            if best != ci:
+                comm[i] = best
+                moved += 1
+        if moved == 0:
+            break
+        moved_any = True
+    _, labels = np.unique(np.asarray(comm), return_inverse=True)
+    return labels, moved_any
+
+
+def louvain(graph: WeightedGraph, resolution: float = 1.0, seed: int = 0) -> np.ndarray:
+    """Louvain communities; returns a dense community label per node."""
+    n = graph.num_nodes
+    labels = np.arange(n)
+    if n == 0 or graph.weights.sum() == 0:
+        return labels
+    rng = np.random.default_rng(seed)
+    indptr, indices, weights = graph.indptr, graph.indices, graph.weights
+    rows = graph.rows()
+
+    for _ in range(LOUVAIN_MAX_LEVELS):
+        level_labels, moved = _louvain_level(indptr, indices, weights, resolution, rng)
+        if not moved:
+            break
+        labels = level_labels[labels]
+        # Aggregate: one node per community, slot weights summed (self-loops
+        # carry the internal weight from both directions)
+        m = int(level_labels.max()) + 1
+        keys, inverse = np.unique(level_labels[rows] * m + level_labels[indices], return_inverse=True)
+        weights = np.bincount(inverse, weights=weights, minlength=len(keys))
+        rows, indices = keys // m, keys % m
+        indptr = np.concatenate([[0], np.cumsum(np.bincount(rows, minlength=m))]).astype(np.int64)
+        if m == 1:
+            break
+    return labels
+
+
+def label_propagation(
+    graph: WeightedGraph, max_iter: int = LPA_MAX_ITER, seed: int = 0
+) -> np.ndarray:
+    """
+    Weighted label propagation, semi-synchronous: each round a random half
+    of the nodes adopt the label with the largest total edge weight among
+    their neighbors, which avoids the oscillation of fully synchronous LPA
+    on bipartite graphs. Returns a dense label per node.
+    """
+    n = graph.num_nodes
+    labels = np.arange(n)
+    if n == 0 or len(graph.indices) == 0:
+        return labels
+    rng = np.random.default_rng(seed)
+    rows = graph.rows()
+    has_neighbors = np.diff(graph.indptr) > 0
+
+    for _ in range(max_iter):
+        keys, inverse = np.unique(rows * n + labels[graph.indices], return_inverse=True)
+        score = np.bincount(inverse, weights=graph.weights, minlength=len(keys))
+        key_node, key_label = keys // n, keys % n
+        # Best label per node: highest weight, ties to the smallest label
+        order = np.lexsort((key_label, -score, key_node))
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = key_node[order][1:] != key_node[order][:-1]
+        best = labels.copy()
+        best[key_node[order][first]] = key_label[order][first]
+
+        if not (best != labels).any():
+            break
+        update = has_neighbors & (rng.random(n) < 0.5)
+        labels = np.where(update, best, labels)
+    _, dense = np.unique(labels, return_inverse=True)
+    return dense
+
+
+def k_hop(
+    graph: WeightedGraph, sources: Sequence[int], k: int
+) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Batched k-hop neighborhoods.
+
+    Returns, for each source, (node indices, hop distances) of every node
+    within k hops, excluding the source itself. All sources advance one hop
+    per NumPy step.
+    """
+    n = graph.num_nodes
+    sources = np.asarray(sources, dtype=np.int64)
+    batch = np.arange(len(sources), dtype=np.int64)
+    seen = np.sort(batch * n + sources)
+    found_keys, found_dist = [], []
+    frontier_batch, frontier_node = batch, sources
+
+    for hop in range(1, k + 1):
+        pos, slots = _expand(graph, frontier_node)
+        if len(slots) == 0:
+            break
+        keys = np.unique(frontier_batch[pos] * n + graph.indices[slots])
+        keys = keys[~np.isin(keys, seen, assume_unique=True)]
+        seen = np.union1d(seen, keys)
+        found_keys.append(keys)
+        found_dist.append(np.full(len(keys), hop, dtype=np.int64))
+        frontier_batch, frontier_node = keys // n, keys % n
+
+    if found_keys:
+        keys, dist = np.concatenate(found_keys), np.concatenate(found_dist)
+    else:
+        keys, dist = np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    owner = keys // n
+    order = np.argsort(owner, kind="stable")
+    keys, dist, owner = keys[order], dist[order], owner[order]
+    bounds = np.searchsorted(owner, np.arange(len(sources) + 1))
+    return [
+        (keys[bounds[b]:bounds[b + 1]] % n, dist[bounds[b]:bounds[b + 1]])
+        for b in range(len(sources))
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Cached analytics per graph version
+# ---------------------------------------------------------------------------
+
+
+class GraphAnalytics:
+    """Memoised analytics for one graph version."""
+
+    def __init__(self, graph: WeightedGraph):
+        self.graph = graph
+        self._results: Dict[Tuple, Any] = {}
+        self._lock = threading.RLock()  # modularity() memoises over communities()
+
+    def _memo(self, key: Tuple, compute):
+        with self._lock:
+            if key not in self._results:
+                self._results[key] = compute()
+            return self._results[key]
+
+    def pagerank(self, damping: float = DEFAULT_DAMPING) -> np.ndarray:
+        return self._memo(("pagerank", damping), lambda: pagerank(self.graph, damping))
+
+    def betweenness(self, samples: Optional[int] = DEFAULT_BETWEENNESS_SAMPLES) -> np.ndarray:
+        return self._memo(
+            ("betweenness", samples), lambda: betweenness(self.graph, samples)
+        )
+
+    def communities(self, method: str = "louvain", resolution: float = 1.0) -> np.ndarray:
+        if method == "louvain":
+            compute = lambda: louvain(self.graph, resolution)  # noqa: E731
+        elif method == "label_propagation":
+            compute = lambda: label_propagation(self.graph)  # noqa: E731
+        else:
+            raise ValueError(f"Unknown community method: {method}")
+        return self._memo(("communities", method, resolution), compute)
+
+    def modularity(self, method: str = "louvain", resolution: float = 1.0) -> float:
+        return self._memo(
+            ("modularity", method, resolution),
+            lambda: modularity(self.graph, self.communities(method, resolution), resolution),
+        )
+
+    def k_hop(self, sources: Sequence[int], k: int) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """Not memoised: batches differ per request and are cheap."""
+        return k_hop(self.graph, sources, k)
+
+    def top(self, scores: np.ndarray, limit: int, mask: Optional[np.ndarray] = None) -> List[int]:
+        """Node indices of the highest scores (optionally within mask)."""
+        candidates = np.flatnonzero(mask) if mask is not None else np.arange(len(scores))
+        order = np.argsort(-scores[candidates], kind="stable")
+        return candidates[order][:limit].tolist()
+
+
+_cache_lock = threading.Lock()
+_cache: "OrderedDict[str, GraphAnalytics]" = OrderedDict()
+
+
+def get_analytics(graph: WeightedGraph) -> GraphAnalytics:
+    """Shared GraphAnalytics for the graph's (name, version)."""
+    with _cache_lock:
+        cached = _cache.get(graph.name)
+        if cached is not None and cached.graph.version == graph.version:
+            _cache.move_to_end(graph.name)
+            return cached
+        analytics = GraphAnalytics(graph)
+        _cache[graph.name] = analytics
+        _cache.move_to_end(graph.name)
+        while len(_cache) > CACHE_MAX_GRAPHS:
+            _cache.popitem(last=False)
+        return analytics
+
+
+def clear_analytics_cache() -> None:
+    with _cache_lock:
+        _cache.clear()
@@ -3,14 +3,22 @@ Co-investor Network Analysis Engine.
 
 Builds and analyzes network graphs showing investor relationships
 based on shared portfolio investments and co-investment records.
+
+The graph itself lives in app.network.store: it is built once per process
+as CSR arrays, kept current incrementally, and shared by every
+NetworkEngine, so the network endpoints answer from memory.
 """
 
 import logging
-from typing import Dict, List, Optional, Tuple, Set
-from collections import defaultdict
-from sqlalchemy import text
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
 from sqlalchemy.orm import Session
 
+from app.network.analytics import GraphAnalytics, get_analytics
+from app.network.store import CoInvestorGraph, GraphArrays, get_graph, node_id
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,13 +33,13 @@ class NetworkEngine:
 
     def __init__(self, db: Session):
         self.db = db
-        self._nodes: Dict[str, Dict] = {}
-        self._edges: Dict[Tuple[str, str], Dict] = {}
-        self._built = False
+        self._graph: Optional[CoInvestorGraph] = None
+        self._arrays: Optional[GraphArrays] = None
+        self._cluster_ids: Dict[int, int] = {}
 
     def _node_id(self, investor_id: int, investor_type: str) -> str:
         """Generate unique node ID."""
-        return f"{investor_type}_{investor_id}"
+        return node_id(investor_id, investor_type)
 
     def _parse_node_id(self, node_id: str) -> Tuple[str, int]:
         """Parse node ID back to type and ID."""
@@ -40,209 +48,32 @@ class NetworkEngine:
 
     def build_network(self, force_rebuild: bool = False) -> None:
         """
-        Build the full co-investor network from database.
+        Load the co-investor network (cached across requests, see
+        app.network.store.get_graph).
 
         Combines data from co_investments table and shared portfolio companies.
         """
-        if self._built and not force_rebuild:
+        if self._graph is not None and not force_rebuild:
             return
+        self._graph = get_graph(self.db, force_rebuild=force_rebuild)
+        # One consistent snapshot of the arrays for this engine's lifetime
+        self._arrays = self._graph.arrays
 
-        self._nodes = {}
-        self._edges = {}
-
-        # Load all investors
-        self._load_investors()
+    def _node(self, idx: int) -> Dict:
+        return self._graph.node_dict(idx, self._arrays, self._cluster_ids.get(idx))
 
-        # Build edges from co_investments table
-        self._build_edges_from_coinvestments()
-
-        # Build edges from shared portfolio companies
-        self._build_edges_from_shared_portfolios()
-
-        # Calculate node metrics
-        self._calculate_node_metrics()
-
-        self._built = True
-        logger.info(
-            f"Network built: {len(self._nodes)} nodes, {len(self._edges)} edges"
-        )
+    def _edge(self, eid: int) -> Dict:
+        return self._graph.edge_dict(eid, self._arrays)
 
-    def _load_investors(self) -> None:
-        """Load all investors as nodes."""
-        # Load LPs
-        lp_query = text("""
-            SELECT id, name, lp_type as investor_subtype, jurisdiction as location
-            FROM lp_fund
-        """)
-        result = self.db.execute(lp_query)
-        for row in result.mappings():
-            node_id = self._node_id(row["id"], "lp")
-            self._nodes[node_id] = {
-                "id": node_id,
-                "investor_id": row["id"],
-                "type": "lp",
-                "name": row["name"],
-                "subtype": row.get("investor_subtype"),
-                "location": row.get("location"),
-                "degree": 0,
-                "weighted_degree": 0,
-                "centrality": 0.0,
-                "cluster_id": None,
-            }
-
-        # Load Family Offices
-        fo_query = text("""
-            SELECT id, name, type as investor_subtype, region as location
-            FROM family_offices
-        """)
-        result = self.db.execute(fo_query)
-        for row in result.mappings():
-            node_id = self._node_id(row["id"], "family_office")
-            self._nodes[node_id] = {
-                "id": node_id,
-                "investor_id": row["id"],
-                "type": "family_office",
-                "name": row["name"],
-                "subtype": row.get("investor_subtype"),
-                "location": row.get("location"),
-                "degree": 0,
-                "weighted_degree": 0,
-                "centrality": 0.0,
-                "cluster_id": None,
-            }
-
-    def _build_edges_from_coinvestments(self) -> None:
-        """Build edges from co_investments table."""
-        query = text("""
-            SELECT primary_investor_id, primary_investor_type,
-                   co_investor_name, co_investor_type,
-                   deal_name, co_investment_count,
-                   MIN(deal_date) as first_date,
-                   MAX(deal_date) as last_date
-            FROM co_investments
-            GROUP BY primary_investor_id, primary_investor_type,
-                     co_investor_name, co_investor_type, deal_name, co_investment_count
-        """)
-        result = self.db.execute(query)
-
-        for row in result.mappings():
-            source_id = self._node_id(
-                row["primary_investor_id"], row["primary_investor_type"]
-            )
-
-            # Co-investor might not be in our database - create external node
-            co_name = row["co_investor_name"]
-            target_id = f"external_{hash(co_name) % 100000}"
-
-            if target_id not in self._nodes:
-                self._nodes[target_id] = {
-                    "id": target_id,
-                    "investor_id": None,
-                    "type": "external",
-                    "name": co_name,
-                    "subtype": row.get("co_investor_type"),
-                    "location": None,
-                    "degree": 0,
-                    "weighted_degree": 0,
-                    "centrality": 0.0,
-                    "cluster_id": None,
-                }
+    def _analytics(self) -> GraphAnalytics:
+        """Analytics for this engine's graph version (shared, memoised)."""
+        return get_analytics(self._graph.weighted_graph(self._arrays))
 
-            edge_key = tuple(sorted([source_id, target_id]))
-            if edge_key not in self._edges:
-                self._edges[edge_key] = {
-                    "source": edge_key[0],
-                    "target": edge_key[1],
-                    "weight": 0,
-                    "shared_companies": [],
-                    "first_date": None,
-                    "last_date": None,
-                }
-
-            edge = self._edges[edge_key]
-            edge["weight"] += row.get("co_investment_count", 1)
-            if row.get("deal_name"):
-                if row["deal_name"] not in edge["shared_companies"]:
-                    edge["shared_companies"].append(row["deal_name"])
-            if row.get("first_date"):
-                if edge["first_date"] is None or row["first_date"] < edge["first_date"]:
-                    edge["first_date"] = row["first_date"]
-            if row.get("last_date"):
-                if edge["last_date"] is None or row["last_date"] > edge["last_date"]:
-                    edge["last_date"] = row["last_date"]
-
-    def _build_edges_from_shared_portfolios(self) -> None:
-        """Build edges from investors sharing portfolio companies."""
-        query = text("""
-            SELECT
-                a.investor_id as investor_a_id,
-                a.investor_type as investor_a_type,
-                b.investor_id as investor_b_id,
-                b.investor_type as investor_b_type,
-                ARRAY_AGG(DISTINCT a.company_name) as shared_companies,
-                COUNT(DISTINCT a.company_name) as shared_count
-            FROM portfolio_companies a
-            JOIN portfolio_companies b
-                ON LOWER(TRIM(a.company_name)) = LOWER(TRIM(b.company_name))
-                AND (a.investor_id != b.investor_id OR a.investor_type != b.investor_type)
-            WHERE a.current_holding = 1 AND b.current_holding = 1
-                AND a.investor_id < b.investor_id OR
-                    (a.investor_id = b.investor_id AND a.investor_type < b.investor_type)
-            GROUP BY a.investor_id, a.investor_type, b.investor_id, b.investor_type
-            HAVING COUNT(DISTINCT a.company_name) >= 1
-        """)
-
-        try:
-            result = self.db.execute(query)
-            for row in result.mappings():
-                source_id = self._node_id(row["investor_a_id"], row["investor_a_type"])
-                target_id = self._node_id(row["investor_b_id"], row["investor_b_type"])
-
-                # Skip if either node doesn't exist
-                if source_id not in self._nodes or target_id not in self._nodes:
-                    continue
-
-                edge_key = tuple(sorted([source_id, target_id]))
-                if edge_key not in self._edges:
-                    self._edges[edge_key] = {
-                        "source": edge_key[0],
-                        "target": edge_key[1],
-                        "weight": 0,
-                        "shared_companies": [],
-                        "first_date": None,
-                        "last_date": None,
-                    }
-
-                edge = self._edges[edge_key]
-                edge["weight"] += row["shared_count"]
-                shared = row.get("shared_companies") or []
-                for company in shared:
-                    if company and company not in edge["shared_companies"]:
-                        edge["shared_companies"].append(company)
-        except Exception as e:
-            logger.warning(f"Error building edges from shared portfolios: {e}")
-
-    def _calculate_node_metrics(self) -> None:
-        """Calculate degree and centrality metrics for all nodes."""
-        # Calculate degree
-        for edge in self._edges.values():
-            source = edge["source"]
-            target = edge["target"]
-            weight = edge["weight"]
-
-            if source in self._nodes:
-                self._nodes[source]["degree"] += 1
-                self._nodes[source]["weighted_degree"] += weight
-            if target in self._nodes:
-                self._nodes[target]["degree"] += 1
-                self._nodes[target]["weighted_degree"] += weight
-
-        # Calculate simple centrality (normalized degree)
-        max_degree = max((n["degree"] for n in self._nodes.values()), default=1)
-        for node in self._nodes.values():
-            node["centrality"] = (
-                round(node["degree"] / max_degree, 3) if max_degree > 0 else 0
-            )
+    def _index(self, investor_id: int, investor_type: str) -> Optional[int]:
+        idx = self._graph.node_index.get(self._node_id(investor_id, investor_type))
+        if idx is None or idx >= self._arrays.num_nodes:
+            return None
+        return idx
 
     def get_network_graph(
         self,
@@ -259,38 +90,26 @@ class NetworkEngine:
             include_external: Include external (non-database) investors
         """
         self.build_network()
+        arrays = self._arrays
 
-        # Filter edges
-        filtered_edges = [e for e in self._edges.values() if e["weight"] >= min_weight]
-
-        # Sort by weight descending
-        filtered_edges.sort(key=lambda x: x["weight"], reverse=True)
-
+        # Filter edges, heaviest first (ties keep build order)
+        edge_ids = np.flatnonzero(arrays.edge_weight >= min_weight)
+        edge_ids = edge_ids[np.argsort(-arrays.edge_weight[edge_ids], kind="stable")]
         if limit:
-            filtered_edges = filtered_edges[:limit]
-
-        # Get nodes that appear in filtered edges
-        active_node_ids = set()
-        for edge in filtered_edges:
-            active_node_ids.add(edge["source"])
-            active_node_ids.add(edge["target"])
-
-        # Filter nodes
-        filtered_nodes = []
-        for node_id in active_node_ids:
-            if node_id in self._nodes:
-                node = self._nodes[node_id]
-                if not include_external and node["type"] == "external":
-                    continue
-                filtered_nodes.append(node)
+            edge_ids = edge_ids[:limit]
+        filtered_edges = [self._edge(int(e)) for e in edge_ids]
 
-        # Calculate stats
-        total_weight = sum(e["weight"] for e in filtered_edges)
-        avg_degree = (
-            sum(n["degree"] for n in filtered_nodes) / len(filtered_nodes)
-            if filtered_nodes
-            else 0
+        # Nodes that appear in filtered edges
+        active = np.unique(
+            np.concatenate([arrays.edge_source[edge_ids], arrays.edge_target[edge_ids]])
         )
+        if not include_external:
+            active = active[~arrays.is_external[active]]
+        filtered_nodes = [self._node(int(i)) for i in active]
+
+        # Calculate stats
+        total_weight = int(arrays.edge_weight[edge_ids].sum())
+        avg_degree = float(arrays.degree[active].mean()) if len(active) else 0
         max_possible_edges = len(filtered_nodes) * (len(filtered_nodes) - 1) / 2
         density = (
             len(filtered_edges) / max_possible_edges if max_possible_edges > 0 else 0
@@ -325,144 +144,182 @@ class NetworkEngine:
             min_weight: Minimum edge weight to include
         """
         self.build_network()
+        arrays = self._arrays
 
-        center_id = self._node_id(investor_id, investor_type)
-        if center_id not in self._nodes:
+        center = self._index(investor_id, investor_type)
+        if center is None:
             return {
                 "nodes": [],
                 "edges": [],
                 "stats": {"total_nodes": 0, "total_edges": 0},
             }
 
-        # BFS to find connected nodes up to depth
-        visited: Set[str] = {center_id}
-        current_level: Set[str] = {center_id}
-
+        # BFS over CSR adjacency up to depth, only along edges >= min_weight
+        visited = {center: None}
+        current_level = [center]
         for _ in range(depth):
-            next_level: Set[str] = set()
-            for node_id in current_level:
-                for edge_key, edge in self._edges.items():
-                    if edge["weight"] < min_weight:
-                        continue
-                    if edge["source"] == node_id and edge["target"] not in visited:
-                        next_level.add(edge["target"])
-                    elif edge["target"] == node_id and edge["source"] not in visited:
-                        next_level.add(edge["source"])
-            visited.update(next_level)
+            next_level = []
+            for u in current_level:
+                lo, hi = arrays.indptr[u], arrays.indptr[u + 1]
+                strong = arrays.edge_weight[arrays.edge_ids[lo:hi]] >= min_weight
+                for v in arrays.indices[lo:hi][strong].tolist():
+                    if v not in visited:
+                        visited[v] = None
+                        next_level.append(v)
             current_level = next_level
 
-        # Collect nodes and edges
-        nodes = [self._nodes[nid] for nid in visited if nid in self._nodes]
-        edges = [
-            e
-            for e in self._edges.values()
-            if e["source"] in visited
-            and e["target"] in visited
-            and e["weight"] >= min_weight
-        ]
+        # Edges between visited nodes
+        edge_ids = set()
+        for u in visited:
+            lo, hi = arrays.indptr[u], arrays.indptr[u + 1]
+            for v, eid in zip(arrays.indices[lo:hi].tolist(), arrays.edge_ids[lo:hi].tolist()):
+                if v in visited and arrays.edge_weight[eid] >= min_weight:
+                    edge_ids.add(eid)
+        edges = [self._edge(e) for e in sorted(edge_ids)]
 
         # Mark the center node
-        for node in nodes:
-            node["is_center"] = node["id"] == center_id
+        nodes = []
+        for idx in visited:
+            node = self._node(idx)
+            node["is_center"] = idx == center
+            nodes.append(node)
 
         return {
-            "center": self._nodes.get(center_id),
+            "center": nodes[0],
             "nodes": nodes,
             "edges": edges,
             "stats": {
                 "total_nodes": len(nodes),
                 "total_edges": len(edges),
-                "direct_connections": sum(
-                    1 for n in nodes if n.get("is_center") is False
-                ),
+                "direct_connections": len(nodes) - 1,
             },
         }
 
-    def get_central_investors(self, limit: int = 20) -> List[Dict]:
+    def get_central_investors(self, limit: int = 20, by: str = "weighted_degree") -> List[Dict]:
         """
         Get most central/connected investors.
 
-        Returns investors ranked by weighted degree (connection strength).
+        by:
+            weighted_degree: connection strength (weighted degree, then degree)
+            pagerank: weighted PageRank
+            betweenness: approximate betweenness (investors that broker
+                between otherwise separate groups)
         """
         self.build_network()
+        arrays = self._arrays
 
-        # Filter out external nodes and sort by weighted degree
-        internal_nodes = [
-            n
-            for n in self._nodes.values()
-            if n["type"] != "external" and n["degree"] > 0
-        ]
-        internal_nodes.sort(
-            key=lambda x: (x["weighted_degree"], x["degree"]), reverse=True
-        )
+        # Filter out external nodes
+        candidates = np.flatnonzero(~arrays.is_external & (arrays.degree > 0))
 
-        return internal_nodes[:limit]
+        if by == "weighted_degree":
+            order = np.lexsort(
+                (-arrays.degree[candidates], -arrays.weighted_degree[candidates])
+            )
+            return [self._node(int(i)) for i in candidates[order][:limit]]
+
+        analytics = self._analytics()
+        if by == "pagerank":
+            scores = analytics.pagerank()
+        elif by == "betweenness":
+            scores = analytics.betweenness()
+        else:
+            raise ValueError(f"Unknown centrality measure: {by}")
+        order = np.argsort(-scores[candidates], kind="stable")
+        result = []
+        for idx in candidates[order][:limit].tolist():
+            node = self._node(idx)
+            node[by] = float(scores[idx])
+            result.append(node)
+        return result
 
-    def detect_clusters(self, min_cluster_size: int = 2) -> List[Dict]:
+    def get_k_hop_neighborhoods(
+        self,
+        investors: List[Tuple[int, str]],
+        k: int = 2,
+        include_external: bool = False,
+        limit: Optional[int] = None,
+    ) -> List[Dict]:
         """
-        Detect investor clusters using connected components.
+        k-hop neighborhoods of several investors in one batched traversal.
 
-        Simple clustering based on graph connectivity.
+        Returns one entry per requested investor with the investors within
+        k hops (nearest first) and their hop distance.
         """
         self.build_network()
+        arrays = self._arrays
 
-        # Build adjacency list
-        adj: Dict[str, Set[str]] = defaultdict(set)
-        for edge in self._edges.values():
-            adj[edge["source"]].add(edge["target"])
-            adj[edge["target"]].add(edge["source"])
+        indices = [self._index(i, t) for i, t in investors]
+        known = [idx for idx in indices if idx is not None]
+        neighborhoods = iter(self._analytics().k_hop(known, k))
 
-        # Find connected components (simple clustering)
-        visited: Set[str] = set()
-        clusters: List[List[str]] = []
+        result = []
+        for (investor_id, investor_type), idx in zip(investors, indices):
+            entry = {"investor": self._node_id(investor_id, investor_type), "found": idx is not None}
+            neighbors: List[Dict] = []
+            if idx is not None:
+                nodes, hops = next(neighborhoods)
+                if not include_external:
+                    keep = ~arrays.is_external[nodes]
+                    nodes, hops = nodes[keep], hops[keep]
+                order = np.argsort(hops, kind="stable")
+                if limit:
+                    order = order[:limit]
+                for i in order.tolist():
+                    neighbor = self._node(int(nodes[i]))
+                    neighbor["hops"] = int(hops[i])
+                    neighbors.append(neighbor)
+            entry["neighbors"] = neighbors
+            result.append(entry)
+        return result
 
-        for node_id in self._nodes:
-            if node_id in visited:
-                continue
-            if self._nodes[node_id]["type"] == "external":
-                continue
+    def detect_clusters(
+        self, min_cluster_size: int = 2, method: str = "louvain"
+    ) -> List[Dict]:
+        """
+        Detect investor clusters.
 
-            # BFS to find component
-            component: List[str] = []
-            queue = [node_id]
-            while queue:
-                current = queue.pop(0)
-                if current in visited:
-                    continue
-                visited.add(current)
-                if self._nodes.get(current, {}).get("type") != "external":
-                    component.append(current)
-                for neighbor in adj[current]:
-                    if neighbor not in visited:
-                        queue.append(neighbor)
+        method:
+            louvain / label_propagation: communities of densely connected
+                investors (see app.network.analytics)
+            components: connected components (on a dense network this is
+                one giant cluster)
 
-            if len(component) >= min_cluster_size:
-                clusters.append(component)
+        External investors link clusters but are not listed as members.
+        """
+        self.build_network()
+        arrays = self._arrays
+
+        if method == "components":
+            clusters = self._connected_components(min_cluster_size)
+        else:
+            labels = self._analytics().communities(method)
+            members_by_label: Dict[int, List[int]] = {}
+            for idx in np.flatnonzero(~arrays.is_external).tolist():
+                members_by_label.setdefault(int(labels[idx]), []).append(idx)
+            clusters = [
+                members for members in members_by_label.values()
+                if len(members) >= min_cluster_size
+            ]
 
         # Assign cluster IDs and build response
         result = []
         for cluster_id, members in enumerate(clusters, 1):
-            # Update node cluster IDs
-            for node_id in members:
-                if node_id in self._nodes:
-                    self._nodes[node_id]["cluster_id"] = cluster_id
-
-            # Find common sectors/industries
-            member_nodes = [self._nodes[m] for m in members if m in self._nodes]
+            for idx in members:
+                self._cluster_ids[idx] = cluster_id
 
             result.append(
                 {
                     "id": cluster_id,
                     "size": len(members),
                     "members": [
-                        {"id": n["id"], "name": n["name"], "type": n["type"]}
-                        for n in member_nodes
+                        {
+                            "id": self._graph.node_ids[i],
+                            "name": self._graph.node_name[i],
+                            "type": self._graph.node_type[i],
+                        }
+                        for i in members
                     ],
-                    "avg_degree": round(
-                        sum(n["degree"] for n in member_nodes) / len(member_nodes), 2
-                    )
-                    if member_nodes
-                    else 0,
+                    "avg_degree": round(float(arrays.degree[members].mean()), 2),
                 }
             )
 
@@ -470,6 +327,36 @@ class NetworkEngine:
         result.sort(key=lambda x: x["size"], reverse=True)
         return result
 
+    def _connected_components(self, min_cluster_size: int) -> List[List[int]]:
+        """Internal members of each connected component, BFS over CSR."""
+        arrays = self._arrays
+        indptr, indices = arrays.indptr, arrays.indices
+        is_external = arrays.is_external
+
+        visited = np.zeros(arrays.num_nodes, dtype=bool)
+        clusters: List[List[int]] = []
+
+        for start in range(arrays.num_nodes):
+            if visited[start] or is_external[start]:
+                continue
+
+            # BFS to find component
+            component: List[int] = []
+            visited[start] = True
+            queue = deque([start])
+            while queue:
+                current = queue.popleft()
+                if not is_external[current]:
+                    component.append(current)
+                neighbors = indices[indptr[current]:indptr[current + 1]]
+                fresh = neighbors[~visited[neighbors]]
+                visited[fresh] = True
+                queue.extend(fresh.tolist())
+
+            if len(component) >= min_cluster_size:
+                clusters.append(component)
+        return clusters
+
     def find_path(
         self,
         source_id: int,
@@ -483,44 +370,42 @@ class NetworkEngine:
         Returns the path with all intermediate investors and connections.
         """
         self.build_network()
+        arrays = self._arrays
 
-        start = self._node_id(source_id, source_type)
-        end = self._node_id(target_id, target_type)
+        start = self._index(source_id, source_type)
+        end = self._index(target_id, target_type)
 
-        if start not in self._nodes or end not in self._nodes:
+        if start is None or end is None:
             return None
 
         if start == end:
             return {
                 "found": True,
                 "path_length": 0,
-                "path": [self._nodes[start]],
+                "path": [self._node(start)],
                 "edges": [],
             }
 
-        # Build adjacency list
-        adj: Dict[str, List[Tuple[str, Dict]]] = defaultdict(list)
-        for edge in self._edges.values():
-            adj[edge["source"]].append((edge["target"], edge))
-            adj[edge["target"]].append((edge["source"], edge))
-
         # BFS to find shortest path
-        visited = {start: None}
+        parent = {start: None}
         edge_used = {start: None}
-        queue = [start]
+        queue = deque([start])
 
         while queue:
-            current = queue.pop(0)
+            current = queue.popleft()
             if current == end:
                 break
 
-            for neighbor, edge in adj[current]:
-                if neighbor not in visited:
-                    visited[neighbor] = current
-                    edge_used[neighbor] = edge
+            lo, hi = arrays.indptr[current], arrays.indptr[current + 1]
+            for neighbor, eid in zip(
+                arrays.indices[lo:hi].tolist(), arrays.edge_ids[lo:hi].tolist()
+            ):
+                if neighbor not in parent:
+                    parent[neighbor] = current
+                    edge_used[neighbor] = eid
                     queue.append(neighbor)
 
-        if end not in visited:
+        if end not in parent:
             return {"found": False, "path_length": -1, "path": [], "edges": []}
 
         # Reconstruct path
@@ -528,10 +413,10 @@ class NetworkEngine:
         edges = []
         current = end
         while current is not None:
-            path.append(self._nodes[current])
+            path.append(self._node(current))
             if edge_used[current] is not None:
-                edges.append(edge_used[current])
-            current = visited[current]
+                edges.append(self._edge(edge_used[current]))
+            current = parent[current]
 
         path.reverse()
         edges.reverse()
@@ -0,0 +1,543 @@
+"""
+Co-investor Network — In-memory Graph Store.
+
+Materializes the co-investor network once per process as integer-indexed
+arrays and keeps it current without rebuilding:
+
+  1. Nodes (LPs, family offices, external co-investors) get dense indices;
+     edges live in parallel lists keyed by (low, high) node index.
+  2. finalize() packs the edges into CSR adjacency (indptr / indices /
+     edge_ids) and precomputes degree, weighted degree and centrality.
+  3. get_graph() serves the cached graph. At most every
+     REFRESH_INTERVAL_S it reads a watermark of the source tables (row
+     counts, max ids, portfolio updated_at, the co_investment_count total
+     and, on PostgreSQL, the newest investor row version); rows appended
+     to portfolio_companies / co_investments are folded into the existing
+     edges, anything else (deletes, updates, investor changes) triggers a
+     full rebuild. A graph older than MAX_GRAPH_AGE_S is rebuilt anyway,
+     for changes the watermark cannot see.
+
+Portfolio edges are grouped in Python by LOWER(TRIM(company_name)) instead
+of self-joining portfolio_companies, and shared company lists are ordered
+sets, so appending a holding costs O(holders of that company).
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import threading
+import time
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
+
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.network.analytics import WeightedGraph
+
+logger = logging.getLogger(__name__)
+
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+REFRESH_INTERVAL_S = 30.0  # how often get_graph() checks the source tables
+MAX_GRAPH_AGE_S = 3600.0  # full rebuild after this long, whatever the watermark says
+GRAPH_NAME = "co_investor_network"
+
+# Versions are unique per process, so a rebuilt graph never reuses the
+# version (and analytics cache entries) of the graph it replaces
+_versions = itertools.count(1)
+
+
+def node_id(investor_id: Any, investor_type: str) -> str:
+    """Public node id, e.g. "lp_12" / "family_office_3"."""
+    return f"{investor_type}_{investor_id}"
+
+
+def external_node_id(co_investor_name: str) -> str:
+    """Node id for a co-investor that is not in our investor tables."""
+    return f"external_{hash(co_investor_name) % 100000}"
+
+
+def _company_key(company_name: Optional[str]) -> Optional[str]:
+    if not company_name:
+        return None
+    key = company_name.strip().lower()
+    return key or None
+
+
+# ---------------------------------------------------------------------------
+# Graph
+# ---------------------------------------------------------------------------
+
+
+class GraphArrays(NamedTuple):
+    """CSR adjacency and node metrics of one graph version.
+
+    Published as a single attribute so readers never see arrays from two
+    different versions; node/edge lists only grow, so indices stay valid.
+    """
+
+    version: int
+    num_nodes: int
+    num_edges: int
+    indptr: np.ndarray  # (num_nodes + 1,)
+    indices: np.ndarray  # neighbor node index per adjacency slot
+    edge_ids: np.ndarray  # edge index per adjacency slot
+    edge_source: np.ndarray  # (num_edges,)
+    edge_target: np.ndarray
+    edge_weight: np.ndarray
+    degree: np.ndarray  # (num_nodes,)
+    weighted_degree: np.ndarray
+    centrality: np.ndarray
+    is_external: np.ndarray
+
+
+def _empty_arrays() -> GraphArrays:
+    empty = np.zeros(0, dtype=np.int64)
+    return GraphArrays(
+        0, 0, 0, np.zeros(1, dtype=np.int64), empty, empty, empty, empty, empty,
+        empty, empty, np.zeros(0), np.zeros(0, dtype=bool),
+    )
+
+
+class CoInvestorGraph:
+    """
+    Co-investor network as dense integer-indexed arrays.
+
+    Node metadata is kept in lists aligned with node indices; edge metadata
+    in lists aligned with edge indices. finalize() publishes a GraphArrays
+    snapshot: neighbors of node i are indices[indptr[i]:indptr[i + 1]] and
+    the matching edge_ids point back into the edge lists.
+    """
+
+    def __init__(self):
+        self.watermark: Dict[str, Any] = {}
+        self.built_at = time.monotonic()
+
+        # Nodes
+        self.node_ids: List[str] = []
+        self.node_index: Dict[str, int] = {}
+        self.node_investor_id: List[Optional[int]] = []
+        self.node_type: List[str] = []
+        self.node_name: List[str] = []
+        self.node_subtype: List[Optional[str]] = []
+        self.node_location: List[Optional[str]] = []
+
+        # Edges (source < target by node id string, as the API reports them)
+        self.edge_index: Dict[Tuple[int, int], int] = {}
+        self.edge_source: List[int] = []
+        self.edge_target: List[int] = []
+        self.edge_weight_list: List[int] = []
+        self.edge_companies: List[Dict[str, None]] = []  # ordered set
+        self.edge_first_date: List[Any] = []
+        self.edge_last_date: List[Any] = []
+        # What each edge's weight is made of, so appended rows don't double count
+        self._edge_deal_keys: List[Set[Tuple]] = []
+        self._edge_portfolio_keys: List[Set[str]] = []
+
+        # Portfolio holdings: company key -> {node index: company name}
+        self._company_holders: Dict[str, Dict[int, str]] = {}
+
+        # CSR adjacency + metrics, published by finalize()
+        self.arrays = _empty_arrays()
+        self._published = False
+        self._weighted: Optional[WeightedGraph] = None
+
+    @property
+    def version(self) -> int:
+        return self.arrays.version
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.edge_source)
+
+    # -- building ----------------------------------------------------------
+
+    def add_node(
+        self,
+        nid: str,
+        investor_id: Optional[int],
+        investor_type: str,
+        name: str,
+        subtype: Optional[str] = None,
+        location: Optional[str] = None,
+    ) -> int:
+        """Add a node (no-op if it exists) and return its index."""
+        idx = self.node_index.get(nid)
+        if idx is not None:
+            return idx
+        idx = len(self.node_ids)
+        self.node_index[nid] = idx
+        self.node_ids.append(nid)
+        self.node_investor_id.append(investor_id)
+        self.node_type.append(investor_type)
+        self.node_name.append(name)
+        self.node_subtype.append(subtype)
+        self.node_location.append(location)
+        return idx
+
+    def _edge(self, a: int, b: int) -> int:
+        if self.node_ids[a] > self.node_ids[b]:
+            a, b = b, a
+        eid = self.edge_index.get((a, b))
+        if eid is None:
+            eid = len(self.edge_source)
+            self.edge_index[(a, b)] = eid
+            self.edge_source.append(a)
+            self.edge_target.append(b)
+            self.edge_weight_list.append(0)
+            self.edge_companies.append({})
+            self.edge_first_date.append(None)
+            self.edge_last_date.append(None)
+            self._edge_deal_keys.append(set())
+            self._edge_portfolio_keys.append(set())
+        return eid
+
+    def add_co_investment(self, row: Dict[str, Any]) -> None:
+        """Fold one co_investments row into the graph.
+
+        Rows with the same (co-investor, deal, count) on an edge add their
+        weight once, like the GROUP BY the network used to be built from.
+        """
+        source = self.node_index.get(
+            node_id(row["primary_investor_id"], row["primary_investor_type"])
+        )
+        if source is None:
+            return
+        co_name = row["co_investor_name"]
+        target = self.add_node(
+            external_node_id(co_name), None, "external", co_name,
+            subtype=row.get("co_investor_type"),
+        )
+        if source == target:
+            return
+        eid = self._edge(source, target)
+
+        deal_key = (
+            co_name, row.get("co_investor_type"), row.get("deal_name"),
+            row.get("co_investment_count"),
+        )
+        if deal_key not in self._edge_deal_keys[eid]:
+            self._edge_deal_keys[eid].add(deal_key)
+            self.edge_weight_list[eid] += row.get("co_investment_count") or 1
+        if row.get("deal_name"):
+            self._add_company(eid, row["deal_name"])
+        deal_date = row.get("deal_date")
+        if deal_date is not None:
+            first, last = self.edge_first_date[eid], self.edge_last_date[eid]
+            if first is None or deal_date < first:
+                self.edge_first_date[eid] = deal_date
+            if last is None or deal_date > last:
+                self.edge_last_date[eid] = deal_date
+
+    def add_holding(self, investor_id: int, investor_type: str, company_name: str) -> None:
+        """Fold one current portfolio holding into the graph.
+
+        Links the investor to every other current holder of the same company
+        (matched on LOWER(TRIM(company_name))); each shared company adds 1 to
+        the edge weight once.
+        """
+        holder = self.node_index.get(node_id(investor_id, investor_type))
+        key = _company_key(company_name)
+        if holder is None or key is None:
+            return
+        holders = self._company_holders.setdefault(key, {})
+        if holder in holders:
+            return
+        for other, other_name in holders.items():
+            eid = self._edge(holder, other)
+            if key not in self._edge_portfolio_keys[eid]:
+                self._edge_portfolio_keys[eid].add(key)
+                self.edge_weight_list[eid] += 1
+                self._add_company(eid, other_name)
+        holders[holder] = company_name
+
+    def _add_company(self, eid: int, company_name: str) -> None:
+        companies = self.edge_companies[eid]
+        if company_name in companies:
+            return
+        if self._published:
+            # Readers may be iterating the published dict; copy on write
+            companies = dict(companies)
+            self.edge_companies[eid] = companies
+        companies[company_name] = None
+
+    def finalize(self) -> None:
+        """Pack edges into CSR adjacency, recompute node metrics and publish."""
+        n, m = self.num_nodes, self.num_edges
+        src = np.asarray(self.edge_source, dtype=np.int64)
+        dst = np.asarray(self.edge_target, dtype=np.int64)
+        weight = np.asarray(self.edge_weight_list, dtype=np.int64)
+
+        rows = np.concatenate([src, dst])
+        cols = np.concatenate([dst, src])
+        eids = np.concatenate([np.arange(m, dtype=np.int64)] * 2)
+        order = np.argsort(rows, kind="stable")
+        counts = np.bincount(rows, minlength=n).astype(np.int64)
+
+        max_degree = int(counts.max()) if n else 0
+        self.arrays = GraphArrays(
+            version=next(_versions),
+            num_nodes=n,
+            num_edges=m,
+            indptr=np.concatenate([[0], np.cumsum(counts)]).astype(np.int64),
+            indices=cols[order],
+            edge_ids=eids[order],
+            edge_source=src,
+            edge_target=dst,
+            edge_weight=weight,
+            degree=counts,
+            weighted_degree=np.bincount(rows, weights=weight[eids], minlength=n).astype(np.int64),
+            centrality=np.round(counts / max_degree, 3) if max_degree > 0 else np.zeros(n),
+            is_external=np.asarray([t == "external" for t in self.node_type], dtype=bool),
+        )
+        self._published = True
+
+    # -- reading -----------------------------------------------------------
+
+    def weighted_graph(self, arrays: GraphArrays) -> WeightedGraph:
+        """The published arrays as a WeightedGraph for app.network.analytics."""
+        cached = self._weighted
+        if cached is not None and cached.version == arrays.version:
+            return cached
+        weighted = WeightedGraph(
+            name=GRAPH_NAME,
+            version=arrays.version,
+            indptr=arrays.indptr,
+            indices=arrays.indices,
+            weights=arrays.edge_weight[arrays.edge_ids].astype(np.float64),
+            labels=self.node_ids[:arrays.num_nodes],
+        )
+        self._weighted = weighted
+        return weighted
+
+    def node_dict(
+        self, idx: int, arrays: GraphArrays, cluster_id: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Fresh node dict in the shape the network API returns."""
+        return {
+            "id": self.node_ids[idx],
+            "investor_id": self.node_investor_id[idx],
+            "type": self.node_type[idx],
+            "name": self.node_name[idx],
+            "subtype": self.node_subtype[idx],
+            "location": self.node_location[idx],
+            "degree": int(arrays.degree[idx]),
+            "weighted_degree": int(arrays.weighted_degree[idx]),
+            "centrality": float(arrays.centrality[idx]),
+            "cluster_id": cluster_id,
+        }
+
+    def edge_dict(self, eid: int, arrays: GraphArrays) -> Dict[str, Any]:
+        """Fresh edge dict in the shape the network API returns."""
+        return {
+            "source": self.node_ids[arrays.edge_source[eid]],
+            "target": self.node_ids[arrays.edge_target[eid]],
+            "weight": int(arrays.edge_weight[eid]),
+            "shared_companies": list(self.edge_companies[eid]),
+            "first_date": self.edge_first_date[eid],
+            "last_date": self.edge_last_date[eid],
+        }
+
+
+# ---------------------------------------------------------------------------
+# Loading
+# ---------------------------------------------------------------------------
+
+_WATERMARK_COLUMNS = """
+        (SELECT COUNT(*) FROM lp_fund) AS lp_count,
+        (SELECT MAX(id) FROM lp_fund) AS lp_max_id,
+        (SELECT COUNT(*) FROM family_offices) AS fo_count,
+        (SELECT MAX(id) FROM family_offices) AS fo_max_id,
+        (SELECT COUNT(*) FROM portfolio_companies) AS pc_count,
+        (SELECT MAX(id) FROM portfolio_companies) AS pc_max_id,
+        (SELECT MAX(updated_at) FROM portfolio_companies) AS pc_updated_at,
+        (SELECT COUNT(*) FROM co_investments) AS ci_count,
+        (SELECT MAX(id) FROM co_investments) AS ci_max_id,
+        (SELECT COALESCE(SUM(co_investment_count), 0) FROM co_investments) AS ci_weight"""
+
+# In-place UPDATEs of investor rows change neither counts nor max ids; on
+# PostgreSQL every updated row gets a new xmin, so the newest one moves
+_PG_WATERMARK_COLUMNS = """,
+        (SELECT MAX(xmin::text::bigint) FROM lp_fund) AS lp_xmin,
+        (SELECT MAX(xmin::text::bigint) FROM family_offices) AS fo_xmin"""
+
+_INVESTOR_WATERMARK_KEYS = (
+    "lp_count", "lp_max_id", "lp_xmin", "fo_count", "fo_max_id", "fo_xmin",
+)
+
+
+def _read_watermark(db: Session) -> Dict[str, Any]:
+    columns = _WATERMARK_COLUMNS
+    if db.get_bind().dialect.name == "postgresql":
+        columns += _PG_WATERMARK_COLUMNS
+    return dict(db.execute(text(f"SELECT {columns}")).mappings().one())
+
+
+def _load_investors(db: Session, graph: CoInvestorGraph) -> None:
+    rows = db.execute(text("""
+        SELECT id, name, lp_type AS investor_subtype, jurisdiction AS location
+        FROM lp_fund
+        ORDER BY id
+    """)).mappings()
+    for row in rows:
+        graph.add_node(
+            node_id(row["id"], "lp"), row["id"], "lp", row["name"],
+            row.get("investor_subtype"), row.get("location"),
+        )
+
+    rows = db.execute(text("""
+        SELECT id, name, type AS investor_subtype, region AS location
+        FROM family_offices
+        ORDER BY id
+    """)).mappings()
+    for row in rows:
+        graph.add_node(
+            node_id(row["id"], "family_office"), row["id"], "family_office", row["name"],
+            row.get("investor_subtype"), row.get("location"),
+        )
+
+
+def _load_co_investments(
+    db: Session, graph: CoInvestorGraph, after_id: Optional[int]
+) -> Tuple[int, int]:
+    """Fold co-investment rows past after_id in; returns (rows, co_investment_count total)."""
+    rows = db.execute(
+        text("""
+            SELECT id, primary_investor_id, primary_investor_type,
+                   co_investor_name, co_investor_type,
+                   deal_name, deal_date, co_investment_count
+            FROM co_investments
+            WHERE id > :after_id
+            ORDER BY id
+        """),
+        {"after_id": after_id or 0},
+    ).mappings()
+    count = weight = 0
+    for row in rows:
+        graph.add_co_investment(row)
+        count += 1
+        weight += row["co_investment_count"] or 0
+    return count, weight
+
+
+def _load_holdings(db: Session, graph: CoInvestorGraph, after_id: Optional[int]) -> int:
+    """Fold portfolio rows past after_id in; returns rows read (any holding state)."""
+    rows = db.execute(
+        text("""
+            SELECT id, investor_id, investor_type, company_name, current_holding
+            FROM portfolio_companies
+            WHERE id > :after_id
+            ORDER BY id
+        """),
+        {"after_id": after_id or 0},
+    )
+    count = 0
+    for _, investor_id, investor_type, company_name, current_holding in rows:
+        count += 1
+        if current_holding == 1:
+            graph.add_holding(investor_id, investor_type, company_name)
+    return count
+
+
+def build_graph(db: Session) -> CoInvestorGraph:
+    """Build the co-investor graph from scratch."""
+    start = time.time()
+    graph = CoInvestorGraph()
+    graph.watermark = _read_watermark(db)
+    _load_investors(db, graph)
+    _load_co_investments(db, graph, None)
+    _load_holdings(db, graph, None)
+    graph.finalize()
+    logger.info(
+        f"Network built: {graph.num_nodes} nodes, {graph.num_edges} edges "
+        f"({int((time.time() - start) * 1000)}ms)"
+    )
+    return graph
+
+
+def refresh_graph(db: Session, graph: CoInvestorGraph) -> CoInvestorGraph:
+    """
+    Bring a graph up to date with the database.
+
+    Appended portfolio_companies / co_investments rows are applied to the
+    existing graph (returned as the same object with a new version). Any
+    other change returns a freshly built graph.
+    """
+    old, new = graph.watermark, _read_watermark(db)
+    if new == old:
+        return graph
+
+    investors_changed = any(new.get(k) != old.get(k) for k in _INVESTOR_WATERMARK_KEYS)
+    if investors_changed or new["pc_updated_at"] != old.get("pc_updated_at"):
+        return build_graph(db)
+
+    appended_pc = _load_holdings(db, graph, old.get("pc_max_id"))
+    appended_ci, appended_weight = _load_co_investments(db, graph, old.get("ci_max_id"))
+    if (
+        old.get("pc_count", 0) + appended_pc != new["pc_count"]
+        or old.get("ci_count", 0) + appended_ci != new["ci_count"]
+        or old.get("ci_weight", 0) + appended_weight != new["ci_weight"]
+    ):
+        # Rows were deleted or updated below the old max id (e.g. the
+        # ON CONFLICT ... co_investment_count + 1 upsert)
+        return build_graph(db)
+
+    graph.watermark = new
+    graph.finalize()
+    logger.info(
+        f"Network updated: +{appended_pc} holdings, +{appended_ci} co-investments "
+        f"-> {graph.num_nodes} nodes, {graph.num_edges} edges (v{graph.version})"
+    )
+    return graph
+
+
+# ---------------------------------------------------------------------------
+# Process-wide cache
+# ---------------------------------------------------------------------------
+
+_cache_lock = threading.Lock()
+_cache: Dict[str, Tuple[CoInvestorGraph, float]] = {}
+
+
+def get_graph(db: Session, force_rebuild: bool = False) -> CoInvestorGraph:
+    """
+    Cached co-investor graph for the session's database.
+
+    Checks the source tables for changes at most every REFRESH_INTERVAL_S;
+    between checks requests are answered from memory. A graph built more
+    than MAX_GRAPH_AGE_S ago is rebuilt at the next check.
+    """
+    key = str(db.get_bind().url)
+    with _cache_lock:
+        cached = _cache.get(key)
+        now = time.monotonic()
+        if cached is None or force_rebuild:
+            graph = build_graph(db)
+        elif now - cached[1] < REFRESH_INTERVAL_S:
+            return cached[0]
+        elif now - cached[0].built_at >= MAX_GRAPH_AGE_S:
+            graph = build_graph(db)
+        else:
+            try:
+                graph = refresh_graph(db, cached[0])
+            except Exception as e:
+                logger.warning(f"Network refresh failed, rebuilding: {e}")
+                db.rollback()
+                graph = build_graph(db)
+        _cache[key] = (graph, now)
+        return graph
+
+
+def invalidate_graph_cache() -> None:
+    """Drop all cached graphs (next get_graph() rebuilds)."""
+    with _cache_lock:
+        _cache.clear()
@@ -4,16 +4,25 @@ LP→GP Relationship Graph Builder — Chain 3 of PLAN_052.
 Constructs a bipartite network from lp_gp_relationships with edge weights
 representing relationship strength. Provides graph analytics: centrality,
 LP overlap between GPs, and cluster detection.
+
+Network-level analytics (PageRank, betweenness brokers, Louvain communities)
+run on the array-backed engine in app.network.analytics; the graph is
+versioned by a content hash so unchanged relationship data reuses cached
+results across requests.
 """
 from __future__ import annotations
+import hashlib
 import logging
 import math
 from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Set
+import numpy as np
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 
+from app.network.analytics import GraphAnalytics, WeightedGraph, get_analytics
+
 logger = logging.getLogger(__name__)
 
 
@@ -79,11 +88,15 @@ def _compute_strength(vintages: int, commitment_usd: float, trend: str) -> int:
     return max(0, min(100, int(vintage_score + capital_score + trend_bonus)))
 
 
+GRAPH_NAME = "lp_gp_graph"
+
+
 class LPGPGraphBuilder:
 
     def __init__(self, db: Session):
         self.db = db
         self._edges: Optional[List[GraphEdge]] = None
+        self._node_names: List[str] = []
 
     def build_graph(self) -> List[GraphEdge]:
         """Build full bipartite graph from lp_gp_relationships."""
@@ -204,3 +217,95 @@ class LPGPGraphBuilder:
 
         overlaps.sort(key=lambda o: o.shared_lp_count, reverse=True)
         return overlaps
+
+    # ------------------------------------------------------------------
+    # Network analytics
+    # ------------------------------------------------------------------
+
+    def to_weighted_graph(self) -> WeightedGraph:
+        """Bipartite graph as CSR arrays (nodes lp_<id> and gp_<firm_id>)."""
+        edges = self.build_graph()
+        index: Dict[str, int] = {}
+        labels: List[str] = []
+        names: List[str] = []
+
+        def node(key: str, name: str) -> int:
+            if key not in index:
+                index[key] = len(labels)
+                labels.append(key)
+                names.append(name)
+            return index[key]
+
+        source = np.fromiter(
+            (node(f"lp_{e.lp_id}", e.lp_name) for e in edges), dtype=np.int64, count=len(edges)
+        )
+        target = np.fromiter(
+            (node(f"gp_{e.gp_firm_id}", e.gp_name) for e in edges), dtype=np.int64, count=len(edges)
+        )
+        weight = np.fromiter(
+            (max(e.relationship_strength, 1) for e in edges), dtype=np.float64, count=len(edges)
+        )
+        self._node_names = names
+
+        digest = hashlib.sha1()
+        digest.update("\n".join(labels).encode())
+        for arr in (source, target, weight):
+            digest.update(arr.tobytes())
+        return WeightedGraph.from_edges(
+            GRAPH_NAME, digest.hexdigest(), len(labels), source, target, weight, labels
+        )
+
+    def analytics(self) -> GraphAnalytics:
+        """Shared analytics for the current graph content."""
+        return get_analytics(self.to_weighted_graph())
+
+    def network_analytics(self, limit: int = 20, method: str = "louvain") -> dict:
+        """Top GPs/LPs by PageRank, broker nodes by betweenness, and communities."""
+        analytics = self.analytics()
+        graph = analytics.graph
+        names = self._node_names
+        is_gp = np.array([label.startswith("gp_") for label in graph.labels], dtype=bool)
+        pr = analytics.pagerank()
+        bc = analytics.betweenness()
+        communities = analytics.communities(method)
+
+        def ranked(scores: np.ndarray, mask: Optional[np.ndarray]) -> List[dict]:
+            return [
+                {
+                    "id": graph.labels[i],
+                    "name": names[i],
+                    "type": "gp" if is_gp[i] else "lp",
+                    "score": round(float(scores[i]), 6),
+                    "community": int(communities[i]),
+                }
+                for i in analytics.top(scores, limit, mask)
+            ]
+
+        summaries = []
+        if graph.num_nodes:
+            sizes = np.bincount(communities)
+            gp_counts = np.bincount(communities, weights=is_gp.astype(np.float64))
+            for cid in np.argsort(-sizes, kind="stable")[:limit]:
+                if sizes[cid] < 2:
+                    break
+                members = np.flatnonzero(communities == cid)
+                lead_gp = members[is_gp[members]]
+                lead = lead_gp[np.argmax(pr[lead_gp])] if len(lead_gp) else None
+                summaries.append({
+                    "community": int(cid),
+                    "size": int(sizes[cid]),
+                    "gp_count": int(gp_counts[cid]),
+                    "lp_count": int(sizes[cid] - gp_counts[cid]),
+                    "anchor_gp": names[lead] if lead is not None else None,
+                })
+
+        return {
+            "total_nodes": graph.num_nodes,
+            "total_edges": graph.num_edges,
+            "method": method,
+            "modularity": round(analytics.modularity(method), 4) if graph.num_nodes else 0.0,
+            "top_gps": ranked(pr, is_gp),
+            "top_lps": ranked(pr, ~is_gp),
+            "brokers": ranked(bc, None),
+            "communities": summaries,
+        }
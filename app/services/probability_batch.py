@@ -0,0 +1,365 @@
+"""
+Deal Probability Engine — Sharded Universe Scoring Runs.
+
+A universe run is split into fixed shards of company ids, recorded in
+txn_prob_batch_shards when the run is created:
+
+  1. start_universe_scan creates (or resumes) the run and, in WORKER_MODE,
+     queues one tier-0 "score_shard" job per unfinished shard plus a tier-1
+     "publish" job that promote_blocked_jobs releases once every shard job
+     is terminal. Without WORKER_MODE the whole run executes in-process.
+  2. run_shard scores one shard under the run's batch_id. Each engine chunk
+     commits its signals, scores and alerts together, so a shard that dies
+     half-way resumes from the first company without a score in this run.
+     Finished shards are checkpointed and skipped on rerun.
+  3. publish_batch flips the run to published in a single UPDATE. Until
+     then get_rankings / get_company_detail ignore its scores, so readers
+     see either the previous run or the complete new one — never a mix.
+
+Rerunning start_universe_scan with the same batch_id re-queues only the
+shards that are not done and whose job is gone or finished without
+completing the shard; shards whose job is still queued or running are left
+to it, and an outstanding publish job is reused.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.models_queue import JobQueue, QueueJobStatus, QueueJobType
+from app.core.probability_models import (
+    BATCH_PUBLISHED,
+    BATCH_RUNNING,
+    SHARD_DONE,
+    SHARD_FAILED,
+    SHARD_PENDING,
+    SHARD_RUNNING,
+    TxnProbBatch,
+    TxnProbBatchShard,
+    TxnProbScore,
+)
+from app.services.probability_engine import TransactionProbabilityEngine
+
+logger = logging.getLogger(__name__)
+
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+DEFAULT_SHARD_SIZE = 1000
+DEFAULT_CHUNK_SIZE = 100  # engine chunk (one commit) inside a shard
+
+SHARD_TIER = 0
+PUBLISH_TIER = 1
+
+_TERMINAL_JOB_STATUSES = {QueueJobStatus.SUCCESS.value, QueueJobStatus.FAILED.value}
+
+
+class BatchNotReadyError(RuntimeError):
+    """Raised when publishing a run whose shards are not all done."""
+
+
+# ---------------------------------------------------------------------------
+# Run lifecycle
+# ---------------------------------------------------------------------------
+
+
+def create_batch(db: Session, shard_size: int = DEFAULT_SHARD_SIZE) -> TxnProbBatch:
+    """Snapshot the active universe into a new run with fixed shards."""
+    if shard_size < 1:
+        raise ValueError("shard_size must be positive")
+
+    company_ids = TransactionProbabilityEngine(db).active_company_ids()
+    shards = [
+        company_ids[start:start + shard_size]
+        for start in range(0, len(company_ids), shard_size)
+    ]
+
+    batch = TxnProbBatch(
+        batch_id=TransactionProbabilityEngine._new_batch_id(),
+        status=BATCH_RUNNING,
+        shard_size=shard_size,
+        total_shards=len(shards),
+        total_companies=len(company_ids),
+    )
+    db.add(batch)
+    db.flush()
+    db.add_all([
+        TxnProbBatchShard(
+            batch_id=batch.batch_id, shard_index=i, company_ids=ids, status=SHARD_PENDING
+        )
+        for i, ids in enumerate(shards)
+    ])
+    db.commit()
+    logger.info(
+        "Created universe run %s: %d companies in %d shards",
+        batch.batch_id, len(company_ids), len(shards),
+    )
+    return batch
+
+
+def start_universe_scan(
+    db: Session,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+    batch_id: Optional[str] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    priority: int = 0,
+    background_tasks=None,
+) -> Dict:
+    """
+    Start a new universe run, or resume ``batch_id``.
+
+    In WORKER_MODE every unfinished shard is queued as its own job, followed
+    by a blocked publish job. When resuming, shards whose job is still
+    active (pending/blocked/claimed/running) are not queued again, and an
+    active publish job is kept instead of adding a second one. Otherwise the
+    run goes to background_tasks when given, or executes inline.
+    """
+    from app.core.job_queue_service import submit_job, WORKER_MODE
+
+    if batch_id:
+        batch = db.query(TxnProbBatch).filter_by(batch_id=batch_id).first()
+        if batch is None:
+            raise ValueError(f"Batch {batch_id} not found")
+        if batch.status == BATCH_PUBLISHED:
+            raise ValueError(f"Batch {batch_id} is already published")
+    else:
+        batch = create_batch(db, shard_size)
+    batch_id = batch.batch_id
+
+    pending = [s for s in _shards(db, batch_id) if s.status != SHARD_DONE]
+    job_ids: List[int] = []
+    in_flight: List[TxnProbBatchShard] = []
+
+    if WORKER_MODE:
+        active_jobs = _active_job_ids(db, [s.job_queue_id for s in pending if s.job_queue_id])
+        in_flight = [s for s in pending if s.job_queue_id in active_jobs]
+        pending = [s for s in pending if s.job_queue_id not in active_jobs]
+        for shard in pending:
+            result = submit_job(
+                db=db,
+                job_type=QueueJobType.TXN_PROBABILITY.value,
+                payload={
+                    "action": "score_shard",
+                    "batch_id": batch_id,
+                    "shard_index": shard.shard_index,
+                    "chunk_size": chunk_size,
+                    "tier": SHARD_TIER,
+                },
+                priority=priority,
+            )
+            shard.job_queue_id = result["job_queue_id"]
+            job_ids.append(result["job_queue_id"])
+        db.commit()
+
+        publish_job = _active_publish_job(db, batch_id)
+        if publish_job is None:
+            result = submit_job(
+                db=db,
+                job_type=QueueJobType.TXN_PROBABILITY.value,
+                payload={
+                    "action": "publish",
+                    "batch_id": batch_id,
+                    "tier": PUBLISH_TIER,
+                    "tier_max_concurrent": 1,
+                },
+                priority=priority,
+                status=(
+                    QueueJobStatus.BLOCKED if pending or in_flight else QueueJobStatus.PENDING
+                ),
+            )
+            job_ids.append(result["job_queue_id"])
+        mode = "queued"
+    elif background_tasks is not None:
+        submit_job(
+            db=db,
+            job_type=QueueJobType.TXN_PROBABILITY.value,
+            payload={"batch_id": batch_id},
+            background_tasks=background_tasks,
+            background_func=run_universe_scan,
+            background_args=(batch_id, chunk_size),
+        )
+        mode = "background"
+    else:
+        run_batch(db, batch_id, chunk_size)
+        mode = "inline"
+
+    status = get_batch_status(db, batch_id)
+    status.update({
+        "mode": mode,
+        "shards_queued": len(pending),
+        "shards_in_flight": len(in_flight),
+        "job_queue_ids": job_ids,
+    })
+    return status
+
+
+def run_shard(
+    db: Session, batch_id: str, shard_index: int, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Dict:
+    """
+    Score one shard of a run, skipping work that is already checkpointed.
+
+    A done shard returns immediately. Otherwise only the shard's companies
+    without a score in this run are scored. The shard is marked done, or
+    failed (and the error re-raised) so the queue records the failure.
+    """
+    shard = (
+        db.query(TxnProbBatchShard)
+        .filter_by(batch_id=batch_id, shard_index=shard_index)
+        .first()
+    )
+    if shard is None:
+        raise ValueError(f"Shard {shard_index} of batch {batch_id} not found")
+    if shard.status == SHARD_DONE:
+        logger.info("Shard %d of %s already done, skipping", shard_index, batch_id)
+        return shard.to_dict()
+
+    shard.status = SHARD_RUNNING
+    shard.started_at = datetime.utcnow()
+    shard.error_message = None
+    db.commit()
+
+    try:
+        company_ids = list(shard.company_ids or [])
+        already_scored = {
+            cid
+            for (cid,) in db.query(TxnProbScore.company_id)
+            .filter(TxnProbScore.batch_id == batch_id)
+            .filter(TxnProbScore.company_id.in_(company_ids))
+            .distinct()
+        } if company_ids else set()
+        remaining = [cid for cid in company_ids if cid not in already_scored]
+
+        succeeded, failed = TransactionProbabilityEngine(db).score_companies(
+            remaining, batch_id, chunk_size
+        )
+
+        shard.status = SHARD_DONE
+        shard.succeeded = len(already_scored) + succeeded
+        shard.failed = failed
+        shard.completed_at = datetime.utcnow()
+        db.commit()
+    except Exception as exc:
+        db.rollback()
+        shard.status = SHARD_FAILED
+        shard.error_message = str(exc)[:1000]
+        shard.completed_at = datetime.utcnow()
+        db.commit()
+        raise
+
+    return shard.to_dict()
+
+
+def publish_batch(db: Session, batch_id: str) -> Dict:
+    """
+    Make a run visible to readers once every shard is done.
+
+    The switch is one UPDATE of the batch row, so rankings move from the
+    previous run to this one atomically. Publishing twice is a no-op.
+    """
+    batch = db.query(TxnProbBatch).filter_by(batch_id=batch_id).first()
+    if batch is None:
+        raise ValueError(f"Batch {batch_id} not found")
+    if batch.status == BATCH_PUBLISHED:
+        return batch.to_dict()
+
+    shards = _shards(db, batch_id)
+    unfinished = [s.shard_index for s in shards if s.status != SHARD_DONE]
+    if unfinished:
+        raise BatchNotReadyError(
+            f"Batch {batch_id} has {len(unfinished)} unfinished shard(s): {unfinished[:10]}"
+        )
+
+    db.query(TxnProbBatch).filter_by(batch_id=batch_id).update({
+        "status": BATCH_PUBLISHED,
+        "succeeded": sum(s.succeeded or 0 for s in shards),
+        "failed": sum(s.failed or 0 for s in shards),
+        "published_at": datetime.utcnow(),
+    })
+    db.commit()
+    db.refresh(batch)
+    logger.info("Published universe run %s", batch_id)
+    return batch.to_dict()
+
+
+def run_batch(db: Session, batch_id: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict:
+    """Score every unfinished shard of a run in this process, then publish."""
+    for shard in _shards(db, batch_id):
+        if shard.status != SHARD_DONE:
+            run_shard(db, batch_id, shard.shard_index, chunk_size)
+    return publish_batch(db, batch_id)
+
+
+async def run_universe_scan(batch_id: str, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """BackgroundTasks entry point: run a whole batch with its own session."""
+    import asyncio
+
+    from app.core.database import get_session_factory
+
+    def _run():
+        db = get_session_factory()()
+        try:
+            return run_batch(db, batch_id, chunk_size)
+        finally:
+            db.close()
+
+    try:
+        await asyncio.to_thread(_run)
+    except Exception as exc:
+        logger.error("Universe run %s failed: %s", batch_id, exc)
+
+
+def get_batch_status(db: Session, batch_id: str) -> Optional[Dict]:
+    """Run row plus per-shard checkpoints, or None if unknown."""
+    batch = db.query(TxnProbBatch).filter_by(batch_id=batch_id).first()
+    if batch is None:
+        return None
+    shards = _shards(db, batch_id)
+    counts: Dict[str, int] = {}
+    for s in shards:
+        counts[s.status] = counts.get(s.status, 0) + 1
+    return {
+        **batch.to_dict(),
+        "shard_status": counts,
+        "shards": [s.to_dict() for s in shards],
+    }
+
+
+def _active_job_ids(db: Session, job_ids: List[int]) -> set:
+    """The given queue jobs that still exist and are not finished."""
+    if not job_ids:
+        return set()
+    rows = db.query(JobQueue.id, JobQueue.status).filter(JobQueue.id.in_(job_ids)).all()
+    return {
+        job_id for job_id, status in rows
+        if getattr(status, "value", status) not in _TERMINAL_JOB_STATUSES
+    }
+
+
+def _active_publish_job(db: Session, batch_id: str) -> Optional[JobQueue]:
+    """An unfinished publish job already queued for the run, if any."""
+    jobs = (
+        db.query(JobQueue)
+        .filter(JobQueue.payload["batch_id"].as_string() == batch_id)
+        .all()
+    )
+    for job in jobs:
+        status = getattr(job.status, "value", job.status)
+        if (job.payload or {}).get("action") == "publish" and status not in _TERMINAL_JOB_STATUSES:
+            return job
+    return None
+
+
+def _shards(db: Session, batch_id: str) -> List[TxnProbBatchShard]:
+    return (
+        db.query(TxnProbBatchShard)
+        .filter_by(batch_id=batch_id)
+        .order_by(TxnProbBatchShard.shard_index)
+        .all()
+    )
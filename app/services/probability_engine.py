@@ -19,6 +19,14 @@ Reuses existing scorers via composition (no modifications):
   - CompanyDiligenceScorer     → diligence_health
 
 Plus 6 new computers in probability_signal_computers.py.
+
+score_universe scores in chunks: new computers answer a whole chunk with
+grouped queries (compute_batch), previous scores/signals load once per chunk,
+and snapshots are bulk-inserted — same rows as score_company per company.
+
+Universe runs are registered in txn_prob_batches and only become visible to
+get_rankings / get_company_detail once published, so readers never see a
+half-written run. probability_batch shards a run across the worker queue.
 """
 
 from __future__ import annotations
@@ -31,10 +39,13 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
-from sqlalchemy import func
+from sqlalchemy import func, or_
 from sqlalchemy.orm import Session
 
 from app.core.probability_models import (
+    BATCH_PUBLISHED,
+    BATCH_RUNNING,
+    TxnProbBatch,
     TxnProbCompany,
     TxnProbScore,
     TxnProbSignal,
@@ -110,115 +121,130 @@ class TransactionProbabilityEngine:
         previous_score = (
             self.db.query(TxnProbScore)
             .filter_by(company_id=company_id)
-            .order_by(TxnProbScore.scored_at.desc())
+            .order_by(TxnProbScore.scored_at.desc(), TxnProbScore.id.desc())
             .first()
         )
 
         batch_id = batch_id or self._new_batch_id()
         signals = self._compute_signals(company)
-        weights = get_weights_for_sector(company.sector or "")
-
-        composite = self._compute_composite(signals, weights)
-        # Phase 4: prefer a fitted calibration (sector-specific, then global);
-        # fall back to the default sigmoid.
-        probability = self._calibrate_to_probability(
-            composite.raw_composite_score, company.sector or ""
-        )
-        grade = self._grade_from_score(composite.raw_composite_score)
-
-        signal_chain = self._build_signal_chain(signals, weights)
-        top_signals = self._top_signals(signal_chain, n=5)
-
-        confidence = (
-            sum(s.confidence for s in signals) / len(signals) if signals else 0.0
-        )
-
-        # Phase 3: detect named convergence patterns from the fresh signals
-        convergences: List[Dict] = []
-        try:
-            convergences = ConvergenceDetector(self.db).detect_from_signals(signals)
-        except Exception as exc:
-            logger.debug("convergence detection failed for %s: %s", company.id, exc)
+        scored = self._compose(company, signals)
 
         # Persist signal snapshots (with velocity/acceleration)
         self._persist_signals(company.id, signals, batch_id)
 
         # Persist composite score
-        score_row = TxnProbScore(
-            company_id=company.id,
-            probability=probability,
-            raw_composite_score=composite.raw_composite_score,
-            grade=grade,
-            confidence=confidence,
-            sector_weights_version=WEIGHTS_VERSION,
-            signal_count=len(signals),
-            active_signal_count=composite.active_signal_count,
-            convergence_factor=composite.convergence_factor,
-            top_signals=top_signals,
-            signal_chain=signal_chain,
-            model_version=MODEL_VERSION,
-            batch_id=batch_id,
-        )
+        score_row = TxnProbScore(**self._score_fields(company.id, scored, batch_id))
         self.db.add(score_row)
         self.db.flush()
 
-        # Phase 3: evaluate alerts against the previous score
-        try:
-            AlertEngine(self.db).evaluate(
-                company_id=company.id,
-                prev_score=previous_score,
-                new_score_row=score_row,
-                new_convergences=convergences,
-                company_name=company.company_name,
-            )
-        except Exception as exc:
-            logger.debug("alert evaluation failed for %s: %s", company.id, exc)
+        self._evaluate_alerts(
+            AlertEngine(self.db), company, previous_score, score_row, scored["convergences"]
+        )
 
         self.db.commit()
 
         return {
             "company_id": company.id,
             "company_name": company.company_name,
-            "probability": probability,
-            "raw_composite_score": composite.raw_composite_score,
-            "grade": grade,
-            "confidence": confidence,
+            "probability": scored["probability"],
+            "raw_composite_score": scored["composite"].raw_composite_score,
+            "grade": scored["grade"],
+            "confidence": scored["confidence"],
             "signal_count": len(signals),
-            "active_signal_count": composite.active_signal_count,
-            "convergence_factor": composite.convergence_factor,
-            "top_signals": top_signals,
-            "signal_chain": signal_chain,
+            "active_signal_count": scored["composite"].active_signal_count,
+            "convergence_factor": scored["composite"].convergence_factor,
+            "top_signals": scored["top_signals"],
+            "signal_chain": scored["signal_chain"],
             "model_version": MODEL_VERSION,
             "batch_id": batch_id,
             "scored_at": score_row.scored_at.isoformat() if score_row.scored_at else None,
-            "convergences": convergences,
+            "convergences": scored["convergences"],
         }
 
     def score_universe(self, batch_size: int = 100) -> Dict:
-        """Batch-score all active companies."""
+        """
+        Batch-score all active companies in this process.
+
+        The run is registered as a TxnProbBatch and published once every
+        chunk is written, so rankings switch to it in one step. For runs
+        sharded across workers see probability_batch.start_universe_scan.
+        """
         batch_id = self._new_batch_id()
-        active_companies = (
-            self.db.query(TxnProbCompany).filter_by(is_active=True).all()
-        )
+        company_ids = self.active_company_ids()
 
-        succeeded = 0
-        failed = 0
-        for c in active_companies:
-            try:
-                self.score_company(c.id, batch_id=batch_id)
-                succeeded += 1
-            except Exception as exc:
-                failed += 1
-                logger.warning("scoring company %s failed: %s", c.id, exc)
-                self.db.rollback()
+        self.db.add(TxnProbBatch(
+            batch_id=batch_id, status=BATCH_RUNNING, shard_size=len(company_ids),
+            total_shards=1, total_companies=len(company_ids),
+        ))
+        self.db.commit()
+
+        succeeded, failed = self.score_companies(company_ids, batch_id, batch_size)
+
+        self.db.query(TxnProbBatch).filter_by(batch_id=batch_id).update({
+            "status": BATCH_PUBLISHED,
+            "succeeded": succeeded,
+            "failed": failed,
+            "published_at": datetime.utcnow(),
+        })
+        self.db.commit()
 
         return {
             "batch_id": batch_id,
-            "total_companies": len(active_companies),
+            "total_companies": len(company_ids),
             "succeeded": succeeded,
             "failed": failed,
         }
 
+    def active_company_ids(self) -> List[int]:
+        """Ids of the active universe, in id order."""
+        return [
+            cid
+            for (cid,) in self.db.query(TxnProbCompany.id)
+            .filter_by(is_active=True)
+            .order_by(TxnProbCompany.id)
+        ]
+
+    def score_companies(
+        self, company_ids: List[int], batch_id: str, batch_size: int = 100
+    ) -> Tuple[int, int]:
+        """
+        Score the given companies under ``batch_id``; returns (succeeded, failed).
+
+        Companies are scored in chunks of ``batch_size``. Signal computers
+        answer for a whole chunk with grouped queries (compute_batch),
+        previous scores and signal snapshots are loaded once per chunk, and
+        the new rows are bulk-inserted with one commit per chunk. Results
+        match score_company; a chunk that fails is rescored company by
+        company so one bad row cannot sink its neighbours. Ids that no
+        longer exist count as failed.
+        """
+        succeeded = 0
+        failed = 0
+        for start in range(0, len(company_ids), batch_size):
+            chunk = company_ids[start:start + batch_size]
+            try:
+                scored = self._score_chunk(chunk, batch_id)
+                succeeded += scored
+                failed += len(chunk) - scored
+                continue
+            except Exception as exc:
+                logger.warning(
+                    "batch scoring of %d companies failed, retrying one by one: %s",
+                    len(chunk), exc,
+                )
+                self.db.rollback()
+
+            for company_id in chunk:
+                try:
+                    self.score_company(company_id, batch_id=batch_id)
+                    succeeded += 1
+                except Exception as exc:
+                    failed += 1
+                    logger.warning("scoring company %s failed: %s", company_id, exc)
+                    self.db.rollback()
+
+        return succeeded, failed
+
     def get_rankings(
         self,
         sector: Optional[str] = None,
@@ -227,12 +253,13 @@ class TransactionProbabilityEngine:
         grade: Optional[str] = None,
     ) -> List[Dict]:
         """Return top companies by latest probability."""
-        # Latest score per company — use a subquery for max(scored_at)
+        # Latest published score per company — use a subquery for max(scored_at)
         latest_subq = (
             self.db.query(
                 TxnProbScore.company_id,
                 func.max(TxnProbScore.scored_at).label("latest_at"),
             )
+            .filter(self._visible_scores())
             .group_by(TxnProbScore.company_id)
             .subquery()
         )
@@ -245,6 +272,7 @@ class TransactionProbabilityEngine:
                 & (TxnProbScore.scored_at == latest_subq.c.latest_at),
             )
             .join(TxnProbCompany, TxnProbCompany.id == TxnProbScore.company_id)
+            .filter(self._visible_scores())
             .filter(TxnProbScore.probability >= min_probability)
             .filter(TxnProbCompany.is_active == True)  # noqa: E712
         )
@@ -281,6 +309,7 @@ class TransactionProbabilityEngine:
         latest_score = (
             self.db.query(TxnProbScore)
             .filter_by(company_id=company_id)
+            .filter(self._visible_scores())
             .order_by(TxnProbScore.scored_at.desc())
             .first()
         )
@@ -359,29 +388,185 @@ class TransactionProbabilityEngine:
             for r in rows
         ]
 
+    # -------------------------------------------------------------------
+    # Batch scoring
+    # -------------------------------------------------------------------
+
+    def _visible_scores(self):
+        """Filter hiding scores of universe runs that are not yet published."""
+        unpublished = (
+            self.db.query(TxnProbBatch.batch_id)
+            .filter(TxnProbBatch.status != BATCH_PUBLISHED)
+        )
+        return or_(
+            TxnProbScore.batch_id.is_(None),
+            TxnProbScore.batch_id.notin_(unpublished),
+        )
+
+    def _score_chunk(self, company_ids: List[int], batch_id: str) -> int:
+        """Score one chunk with grouped reads and bulk writes; returns companies scored."""
+        companies = (
+            self.db.query(TxnProbCompany)
+            .filter(TxnProbCompany.id.in_(company_ids))
+            .order_by(TxnProbCompany.id)
+            .all()
+        )
+        signals_by_company = self._compute_signals_batch(companies)
+        previous_scores = self._latest_scores(company_ids)
+        previous_signals = self._latest_signals(company_ids)
+
+        calibration_cache: Dict[str, object] = {}
+        scored = {
+            c.id: self._compose(c, signals_by_company[c.id], calibration_cache)
+            for c in companies
+        }
+
+        scored_at = datetime.utcnow()
+        self.db.bulk_insert_mappings(
+            TxnProbSignal,
+            [
+                self._signal_snapshot(
+                    c.id, s, previous_signals.get((c.id, s.signal_type)), batch_id, scored_at
+                )
+                for c in companies
+                for s in signals_by_company[c.id]
+            ],
+        )
+        score_rows = {
+            c.id: TxnProbScore(**self._score_fields(c.id, scored[c.id], batch_id))
+            for c in companies
+        }
+        self.db.add_all(list(score_rows.values()))
+        self.db.flush()
+
+        alert_engine = AlertEngine(self.db)
+        for c in companies:
+            self._evaluate_alerts(
+                alert_engine, c, previous_scores.get(c.id), score_rows[c.id],
+                scored[c.id]["convergences"],
+            )
+
+        self.db.commit()
+        return len(companies)
+
+    def _latest_scores(self, company_ids: List[int]) -> Dict[int, TxnProbScore]:
+        """Latest score row per company (ties broken by id, as in score_company)."""
+        latest_subq = (
+            self.db.query(
+                TxnProbScore.company_id,
+                func.max(TxnProbScore.scored_at).label("latest_at"),
+            )
+            .filter(TxnProbScore.company_id.in_(company_ids))
+            .group_by(TxnProbScore.company_id)
+            .subquery()
+        )
+        rows = (
+            self.db.query(TxnProbScore)
+            .join(
+                latest_subq,
+                (TxnProbScore.company_id == latest_subq.c.company_id)
+                & (TxnProbScore.scored_at == latest_subq.c.latest_at),
+            )
+            .order_by(TxnProbScore.id.desc())
+            .all()
+        )
+        latest: Dict[int, TxnProbScore] = {}
+        for row in rows:
+            latest.setdefault(row.company_id, row)
+        return latest
+
+    def _latest_signals(
+        self, company_ids: List[int]
+    ) -> Dict[Tuple[int, str], Tuple[float, Optional[float]]]:
+        """(score, velocity) of the latest snapshot per (company, signal_type)."""
+        latest_subq = (
+            self.db.query(
+                TxnProbSignal.company_id,
+                TxnProbSignal.signal_type,
+                func.max(TxnProbSignal.scored_at).label("latest_at"),
+            )
+            .filter(TxnProbSignal.company_id.in_(company_ids))
+            .group_by(TxnProbSignal.company_id, TxnProbSignal.signal_type)
+            .subquery()
+        )
+        rows = (
+            self.db.query(
+                TxnProbSignal.company_id,
+                TxnProbSignal.signal_type,
+                TxnProbSignal.score,
+                TxnProbSignal.velocity,
+            )
+            .join(
+                latest_subq,
+                (TxnProbSignal.company_id == latest_subq.c.company_id)
+                & (TxnProbSignal.signal_type == latest_subq.c.signal_type)
+                & (TxnProbSignal.scored_at == latest_subq.c.latest_at),
+            )
+            .all()
+        )
+        return {(r.company_id, r.signal_type): (r.score, r.velocity) for r in rows}
+
     # -------------------------------------------------------------------
     # Signal computation
     # -------------------------------------------------------------------
 
     def _compute_signals(self, company: TxnProbCompany) -> List[SignalResult]:
         """Compute all 12 signals for a company."""
-        results: List[SignalResult] = []
+        return [
+            self._compute_signal(signal_type, meta, company)
+            for signal_type, meta in SIGNAL_TAXONOMY.items()
+        ]
+
+    def _compute_signal(
+        self, signal_type: str, meta: Dict, company: TxnProbCompany
+    ) -> SignalResult:
+        try:
+            source_kind = meta.get("scorer_source")
+            if source_kind == "existing_scorer":
+                return self._score_via_existing(signal_type, meta, company)
+            if source_kind == "query":
+                return self._score_via_query(signal_type, meta, company)
+            if source_kind == "new_computer":
+                return self._score_via_computer(signal_type, company)
+            return self._neutral_signal(signal_type, "unknown scorer_source")
+        except Exception as exc:
+            logger.warning("signal %s failed for company %s: %s", signal_type, company.id, exc)
+            self.db.rollback()
+            return self._neutral_signal(signal_type, f"scorer raised: {exc}")
+
+    def _compute_signals_batch(
+        self, companies: List[TxnProbCompany]
+    ) -> Dict[int, List[SignalResult]]:
+        """
+        Compute all 12 signals for a chunk of companies.
+
+        New computers and the sector_momentum query answer for the whole
+        chunk at once (compute_batch); existing scorers are still called per
+        company. Companies a batch computer returns nothing for (or all of
+        them, if it raises) go through the per-company path for that signal.
+        Signals come back in SIGNAL_TAXONOMY order, exactly as
+        _compute_signals returns them.
+        """
+        results: Dict[int, List[SignalResult]] = {c.id: [] for c in companies}
         for signal_type, meta in SIGNAL_TAXONOMY.items():
+            source_kind = meta.get("scorer_source")
+            batch: Dict[int, SignalResult] = {}
             try:
-                source_kind = meta.get("scorer_source")
-                if source_kind == "existing_scorer":
-                    result = self._score_via_existing(signal_type, meta, company)
-                elif source_kind == "query":
-                    result = self._score_via_query(signal_type, meta, company)
-                elif source_kind == "new_computer":
-                    result = self._score_via_computer(signal_type, company)
-                else:
-                    result = self._neutral_signal(signal_type, "unknown scorer_source")
+                if source_kind == "new_computer" and signal_type in NEW_COMPUTERS:
+                    batch = self._get_computer(signal_type).compute_batch(companies)
+                elif source_kind == "query" and signal_type == "sector_momentum":
+                    batch = self._score_sector_momentum_batch(companies)
             except Exception as exc:
-                logger.warning("signal %s failed for company %s: %s", signal_type, company.id, exc)
+                logger.warning(
+                    "batch signal %s failed, computing per company: %s", signal_type, exc
+                )
                 self.db.rollback()
-                result = self._neutral_signal(signal_type, f"scorer raised: {exc}")
-            results.append(result)
+                batch = {}
+            for company in companies:
+                result = batch.get(company.id)
+                if result is None:
+                    result = self._compute_signal(signal_type, meta, company)
+                results[company.id].append(result)
         return results
 
     def _score_via_existing(
@@ -469,6 +654,60 @@ class TransactionProbabilityEngine:
             logger.debug("sector_momentum query failed: %s", exc)
             return self._neutral_signal("sector_momentum", "query failed")
 
+        return self._sector_momentum_result(company, row)
+
+    def _score_sector_momentum_batch(
+        self, companies: List[TxnProbCompany]
+    ) -> Dict[int, SignalResult]:
+        """Latest pe_market_signals row per distinct sector, one query per chunk."""
+        from sqlalchemy import text as sa_text
+
+        sectors = sorted({c.sector for c in companies if c.sector})
+        rows: Dict[str, Dict] = {}
+        if sectors:
+            try:
+                fetched = (
+                    self.db.execute(
+                        sa_text(
+                            """
+                            SELECT k.sector, s.momentum_score, s.signal_type, s.deal_count
+                            FROM unnest(CAST(:sectors AS text[])) AS k(sector)
+                            CROSS JOIN LATERAL (
+                                SELECT momentum_score, signal_type, deal_count
+                                FROM pe_market_signals
+                                WHERE sector = k.sector
+                                ORDER BY scanned_at DESC
+                                LIMIT 1
+                            ) s
+                            """
+                        ),
+                        {"sectors": sectors},
+                    )
+                    .mappings()
+                    .all()
+                )
+                rows = {r["sector"]: r for r in fetched}
+            except Exception as exc:
+                # Empty result: _compute_signals_batch falls back per company
+                self.db.rollback()
+                logger.debug("sector_momentum batch query failed: %s", exc)
+                return {}
+
+        results = {}
+        for company in companies:
+            if not company.sector:
+                results[company.id] = self._neutral_signal(
+                    "sector_momentum", "company has no sector"
+                )
+            else:
+                results[company.id] = self._sector_momentum_result(
+                    company, rows.get(company.sector)
+                )
+        return results
+
+    def _sector_momentum_result(
+        self, company: TxnProbCompany, row: Optional[Dict]
+    ) -> SignalResult:
         if not row:
             return self._neutral_signal(
                 "sector_momentum", f"no pe_market_signals for {company.sector}"
@@ -491,12 +730,14 @@ class TransactionProbabilityEngine:
         self, signal_type: str, company: TxnProbCompany
     ) -> SignalResult:
         """Call one of the new signal computers."""
-        computer_cls = NEW_COMPUTERS.get(signal_type)
-        if not computer_cls:
+        if signal_type not in NEW_COMPUTERS:
             return self._neutral_signal(signal_type, "no computer registered")
+        return self._get_computer(signal_type).compute(company)
+
+    def _get_computer(self, signal_type: str):
         if signal_type not in self._computer_cache:
-            self._computer_cache[signal_type] = computer_cls(self.db)
-        return self._computer_cache[signal_type].compute(company)
+            self._computer_cache[signal_type] = NEW_COMPUTERS[signal_type](self.db)
+        return self._computer_cache[signal_type]
 
     def _get_scorer(self, class_path: str):
         if class_path in self._scorer_cache:
@@ -567,21 +808,26 @@ class TransactionProbabilityEngine:
         except OverflowError:
             return 0.0 if raw < x0 else 1.0
 
-    def _calibrate_to_probability(self, raw: float, sector: str) -> float:
+    def _calibrate_to_probability(
+        self, raw: float, sector: str, cache: Optional[Dict[str, object]] = None
+    ) -> float:
         """
         Phase 4: use a fitted Platt/isotonic calibration if available
         (preferring sector-specific, then global), falling back to the
         default sigmoid when no calibration has been fit yet.
+
+        ``cache`` (scope -> calibration row) lets batch scoring look each
+        scope up once per chunk.
         """
         try:
             # Sector-specific first
             if sector:
-                cal = get_active_calibration(self.db, scope=sector)
+                cal = self._active_calibration(sector, cache)
                 p = calibrate_with_active(raw, cal)
                 if p is not None:
                     return float(p)
             # Then global
-            cal = get_active_calibration(self.db, scope="global")
+            cal = self._active_calibration("global", cache)
             p = calibrate_with_active(raw, cal)
             if p is not None:
                 return float(p)
@@ -590,6 +836,13 @@ class TransactionProbabilityEngine:
             self.db.rollback()
         return self._calibrate_sigmoid(raw)
 
+    def _active_calibration(self, scope: str, cache: Optional[Dict[str, object]]):
+        if cache is None:
+            return get_active_calibration(self.db, scope=scope)
+        if scope not in cache:
+            cache[scope] = get_active_calibration(self.db, scope=scope)
+        return cache[scope]
+
     @staticmethod
     def _grade_from_score(raw: float) -> str:
         if raw >= 85:
@@ -618,6 +871,88 @@ class TransactionProbabilityEngine:
     # Signal chain + persistence
     # -------------------------------------------------------------------
 
+    def _compose(
+        self,
+        company: TxnProbCompany,
+        signals: List[SignalResult],
+        calibration_cache: Optional[Dict[str, object]] = None,
+    ) -> Dict:
+        """Composite, calibrated probability, grade, signal chain and convergences."""
+        weights = get_weights_for_sector(company.sector or "")
+
+        composite = self._compute_composite(signals, weights)
+        # Phase 4: prefer a fitted calibration (sector-specific, then global);
+        # fall back to the default sigmoid.
+        probability = self._calibrate_to_probability(
+            composite.raw_composite_score, company.sector or "", calibration_cache
+        )
+        grade = self._grade_from_score(composite.raw_composite_score)
+
+        signal_chain = self._build_signal_chain(signals, weights)
+        top_signals = self._top_signals(signal_chain, n=5)
+
+        confidence = (
+            sum(s.confidence for s in signals) / len(signals) if signals else 0.0
+        )
+
+        # Phase 3: detect named convergence patterns from the fresh signals
+        convergences: List[Dict] = []
+        try:
+            convergences = ConvergenceDetector(self.db).detect_from_signals(signals)
+        except Exception as exc:
+            logger.debug("convergence detection failed for %s: %s", company.id, exc)
+
+        return {
+            "composite": composite,
+            "probability": probability,
+            "grade": grade,
+            "confidence": confidence,
+            "signal_count": len(signals),
+            "signal_chain": signal_chain,
+            "top_signals": top_signals,
+            "convergences": convergences,
+        }
+
+    @staticmethod
+    def _score_fields(company_id: int, scored: Dict, batch_id: str) -> Dict:
+        """Column values of the TxnProbScore row for a composed result."""
+        composite = scored["composite"]
+        return {
+            "company_id": company_id,
+            "probability": scored["probability"],
+            "raw_composite_score": composite.raw_composite_score,
+            "grade": scored["grade"],
+            "confidence": scored["confidence"],
+            "sector_weights_version": WEIGHTS_VERSION,
+            "signal_count": scored["signal_count"],
+            "active_signal_count": composite.active_signal_count,
+            "convergence_factor": composite.convergence_factor,
+            "top_signals": scored["top_signals"],
+            "signal_chain": scored["signal_chain"],
+            "model_version": MODEL_VERSION,
+            "batch_id": batch_id,
+        }
+
+    @staticmethod
+    def _evaluate_alerts(
+        alert_engine: AlertEngine,
+        company: TxnProbCompany,
+        previous_score: Optional[TxnProbScore],
+        score_row: TxnProbScore,
+        convergences: List[Dict],
+    ) -> None:
+        """Phase 3: evaluate alerts against the previous score."""
+        try:
+            alert_engine.evaluate(
+                company_id=company.id,
+                prev_score=previous_score,
+                new_score_row=score_row,
+                new_convergences=convergences,
+                company_name=company.company_name,
+            )
+        except Exception as exc:
+            logger.debug("alert evaluation failed for %s: %s", company.id, exc)
+
     def _build_signal_chain(
         self, signals: List[SignalResult], weights: Dict[str, float]
     ) -> List[Dict]:
@@ -653,34 +988,46 @@ class TransactionProbabilityEngine:
                 .order_by(TxnProbSignal.scored_at.desc())
                 .first()
             )
-            previous_score = prev.score if prev else None
-            prev_velocity = prev.velocity if prev else None
-            velocity, acceleration = self._compute_velocity_static(
-                current=s.score,
-                previous=previous_score,
-                prev_velocity=prev_velocity,
-            )
-            snap = TxnProbSignal(
-                company_id=company_id,
-                signal_type=s.signal_type,
-                score=s.score,
-                previous_score=previous_score,
-                velocity=velocity,
-                acceleration=acceleration,
-                signal_details=s.details,
-                data_sources=s.data_sources,
-                confidence=s.confidence,
-                batch_id=batch_id,
-                # Use explicit microsecond-precision timestamp to avoid
-                # collisions on the unique (company_id, signal_type, scored_at)
-                # constraint when scoring runs back-to-back (SQLite's
-                # func.now() has second-level granularity).
-                scored_at=datetime.utcnow(),
-            )
-            self.db.add(snap)
+            previous = (prev.score, prev.velocity) if prev else None
+            # Use explicit microsecond-precision timestamp to avoid
+            # collisions on the unique (company_id, signal_type, scored_at)
+            # constraint when scoring runs back-to-back (SQLite's
+            # func.now() has second-level granularity).
+            self.db.add(TxnProbSignal(**self._signal_snapshot(
+                company_id, s, previous, batch_id, datetime.utcnow()
+            )))
         # Flush so the score row's FK is consistent
         self.db.flush()
 
+    def _signal_snapshot(
+        self,
+        company_id: int,
+        s: SignalResult,
+        previous: Optional[Tuple[float, Optional[float]]],
+        batch_id: str,
+        scored_at: datetime,
+    ) -> Dict:
+        """Column values of a TxnProbSignal row; ``previous`` is (score, velocity)."""
+        previous_score, prev_velocity = previous if previous else (None, None)
+        velocity, acceleration = self._compute_velocity_static(
+            current=s.score,
+            previous=previous_score,
+            prev_velocity=prev_velocity,
+        )
+        return {
+            "company_id": company_id,
+            "signal_type": s.signal_type,
+            "score": s.score,
+            "previous_score": previous_score,
+            "velocity": velocity,
+            "acceleration": acceleration,
+            "signal_details": s.details,
+            "data_sources": s.data_sources,
+            "confidence": s.confidence,
+            "batch_id": batch_id,
+            "scored_at": scored_at,
+        }
+
     @staticmethod
     def _new_batch_id() -> str:
         return f"txnp-{datetime.utcnow().strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
@@ -3,7 +3,10 @@ Deal Probability Engine — Signal Computers (SPEC 046, PLAN_059 Phase 2).
 
 6 new signal computers for signals not already covered by existing scorers.
 Each computer has `.compute(company: TxnProbCompany) -> SignalResult` returning
-a score (0-100), confidence (0-1), and details dict for explainability.
+a score (0-100), confidence (0-1), and details dict for explainability, and
+`.compute_batch(companies) -> {company.id: SignalResult}` which answers for a
+whole chunk with one grouped query per source table (same results as calling
+compute() per company).
 
 Graceful degradation: if source data is missing or empty, returns a
 neutral score (50) with low confidence (0.0-0.3) rather than raising.
@@ -52,12 +55,41 @@ def _clamp(v: float, lo: float = 0.0, hi: float = 100.0) -> float:
 
 def _safe_fetchall(db: Session, sql: str, params: Optional[Dict] = None) -> List:
     """Run a query with graceful handling of missing tables."""
+    rows = _try_fetchall(db, sql, params)
+    return [] if rows is None else rows
+
+
+def _try_fetchall(db: Session, sql: str, params: Optional[Dict] = None) -> Optional[List]:
+    """Like _safe_fetchall, but returns None on failure so batch paths can fall back."""
     try:
         return db.execute(text(sql), params or {}).mappings().all()
     except Exception as exc:
         db.rollback()
         logger.debug("query failed (%s): %s", exc.__class__.__name__, str(exc)[:120])
-        return []
+        return None
+
+
+# Per-company match keys for batch queries: one row per company in the chunk,
+# numbered by position (idx is 1-based) so grouped rows map back to companies.
+_COMPANY_KEYS = (
+    "unnest(CAST(:cids AS integer[]), CAST(:names AS text[])) "
+    "WITH ORDINALITY AS k(cid, name, idx)"
+)
+
+
+def _company_key_params(companies: List[TxnProbCompany]) -> Dict:
+    return {
+        "cids": [c.canonical_company_id for c in companies],
+        "names": [c.company_name for c in companies],
+    }
+
+
+def _group_by_idx(rows: List, companies: List[TxnProbCompany]) -> Dict[int, List]:
+    """Map rows carrying an ``idx`` column (from _COMPANY_KEYS) to company ids."""
+    grouped: Dict[int, List] = {c.id: [] for c in companies}
+    for r in rows:
+        grouped[companies[r["idx"] - 1].id].append(r)
+    return grouped
 
 
 # ---------------------------------------------------------------------------
@@ -76,6 +108,16 @@ class BaseSignalComputer:
     def compute(self, company: TxnProbCompany) -> SignalResult:  # pragma: no cover
         raise NotImplementedError
 
+    def compute_batch(self, companies: List[TxnProbCompany]) -> Dict[int, SignalResult]:
+        """
+        Compute the signal for a chunk of companies, keyed by company id.
+
+        The default calls compute() per company; computers override it
+        with grouped queries that return the same results, and fall back
+        to this default when a grouped query fails.
+        """
+        return {c.id: self.compute(c) for c in companies}
+
     def _neutral(self, reason: str, sources: Optional[List[str]] = None) -> SignalResult:
         return SignalResult(
             signal_type=self.signal_type,
@@ -124,6 +166,29 @@ class InsiderActivityComputer(BaseSignalComputer):
                 "lookback": self.LOOKBACK_DAYS,
             },
         )
+        return self._score(rows)
+
+    def compute_batch(self, companies: List[TxnProbCompany]) -> Dict[int, SignalResult]:
+        rows = _try_fetchall(
+            self.db,
+            f"""
+            SELECT
+                k.idx,
+                t.transaction_type,
+                COALESCE(t.total_value_usd, 0) AS value_usd,
+                COALESCE(t.shares, 0) AS shares
+            FROM {_COMPANY_KEYS}
+            JOIN insider_transactions t
+              ON (t.company_id = k.cid OR LOWER(t.company_name) = LOWER(k.name))
+            WHERE t.transaction_date >= NOW() - make_interval(days => :lookback)
+            """,
+            {**_company_key_params(companies), "lookback": self.LOOKBACK_DAYS},
+        )
+        if rows is None:
+            return super().compute_batch(companies)
+        return {cid: self._score(r) for cid, r in _group_by_idx(rows, companies).items()}
+
+    def _score(self, rows: List) -> SignalResult:
         if not rows:
             return self._neutral("no insider transactions in window", ["insider_transactions"])
 
@@ -216,6 +281,30 @@ class HiringVelocityComputer(BaseSignalComputer):
                 "lookback": self.LOOKBACK_DAYS,
             },
         )
+        return self._score(rows)
+
+    def compute_batch(self, companies: List[TxnProbCompany]) -> Dict[int, SignalResult]:
+        rows = _try_fetchall(
+            self.db,
+            f"""
+            SELECT
+                k.idx,
+                COALESCE(LOWER(j.seniority_level), '') AS seniority,
+                COALESCE(LOWER(j.title), '') AS title,
+                j.first_seen
+            FROM {_COMPANY_KEYS}
+            JOIN job_postings j
+              ON (j.company_id = k.cid OR LOWER(j.company) = LOWER(k.name))
+            WHERE (j.status = 'open' OR j.status IS NULL)
+              AND j.first_seen >= NOW() - make_interval(days => :lookback)
+            """,
+            {**_company_key_params(companies), "lookback": self.LOOKBACK_DAYS},
+        )
+        if rows is None:
+            return super().compute_batch(companies)
+        return {cid: self._score(r) for cid, r in _group_by_idx(rows, companies).items()}
+
+    def _score(self, rows: List) -> SignalResult:
         if not rows:
             return self._neutral("no open job postings in window", ["job_postings"])
 
@@ -276,8 +365,6 @@ class DealActivitySignalComputer(BaseSignalComputer):
     FORM_D_LOOKBACK_DAYS = 365
 
     def compute(self, company: TxnProbCompany) -> SignalResult:
-        form_d_count = 0
-        form_d_value = 0.0
         form_d_rows = _safe_fetchall(
             self.db,
             """
@@ -288,9 +375,6 @@ class DealActivitySignalComputer(BaseSignalComputer):
             """,
             {"name": company.company_name, "lookback": self.FORM_D_LOOKBACK_DAYS},
         )
-        if form_d_rows:
-            form_d_count = len(form_d_rows)
-            form_d_value = sum(float(r.get("amount") or 0) for r in form_d_rows)
 
         # Sector deal flow (last 90 days of pe_deals)
         sector_deal_count = 0
@@ -309,6 +393,59 @@ class DealActivitySignalComputer(BaseSignalComputer):
             if sector_rows:
                 sector_deal_count = int(sector_rows[0].get("c") or 0)
 
+        return self._score(company, form_d_rows, sector_deal_count)
+
+    def compute_batch(self, companies: List[TxnProbCompany]) -> Dict[int, SignalResult]:
+        form_d_rows = _try_fetchall(
+            self.db,
+            f"""
+            SELECT k.idx, f.filing_date,
+                   COALESCE(CAST(f.total_amount_sold AS FLOAT), 0) AS amount
+            FROM {_COMPANY_KEYS}
+            JOIN form_d_filings f ON LOWER(f.issuer_name) = LOWER(k.name)
+            WHERE f.filing_date >= NOW() - make_interval(days => :lookback)
+            """,
+            {**_company_key_params(companies), "lookback": self.FORM_D_LOOKBACK_DAYS},
+        )
+        if form_d_rows is None:
+            return super().compute_batch(companies)
+
+        sector_counts: Dict[str, int] = {}
+        sectors = sorted({c.sector for c in companies if c.sector})
+        if sectors:
+            sector_rows = _try_fetchall(
+                self.db,
+                """
+                SELECT p.sector, COUNT(*) AS c
+                FROM pe_deals d
+                JOIN pe_portfolio_companies p ON d.company_id = p.id
+                WHERE p.sector = ANY(CAST(:sectors AS text[]))
+                  AND d.announced_date >= NOW() - make_interval(days => 90)
+                GROUP BY p.sector
+                """,
+                {"sectors": sectors},
+            )
+            if sector_rows is None:
+                return super().compute_batch(companies)
+            sector_counts = {r["sector"]: int(r.get("c") or 0) for r in sector_rows}
+
+        grouped = _group_by_idx(form_d_rows, companies)
+        return {
+            c.id: self._score(
+                c, grouped[c.id], sector_counts.get(c.sector, 0) if c.sector else 0
+            )
+            for c in companies
+        }
+
+    def _score(
+        self, company: TxnProbCompany, form_d_rows: List, sector_deal_count: int
+    ) -> SignalResult:
+        form_d_count = 0
+        form_d_value = 0.0
+        if form_d_rows:
+            form_d_count = len(form_d_rows)
+            form_d_value = sum(float(r.get("amount") or 0) for r in form_d_rows)
+
         if form_d_count == 0 and sector_deal_count == 0:
             return self._neutral(
                 "no form_d filings or sector deals",
@@ -373,6 +510,51 @@ class FounderRiskComputer(BaseSignalComputer):
     CURRENT_YEAR = datetime.utcnow().year
 
     def compute(self, company: TxnProbCompany) -> SignalResult:
+        departure_rows = []
+        if company.canonical_company_id:
+            departure_rows = _safe_fetchall(
+                self.db,
+                """
+                SELECT change_type, old_title, COALESCE(significance_score, 5) AS sig
+                FROM leadership_changes
+                WHERE company_id = :cid
+                  AND change_type IN ('departure', 'retirement')
+                  AND effective_date >= NOW() - make_interval(days => 730)
+                  AND (is_c_suite = true OR LOWER(old_title) LIKE '%founder%' OR LOWER(old_title) LIKE '%ceo%')
+                """,
+                {"cid": company.canonical_company_id},
+            )
+        return self._score(company, departure_rows)
+
+    def compute_batch(self, companies: List[TxnProbCompany]) -> Dict[int, SignalResult]:
+        cids = sorted({c.canonical_company_id for c in companies if c.canonical_company_id})
+        by_cid: Dict[int, List] = {}
+        if cids:
+            rows = _try_fetchall(
+                self.db,
+                """
+                SELECT company_id, change_type, old_title,
+                       COALESCE(significance_score, 5) AS sig
+                FROM leadership_changes
+                WHERE company_id = ANY(CAST(:cids AS integer[]))
+                  AND change_type IN ('departure', 'retirement')
+                  AND effective_date >= NOW() - make_interval(days => 730)
+                  AND (is_c_suite = true OR LOWER(old_title) LIKE '%founder%' OR LOWER(old_title) LIKE '%ceo%')
+                """,
+                {"cids": cids},
+            )
+            if rows is None:
+                return super().compute_batch(companies)
+            for r in rows:
+                by_cid.setdefault(r["company_id"], []).append(r)
+        return {
+            c.id: self._score(
+                c, by_cid.get(c.canonical_company_id, []) if c.canonical_company_id else []
+            )
+            for c in companies
+        }
+
+    def _score(self, company: TxnProbCompany, departure_rows: List) -> SignalResult:
         sources = []
         risk_components = []
 
@@ -393,27 +575,14 @@ class FounderRiskComputer(BaseSignalComputer):
             sources.append("company.founded_year")
 
         # Component 2: recent co-founder / CEO departures
-        if company.canonical_company_id:
-            departure_rows = _safe_fetchall(
-                self.db,
-                """
-                SELECT change_type, old_title, COALESCE(significance_score, 5) AS sig
-                FROM leadership_changes
-                WHERE company_id = :cid
-                  AND change_type IN ('departure', 'retirement')
-                  AND effective_date >= NOW() - make_interval(days => 730)
-                  AND (is_c_suite = true OR LOWER(old_title) LIKE '%founder%' OR LOWER(old_title) LIKE '%ceo%')
-                """,
-                {"cid": company.canonical_company_id},
-            )
-            if departure_rows:
-                # Significance-weighted: 1 CEO departure = 80, 2+ = 90
-                max_sig = max(int(r.get("sig") or 5) for r in departure_rows)
-                dep_component = 50 + min(40, max_sig * 4)
-                if len(departure_rows) >= 2:
-                    dep_component = min(100, dep_component + 10)
-                risk_components.append(dep_component)
-                sources.append("leadership_changes")
+        if departure_rows:
+            # Significance-weighted: 1 CEO departure = 80, 2+ = 90
+            max_sig = max(int(r.get("sig") or 5) for r in departure_rows)
+            dep_component = 50 + min(40, max_sig * 4)
+            if len(departure_rows) >= 2:
+                dep_component = min(100, dep_component + 10)
+            risk_components.append(dep_component)
+            sources.append("leadership_changes")
 
         if not risk_components:
             return self._neutral(
@@ -472,10 +641,37 @@ class InnovationVelocityComputer(BaseSignalComputer):
             """,
             {"pat": f"%{company.company_name}%"},
         )
-        if not rows:
+        return self._score(rows[0] if rows else None)
+
+    def compute_batch(self, companies: List[TxnProbCompany]) -> Dict[int, SignalResult]:
+        # Top assignee per company pattern via LATERAL: one round trip per chunk
+        rows = _try_fetchall(
+            self.db,
+            """
+            SELECT k.idx, a.total_patents, a.assignee_last_seen_date
+            FROM unnest(CAST(:pats AS text[])) WITH ORDINALITY AS k(pat, idx)
+            CROSS JOIN LATERAL (
+                SELECT
+                    COALESCE(assignee_total_num_patents, 0) AS total_patents,
+                    assignee_last_seen_date
+                FROM uspto_assignees
+                WHERE LOWER(assignee_organization) ILIKE LOWER(k.pat)
+                   OR LOWER(assignee_name) ILIKE LOWER(k.pat)
+                ORDER BY assignee_total_num_patents DESC
+                LIMIT 1
+            ) a
+            """,
+            {"pats": [f"%{c.company_name}%" for c in companies]},
+        )
+        if rows is None:
+            return super().compute_batch(companies)
+        grouped = _group_by_idx(rows, companies)
+        return {cid: self._score(r[0] if r else None) for cid, r in grouped.items()}
+
+    def _score(self, row) -> SignalResult:
+        if not row:
             return self._neutral("no USPTO assignee match", ["uspto_assignees"])
 
-        row = rows[0]
         total_patents = int(row.get("total_patents") or 0)
         last_seen = row.get("assignee_last_seen_date")
 
@@ -541,9 +737,8 @@ class MacroTailwindComputer(BaseSignalComputer):
     signal_type = "macro_tailwind"
 
     def compute(self, company: TxnProbCompany) -> SignalResult:
-        region_score = None
-        sector_score = None
-        sources = []
+        region_rows: List = []
+        sector_rows: List = []
 
         # HQ state → convergence region score
         if company.hq_state:
@@ -558,9 +753,6 @@ class MacroTailwindComputer(BaseSignalComputer):
                 """,
                 {"state": company.hq_state},
             )
-            if region_rows:
-                region_score = float(region_rows[0].get("convergence_score") or 0)
-                sources.append("convergence_regions")
 
         # Sector momentum
         if company.sector:
@@ -575,9 +767,76 @@ class MacroTailwindComputer(BaseSignalComputer):
                 """,
                 {"sector": company.sector},
             )
-            if sector_rows:
-                sector_score = float(sector_rows[0].get("momentum_score") or 0)
-                sources.append("pe_market_signals")
+
+        return self._score(
+            company,
+            region_rows[0] if region_rows else None,
+            sector_rows[0] if sector_rows else None,
+        )
+
+    def compute_batch(self, companies: List[TxnProbCompany]) -> Dict[int, SignalResult]:
+        # Latest row per distinct state / sector, one LATERAL query each
+        states = sorted({c.hq_state for c in companies if c.hq_state})
+        sectors = sorted({c.sector for c in companies if c.sector})
+        regions: Dict[str, Dict] = {}
+        momentum: Dict[str, Dict] = {}
+        if states:
+            rows = _try_fetchall(
+                self.db,
+                """
+                SELECT k.state, r.convergence_score
+                FROM unnest(CAST(:states AS text[])) AS k(state)
+                CROSS JOIN LATERAL (
+                    SELECT convergence_score
+                    FROM convergence_regions
+                    WHERE k.state = ANY(SELECT jsonb_array_elements_text(states::jsonb))
+                    ORDER BY scored_at DESC
+                    LIMIT 1
+                ) r
+                """,
+                {"states": states},
+            )
+            if rows is None:
+                return super().compute_batch(companies)
+            regions = {r["state"]: r for r in rows}
+        if sectors:
+            rows = _try_fetchall(
+                self.db,
+                """
+                SELECT k.sector, m.momentum_score
+                FROM unnest(CAST(:sectors AS text[])) AS k(sector)
+                CROSS JOIN LATERAL (
+                    SELECT momentum_score
+                    FROM pe_market_signals
+                    WHERE sector = k.sector
+                    ORDER BY scanned_at DESC
+                    LIMIT 1
+                ) m
+                """,
+                {"sectors": sectors},
+            )
+            if rows is None:
+                return super().compute_batch(companies)
+            momentum = {r["sector"]: r for r in rows}
+        return {
+            c.id: self._score(
+                c,
+                regions.get(c.hq_state) if c.hq_state else None,
+                momentum.get(c.sector) if c.sector else None,
+            )
+            for c in companies
+        }
+
+    def _score(self, company: TxnProbCompany, region_row, sector_row) -> SignalResult:
+        region_score = None
+        sector_score = None
+        sources = []
+        if region_row:
+            region_score = float(region_row.get("convergence_score") or 0)
+            sources.append("convergence_regions")
+        if sector_row:
+            sector_score = float(sector_row.get("momentum_score") or 0)
+            sources.append("pe_market_signals")
 
         components = [c for c in (region_score, sector_score) if c is not None]
         if not components:
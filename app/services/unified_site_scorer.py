@@ -5,6 +5,14 @@ Point-based (lat/lng) site scoring across 5 factors using Haversine
 radius queries against the existing 63-table site intel infrastructure.
 Supports configurable use-case weights (datacenter, manufacturing, warehouse, general).
 
+score_location issues the radius and state queries for one point.
+score_locations / compare_locations batch many points: points are grouped
+into SCORE_TILE_DEGREES grid tiles, each point layer is fetched once per
+tile for the tile's union bounding box and indexed by latitude, state-level
+lookups run once per state, and every point gets the same result the
+per-point path would produce. Tiling keeps each fetch bounded when points
+are spread across the country.
+
 Factors:
   Power Access (nearby MW, substations, electricity price)
   Climate Risk (NRI risk score, flood zones, seismic hazard)
@@ -16,7 +24,9 @@ from __future__ import annotations
 import logging
 import math
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 
@@ -64,6 +74,9 @@ USE_CASE_WEIGHTS = {
 GRADE_THRESHOLDS = [(80, "A"), (65, "B"), (50, "C"), (35, "D"), (0, "F")]
 SIGNAL_MAP = [(70, "green"), (50, "yellow"), (0, "red")]
 
+# Grid tile size (degrees) for batch scoring; one layer fetch per tile
+SCORE_TILE_DEGREES = 2.0
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -107,6 +120,7 @@ def _reverse_geocode_state(db: Session, lat: float, lng: float) -> Optional[str]
         SELECT state FROM power_plant
         WHERE latitude BETWEEN :lat_min AND :lat_max
           AND longitude BETWEEN :lng_min AND :lng_max
+        ORDER BY id
         LIMIT 1
     """, _bbox_params(lat, lng, 100))
     if plant_rows:
@@ -114,6 +128,66 @@ def _reverse_geocode_state(db: Session, lat: float, lng: float) -> Optional[str]
     return None
 
 
+def _union_bbox(points: Sequence[Tuple[float, float]], radius_miles: float) -> dict:
+    """Bounding box covering the radius bbox of every point."""
+    boxes = [_bbox_params(lat, lng, radius_miles) for lat, lng in points]
+    return {
+        "lat_min": min(b["lat_min"] for b in boxes),
+        "lat_max": max(b["lat_max"] for b in boxes),
+        "lng_min": min(b["lng_min"] for b in boxes),
+        "lng_max": max(b["lng_max"] for b in boxes),
+    }
+
+
+def _tile_points(
+    points: Sequence[Tuple[float, float]], tile_degrees: float
+) -> List[List[int]]:
+    """Group point indices by grid tile (in first-seen tile order)."""
+    tiles: Dict[Tuple[int, int], List[int]] = {}
+    for i, (lat, lng) in enumerate(points):
+        key = (math.floor(lat / tile_degrees), math.floor(lng / tile_degrees))
+        tiles.setdefault(key, []).append(i)
+    return list(tiles.values())
+
+
+class _PointLayer:
+    """
+    Rows of one lat/lng table, sorted by latitude for bbox lookups.
+
+    select() returns the same rows as ``latitude BETWEEN :lat_min AND
+    :lat_max AND longitude BETWEEN :lng_min AND :lng_max``: a binary search
+    narrows the latitude range, then longitude is masked. Row indices come
+    back in fetch order so "first row" semantics (LIMIT 1) are preserved.
+    """
+
+    def __init__(self, rows: Sequence[tuple]):
+        self.rows = list(rows)
+        lat = np.array([np.nan if r[0] is None else float(r[0]) for r in self.rows], dtype=np.float64)
+        lng = np.array([np.nan if r[1] is None else float(r[1]) for r in self.rows], dtype=np.float64)
+        self._order = np.argsort(lat, kind="stable")  # NaN sorts last
+        self._lat = lat[self._order]
+        self._lng = lng[self._order]
+
+    @classmethod
+    def fetch(
+        cls, db: Session, table: str, columns: str, bbox: dict, order_by: str = ""
+    ) -> "_PointLayer":
+        rows = _safe_query(db, f"""
+            SELECT latitude, longitude, {columns} FROM {table}
+            WHERE latitude BETWEEN :lat_min AND :lat_max
+              AND longitude BETWEEN :lng_min AND :lng_max
+            {f"ORDER BY {order_by}" if order_by else ""}
+        """, bbox)
+        return cls(rows)
+
+    def select(self, bbox: dict) -> List[tuple]:
+        lo = np.searchsorted(self._lat, bbox["lat_min"], side="left")
+        hi = np.searchsorted(self._lat, bbox["lat_max"], side="right")
+        lng = self._lng[lo:hi]
+        hits = self._order[lo:hi][(lng >= bbox["lng_min"]) & (lng <= bbox["lng_max"])]
+        return [self.rows[i] for i in np.sort(hits)]
+
+
 def _find_county_fips(db: Session, lat: float, lng: float) -> Optional[str]:
     """Find county FIPS by matching nearest NRI county (crude centroid match)."""
     # Use NRI table — find closest county (already has county_fips)
@@ -160,6 +234,13 @@ def _score_power(db: Session, lat: float, lng: float, radius: float) -> tuple[in
 
     # State electricity price (industrial)
     state = _reverse_geocode_state(db, lat, lng)
+    price = _state_electricity_price(db, state)
+
+    return _power_factor(total_mw, plant_count, sub_count, price, state, radius)
+
+
+def _state_electricity_price(db: Session, state: Optional[str]) -> Optional[float]:
+    """Latest industrial electricity price for a state."""
     price = None
     if state:
         price_rows = _safe_query(db, """
@@ -171,7 +252,13 @@ def _score_power(db: Session, lat: float, lng: float, radius: float) -> tuple[in
         """, {"state": state})
         if price_rows and price_rows[0][0]:
             price = float(price_rows[0][0])
+    return price
+
 
+def _power_factor(
+    total_mw: float, plant_count: int, sub_count: int, price: Optional[float],
+    state: Optional[str], radius: float,
+) -> tuple[int, str, str, dict]:
     # Score
     mw_score = min(total_mw / 50, 100)   # 5000 MW = 100
     sub_score = min(sub_count * 5, 100)   # 20 subs = 100
@@ -206,6 +293,23 @@ def _score_power(db: Session, lat: float, lng: float, radius: float) -> tuple[in
 
 def _score_climate(db: Session, lat: float, lng: float, state: Optional[str]) -> tuple[int, str, str, dict]:
     """Climate Risk: NRI score + flood zones + seismic (inverted — low risk = high score)."""
+    nri_score, nri_rating, flood_high_risk = _state_climate(db, state)
+
+    # Seismic: nearest hazard
+    seismic_rows = _safe_query(db, """
+        SELECT hazard_level FROM seismic_hazard
+        WHERE latitude BETWEEN :lat_min AND :lat_max
+          AND longitude BETWEEN :lng_min AND :lng_max
+        ORDER BY hazard_level ASC
+        LIMIT 1
+    """, _bbox_params(lat, lng, 200))
+    seismic_level = seismic_rows[0][0] if seismic_rows else None
+
+    return _climate_factor(nri_score, nri_rating, flood_high_risk, seismic_level)
+
+
+def _state_climate(db: Session, state: Optional[str]) -> tuple:
+    """State NRI risk (mean score, modal rating) and high-risk flood zone count."""
     nri_score = None
     nri_rating = None
     flood_high_risk = 0
@@ -229,16 +333,12 @@ def _score_climate(db: Session, lat: float, lng: float, state: Optional[str]) ->
         """, {"state": state})
         flood_high_risk = int(flood_rows[0][0]) if flood_rows else 0
 
-    # Seismic: nearest hazard
-    seismic_rows = _safe_query(db, """
-        SELECT hazard_level FROM seismic_hazard
-        WHERE latitude BETWEEN :lat_min AND :lat_max
-          AND longitude BETWEEN :lng_min AND :lng_max
-        ORDER BY hazard_level ASC
-        LIMIT 1
-    """, _bbox_params(lat, lng, 200))
-    seismic_level = seismic_rows[0][0] if seismic_rows else None
+    return nri_score, nri_rating, flood_high_risk
+
 
+def _climate_factor(
+    nri_score: Optional[float], nri_rating, flood_high_risk: int, seismic_level,
+) -> tuple[int, str, str, dict]:
     details = {
         "nri_risk_score": nri_score,
         "nri_risk_rating": nri_rating,
@@ -422,6 +522,15 @@ def _score_connectivity(db: Session, lat: float, lng: float, radius: float) -> t
     dc_count = int(dc_rows[0][0]) if dc_rows else 0
     dc_power = float(dc_rows[0][1] or 0) if dc_rows else 0
 
+    return _connectivity_factor(
+        providers, max_speed, has_fiber, ix_count, ix_networks, dc_count, dc_power, radius
+    )
+
+
+def _connectivity_factor(
+    providers: int, max_speed: float, has_fiber: bool, ix_count: int, ix_networks: int,
+    dc_count: int, dc_power: float, radius: float,
+) -> tuple[int, str, str, dict]:
     details = {
         "broadband_providers": providers,
         "max_download_mbps": max_speed,
@@ -460,14 +569,6 @@ def _score_regulatory(db: Session, lat: float, lng: float, radius: float, state:
     """Regulatory/Incentives: OZ, FTZ, incentive programs, utility rates."""
     params = _bbox_params(lat, lng, radius)
 
-    # Opportunity zones nearby (state-level since OZ lacks lat/lng)
-    oz_count = 0
-    if state:
-        oz_rows = _safe_query(db, """
-            SELECT COUNT(*) FROM opportunity_zone WHERE state = :state
-        """, {"state": state})
-        oz_count = int(oz_rows[0][0]) if oz_rows else 0
-
     # Foreign trade zones nearby
     ftz_rows = _safe_query(db, """
         SELECT COUNT(*) FROM foreign_trade_zone
@@ -476,6 +577,20 @@ def _score_regulatory(db: Session, lat: float, lng: float, radius: float, state:
     """, params)
     ftz_count = int(ftz_rows[0][0]) if ftz_rows else 0
 
+    oz_count, incentive_count, ind_rate = _state_regulatory(db, state)
+    return _regulatory_factor(oz_count, ftz_count, incentive_count, ind_rate, state)
+
+
+def _state_regulatory(db: Session, state: Optional[str]) -> tuple:
+    """State opportunity zone count, incentive program count and industrial rate."""
+    # Opportunity zones nearby (state-level since OZ lacks lat/lng)
+    oz_count = 0
+    if state:
+        oz_rows = _safe_query(db, """
+            SELECT COUNT(*) FROM opportunity_zone WHERE state = :state
+        """, {"state": state})
+        oz_count = int(oz_rows[0][0]) if oz_rows else 0
+
     # Incentive programs (state-level)
     incentive_count = 0
     if state:
@@ -496,6 +611,13 @@ def _score_regulatory(db: Session, lat: float, lng: float, radius: float, state:
         if rate_rows and rate_rows[0][0]:
             ind_rate = float(rate_rows[0][0])
 
+    return oz_count, incentive_count, ind_rate
+
+
+def _regulatory_factor(
+    oz_count: int, ftz_count: int, incentive_count: int, ind_rate: Optional[float],
+    state: Optional[str],
+) -> tuple[int, str, str, dict]:
     details = {
         "opportunity_zones_in_state": oz_count,
         "ftz_nearby": ftz_count,
@@ -552,42 +674,189 @@ class UnifiedSiteScorer:
     ) -> UnifiedSiteScore:
         """Score a location across 5 factors."""
 
-        weights = USE_CASE_WEIGHTS.get(use_case, USE_CASE_WEIGHTS["general"])
         state = _reverse_geocode_state(self.db, lat, lng)
+        return self._assemble(
+            lat, lng, use_case, state,
+            power=_score_power(self.db, lat, lng, radius_miles),
+            climate=_score_climate(self.db, lat, lng, state),
+            workforce=_score_workforce(self.db, state),
+            connectivity=_score_connectivity(self.db, lat, lng, radius_miles),
+            regulatory=_score_regulatory(self.db, lat, lng, radius_miles, state),
+        )
+
+    def score_locations(
+        self,
+        locations: List[Dict],
+        radius_miles: float = 50,
+        use_case: str = "general",
+    ) -> List[UnifiedSiteScore]:
+        """
+        Score many locations in one pass (same results as score_location).
+
+        Points are grouped into SCORE_TILE_DEGREES grid tiles. Per tile, each
+        point layer (power plants, substations, seismic hazard, broadband,
+        IX, data centers, FTZ) is queried once for the bounding box of that
+        tile's points and filtered per point in memory, so the rows held at
+        once stay bounded however far apart the points are. State-level
+        factors are queried once per distinct state across all tiles.
+
+        Returns:
+            Scores in input order
+        """
+        if not locations:
+            return []
+
+        points = [(loc["lat"], loc["lng"]) for loc in locations]
+        results: List[Optional[UnifiedSiteScore]] = [None] * len(points)
+        by_state: Dict[Optional[str], tuple] = {}
+        for tile in _tile_points(points, SCORE_TILE_DEGREES):
+            scores = self._score_tile(
+                [points[i] for i in tile], radius_miles, use_case, by_state
+            )
+            for i, score in zip(tile, scores):
+                results[i] = score
+        return results
+
+    def _score_tile(
+        self,
+        points: List[Tuple[float, float]],
+        radius_miles: float,
+        use_case: str,
+        by_state: Dict[Optional[str], tuple],
+    ) -> List[UnifiedSiteScore]:
+        """Score nearby points from one fetch of each layer (see score_locations)."""
+        db = self.db
+        plant_radius = max(radius_miles, 100)  # power radius + reverse geocode
+
+        plants = _PointLayer.fetch(
+            db, "power_plant", "nameplate_capacity_mw, state",
+            _union_bbox(points, plant_radius), order_by="id",
+        )
+        seismic = _PointLayer.fetch(db, "seismic_hazard", "hazard_level", _union_bbox(points, 200))
+        area = _union_bbox(points, radius_miles)
+        substations = _PointLayer.fetch(db, "substation", "1", area)
+        broadband = _PointLayer.fetch(
+            db, "broadband_availability", "provider_name, max_download_mbps, technology", area
+        )
+        exchanges = _PointLayer.fetch(db, "internet_exchange", "network_count", area)
+        data_centers = _PointLayer.fetch(db, "data_center_facility", "power_mw", area)
+        trade_zones = _PointLayer.fetch(db, "foreign_trade_zone", "1", area)
+
+        # First plant by id within 100mi, as _reverse_geocode_state
+        states = []
+        for lat, lng in points:
+            nearby = plants.select(_bbox_params(lat, lng, 100))
+            states.append(nearby[0][3] if nearby else None)
+
+        for state in set(states):
+            if state not in by_state:
+                by_state[state] = (
+                    _state_electricity_price(db, state),
+                    _state_climate(db, state),
+                    _score_workforce(db, state),
+                    _state_regulatory(db, state),
+                )
+
+        results = []
+        for (lat, lng), state in zip(points, states):
+            price, (nri_score, nri_rating, flood_high_risk), workforce, regulatory = by_state[state]
+            params = _bbox_params(lat, lng, radius_miles)
+
+            plant_rows = plants.select(params)
+            total_mw = sum((r[2] for r in plant_rows if r[2] is not None), 0)
+            power = _power_factor(
+                float(total_mw), len(plant_rows), len(substations.select(params)),
+                price, state, radius_miles,
+            )
+
+            # ORDER BY hazard_level ASC LIMIT 1 (NULLs sort last)
+            levels = [r[2] for r in seismic.select(_bbox_params(lat, lng, 200))]
+            non_null = [level for level in levels if level is not None]
+            seismic_level = min(non_null) if non_null else None
+            climate = _climate_factor(nri_score, nri_rating, flood_high_risk, seismic_level)
+
+            bb_rows = broadband.select(params)
+            speeds = [r[3] for r in bb_rows if r[3] is not None]
+            ix_rows = exchanges.select(params)
+            networks = [r[2] for r in ix_rows if r[2] is not None]
+            dc_rows = data_centers.select(params)
+            connectivity = _connectivity_factor(
+                providers=len({r[2] for r in bb_rows if r[2] is not None}),
+                max_speed=float(max(speeds)) if speeds and max(speeds) else 0,
+                has_fiber=any(
+                    r[4] == "Fiber" or (r[3] is not None and r[3] >= 1000) for r in bb_rows
+                ),
+                ix_count=len(ix_rows),
+                ix_networks=int(max(networks)) if networks else 0,
+                dc_count=len(dc_rows),
+                dc_power=float(sum((r[2] or 0 for r in dc_rows), 0)),
+                radius=radius_miles,
+            )
+
+            oz_count, incentive_count, ind_rate = regulatory
+            regulatory_factor = _regulatory_factor(
+                oz_count, len(trade_zones.select(params)), incentive_count, ind_rate, state
+            )
+
+            w_score, w_reading, w_impact, w_details = workforce
+            results.append(self._assemble(
+                lat, lng, use_case, state,
+                power=power,
+                climate=climate,
+                workforce=(w_score, w_reading, w_impact, dict(w_details)),
+                connectivity=connectivity,
+                regulatory=regulatory_factor,
+            ))
+        return results
+
+    def _assemble(
+        self,
+        lat: float,
+        lng: float,
+        use_case: str,
+        state: Optional[str],
+        power: tuple,
+        climate: tuple,
+        workforce: tuple,
+        connectivity: tuple,
+        regulatory: tuple,
+    ) -> UnifiedSiteScore:
+        """Combine the five factor results into a weighted composite score."""
+        weights = USE_CASE_WEIGHTS.get(use_case, USE_CASE_WEIGHTS["general"])
         factors = []
         all_metrics = {"state_detected": state}
         factors_with_data = 0
 
         # --- Power Access ---
-        p_score, p_reading, p_impact, p_details = _score_power(self.db, lat, lng, radius_miles)
+        p_score, p_reading, p_impact, p_details = power
         factors.append(SiteFactor("Power access", p_score, weights["power"], p_reading, p_impact, p_details))
         all_metrics.update({f"power_{k}": v for k, v in p_details.items()})
         if p_details.get("plant_count", 0) > 0 or p_details.get("substation_count", 0) > 0:
             factors_with_data += 1
 
         # --- Climate Risk ---
-        c_score, c_reading, c_impact, c_details = _score_climate(self.db, lat, lng, state)
+        c_score, c_reading, c_impact, c_details = climate
         factors.append(SiteFactor("Climate risk", c_score, weights["climate"], c_reading, c_impact, c_details))
         all_metrics.update({f"climate_{k}": v for k, v in c_details.items()})
         if c_details.get("nri_risk_score") is not None:
             factors_with_data += 1
 
         # --- Workforce ---
-        w_score, w_reading, w_impact, w_details = _score_workforce(self.db, state)
+        w_score, w_reading, w_impact, w_details = workforce
         factors.append(SiteFactor("Workforce", w_score, weights["workforce"], w_reading, w_impact, w_details))
         all_metrics.update({f"workforce_{k}": v for k, v in w_details.items()})
         if w_details.get("unemployment_rate") is not None:
             factors_with_data += 1
 
         # --- Connectivity ---
-        n_score, n_reading, n_impact, n_details = _score_connectivity(self.db, lat, lng, radius_miles)
+        n_score, n_reading, n_impact, n_details = connectivity
         factors.append(SiteFactor("Connectivity", n_score, weights["connectivity"], n_reading, n_impact, n_details))
         all_metrics.update({f"connectivity_{k}": v for k, v in n_details.items()})
         if n_details.get("broadband_providers", 0) > 0 or n_details.get("dc_count", 0) > 0:
             factors_with_data += 1
 
         # --- Regulatory / Incentives ---
-        r_score, r_reading, r_impact, r_details = _score_regulatory(self.db, lat, lng, radius_miles, state)
+        r_score, r_reading, r_impact, r_details = regulatory
         factors.append(SiteFactor("Regulatory & incentives", r_score, weights["regulatory"], r_reading, r_impact, r_details))
         all_metrics.update({f"regulatory_{k}": v for k, v in r_details.items()})
         if r_details.get("ftz_nearby", 0) > 0 or r_details.get("incentive_programs", 0) > 0:
@@ -616,11 +885,5 @@ class UnifiedSiteScorer:
         use_case: str = "general",
     ) -> List[UnifiedSiteScore]:
         """Score and rank multiple locations."""
-        results = []
-        for loc in locations:
-            result = self.score_location(
-                lat=loc["lat"], lng=loc["lng"],
-                radius_miles=radius_miles, use_case=use_case,
-            )
-            results.append(result)
+        results = self.score_locations(locations, radius_miles=radius_miles, use_case=use_case)
         return sorted(results, key=lambda r: r.score, reverse=True)
@@ -10,7 +10,6 @@ from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
 from app.core.ingest_base import BaseSourceIngestor, create_ingestion_job
-from app.core.batch_operations import batch_insert
 from app.sources.fred.client import FREDClient
 from app.sources.fred import metadata
 
@@ -113,52 +112,51 @@ class FREDIngestor(BaseSourceIngestor):
                 },
             )
 
-            # 4. Fetch data from FRED API
+            # 4-5. Stream fetch -> parse -> insert, one series per page
             logger.info(f"Fetching {len(series_ids)} series from FRED API")
-            all_parsed_data = {}
-
-            for i, series_id in enumerate(series_ids, 1):
-                logger.info(f"Fetching series {i}/{len(series_ids)}: {series_id}")
 
+            async def _fetch_series_pages():
+                for i, series_id in enumerate(series_ids, 1):
+                    logger.info(f"Fetching series {i}/{len(series_ids)}: {series_id}")
+                    try:
+                        api_response = await client.get_series_observations(
+                            series_id=series_id,
+                            observation_start=observation_start,
+                            observation_end=observation_end,
+                        )
+                    except Exception as e:
+                        logger.error(f"Failed to fetch series {series_id}: {e}")
+                        continue
+                    yield series_id, api_response
+
+            def _parse_series_page(page):
+                series_id, api_response = page
                 try:
-                    api_response = await client.get_series_observations(
-                        series_id=series_id,
-                        observation_start=observation_start,
-                        observation_end=observation_end,
-                    )
                     parsed = metadata.parse_observations(api_response, series_id)
-                    all_parsed_data[series_id] = parsed
-                    logger.info(f"Parsed {len(parsed)} observations for {series_id}")
-
                 except Exception as e:
-                    logger.error(f"Failed to fetch series {series_id}: {e}")
-                    all_parsed_data[series_id] = []
-
-            # 5. Insert data
-            rows = metadata.build_insert_values(all_parsed_data)
-
-            if not rows:
+                    logger.error(f"Failed to parse series {series_id}: {e}")
+                    return []
+                logger.info(f"Parsed {len(parsed)} observations for {series_id}")
+                return parsed
+
+            result = await self.stream_insert_rows(
+                pages=_fetch_series_pages(),
+                parse_func=_parse_series_page,
+                table_name=table_name,
+                columns=[
+                    "series_id",
+                    "date",
+                    "value",
+                    "realtime_start",
+                    "realtime_end",
+                ],
+                conflict_columns=["series_id", "date"],
+                update_columns=["value", "realtime_start", "realtime_end"],
+                batch_size=1000,
+            )
+            rows_inserted = result.rows_inserted
+            if not rows_inserted:
                 logger.warning("No data to insert")
-                rows_inserted = 0
-            else:
-                logger.info(f"Inserting {len(rows)} rows into {table_name}")
-
-                result = batch_insert(
-                    db=self.db,
-                    table_name=table_name,
-                    rows=rows,
-                    columns=[
-                        "series_id",
-                        "date",
-                        "value",
-                        "realtime_start",
-                        "realtime_end",
-                    ],
-                    conflict_columns=["series_id", "date"],
-                    update_columns=["value", "realtime_start", "realtime_end"],
-                    batch_size=1000,
-                )
-                rows_inserted = result.rows_inserted
 
             # 6. Complete job (fail if no rows inserted)
             self.complete_job(job_id, rows_inserted, require_rows=True)
@@ -4,14 +4,24 @@ Job Posting Intelligence — collection orchestrator.
 Coordinates ATS detection, job fetching, normalization, and storage.
 """
 
+import asyncio
 import json
 import logging
+import os
 from dataclasses import dataclass, field
 from datetime import datetime, date
-from typing import Optional
+from typing import Callable, Optional
+from urllib.parse import urlparse
 
 from sqlalchemy import text
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.rate_limiter import (
+    DEFAULT_RATE_LIMITS,
+    RateLimiterService,
+    RateLimitExceeded,
+    get_rate_limiter,
+)
 
 from app.sources.job_postings.metadata import (
     detect_seniority,
@@ -31,6 +41,97 @@ from app.sources.job_postings.ats.smartrecruiters import SmartRecruitersClient
 
 logger = logging.getLogger(__name__)
 
+# Company crawls in flight at once across all ATS hosts in collect_all
+CRAWL_CONCURRENCY = int(os.getenv("JOB_POSTING_CRAWL_CONCURRENCY", "16"))
+
+# Longest a crawl waits for its host's rate limit token
+CRAWL_RATE_LIMIT_TIMEOUT = 300.0
+
+# Shared API host per hosted ATS; other crawls are keyed by their own host
+_ATS_API_HOSTS = {
+    "greenhouse": urlparse(GreenhouseClient.BASE_URL).hostname,
+    "lever": urlparse(LeverClient.BASE_URL).hostname,
+    "ashby": urlparse(AshbyClient.BASE_URL).hostname,
+    "smartrecruiters": urlparse(SmartRecruitersClient.BASE_URL).hostname,
+}
+
+# Hosts throttled through the process-wide rate limiter. Every other host
+# (Workday tenants, career sites) only gets a per-run semaphore, so one-off
+# hosts don't leave permanent buckets in the shared limiter.
+_SHARED_LIMIT_HOSTS = frozenset(_ATS_API_HOSTS.values())
+
+
+def crawl_host(
+    ats_type: Optional[str],
+    board_token: Optional[str],
+    careers_url: Optional[str],
+    website: Optional[str],
+) -> str:
+    """
+    Host a company's crawl will hit, used to group crawls for politeness.
+
+    Hosted ATS boards share one API host; Workday crawls hit the tenant's
+    myworkdayjobs.com host; generic scrapes and companies whose ATS is not
+    known yet (detection fetches their site) are keyed by their own host.
+    """
+    if ats_type in _ATS_API_HOSTS and board_token:
+        return _ATS_API_HOSTS[ats_type]
+    if ats_type == "workday" and board_token and "myworkdayjobs" in board_token:
+        url = board_token
+    elif ats_type in ("workday", "generic") and careers_url:
+        url = careers_url
+    else:
+        url = careers_url or website or ""
+    host = urlparse(url if "//" in url else f"https://{url}").hostname
+    return host or "unknown"
+
+
+# Postings per INSERT ... ON CONFLICT statement (19 bind parameters each)
+UPSERT_BATCH_SIZE = 500
+
+# Columns written by _upsert_postings, in INSERT order
+_UPSERT_COLUMNS = (
+    "company_id", "external_job_id", "title", "title_normalized",
+    "department", "team", "location", "employment_type", "workplace_type",
+    "seniority_level", "salary_min", "salary_max", "salary_currency",
+    "salary_interval", "description_text", "requirements", "source_url",
+    "ats_type", "posted_date",
+)
+
+# Updated from the crawl only when it has a value
+_COALESCE_COLUMNS = (
+    "title", "title_normalized", "department", "team", "location",
+    "employment_type", "workplace_type", "seniority_level",
+    "salary_min", "salary_max", "requirements",
+)
+
+
+def _build_upsert_sql(n_rows: int) -> str:
+    """
+    Multi-row upsert of ``n_rows`` postings bound as ``:<column>_<row>``.
+
+    Returns one boolean per row: true when inserted, false when an existing
+    posting was updated (``xmax = 0`` marks a fresh insert).
+    """
+    cols = ", ".join(_UPSERT_COLUMNS)
+    values = ",\n".join(
+        "(" + ", ".join(f":{col}_{n}" for col in _UPSERT_COLUMNS) + ", 'open', NOW(), NOW())"
+        for n in range(n_rows)
+    )
+    updates = ",\n    ".join(
+        f"{col} = COALESCE(EXCLUDED.{col}, job_postings.{col})" for col in _COALESCE_COLUMNS
+    )
+    return (
+        f"INSERT INTO job_postings ({cols}, status, first_seen_at, last_seen_at)\n"
+        f"VALUES\n{values}\n"
+        "ON CONFLICT (company_id, external_job_id) DO UPDATE SET\n"
+        "    last_seen_at = NOW(),\n"
+        f"    {updates},\n"
+        "    status = 'open',\n"
+        "    closed_at = NULL\n"
+        "RETURNING (xmax = 0) AS inserted"
+    )
+
 
 @dataclass
 class CollectionResult:
@@ -48,7 +149,8 @@ class CollectionResult:
 class JobPostingCollector:
     """Orchestrates job posting collection for a company."""
 
-    def __init__(self):
+    def __init__(self, rate_limiter: Optional[RateLimiterService] = None):
+        self._rate_limiter = rate_limiter or get_rate_limiter()
         self._detector = ATSDetector()
         self._greenhouse = GreenhouseClient()
         self._lever = LeverClient()
@@ -160,12 +262,34 @@ class JobPostingCollector:
         return result
 
     async def collect_all(
-        self, db: Session, limit: Optional[int] = None, skip_recent_hours: int = 24
+        self,
+        db: Session,
+        limit: Optional[int] = None,
+        skip_recent_hours: int = 24,
+        concurrency: Optional[int] = None,
+        progress_callback: Optional[Callable[[dict], None]] = None,
     ) -> dict:
-        """Collect for all companies with websites, skipping recently crawled."""
+        """
+        Collect for all companies with websites, skipping recently crawled.
+
+        Companies are grouped by the host their crawl hits (see crawl_host).
+        Each host gets as many lanes as its rate limit allows concurrent
+        requests, and at most ``concurrency`` crawls (CRAWL_CONCURRENCY) run
+        at once. Crawls of a hosted ATS API take a token from that host's
+        bucket in the shared rate limiter; other hosts are held to the
+        default concurrent limit by a semaphore that lives only for this
+        call. Each crawl uses its own session on ``db``'s engine and
+        commits on its own.
+
+        ``progress_callback`` receives the running summary after every
+        company, so callers can stream partial results into a job record.
+        """
         rows = db.execute(
             text("""
-                SELECT ic.id FROM industrial_companies ic
+                SELECT ic.id, ic.website, ic.careers_page_url,
+                       cfg.ats_type, cfg.board_token, cfg.careers_url
+                FROM industrial_companies ic
+                LEFT JOIN company_ats_config cfg ON cfg.company_id = ic.id
                 WHERE ic.website IS NOT NULL
                 AND NOT EXISTS (
                     SELECT 1 FROM company_ats_config cac
@@ -178,22 +302,74 @@ class JobPostingCollector:
             {"lim": limit or 10000},
         ).fetchall()
 
-        results = []
-        for (cid,) in rows:
-            r = await self.collect_company(db, cid)
-            results.append(r)
-            logger.info(
-                f"[{len(results)}/{len(rows)}] {r.company_name}: "
-                f"{r.total_fetched} fetched, {r.new_postings} new, {r.error or 'OK'}"
-            )
+        hosts: dict[str, list[int]] = {}
+        for cid, website, careers_page_url, ats_type, token, cfg_careers_url in rows:
+            host = crawl_host(ats_type, token, cfg_careers_url or careers_page_url, website)
+            hosts.setdefault(host, []).append(cid)
+        logger.info(f"Crawling {len(rows)} companies across {len(hosts)} hosts")
 
+        SessionLocal = sessionmaker(bind=db.get_bind())
+        slots = asyncio.Semaphore(concurrency or CRAWL_CONCURRENCY)
+        results: list[CollectionResult] = []
         summary = {
-            "companies_processed": len(results),
-            "total_fetched": sum(r.total_fetched for r in results),
-            "total_new": sum(r.new_postings for r in results),
-            "total_closed": sum(r.closed_postings for r in results),
-            "errors": sum(1 for r in results if r.error),
+            "companies_total": len(rows),
+            "companies_processed": 0,
+            "total_fetched": 0,
+            "total_new": 0,
+            "total_updated": 0,
+            "total_closed": 0,
+            "errors": 0,
+        }
+
+        default_concurrent = DEFAULT_RATE_LIMITS["default"]["concurrent_limit"]
+        host_slots = {
+            host: asyncio.Semaphore(default_concurrent)
+            for host in hosts
+            if host not in _SHARED_LIMIT_HOSTS
         }
+
+        def host_limit(host: str):
+            if host in host_slots:
+                return host_slots[host]
+            return self._rate_limiter.limit(host, timeout=CRAWL_RATE_LIMIT_TIMEOUT)
+
+        async def crawl(host: str, cid: int) -> CollectionResult:
+            try:
+                async with host_limit(host):
+                    async with slots:
+                        crawl_db = SessionLocal()
+                        try:
+                            return await self.collect_company(crawl_db, cid)
+                        finally:
+                            crawl_db.close()
+            except RateLimitExceeded as e:
+                return CollectionResult(company_id=cid, error=str(e))
+
+        async def lane(host: str, queue: list[int]) -> None:
+            while queue:
+                r = await crawl(host, queue.pop(0))
+                results.append(r)
+                summary["companies_processed"] += 1
+                summary["total_fetched"] += r.total_fetched
+                summary["total_new"] += r.new_postings
+                summary["total_updated"] += r.updated_postings
+                summary["total_closed"] += r.closed_postings
+                summary["errors"] += 1 if r.error else 0
+                logger.info(
+                    f"[{len(results)}/{len(rows)}] {r.company_name} ({host}): "
+                    f"{r.total_fetched} fetched, {r.new_postings} new, {r.error or 'OK'}"
+                )
+                if progress_callback:
+                    progress_callback(dict(summary))
+
+        lanes = []
+        for host, queue in hosts.items():
+            if host in host_slots:
+                per_host = default_concurrent
+            else:
+                per_host = self._rate_limiter.get_stats(host)["concurrent_limit"]
+            lanes.extend(lane(host, queue) for _ in range(min(per_host, len(queue))))
+        await asyncio.gather(*lanes)
         return summary
 
     async def discover_ats(
@@ -321,132 +497,72 @@ class JobPostingCollector:
     def _upsert_postings(
         self, db: Session, company_id: int, jobs: list[dict], ats_type: str
     ) -> tuple[int, int]:
-        """Upsert normalized postings into job_postings table. Returns (new, updated)."""
-        new_count = 0
-        updated_count = 0
-
+        """
+        Upsert normalized postings into job_postings table. Returns (new, updated).
+
+        Postings go in chunks of UPSERT_BATCH_SIZE, one multi-row
+        INSERT ... ON CONFLICT (company_id, external_job_id) DO UPDATE per
+        chunk. Existing rows keep a column's value when the crawl has none
+        (COALESCE), are marked seen and reopened. A posting repeated within
+        the crawl is written once, with its last occurrence.
+        """
+        rows: dict[str, dict] = {}
         for job in jobs:
             ext_id = job.get("external_job_id", "")
             if not ext_id:
                 continue
+            requirements = job.get("requirements")
+            rows[ext_id] = {
+                **{col: job.get(col) for col in _UPSERT_COLUMNS},
+                "company_id": company_id,
+                "external_job_id": ext_id,
+                "requirements": json.dumps(requirements) if requirements else None,
+                "ats_type": job.get("ats_type") or ats_type,
+            }
 
-            # Ensure all expected keys exist
-            for k in (
-                "title", "title_normalized", "department", "team", "location",
-                "employment_type", "workplace_type", "seniority_level",
-                "salary_min", "salary_max", "salary_currency", "salary_interval",
-                "description_text", "requirements", "source_url", "ats_type", "posted_date",
-            ):
-                job.setdefault(k, None)
-
-            job["ats_type"] = job.get("ats_type") or ats_type
-
-            # Check if exists
-            existing = db.execute(
-                text("SELECT id FROM job_postings WHERE company_id = :cid AND external_job_id = :eid"),
-                {"cid": company_id, "eid": ext_id},
-            ).fetchone()
-
-            if existing:
-                # Update last_seen and mutable fields
-                req_json_upd = json.dumps(job.get("requirements")) if job.get("requirements") else None
-                db.execute(
-                    text("""
-                        UPDATE job_postings SET
-                            last_seen_at = NOW(),
-                            title = COALESCE(:title, title),
-                            title_normalized = COALESCE(:title_normalized, title_normalized),
-                            department = COALESCE(:department, department),
-                            team = COALESCE(:team, team),
-                            location = COALESCE(:location, location),
-                            employment_type = COALESCE(:employment_type, employment_type),
-                            workplace_type = COALESCE(:workplace_type, workplace_type),
-                            seniority_level = COALESCE(:seniority_level, seniority_level),
-                            salary_min = COALESCE(:salary_min, salary_min),
-                            salary_max = COALESCE(:salary_max, salary_max),
-                            requirements = COALESCE(:requirements_json, requirements),
-                            status = 'open',
-                            closed_at = NULL
-                        WHERE company_id = :cid AND external_job_id = :eid
-                    """),
-                    {**job, "cid": company_id, "eid": ext_id, "requirements_json": req_json_upd},
-                )
-                updated_count += 1
-            else:
-                # Insert new posting
-                req_json = json.dumps(job.get("requirements")) if job.get("requirements") else None
-                db.execute(
-                    text("""
-                        INSERT INTO job_postings (
-                            company_id, external_job_id, title, title_normalized,
-                            department, team, location, employment_type, workplace_type,
-                            seniority_level, salary_min, salary_max, salary_currency,
-                            salary_interval, description_text, requirements, source_url,
-                            ats_type, status, first_seen_at, last_seen_at, posted_date
-                        ) VALUES (
-                            :cid, :eid, :title, :title_normalized,
-                            :department, :team, :location, :employment_type, :workplace_type,
-                            :seniority_level, :salary_min, :salary_max, :salary_currency,
-                            :salary_interval, :description_text, :requirements, :source_url,
-                            :ats_type, 'open', NOW(), NOW(), :posted_date
-                        )
-                    """),
-                    {
-                        "cid": company_id,
-                        "eid": ext_id,
-                        "title": job["title"],
-                        "title_normalized": job.get("title_normalized"),
-                        "department": job.get("department"),
-                        "team": job.get("team"),
-                        "location": job.get("location"),
-                        "employment_type": job.get("employment_type"),
-                        "workplace_type": job.get("workplace_type"),
-                        "seniority_level": job.get("seniority_level"),
-                        "salary_min": job.get("salary_min"),
-                        "salary_max": job.get("salary_max"),
-                        "salary_currency": job.get("salary_currency"),
-                        "salary_interval": job.get("salary_interval"),
-                        "description_text": job.get("description_text"),
-                        "requirements": req_json,
-                        "source_url": job.get("source_url"),
-                        "ats_type": job.get("ats_type"),
-                        "posted_date": job.get("posted_date"),
-                    },
-                )
-                new_count += 1
+        new_count = 0
+        updated_count = 0
+        batch = list(rows.values())
+        for i in range(0, len(batch), UPSERT_BATCH_SIZE):
+            chunk = batch[i:i + UPSERT_BATCH_SIZE]
+            params = {
+                f"{col}_{n}": row[col]
+                for n, row in enumerate(chunk)
+                for col in _UPSERT_COLUMNS
+            }
+            inserted = db.execute(text(_build_upsert_sql(len(chunk))), params).scalars().all()
+            chunk_new = sum(1 for flag in inserted if flag)
+            new_count += chunk_new
+            updated_count += len(inserted) - chunk_new
 
         return new_count, updated_count
 
     def _detect_closed_postings(
         self, db: Session, company_id: int, current_job_ids: set[str]
     ) -> int:
-        """Mark postings as closed if not in current crawl."""
+        """
+        Mark postings as closed if not in current crawl.
+
+        One UPDATE anti-joins the company's open postings against the crawl's
+        ids, in the caller's transaction so the upsert and the closures
+        commit together.
+        """
         if not current_job_ids:
             return 0
 
-        # Get all open postings for this company
-        open_rows = db.execute(
+        result = db.execute(
             text("""
-                SELECT external_job_id FROM job_postings
-                WHERE company_id = :cid AND status = 'open'
-            """),
-            {"cid": company_id},
-        ).fetchall()
-
-        closed_count = 0
-        for (eid,) in open_rows:
-            if eid not in current_job_ids:
-                db.execute(
-                    text("""
-                        UPDATE job_postings
-                        SET status = 'closed', closed_at = NOW()
-                        WHERE company_id = :cid AND external_job_id = :eid
-                    """),
-                    {"cid": company_id, "eid": eid},
+                UPDATE job_postings jp
+                SET status = 'closed', closed_at = NOW()
+                WHERE jp.company_id = :cid AND jp.status = 'open'
+                AND NOT EXISTS (
+                    SELECT 1 FROM unnest(CAST(:eids AS text[])) AS cur(eid)
+                    WHERE cur.eid = jp.external_job_id
                 )
-                closed_count += 1
-
-        return closed_count
+            """),
+            {"cid": company_id, "eids": sorted(current_job_ids)},
+        )
+        return result.rowcount or 0
 
     def _create_snapshot(self, db: Session, company_id: int):
         """Create or update today's snapshot for a company."""
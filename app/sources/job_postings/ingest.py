@@ -5,6 +5,7 @@ Called by the job dispatch system (app/api/v1/jobs.py) or directly from the API
 """
 
 import logging
+import time
 from typing import Optional
 
 from sqlalchemy import text
@@ -21,6 +22,9 @@ from app.sources.job_postings.collector import JobPostingCollector
 
 logger = logging.getLogger(__name__)
 
+# Seconds between progress writes to the job record during collect_all
+PROGRESS_INTERVAL = 5.0
+
 
 def _ensure_tables(db: Session):
     """Create tables if they don't exist."""
@@ -81,8 +85,25 @@ async def ingest_job_postings_all(
     lim = limit or config.get("limit")
     skip_hrs = skip_recent_hours or config.get("skip_recent_hours", 24)
 
+    last_report = [0.0]
+
+    def report_progress(partial: dict, force: bool = False):
+        # Partial totals land on the job record as companies finish (throttled)
+        now = time.monotonic()
+        if not force and now - last_report[0] < PROGRESS_INTERVAL:
+            return
+        last_report[0] = now
+        job = db.get(IngestionJob, job_id)
+        if job:
+            job.rows_committed = partial["total_new"] + partial["total_updated"]
+            job.progress_checkpoint = partial
+            db.commit()
+
     async with JobPostingCollector() as collector:
-        summary = await collector.collect_all(db, limit=lim, skip_recent_hours=int(skip_hrs))
+        summary = await collector.collect_all(
+            db, limit=lim, skip_recent_hours=int(skip_hrs), progress_callback=report_progress
+        )
+    report_progress(summary, force=True)
 
     total = summary.get("total_fetched", 0)
     errors = summary.get("errors", 0)
@@ -9,14 +9,32 @@ Parses job description text to extract:
 - Years of experience
 
 Results populate the `requirements` JSONB column on job_postings.
+
+Matching is compiled once per process (see SkillMatcher): a single scan
+finds which taxonomy keywords occur in a description, and only the
+patterns behind those keywords are run. extract_skills_batch and
+backfill_requirements can spread large batches over worker processes.
 """
 
+import functools
+import json
+import multiprocessing
 import re
 import logging
-from typing import Optional
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Iterable, Iterator, Optional
+
+from sqlalchemy import text as sql_text
+from sqlalchemy.orm import Session
 
 logger = logging.getLogger(__name__)
 
+# Postings per backfill read / UPDATE, and per task sent to a worker process
+BACKFILL_BATCH_SIZE = 1000
+PROCESS_CHUNK_SIZE = 200
+
 
 # ---------------------------------------------------------------------------
 # Skills taxonomy — ordered by category
@@ -237,16 +255,19 @@ def extract_skills(description: str, title: str = "") -> dict:
     text = _prepare_text(description)
     title_lower = title.lower() if title else ""
 
-    # Extract from full description
-    skills = _extract_matches(text, TECH_SKILLS)
-    soft = _extract_matches(text, SOFT_SKILLS)
-    certs = _extract_matches(text, CERTIFICATIONS)
-    education = _extract_education(text)
+    # Extract from full description (one keyword scan for all taxonomies)
+    matcher = get_matcher()
+    matches = matcher.match(text)
+    skills = matches["skills"]
+    soft = matches["soft_skills"]
+    certs = matches["certifications"]
+    # Levels are ordered highest first
+    education = matches["education"][0] if matches["education"] else None
     years, years_raw = _extract_experience(text)
 
     # Boost skills that appear in the title
     if title_lower:
-        title_skills = _extract_matches(title_lower, TECH_SKILLS)
+        title_skills = matcher.match(title_lower, ("skills",))["skills"]
         # Title skills go first
         skills = list(dict.fromkeys(title_skills + skills))
 
@@ -269,68 +290,108 @@ def extract_skills(description: str, title: str = "") -> dict:
     return result
 
 
-def extract_skills_batch(postings: list[dict]) -> list[dict]:
+def extract_skills_batch(postings: list[dict], processes: int = 1) -> list[dict]:
     """Extract skills for a batch of postings. Modifies dicts in-place.
 
     Each posting dict should have 'description_text' and optionally 'title'.
-    Sets 'requirements' key on each posting.
+    Sets 'requirements' key on each posting. With ``processes`` > 1 the
+    extraction runs in that many worker processes.
     """
+    items = [(p.get("description_text", ""), p.get("title", "")) for p in postings]
     extracted = 0
-    for posting in postings:
-        desc = posting.get("description_text", "")
-        title = posting.get("title", "")
-        if desc:
-            reqs = extract_skills(desc, title)
-            if reqs and reqs.get("skill_count", 0) > 0:
-                posting["requirements"] = reqs
-                extracted += 1
+    for posting, reqs in zip(postings, _extract_many(items, processes)):
+        if reqs:
+            posting["requirements"] = reqs
+            extracted += 1
     logger.info(f"Extracted skills for {extracted}/{len(postings)} postings")
     return postings
 
 
+def backfill_requirements(
+    db: Session,
+    company_id: Optional[int] = None,
+    limit: Optional[int] = None,
+    processes: int = 1,
+    batch_size: int = BACKFILL_BATCH_SIZE,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+) -> tuple[int, int]:
+    """
+    Fill `requirements` on postings that have a description but none yet.
+
+    Walks job_postings in id order, ``batch_size`` rows at a time (all of
+    them when ``limit`` is None), extracts with ``processes`` workers and
+    writes each batch with one UPDATE, committing per batch. Postings
+    without any skill stay NULL, as on collection.
+
+    Returns (postings processed, postings enriched).
+    """
+    conditions = ["requirements IS NULL", "description_text IS NOT NULL", "id > :last_id"]
+    params: dict = {}
+    if company_id:
+        conditions.append("company_id = :cid")
+        params["cid"] = company_id
+    select = sql_text(f"""
+        SELECT id, title, description_text
+        FROM job_postings
+        WHERE {" AND ".join(conditions)}
+        ORDER BY id
+        LIMIT :lim
+    """)
+    update = sql_text("""
+        UPDATE job_postings jp
+        SET requirements = CAST(v.reqs AS jsonb)
+        FROM unnest(CAST(:ids AS integer[]), CAST(:reqs AS text[])) AS v(id, reqs)
+        WHERE jp.id = v.id
+    """)
+
+    processed = enriched = 0
+    last_id = 0
+    with _worker_pool(processes) as pool:
+        while limit is None or processed < limit:
+            lim = batch_size if limit is None else min(batch_size, limit - processed)
+            rows = db.execute(select, {**params, "last_id": last_id, "lim": lim}).fetchall()
+            if not rows:
+                break
+            last_id = rows[-1][0]
+            results = _extract_many([(desc, title or "") for _, title, desc in rows], processes, pool)
+            done = [(row[0], json.dumps(reqs)) for row, reqs in zip(rows, results) if reqs]
+            if done:
+                ids, reqs = zip(*done)
+                db.execute(update, {"ids": list(ids), "reqs": list(reqs)})
+            db.commit()
+            processed += len(rows)
+            enriched += len(done)
+            logger.info(f"Skills backfill: {enriched}/{processed} postings enriched")
+            if progress_callback:
+                progress_callback(processed, enriched)
+
+    return processed, enriched
+
+
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
 
+_HTML_TAG = re.compile(r"<[^>]+>")
+_WHITESPACE = re.compile(r"\s+")
+
+
 def _prepare_text(raw: str) -> str:
     """Clean HTML artifacts and normalize text for matching."""
     # Strip HTML tags
-    text = re.sub(r"<[^>]+>", " ", raw)
+    text = _HTML_TAG.sub(" ", raw)
     # Decode common entities
     text = text.replace("&amp;", "&").replace("&lt;", "<").replace("&gt;", ">")
     text = text.replace("&nbsp;", " ").replace("&#39;", "'").replace("&quot;", '"')
     # Collapse whitespace
-    text = re.sub(r"\s+", " ", text)
+    text = _WHITESPACE.sub(" ", text)
     return text.lower()
 
 
-def _extract_matches(text: str, taxonomy: list[tuple[str, list[str]]]) -> list[str]:
-    """Find all matching skills from a taxonomy in the text."""
-    found = []
-    for display_name, patterns in taxonomy:
-        for pat in patterns:
-            try:
-                if re.search(pat, text, re.IGNORECASE):
-                    found.append(display_name)
-                    break  # one match per skill is enough
-            except re.error:
-                continue
-    return found
-
-
-def _extract_education(text: str) -> Optional[str]:
-    """Extract highest education requirement mentioned."""
-    for level, patterns in EDUCATION_PATTERNS:
-        for pat in patterns:
-            if re.search(pat, text, re.IGNORECASE):
-                return level
-    return None
-
-
 def _extract_experience(text: str) -> tuple[Optional[int], Optional[str]]:
     """Extract years of experience. Returns (years_int, raw_match_text)."""
-    for pat in EXPERIENCE_PATTERNS:
-        match = re.search(pat, text, re.IGNORECASE)
+    for pat in _experience_patterns():
+        match = pat.search(text)
         if match:
             try:
                 years = int(match.group(1))
@@ -339,3 +400,235 @@ def _extract_experience(text: str) -> tuple[Optional[int], Optional[str]]:
             except (ValueError, IndexError):
                 continue
     return None, None
+
+
+@functools.lru_cache(maxsize=None)
+def _experience_patterns() -> list[re.Pattern]:
+    return [re.compile(p, re.IGNORECASE) for p in EXPERIENCE_PATTERNS]
+
+
+# ---------------------------------------------------------------------------
+# Compiled matcher
+# ---------------------------------------------------------------------------
+
+_REGEX_META = set(".^$*+?{}[]|()\\")
+
+
+def _literal_prefix(pattern: str) -> tuple[str, bool]:
+    """
+    Lowercase literal text every match of ``pattern`` starts with.
+
+    Returns (literal, anchored): anchored when the pattern opens with \\b,
+    so the literal can only start at a word boundary. An empty literal
+    means the pattern has no usable prefix (e.g. a top-level alternation).
+    """
+    if _has_top_level_alternation(pattern):
+        return "", False
+
+    anchored = pattern.startswith(r"\b")
+    i = 2 if anchored else 0
+    chars: list[str] = []
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == "\\":
+            escaped = pattern[i + 1:i + 2]
+            if not escaped or escaped.isalnum():
+                break
+            ch, width = escaped, 2
+        elif ch in _REGEX_META:
+            break
+        else:
+            width = 1
+        if pattern[i + width:i + width + 1] in ("?", "*", "{"):
+            break  # optional character ends the literal
+        chars.append(ch)
+        i += width
+    literal = "".join(chars).lower()
+    return literal, anchored and bool(literal) and (literal[0].isalnum() or literal[0] == "_")
+
+
+def _has_top_level_alternation(pattern: str) -> bool:
+    depth, in_class, i = 0, False, 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == "\\":
+            i += 2
+            continue
+        if in_class:
+            in_class = ch != "]"
+        elif ch == "[":
+            in_class = True
+        elif ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif ch == "|" and depth == 0:
+            return True
+        i += 1
+    return False
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """
+    Regex alternation of ``words`` shaped as a prefix trie.
+
+    Greedy, so at any position it matches the longest word present there.
+    """
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = "(?:" + "|".join(branches) + ")"
+        return body + "?" if "" in node else body
+
+    return build(trie)
+
+
+class SkillMatcher:
+    """
+    Taxonomies compiled for single-pass matching.
+
+    Each pattern's leading literal ("python" for r"\\bpython\\b") is a
+    keyword. One trie-shaped regex scan finds where keywords start at word
+    boundaries in the text; a pattern anchored at \\b is then only tried at
+    its keyword's positions (``regex.match(text, pos)``). The few patterns
+    without an anchored keyword fall back to a substring check on the
+    keyword and a full ``search``. Results are the same as running every
+    pattern with ``re.search``.
+    """
+
+    def __init__(self, taxonomies: dict[str, list[tuple[str, list[str]]]]):
+        # category -> [(display_name, [(keyword, anchored, regex)])]
+        self.taxonomies: dict[str, list[tuple[str, list[tuple[str, bool, re.Pattern]]]]] = {}
+        anchored_keywords: set[str] = set()
+        for category, taxonomy in taxonomies.items():
+            entries = []
+            for display_name, patterns in taxonomy:
+                compiled = []
+                for pat in patterns:
+                    try:
+                        regex = re.compile(pat, re.IGNORECASE)
+                    except re.error:
+                        logger.debug(f"Skipping invalid skill pattern {pat!r}")
+                        continue
+                    keyword, anchored = _literal_prefix(pat)
+                    if anchored:
+                        anchored_keywords.add(keyword)
+                    compiled.append((keyword, anchored, regex))
+                entries.append((display_name, compiled))
+            self.taxonomies[category] = entries
+
+        # The scan reports the longest keyword at a position; every keyword
+        # that is a prefix of it starts there too
+        self._implied = {
+            word: [w for w in anchored_keywords if word.startswith(w)]
+            for word in anchored_keywords
+        }
+        self._scan = (
+            re.compile(r"\b(?=(" + _trie_pattern(anchored_keywords) + "))")
+            if anchored_keywords else None
+        )
+
+    def keyword_positions(self, haystack: str) -> dict[str, list[int]]:
+        """Start offsets of each anchored keyword in lowercased ``haystack``."""
+        positions: dict[str, list[int]] = {}
+        if self._scan is not None:
+            for m in self._scan.finditer(haystack):
+                pos = m.start()
+                for word in self._implied[m.group(1)]:
+                    positions.setdefault(word, []).append(pos)
+        return positions
+
+    def match(self, text: str, categories: Optional[Iterable[str]] = None) -> dict[str, list[str]]:
+        """Display names matched in ``text`` per category, in taxonomy order."""
+        haystack = text.lower()
+        positions = self.keyword_positions(haystack)
+        # Offsets only carry over when lowercasing kept the length
+        by_position = len(haystack) == len(text)
+        result = {}
+        for category in categories or self.taxonomies:
+            found = []
+            for display_name, patterns in self.taxonomies[category]:
+                for keyword, anchored, regex in patterns:
+                    if anchored:
+                        starts = positions.get(keyword)
+                        if not starts:
+                            continue
+                        hit = (
+                            any(regex.match(text, pos) for pos in starts)
+                            if by_position else regex.search(text)
+                        )
+                    else:
+                        hit = keyword in haystack and regex.search(text)
+                    if hit:
+                        found.append(display_name)
+                        break  # one match per skill is enough
+            result[category] = found
+        return result
+
+
+@functools.lru_cache(maxsize=None)
+def get_matcher() -> SkillMatcher:
+    """Process-wide matcher for the built-in taxonomies (built on first use)."""
+    return SkillMatcher({
+        "skills": TECH_SKILLS,
+        "soft_skills": SOFT_SKILLS,
+        "certifications": CERTIFICATIONS,
+        "education": EDUCATION_PATTERNS,
+    })
+
+
+# ---------------------------------------------------------------------------
+# Batch execution
+# ---------------------------------------------------------------------------
+
+def _requirements_chunk(items: list[tuple[str, str]]) -> list[Optional[dict]]:
+    """Requirements per (description, title), None when no skill was found."""
+    out = []
+    for desc, title in items:
+        reqs = extract_skills(desc, title) if desc else {}
+        out.append(reqs if reqs.get("skill_count", 0) > 0 else None)
+    return out
+
+
+@contextmanager
+def _worker_pool(processes: int) -> Iterator[Optional[ProcessPoolExecutor]]:
+    """ProcessPoolExecutor (spawn) when processes > 1, else None."""
+    if processes <= 1:
+        yield None
+        return
+    with ProcessPoolExecutor(
+        max_workers=processes, mp_context=multiprocessing.get_context("spawn")
+    ) as pool:
+        yield pool
+
+
+def _extract_many(
+    items: list[tuple[str, str]],
+    processes: int,
+    pool: Optional[ProcessPoolExecutor] = None,
+) -> list[Optional[dict]]:
+    """Run _requirements_chunk over ``items`` in order, in a pool if given or requested."""
+    if processes <= 1 or len(items) <= PROCESS_CHUNK_SIZE:
+        return _requirements_chunk(items)
+    if pool is None:
+        with _worker_pool(processes) as own_pool:
+            return _extract_many(items, processes, own_pool)
+
+    # Bounded submission keeps memory flat for very large batches
+    results: list[Optional[dict]] = []
+    pending: deque = deque()
+    for i in range(0, len(items), PROCESS_CHUNK_SIZE):
+        pending.append(pool.submit(_requirements_chunk, items[i:i + PROCESS_CHUNK_SIZE]))
+        if len(pending) >= processes * 2:
+            results.extend(pending.popleft().result())
+    while pending:
+        results.extend(pending.popleft().result())
+    return results
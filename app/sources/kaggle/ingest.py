@@ -17,11 +17,12 @@ import csv
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 
+from app.core.batch_operations import copy_frame, update_rows_committed
 from app.core.config import get_settings
 from app.core.models import DatasetRegistry, IngestionJob, JobStatus
 from app.sources.kaggle.client import KaggleClient
@@ -29,6 +30,10 @@ from app.sources.kaggle import m5_metadata
 
 logger = logging.getLogger(__name__)
 
+# Wide sales rows (items) per chunk. Each item melts to one long row per
+# day (~1,900), so a chunk is ~1M m5_sales rows and one COPY transaction.
+SALES_CHUNK_ITEMS = 500
+
 
 # =============================================================================
 # TABLE PREPARATION
@@ -248,121 +253,98 @@ async def ingest_m5_sales(
     db: Session,
     file_path: Path,
     calendar_path: Optional[Path] = None,
-    batch_size: int = 10000,
+    chunk_items: int = SALES_CHUNK_ITEMS,
     limit_items: Optional[int] = None,
+    job_id: Optional[int] = None,
 ) -> Dict[str, int]:
     """
     Ingest sales_train_validation.csv into m5_items and m5_sales tables.
 
     This transforms the wide-format sales data (d_1 to d_1969 columns)
-    into long format for efficient querying.
+    into long format for efficient querying. The file is read in chunks of
+    ``chunk_items`` rows; each chunk is melted with array operations
+    (m5_metadata.melt_sales_chunk), dated through the calendar by day
+    index and streamed into both tables with COPY + merge, then committed.
+    Memory is bounded by one chunk (~``chunk_items`` x days long rows).
 
     Args:
         db: Database session
         file_path: Path to sales_train_validation.csv
         calendar_path: Optional path to calendar.csv for date lookup
-        batch_size: Rows per batch insert
+        chunk_items: Wide rows (items) per chunk / transaction
         limit_items: Optional limit on number of items to process (for testing)
+        job_id: Optional ingestion job ID for rows_committed progress tracking
 
     Returns:
         Dictionary with items_inserted and sales_inserted counts
     """
+    import pandas as pd
+
     logger.info(f"Ingesting sales from: {file_path}")
 
-    # Build calendar lookup for d -> date mapping
-    calendar_lookup = {}
-    if calendar_path and calendar_path.exists():
-        logger.info("Building calendar lookup for date mapping...")
-        with open(calendar_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                calendar_lookup[row["d"]] = row["date"]
-
-    # SQL for items
-    items_sql = """
-        INSERT INTO m5_items 
-        (id, item_id, dept_id, cat_id, store_id, state_id)
-        VALUES 
-        (:id, :item_id, :dept_id, :cat_id, :store_id, :state_id)
-        ON CONFLICT (id) DO NOTHING
-    """
+    # Get day columns (d_1, d_2, ..., d_1969)
+    header = pd.read_csv(file_path, nrows=0).columns
+    day_columns = [col for col in header if col.startswith("d_")]
+    logger.info(f"Found {len(day_columns)} day columns")
 
-    # SQL for sales
-    sales_sql = """
-        INSERT INTO m5_sales 
-        (item_store_id, d, item_id, store_id, date, sales)
-        VALUES 
-        (:item_store_id, :d, :item_id, :store_id, :date, :sales)
-        ON CONFLICT (item_store_id, d) DO UPDATE SET
-            sales = EXCLUDED.sales,
-            date = EXCLUDED.date,
-            ingested_at = NOW()
-    """
+    day_dates = None
+    if calendar_path and calendar_path.exists():
+        logger.info("Mapping day columns to dates through the calendar...")
+        day_dates = _calendar_dates(calendar_path, day_columns)
 
     items_inserted = 0
     sales_inserted = 0
-    items_batch = []
-    sales_batch = []
-
-    with open(file_path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
 
-        # Get day columns (d_1, d_2, ..., d_1969)
-        fieldnames = reader.fieldnames
-        day_columns = [col for col in fieldnames if col.startswith("d_")]
-        logger.info(f"Found {len(day_columns)} day columns")
-
-        item_count = 0
-        for row in reader:
-            # Check limit
-            if limit_items and item_count >= limit_items:
-                break
-
-            item_count += 1
+    chunks = pd.read_csv(
+        file_path,
+        usecols=m5_metadata.SALES_ID_COLUMNS + day_columns,
+        dtype={
+            **{col: str for col in m5_metadata.SALES_ID_COLUMNS},
+            **{col: "float32" for col in day_columns},
+        },
+        chunksize=chunk_items,
+        nrows=limit_items,
+    )
+    for chunk in chunks:
+        items, sales = m5_metadata.melt_sales_chunk(chunk, day_columns, day_dates)
 
-            # Extract item dimension data
-            item_data = m5_metadata.parse_sales_row_to_items(row)
-            items_batch.append(item_data)
+        try:
+            inserted, _ = copy_frame(
+                db, "m5_items", items.drop_duplicates("id"),
+                conflict_columns=["id"], update_columns=[],
+            )
+            items_inserted += inserted
 
-            # Transform to long format sales data
-            sales_rows = m5_metadata.parse_sales_row_to_long_format(
-                row, day_columns, calendar_lookup
+            copy_frame(
+                db, "m5_sales", sales,
+                conflict_columns=["item_store_id", "d"],
+                update_columns=["sales", "date"],
+                touch_columns=["ingested_at"],
             )
-            sales_batch.extend(sales_rows)
-
-            # Batch insert items
-            if len(items_batch) >= batch_size:
-                db.execute(text(items_sql), items_batch)
-                items_inserted += len(items_batch)
-                items_batch = []
-
-            # Batch insert sales
-            if len(sales_batch) >= batch_size:
-                db.execute(text(sales_sql), sales_batch)
-                sales_inserted += len(sales_batch)
-                sales_batch = []
-
-                if sales_inserted % 500000 == 0:
-                    logger.info(
-                        f"Inserted {sales_inserted} sales rows, {items_inserted} items..."
-                    )
-                    db.commit()  # Commit periodically
-
-        # Insert remaining batches
-        if items_batch:
-            db.execute(text(items_sql), items_batch)
-            items_inserted += len(items_batch)
-
-        if sales_batch:
-            db.execute(text(sales_sql), sales_batch)
-            sales_inserted += len(sales_batch)
+            sales_inserted += len(sales)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+        if job_id:
+            update_rows_committed(db, job_id, items_inserted + sales_inserted)
+        logger.info(f"Inserted {sales_inserted} sales rows, {items_inserted} items...")
 
-    db.commit()
     logger.info(f"Inserted {items_inserted} items, {sales_inserted} sales rows")
 
     return {"items_inserted": items_inserted, "sales_inserted": sales_inserted}
 
 
+def _calendar_dates(calendar_path: Path, day_columns: List[str]) -> List[Optional[str]]:
+    """Date string for each day column from calendar.csv (None when absent)."""
+    import pandas as pd
+
+    calendar = pd.read_csv(calendar_path, usecols=["d", "date"], dtype=str)
+    dates = calendar.drop_duplicates("d", keep="last").set_index("d")["date"]
+    return [None if pd.isna(v) else v for v in dates.reindex(day_columns)]
+
+
 # =============================================================================
 # MAIN ORCHESTRATION
 # =============================================================================
@@ -482,7 +464,11 @@ async def ingest_m5_dataset(
         # Step 5: Ingest sales (this is the big one!)
         logger.info("Step 5: Ingesting sales data (this may take a while)...")
         sales_result = await ingest_m5_sales(
-            db, sales_path, calendar_path=calendar_path, limit_items=limit_items
+            db,
+            sales_path,
+            calendar_path=calendar_path,
+            limit_items=limit_items,
+            job_id=job_id,
         )
         results["rows"]["items"] = sales_result["items_inserted"]
         results["rows"]["sales"] = sales_result["sales_inserted"]
@@ -23,7 +23,7 @@ M5 Hierarchy:
 """
 
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -469,6 +469,63 @@ def parse_sales_row_to_long_format(
     return sales_rows
 
 
+SALES_ID_COLUMNS = ["item_id", "dept_id", "cat_id", "store_id", "state_id"]
+
+
+def melt_sales_chunk(
+    chunk: Any,
+    day_columns: List[str],
+    day_dates: Optional[List[Optional[str]]] = None,
+) -> Tuple[Any, Any]:
+    """
+    Vectorized wide-to-long transform of a chunk of sales rows.
+
+    The columnar equivalent of parse_sales_row_to_items plus
+    parse_sales_row_to_long_format over every row of ``chunk``: the
+    (items x days) block of sales is flattened in row-major order and
+    missing values are dropped. Repeated string columns are built as
+    categoricals over the chunk's items and days, so the long frame only
+    holds integer codes per row.
+
+    Args:
+        chunk: pandas DataFrame of wide sales rows (id columns + day columns)
+        day_columns: Day column names (d_1, d_2, ...)
+        day_dates: Optional date string per day column, aligned with
+            ``day_columns`` (None where the calendar has no entry)
+
+    Returns:
+        (items, sales) DataFrames with the m5_items and m5_sales columns
+    """
+    import numpy as np
+    import pandas as pd
+
+    ids = {col: chunk[col].astype(str) for col in SALES_ID_COLUMNS}
+    item_store_ids = (ids["item_id"] + "_" + ids["store_id"]).to_numpy()
+    items = pd.DataFrame({"id": item_store_ids, **{k: v.to_numpy() for k, v in ids.items()}})
+
+    values = chunk[day_columns].to_numpy(dtype="float64")
+    n_items, n_days = values.shape
+    present = ~np.isnan(values.ravel())
+    item_idx = np.repeat(np.arange(n_items), n_days)[present]
+    day_idx = np.tile(np.arange(n_days), n_items)[present]
+
+    def repeat(labels, idx):
+        codes, uniques = pd.factorize(np.asarray(labels, dtype=object))
+        return pd.Categorical.from_codes(codes[idx], uniques)
+
+    sales = pd.DataFrame(
+        {
+            "item_store_id": repeat(item_store_ids, item_idx),
+            "d": repeat(day_columns, day_idx),
+            "item_id": repeat(ids["item_id"], item_idx),
+            "store_id": repeat(ids["store_id"], item_idx),
+            "date": repeat(day_dates if day_dates is not None else [None] * n_days, day_idx),
+            "sales": values.ravel()[present].astype("int64"),
+        }
+    )
+    return items, sales
+
+
 # =============================================================================
 # METADATA HELPERS
 # =============================================================================
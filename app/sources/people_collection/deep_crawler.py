@@ -20,6 +20,7 @@ from datetime import datetime
 
 from bs4 import BeautifulSoup
 
+from app.core.cpu_offload import run_cpu_bound
 from app.sources.people_collection.base_collector import BaseCollector
 from app.sources.people_collection.html_cleaner import HTMLCleaner
 from app.sources.people_collection.llm_extractor import LLMExtractor
@@ -207,7 +208,7 @@ class DeepCrawler(BaseCollector):
                 result.page_urls.append(url)
 
                 # Check if page has people content
-                cleaned = self.html_cleaner.clean(html, url)
+                cleaned = await run_cpu_bound(self.html_cleaner.clean, html, url)
 
                 if cleaned.has_leadership_content or self._page_likely_has_people(
                     html, url
@@ -11,6 +11,7 @@ import logging
 from typing import Optional, List, Dict
 from datetime import datetime
 
+from app.core.cpu_offload import run_cpu_bound
 from app.sources.people_collection.base_collector import BaseCollector
 from app.sources.people_collection.page_finder import PageFinder
 from app.sources.people_collection.html_cleaner import HTMLCleaner, extract_people_cards
@@ -214,8 +215,8 @@ class WebsiteAgent(BaseCollector):
 
         logger.debug(f"[WebsiteAgent] Fetched {len(html)} bytes from {page_url}")
 
-        # Clean HTML
-        cleaned = self.html_cleaner.clean(html)
+        # Clean HTML (CPU-bound — offloaded to the worker process lane)
+        cleaned = await run_cpu_bound(self.html_cleaner.clean, html)
         logger.debug(
             f"[WebsiteAgent] Cleaned HTML: {len(cleaned.text)} chars, "
             f"has_leadership_content={cleaned.has_leadership_content}"
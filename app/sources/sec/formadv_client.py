@@ -16,6 +16,8 @@ import httpx
 import csv
 import io
 
+from app.core.http_client import shared_transport
+
 logger = logging.getLogger(__name__)
 
 
@@ -100,6 +102,7 @@ class FormADVClient:
                     "Accept": "application/json, text/csv",
                 },
                 follow_redirects=True,
+                transport=shared_transport(),
             )
         return self._client
 
@@ -12,6 +12,7 @@ from sqlalchemy import inspect
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
+from app.core.cpu_offload import run_cpu_bound
 from app.core.models import IngestionJob, JobStatus
 from app.sources.sec.client import SECClient
 from app.sources.sec import xbrl_parser
@@ -165,8 +166,8 @@ async def ingest_company_financial_data(
         # Fetch company facts from SEC
         facts_data = await client.get_company_facts(cik)
 
-        # Parse financial data
-        parsed_data = xbrl_parser.parse_company_facts(facts_data, cik)
+        # Parse financial data (CPU-bound — offloaded to the worker process lane)
+        parsed_data = await run_cpu_bound(xbrl_parser.parse_company_facts, facts_data, cik)
 
         # Upsert financial facts (optional — slowest part)
         facts_count = 0
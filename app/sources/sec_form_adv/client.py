@@ -9,6 +9,8 @@ import httpx
 from typing import Dict, List, Optional, Any
 import asyncio
 
+from app.core.http_client import shared_transport
+
 logger = logging.getLogger(__name__)
 
 
@@ -85,7 +87,7 @@ class FormADVClient:
 
         url = f"{self.IAPD_API_URL}/search/adviser"
 
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=shared_transport()) as client:
             try:
                 response = await client.get(
                     url, params=params, headers=self._get_headers(), timeout=30
@@ -113,7 +115,7 @@ class FormADVClient:
 
         url = f"{self.IAPD_API_URL}/adviser/{crd_number}"
 
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=shared_transport()) as client:
             try:
                 response = await client.get(
                     url, headers=self._get_headers(), timeout=30
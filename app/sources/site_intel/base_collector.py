@@ -10,13 +10,25 @@ import logging
 import os
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Optional, List, Dict, Any, Type, Coroutine
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
 
 import httpx
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 from sqlalchemy.dialects.postgresql import insert
 
+from app.core.http_client import shared_transport
 from app.core.models_site_intel import SiteIntelCollectionJob
 from app.sources.site_intel.types import (
     SiteIntelDomain,
@@ -30,6 +42,42 @@ from app.sources.site_intel.types import (
 logger = logging.getLogger(__name__)
 
 
+def _as_int(value: Any) -> Optional[int]:
+    """Parse a total count from a response field (None if absent/invalid)."""
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _with_column_defaults(model: Type, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Records with the model's scalar / callable column defaults filled in.
+
+    Mirrors what insert(model).values() applies on the executemany path:
+    only keys a record lacks are filled, callables are called per record.
+    Server-side defaults, sequences and SQL expressions are left to the DB.
+    """
+    defaults = [
+        (column.name, column.default)
+        for column in model.__table__.columns
+        if column.default is not None
+        and (column.default.is_scalar or column.default.is_callable)
+    ]
+    if not defaults:
+        return records
+
+    filled = []
+    for rec in records:
+        missing = [(key, d) for key, d in defaults if key not in rec]
+        if missing:
+            rec = dict(rec)
+            for key, default in missing:
+                rec[key] = default.arg(None) if default.is_callable else default.arg
+        filled.append(rec)
+    return filled
+
+
 class BaseCollector(ABC):
     """
     Abstract base class for site intelligence collectors.
@@ -48,6 +96,7 @@ class BaseCollector(ABC):
     default_timeout: float = 30.0
     default_retries: int = 3
     rate_limit_delay: float = 0.5  # seconds between requests
+    page_concurrency: int = 4  # pages in flight in iter_pages
 
     def __init__(
         self,
@@ -100,11 +149,12 @@ class BaseCollector(ABC):
                 headers=headers,
                 timeout=self.default_timeout,
                 follow_redirects=True,
+                transport=shared_transport(),
             )
         return self._client
 
     async def close_client(self):
-        """Close the HTTP client."""
+        """Close the HTTP client; pooled connections stay open for other collectors."""
         if self._client is not None:
             await self._client.aclose()
             self._client = None
@@ -270,10 +320,16 @@ class BaseCollector(ABC):
         data_key: str = "data",
         per_page: int = 100,
         max_pages: Optional[int] = None,
+        offset_key: Optional[str] = None,
+        total_key: Optional[str] = None,
+        max_concurrent: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """
         Fetch all pages of a paginated API.
 
+        Collects iter_pages into one list; see iter_pages for when pages
+        are fetched concurrently.
+
         Args:
             endpoint: API endpoint
             params: Base query parameters
@@ -282,39 +338,147 @@ class BaseCollector(ABC):
             data_key: Key in response containing data array
             per_page: Items per page
             max_pages: Maximum pages to fetch (None for all)
+            offset_key: Parameter name for a record offset (replaces page_key)
+            total_key: Key in the first response holding the total item count
+            max_concurrent: Pages in flight at once (default page_concurrency)
 
         Returns:
             List of all items across pages
         """
         all_items = []
-        page = 1
-        params = params or {}
-
-        while True:
-            params[page_key] = page
-            params[per_page_key] = per_page
-
-            response = await self.fetch_json(endpoint, params=params)
-            items = response.get(data_key, [])
-
-            if not items:
-                break
-
+        async for items in self.iter_pages(
+            endpoint,
+            params=params,
+            page_key=page_key,
+            per_page_key=per_page_key,
+            data_key=data_key,
+            per_page=per_page,
+            max_pages=max_pages,
+            offset_key=offset_key,
+            total_key=total_key,
+            max_concurrent=max_concurrent,
+        ):
             all_items.extend(items)
-            logger.debug(
-                f"Fetched page {page}, {len(items)} items, total: {len(all_items)}"
-            )
-
-            if len(items) < per_page:
-                break
-
-            if max_pages and page >= max_pages:
-                break
+        return all_items
 
-            page += 1
-            await asyncio.sleep(self.rate_limit_delay)
+    async def iter_pages(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        page_key: str = "page",
+        per_page_key: str = "per_page",
+        data_key: str = "data",
+        per_page: int = 100,
+        max_pages: Optional[int] = None,
+        offset_key: Optional[str] = None,
+        total_key: Optional[str] = None,
+        max_concurrent: Optional[int] = None,
+        fetch: Optional[Callable[..., Awaitable[Dict[str, Any]]]] = None,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Yield the items of each page of a paginated API, in page order.
+
+        The first page is fetched alone. After that, pages are independent
+        when the first response carries a total count (``total_key``) or
+        the API pages by record offset (``offset_key``, e.g. ArcGIS
+        ``resultOffset``): the following pages are fetched in windows of
+        ``max_concurrent`` through gather_with_limit (so apply_rate_limit
+        still runs before every request), and the next window is already
+        in flight while the caller processes the current one. Without a
+        total, offset pages are fetched speculatively and the walk stops at
+        the first short or empty page; at most one window of extra requests
+        is discarded. Plain page-number pagination without a total stays
+        one page at a time (some APIs repeat the last page past the end),
+        still prefetching the next page.
+
+        A page is the last one when it is empty, or shorter than
+        ``per_page`` without ArcGIS's ``exceededTransferLimit`` flag. When
+        an offset API caps the first page below ``per_page`` and sets that
+        flag, offsets advance by the capped size instead.
 
-        return all_items
+        Args:
+            endpoint: API endpoint
+            params: Base query parameters (not modified)
+            page_key: Parameter name for page number (1-based)
+            per_page_key: Parameter name for page size
+            data_key: Key in response containing data array
+            per_page: Items per page
+            max_pages: Maximum pages to fetch (None for all)
+            offset_key: Parameter name for a record offset (replaces page_key)
+            total_key: Key in the first response holding the total item count
+            max_concurrent: Pages in flight at once (default page_concurrency)
+            fetch: Coroutine function(endpoint, params=...) returning the
+                JSON response (default fetch_json)
+
+        Yields:
+            List of items for each page
+        """
+        fetch = fetch or self.fetch_json
+        max_concurrent = max_concurrent or self.page_concurrency
+        base_params = dict(params or {})
+        step = per_page
+
+        def page_params(index: int) -> Dict[str, Any]:
+            page = {**base_params, per_page_key: per_page}
+            if offset_key:
+                page[offset_key] = index * step
+            else:
+                page[page_key] = index + 1
+            return page
+
+        first = await fetch(endpoint, params=page_params(0))
+        items = first.get(data_key) or []
+        if not items:
+            return
+        if offset_key and len(items) < per_page and first.get("exceededTransferLimit"):
+            step = len(items)
+        yield items
+        if self._is_last_page(first, items, step) or max_pages == 1:
+            return
+
+        last = None  # exclusive page index
+        total = _as_int(first.get(total_key)) if total_key else None
+        if total is not None:
+            last = -(-total // step)
+        if max_pages:
+            last = min(last, max_pages) if last is not None else max_pages
+        window = max_concurrent if total is not None or offset_key else 1
+
+        async def fetch_window(indices: range) -> list:
+            coros = [fetch(endpoint, params=page_params(i)) for i in indices]
+            return await self.gather_with_limit(coros, max_concurrent, return_exceptions=False)
+
+        def start(index: int) -> Tuple[asyncio.Future, int]:
+            stop = index + window if last is None else min(index + window, last)
+            return asyncio.ensure_future(fetch_window(range(index, stop))), stop
+
+        index = 1
+        pending = start(index) if last is None or index < last else None
+        try:
+            while pending:
+                responses, stop = await pending[0], pending[1]
+                ends = total is None and any(
+                    self._is_last_page(r, r.get(data_key) or [], step) for r in responses
+                )
+                pending = start(stop) if not ends and (last is None or stop < last) else None
+                for page, response in enumerate(responses, start=index):
+                    items = response.get(data_key) or []
+                    if items:
+                        yield items
+                    logger.debug(f"Fetched page {page + 1}, {len(items)} items")
+                    if total is None and self._is_last_page(response, items, step):
+                        return
+                index = stop
+        finally:
+            if pending:
+                pending[0].cancel()
+
+    @staticmethod
+    def _is_last_page(response: Dict[str, Any], items: list, per_page: int) -> bool:
+        """Whether a page ends the walk (empty, or short and not truncated)."""
+        if not items:
+            return True
+        return len(items) < per_page and not response.get("exceededTransferLimit")
 
     # =========================================================================
     # JOB MANAGEMENT
@@ -577,6 +741,7 @@ class BaseCollector(ABC):
         unique_columns: List[str],
         update_columns: Optional[List[str]] = None,
         batch_size: int = 1000,
+        use_copy: bool = False,
     ) -> tuple[int, int]:
         """
         Bulk upsert records using PostgreSQL ON CONFLICT.
@@ -587,6 +752,8 @@ class BaseCollector(ABC):
             unique_columns: Columns that form the unique constraint
             update_columns: Columns to update on conflict (None = all non-unique)
             batch_size: Records per batch
+            use_copy: Load via COPY into a staging table and merge once per
+                chunk (see app.core.batch_operations.copy_insert)
 
         Returns:
             Tuple of (inserted_count, updated_count)
@@ -602,6 +769,9 @@ class BaseCollector(ABC):
             all_columns = set(records[0].keys())
             update_columns = list(all_columns - set(unique_columns) - {"id"})
 
+        if use_copy:
+            return self._copy_upsert(model, records, unique_columns, update_columns)
+
         for i in range(0, len(records), batch_size):
             batch = records[i : i + batch_size]
 
@@ -663,6 +833,42 @@ class BaseCollector(ABC):
 
         return inserted, updated
 
+    def _copy_upsert(
+        self,
+        model: Type,
+        records: List[Dict[str, Any]],
+        unique_columns: List[str],
+        update_columns: List[str],
+    ) -> tuple[int, int]:
+        """
+        COPY-based variant of bulk_upsert (first record per key wins).
+
+        COPY bypasses SQLAlchemy, so Python-side column defaults (e.g.
+        ``collected_at = Column(DateTime, default=datetime.utcnow)``) are
+        filled in here for records that omit those columns.
+        """
+        from app.core.batch_operations import copy_insert
+
+        seen = set()
+        deduped = []
+        for rec in records:
+            key = tuple(rec.get(col) for col in unique_columns)
+            if key not in seen:
+                seen.add(key)
+                deduped.append(rec)
+
+        deduped = _with_column_defaults(model, deduped)
+        columns = list(dict.fromkeys(k for rec in deduped for k in rec.keys()))
+        result = copy_insert(
+            db=self.db,
+            table_name=model.__tablename__,
+            rows=deduped,
+            columns=columns,
+            conflict_columns=unique_columns,
+            update_columns=update_columns,
+        )
+        return result.rows_inserted, result.rows_updated
+
     def null_preserving_upsert(
         self,
         model: Type,
@@ -118,11 +118,12 @@ class HIFLDInfraCollector(BaseCollector):
         """
         Collect electrical substations from HIFLD.
 
-        Uses ArcGIS REST API with pagination via resultOffset.
+        Uses ArcGIS REST API with pagination via resultOffset; pages are
+        fetched concurrently and upserted as they arrive.
         """
+        processed = 0
+        inserted = 0
         try:
-            all_substations = []
-            offset = 0
             page_size = 1000  # Rutgers mirror caps at 1000 per request
 
             # Build state filter if specified
@@ -131,77 +132,61 @@ class HIFLDInfraCollector(BaseCollector):
                 state_list = ", ".join(f"'{s}'" for s in config.states)
                 state_filter = f"STATE IN ({state_list})"
 
-            while True:
-                params = {
-                    "where": state_filter if state_filter else "1=1",
-                    "outFields": "*",
-                    "returnGeometry": "false",
-                    "f": "json",
-                    "resultOffset": offset,
-                    "resultRecordCount": page_size,
-                }
-
-                response = await self.fetch_json(
-                    self.SUBSTATIONS_URL,
-                    params=params,
-                    use_base_url=False,  # Use full URL
-                )
-
-                features = response.get("features", [])
-                if not features:
-                    break
-
-                all_substations.extend(features)
+            params = {
+                "where": state_filter if state_filter else "1=1",
+                "outFields": "*",
+                "returnGeometry": "false",
+                "f": "json",
+            }
+
+            async for features in self.iter_pages(
+                self.SUBSTATIONS_URL,
+                params=params,
+                per_page_key="resultRecordCount",
+                offset_key="resultOffset",
+                data_key="features",
+                per_page=page_size,
+                fetch=super().fetch_json,  # full URL; iter_pages rate-limits
+            ):
+                processed += len(features)
                 logger.info(
-                    f"Fetched {len(features)} substation records (total: {len(all_substations)})"
+                    f"Fetched {len(features)} substation records (total: {processed})"
                 )
 
-                # Check if we've reached the end
-                if len(features) < page_size and not response.get("exceededTransferLimit"):
-                    break
+                records = [
+                    r for r in map(self._transform_substation, features) if r
+                ]
+                if records:
+                    page_inserted, _ = self.bulk_upsert(
+                        Substation,
+                        records,
+                        unique_columns=["hifld_id"],
+                        update_columns=[
+                            "name",
+                            "state",
+                            "county",
+                            "city",
+                            "latitude",
+                            "longitude",
+                            "max_voltage_kv",
+                            "min_voltage_kv",
+                            "owner",
+                            "substation_type",
+                            "status",
+                            "collected_at",
+                        ],
+                    )
+                    inserted += page_inserted
 
-                offset += page_size
                 self.update_progress(
-                    len(all_substations),
-                    len(all_substations) + page_size,
-                    "Fetching substations",
-                )
-
-            # Transform records
-            records = []
-            for feature in all_substations:
-                transformed = self._transform_substation(feature)
-                if transformed:
-                    records.append(transformed)
-
-            # Insert into database
-            if records:
-                inserted, _ = self.bulk_upsert(
-                    Substation,
-                    records,
-                    unique_columns=["hifld_id"],
-                    update_columns=[
-                        "name",
-                        "state",
-                        "county",
-                        "city",
-                        "latitude",
-                        "longitude",
-                        "max_voltage_kv",
-                        "min_voltage_kv",
-                        "owner",
-                        "substation_type",
-                        "status",
-                        "collected_at",
-                    ],
+                    processed, processed + page_size, "Fetching substations"
                 )
-                return {"processed": len(all_substations), "inserted": inserted}
 
-            return {"processed": 0, "inserted": 0}
+            return {"processed": processed, "inserted": inserted}
 
         except Exception as e:
             logger.error(f"Failed to collect substations: {e}", exc_info=True)
-            return {"processed": 0, "inserted": 0, "error": str(e)}
+            return {"processed": processed, "inserted": inserted, "error": str(e)}
 
     def _transform_substation(
         self, feature: Dict[str, Any]
@@ -267,89 +252,72 @@ class HIFLDInfraCollector(BaseCollector):
         """
         Collect transmission lines from HIFLD ArcGIS FeatureServer.
 
-        Uses pagination via resultOffset.
+        Uses pagination via resultOffset (pages fetched concurrently).
         Note: Transmission lines have no STATE field — they span state boundaries.
         State filtering is not supported; all lines are collected.
         """
+        processed = 0
+        inserted = 0
         try:
-            all_lines = []
-            offset = 0
             page_size = 2000
 
-            while True:
-                params = {
-                    "where": "1=1",
-                    "outFields": "OBJECTID_1,OBJECTID,ID,OWNER,VOLTAGE,VOLT_CLASS,Shape__Length,TYPE,STATUS",
-                    "returnGeometry": "false",
-                    "f": "json",
-                    "resultOffset": offset,
-                    "resultRecordCount": page_size,
-                }
-
-                response = await self.fetch_json(
-                    self.TRANSMISSION_URL,
-                    params=params,
-                    use_base_url=False,
-                )
-
-                features = response.get("features", [])
-                if not features:
-                    break
-
-                all_lines.extend(features)
+            params = {
+                "where": "1=1",
+                "outFields": "OBJECTID_1,OBJECTID,ID,OWNER,VOLTAGE,VOLT_CLASS,Shape__Length,TYPE,STATUS",
+                "returnGeometry": "false",
+                "f": "json",
+            }
+
+            async for features in self.iter_pages(
+                self.TRANSMISSION_URL,
+                params=params,
+                per_page_key="resultRecordCount",
+                offset_key="resultOffset",
+                data_key="features",
+                per_page=page_size,
+                fetch=super().fetch_json,
+            ):
+                processed += len(features)
                 logger.info(
                     f"Fetched {len(features)} transmission line records "
-                    f"(total: {len(all_lines)})"
+                    f"(total: {processed})"
                 )
 
-                if len(features) < page_size and not response.get(
-                    "exceededTransferLimit"
-                ):
-                    break
+                records = [
+                    r for r in map(self._transform_transmission_line, features) if r
+                ]
+                if records:
+                    page_inserted, _ = self.bulk_upsert(
+                        TransmissionLine,
+                        records,
+                        unique_columns=["hifld_id"],
+                        update_columns=[
+                            "name",
+                            "state",
+                            "owner",
+                            "voltage_kv",
+                            "voltage_class",
+                            "num_circuits",
+                            "line_type",
+                            "sub_type",
+                            "length_miles",
+                            "status",
+                            "collected_at",
+                        ],
+                    )
+                    inserted += page_inserted
 
-                offset += page_size
                 self.update_progress(
-                    len(all_lines),
-                    len(all_lines) + page_size,
-                    "Fetching transmission lines",
-                )
-
-            # Transform records
-            records = []
-            for feature in all_lines:
-                transformed = self._transform_transmission_line(feature)
-                if transformed:
-                    records.append(transformed)
-
-            # Insert into database
-            if records:
-                inserted, _ = self.bulk_upsert(
-                    TransmissionLine,
-                    records,
-                    unique_columns=["hifld_id"],
-                    update_columns=[
-                        "name",
-                        "state",
-                        "owner",
-                        "voltage_kv",
-                        "voltage_class",
-                        "num_circuits",
-                        "line_type",
-                        "sub_type",
-                        "length_miles",
-                        "status",
-                        "collected_at",
-                    ],
+                    processed, processed + page_size, "Fetching transmission lines"
                 )
-                return {"processed": len(all_lines), "inserted": inserted}
 
-            return {"processed": 0, "inserted": 0}
+            return {"processed": processed, "inserted": inserted}
 
         except Exception as e:
             logger.error(
                 f"Failed to collect transmission lines: {e}", exc_info=True
             )
-            return {"processed": 0, "inserted": 0, "error": str(e)}
+            return {"processed": processed, "inserted": inserted, "error": str(e)}
 
     def _transform_transmission_line(
         self, feature: Dict[str, Any]
@@ -0,0 +1,80 @@
+"""Deal probability universe-run executor for the worker queue."""
+
+import asyncio
+import logging
+
+from sqlalchemy.orm import Session
+
+from app.core.models_queue import JobQueue
+from app.core.pg_notify import send_job_event
+
+logger = logging.getLogger(__name__)
+
+
+async def execute(job: JobQueue, db: Session):
+    """Score one shard of a universe run, or publish a finished run."""
+    from app.core.database import get_session_factory
+    from app.services.probability_batch import (
+        DEFAULT_CHUNK_SIZE,
+        publish_batch,
+        run_shard,
+    )
+
+    payload = job.payload or {}
+    action = payload.get("action", "score_shard")
+    batch_id = payload.get("batch_id")
+    if not batch_id:
+        raise ValueError("txn_probability job requires batch_id")
+
+    if action == "score_shard":
+        shard_index = payload.get("shard_index")
+        message = f"Scoring shard {shard_index} of {batch_id}"
+
+        def work(work_db):
+            return run_shard(
+                work_db, batch_id, shard_index,
+                chunk_size=payload.get("chunk_size", DEFAULT_CHUNK_SIZE),
+            )
+
+    elif action == "publish":
+        message = f"Publishing {batch_id}"
+
+        def work(work_db):
+            return publish_batch(work_db, batch_id)
+
+    else:
+        raise ValueError(f"Unknown txn_probability action: {action}")
+
+    send_job_event(
+        db,
+        "job_progress",
+        {
+            "job_id": job.id,
+            "job_type": "txn_probability",
+            "progress_pct": 10.0,
+            "progress_message": message,
+        },
+    )
+    db.commit()
+
+    # Scoring is synchronous and DB-bound — keep it off the event loop so
+    # heartbeats and other slots keep running. Fresh session per job.
+    def run():
+        work_db = get_session_factory()()
+        try:
+            return work(work_db)
+        finally:
+            work_db.close()
+
+    result = await asyncio.to_thread(run)
+
+    if action == "score_shard":
+        msg = (
+            f"Shard {shard_index}: {result.get('succeeded', 0)} scored, "
+            f"{result.get('failed', 0)} failed"
+        )
+    else:
+        msg = f"Published {batch_id}: {result.get('succeeded', 0)} companies scored"
+    job.progress_pct = 100.0
+    job.progress_message = msg
+    db.commit()
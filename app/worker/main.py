@@ -1,8 +1,9 @@
 """
 Worker process entrypoint.
 
-Polls job_queue for pending jobs, claims them via SELECT FOR UPDATE SKIP LOCKED,
-and routes to the appropriate executor. Sends progress via pg_notify.
+Blocks on LISTEN for job_queue notifications, claims up to the number of
+free slots in one UPDATE ... RETURNING with SELECT FOR UPDATE SKIP LOCKED,
+and routes each job to the appropriate executor. Sends progress via pg_notify.
 
 Each worker runs up to WORKER_MAX_CONCURRENT jobs simultaneously using an
 asyncio.Semaphore to bound concurrency.
@@ -12,8 +13,15 @@ Usage:
 
 Env vars:
     DATABASE_URL        — Required
-    WORKER_POLL_INTERVAL — Seconds between polls (default 2.0)
+    WORKER_POLL_INTERVAL — Seconds between polls when LISTEN is unavailable (default 2.0)
+    WORKER_LISTEN_FALLBACK_INTERVAL — Seconds between safety polls while LISTEN
+                          is connected (default 30.0)
     WORKER_MAX_CONCURRENT — Max concurrent jobs per worker (default 4)
+    WORKER_HEARTBEAT_INTERVAL — Seconds between heartbeat writes (default 30)
+    WORKER_CANCEL_CHECK_INTERVAL — Seconds between cancellation checks,
+                          i.e. worst-case cancel latency (default 10)
+    WORKER_PROCESS_POOL_SIZE — CPU process lane size, see app/worker/process_lane.py
+    WORKER_LANE_METRICS_INTERVAL — Seconds between lane metrics reports (default 60)
 """
 
 import asyncio
@@ -23,14 +31,17 @@ import signal
 import socket
 import uuid
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
 
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from app.core.database import get_session_factory
+from app.core.http_client import close_shared_pools, pool_stats
+from app.core.job_queue_service import JOB_QUEUE_CHANNEL, JOBS_PROMOTED_CHANNEL
 from app.core.models_queue import JobQueue, QueueJobStatus, QueueJobType
 from app.core.pg_notify import send_job_event
+from app.worker import process_lane
 
 # Configure logging
 logging.basicConfig(
@@ -40,9 +51,12 @@ logging.basicConfig(
 logger = logging.getLogger("worker")
 
 POLL_INTERVAL = float(os.getenv("WORKER_POLL_INTERVAL", "2.0"))
+LISTEN_FALLBACK_INTERVAL = float(os.getenv("WORKER_LISTEN_FALLBACK_INTERVAL", "30.0"))
 MAX_CONCURRENT = int(os.getenv("WORKER_MAX_CONCURRENT", "4"))
 DRAIN_TIMEOUT = float(os.getenv("WORKER_DRAIN_TIMEOUT", "30.0"))
-HEARTBEAT_INTERVAL = 30  # seconds
+HEARTBEAT_INTERVAL = float(os.getenv("WORKER_HEARTBEAT_INTERVAL", "30"))
+CANCEL_CHECK_INTERVAL = float(os.getenv("WORKER_CANCEL_CHECK_INTERVAL", "10"))
+LANE_METRICS_INTERVAL = float(os.getenv("WORKER_LANE_METRICS_INTERVAL", "60"))
 WORKER_ID = f"{socket.gethostname()}-{uuid.uuid4().hex[:8]}"
 
 # Graceful shutdown flag
@@ -64,7 +78,21 @@ signal.signal(signal.SIGINT, _handle_signal)
 # Executor registry
 # ---------------------------------------------------------------------------
 
+# job type -> async executor(job, db), and how the worker runs it. Job types
+# registered with ExecutionMode.PROCESS run their executor in the CPU
+# process lane instead of on the event loop (see process_lane.resolve_mode).
 EXECUTORS = {}
+EXECUTION_MODES: Dict[QueueJobType, process_lane.ExecutionMode] = {}
+
+
+def register_executor(
+    job_type: QueueJobType,
+    executor,
+    mode: process_lane.ExecutionMode = process_lane.ExecutionMode.ASYNC,
+) -> None:
+    """Register the executor for a job type and its execution mode."""
+    EXECUTORS[job_type] = executor
+    EXECUTION_MODES[job_type] = mode
 
 
 def _load_executors():
@@ -77,19 +105,19 @@ def _load_executors():
     from app.worker.executors.agentic import execute as agentic_exec
     from app.worker.executors.foot_traffic import execute as foot_traffic_exec
     from app.worker.executors.ingestion import execute as ingestion_exec
+    from app.worker.executors.txn_probability import execute as txn_probability_exec
 
-    EXECUTORS.update(
-        {
-            QueueJobType.SITE_INTEL: site_intel_exec,
-            QueueJobType.PEOPLE: people_exec,
-            QueueJobType.LP: lp_exec,
-            QueueJobType.PE: pe_exec,
-            QueueJobType.FO: fo_exec,
-            QueueJobType.AGENTIC: agentic_exec,
-            QueueJobType.FOOT_TRAFFIC: foot_traffic_exec,
-            QueueJobType.INGESTION: ingestion_exec,
-        }
-    )
+    register_executor(QueueJobType.SITE_INTEL, site_intel_exec)
+    register_executor(QueueJobType.PEOPLE, people_exec)
+    register_executor(QueueJobType.LP, lp_exec)
+    register_executor(QueueJobType.PE, pe_exec)
+    register_executor(QueueJobType.FO, fo_exec)
+    register_executor(QueueJobType.AGENTIC, agentic_exec)
+    register_executor(QueueJobType.FOOT_TRAFFIC, foot_traffic_exec)
+    register_executor(QueueJobType.INGESTION, ingestion_exec)
+    # Scoring is DB-bound and already runs in a thread (asyncio.to_thread),
+    # so it stays on the event loop rather than taking a CPU lane slot
+    register_executor(QueueJobType.TXN_PROBABILITY, txn_probability_exec)
 
 
 # ---------------------------------------------------------------------------
@@ -97,12 +125,18 @@ def _load_executors():
 # ---------------------------------------------------------------------------
 
 
-def claim_job(db: Session) -> Optional[JobQueue]:
+def claim_jobs(db: Session, limit: int, worker_id: str = WORKER_ID) -> List[int]:
     """
-    Claim a pending job using SELECT FOR UPDATE SKIP LOCKED.
+    Claim up to ``limit`` pending jobs in a single round trip.
 
-    Returns the claimed job or None if no jobs available.
+    Uses UPDATE ... WHERE id IN (SELECT ... FOR UPDATE SKIP LOCKED LIMIT n)
+    RETURNING id so concurrent workers never claim the same row.
+
+    Returns the claimed job IDs in priority order (may be empty).
     """
+    if limit <= 0:
+        return []
+
     result = db.execute(
         text("""
             UPDATE job_queue
@@ -110,31 +144,42 @@ def claim_job(db: Session) -> Optional[JobQueue]:
                 worker_id = :worker_id,
                 claimed_at = NOW(),
                 heartbeat_at = NOW()
-            WHERE id = (
+            WHERE id IN (
                 SELECT id FROM job_queue
                 WHERE status = :pending
                 ORDER BY priority DESC, created_at ASC
                 FOR UPDATE SKIP LOCKED
-                LIMIT 1
+                LIMIT :limit
             )
-            RETURNING id, job_type, payload, job_table_id
+            RETURNING id, priority, created_at
         """),
         {
             "claimed": QueueJobStatus.CLAIMED.value,
             "pending": QueueJobStatus.PENDING.value,
-            "worker_id": WORKER_ID,
+            "worker_id": worker_id,
+            "limit": limit,
         },
     )
-    row = result.fetchone()
-    if row is None:
-        db.commit()
-        return None
-
+    rows = result.fetchall()
     db.commit()
 
+    # RETURNING order is unspecified; start higher-priority jobs first
+    rows.sort(key=lambda r: (-(r[1] or 0), r[2]))
+    return [r[0] for r in rows]
+
+
+def claim_job(db: Session) -> Optional[JobQueue]:
+    """
+    Claim a single pending job using SELECT FOR UPDATE SKIP LOCKED.
+
+    Returns the claimed job or None if no jobs available.
+    """
+    job_ids = claim_jobs(db, 1)
+    if not job_ids:
+        return None
+
     # Load as ORM object for the executor
-    job = db.get(JobQueue, row[0])
-    return job
+    return db.get(JobQueue, job_ids[0])
 
 
 class JobCancelledError(Exception):
@@ -142,44 +187,132 @@ class JobCancelledError(Exception):
     pass
 
 
-async def _heartbeat_loop(db_factory, job_id: int):
+def _is_cancelled(status: Optional[str], error_message: Optional[str]) -> bool:
+    """A job is cancelled when marked FAILED with a 'Cancelled ...' error."""
+    return (
+        status == QueueJobStatus.FAILED.value
+        and bool(error_message)
+        and "Cancelled" in error_message
+    )
+
+
+class HeartbeatManager:
     """
-    Periodically update heartbeat_at while a job is executing.
+    Single heartbeat writer for every job running in this worker.
 
-    Also checks if the job has been cancelled (status set to FAILED with
-    'Cancelled by user' error). If so, raises JobCancelledError to stop
-    the executor.
+    Instead of one loop and one session per job, a single task:
+    - every HEARTBEAT_INTERVAL, updates heartbeat_at for all registered
+      jobs with one UPDATE ... RETURNING that also reads their status
+    - every CANCEL_CHECK_INTERVAL in between, reads statuses with one SELECT
+    and sets the cancel event of any job found cancelled.
     """
-    SessionLocal = db_factory
-    while True:
-        await asyncio.sleep(HEARTBEAT_INTERVAL)
-        session = SessionLocal()
-        try:
-            # Check if job was cancelled
-            result = session.execute(
-                text("SELECT status, error_message FROM job_queue WHERE id = :id"),
-                {"id": job_id},
-            )
-            row = result.fetchone()
-            if row and row[0] == QueueJobStatus.FAILED.value and row[1] and "Cancelled" in row[1]:
-                logger.info(f"Job {job_id} was cancelled — stopping execution")
-                session.close()
-                raise JobCancelledError(f"Job {job_id} cancelled by user")
 
-            session.execute(
-                text("UPDATE job_queue SET heartbeat_at = NOW() WHERE id = :id"),
-                {"id": job_id},
-            )
-            session.commit()
-        except JobCancelledError:
-            raise
-        except Exception:
-            session.rollback()
+    def __init__(
+        self,
+        heartbeat_interval: float = HEARTBEAT_INTERVAL,
+        cancel_check_interval: float = CANCEL_CHECK_INTERVAL,
+    ):
+        self.heartbeat_interval = heartbeat_interval
+        self.cancel_check_interval = min(cancel_check_interval, heartbeat_interval)
+        self._cancel_events: dict[int, asyncio.Event] = {}
+
+    def register(self, job_id: int) -> asyncio.Event:
+        """Track a running job; returns an event set when it is cancelled."""
+        event = self._cancel_events.get(job_id)
+        if event is None:
+            event = asyncio.Event()
+            self._cancel_events[job_id] = event
+        return event
+
+    def unregister(self, job_id: int) -> None:
+        """Stop tracking a job once it has finished."""
+        self._cancel_events.pop(job_id, None)
+
+    @property
+    def job_ids(self) -> List[int]:
+        return list(self._cancel_events)
+
+    def beat(
+        self, db: Session, write_heartbeat: bool, job_ids: Optional[List[int]] = None
+    ) -> List[int]:
+        """
+        Run one heartbeat/cancel-check round trip for all tracked jobs.
+
+        Runs in a worker thread (asyncio.to_thread), so it only talks to the
+        database and returns the IDs of jobs found cancelled; the caller
+        sets their events on the event loop with mark_cancelled().
+        """
+        if job_ids is None:
+            job_ids = self.job_ids
+        if not job_ids:
+            return []
+
+        if write_heartbeat:
+            sql = """
+                UPDATE job_queue SET heartbeat_at = NOW()
+                WHERE id = ANY(:ids)
+                RETURNING id, status, error_message
+            """
+        else:
+            sql = "SELECT id, status, error_message FROM job_queue WHERE id = ANY(:ids)"
+
+        rows = db.execute(text(sql), {"ids": job_ids}).fetchall()
+        db.commit()
+
+        return [
+            job_id
+            for job_id, status, error_message in rows
+            if _is_cancelled(status, error_message)
+        ]
+
+    def mark_cancelled(self, job_ids: List[int]) -> List[int]:
+        """Set the cancel events of the given jobs (event loop thread only).
+
+        Returns the jobs whose events were newly set.
+        """
+        newly_set = []
+        for job_id in job_ids:
+            event = self._cancel_events.get(job_id)
+            if event is not None and not event.is_set():
+                logger.info(f"Job {job_id} was cancelled — stopping execution")
+                event.set()
+                newly_set.append(job_id)
+        return newly_set
+
+    async def run(self, db_factory) -> None:
+        """Heartbeat loop; runs until cancelled by poll_loop shutdown."""
+        db = db_factory()
+        since_heartbeat = 0.0
+        try:
+            while True:
+                await asyncio.sleep(self.cancel_check_interval)
+                since_heartbeat += self.cancel_check_interval
+                write_heartbeat = since_heartbeat >= self.heartbeat_interval
+                if write_heartbeat:
+                    since_heartbeat = 0.0
+                try:
+                    cancelled = await asyncio.to_thread(
+                        self.beat, db, write_heartbeat, self.job_ids
+                    )
+                except Exception as e:
+                    logger.warning(f"Heartbeat round trip failed: {e}")
+                    try:
+                        db.rollback()
+                    except Exception:
+                        pass
+                    continue
+                self.mark_cancelled(cancelled)
         finally:
-            try:
-                session.close()
-            except Exception:
-                pass
+            db.close()
+
+
+_heartbeats = HeartbeatManager()
+
+
+async def _wait_for_cancel(job_id: int, cancel_event: asyncio.Event):
+    """Raise JobCancelledError once the heartbeat manager flags the job."""
+    await cancel_event.wait()
+    raise JobCancelledError(f"Job {job_id} cancelled by user")
 
 
 async def execute_job(job: JobQueue, db: Session):
@@ -250,15 +383,27 @@ async def execute_job(job: JobQueue, db: Session):
         except Exception:
             pass
 
-    # Start heartbeat (also monitors for cancellation)
-    SessionLocal = get_session_factory()
-    heartbeat_task = asyncio.create_task(_heartbeat_loop(SessionLocal, job.id))
-    executor_task = asyncio.create_task(executor(job, db))
+    # Register with the worker-wide heartbeat (also monitors for cancellation)
+    cancel_event = _heartbeats.register(job.id)
+    cancel_task = asyncio.create_task(_wait_for_cancel(job.id, cancel_event))
+    mode = process_lane.resolve_mode(
+        EXECUTION_MODES.get(job_type_enum, process_lane.ExecutionMode.ASYNC)
+    )
+    if mode == process_lane.ExecutionMode.PROCESS:
+        # Runs in a pool process with its own session. Cancelling only stops
+        # waiting here; the pool process notices the job is no longer
+        # RUNNING at its next status check and stops its executor.
+        executor_coro = process_lane.get_lane().run(
+            process_lane.run_job, job_type_enum.value, job.id
+        )
+    else:
+        executor_coro = executor(job, db)
+    executor_task = asyncio.create_task(executor_coro)
 
     try:
         # Wait for either the executor to finish or the heartbeat to detect cancellation
         done, pending = await asyncio.wait(
-            {executor_task, heartbeat_task},
+            {executor_task, cancel_task},
             return_when=asyncio.FIRST_COMPLETED,
             timeout=job_timeout_secs,  # None = no timeout (default if no config)
         )
@@ -266,13 +411,13 @@ async def execute_job(job: JobQueue, db: Session):
         # If timed out, done is empty
         if not done:
             executor_task.cancel()
-            heartbeat_task.cancel()
+            cancel_task.cancel()
             try:
                 await executor_task
             except (asyncio.CancelledError, Exception):
                 pass
             try:
-                await heartbeat_task
+                await cancel_task
             except (asyncio.CancelledError, Exception):
                 pass
             raise TimeoutError(
@@ -280,16 +425,16 @@ async def execute_job(job: JobQueue, db: Session):
             )
 
         # Check if heartbeat detected cancellation
-        if heartbeat_task in done:
-            heartbeat_exc = heartbeat_task.exception()
-            if isinstance(heartbeat_exc, JobCancelledError):
+        if cancel_task in done:
+            cancel_exc = cancel_task.exception()
+            if isinstance(cancel_exc, JobCancelledError):
                 # Cancel the executor
                 executor_task.cancel()
                 try:
                     await executor_task
                 except (asyncio.CancelledError, Exception):
                     pass
-                raise heartbeat_exc
+                raise cancel_exc
 
         # Executor finished — get its result (may raise)
         executor_task.result()
@@ -374,6 +519,8 @@ async def execute_job(job: JobQueue, db: Session):
         db.commit()
 
     finally:
+        _heartbeats.unregister(job.id)
+
         # Release rate limit slot
         if rate_limiter and source_name:
             rate_limiter.release(source_name)
@@ -392,7 +539,7 @@ async def execute_job(job: JobQueue, db: Session):
                 logger.error(f"Failed to promote blocked jobs for batch {batch_id}: {e}")
 
         # Clean up whichever task is still running
-        for t in (heartbeat_task, executor_task):
+        for t in (cancel_task, executor_task):
             if not t.done():
                 t.cancel()
                 try:
@@ -410,52 +557,136 @@ async def _run_slot(semaphore: asyncio.Semaphore, job: JobQueue, db: Session):
         semaphore.release()
 
 
+async def _lane_metrics_loop(db_factory) -> None:
+    """
+    Periodically log and publish process-lane queue depth and utilization,
+    and the shared HTTP pools' connection reuse and wait time.
+    """
+    while True:
+        await asyncio.sleep(LANE_METRICS_INTERVAL)
+        events = []
+        metrics = process_lane.lane_metrics()
+        for m in metrics:
+            logger.info(
+                f"Lane {m['lane']}: active={m['active']}/{m['pool_size']} "
+                f"queue_depth={m['queue_depth']} utilization={m['utilization']:.1%}"
+            )
+        if metrics:
+            events.append(("worker_lanes", {"worker_id": WORKER_ID, "lanes": metrics}))
+        pools = pool_stats()
+        for origin, p in pools.items():
+            logger.info(
+                f"HTTP pool {origin}: requests={p['requests']} opened={p['connections_opened']} "
+                f"reused={p['reused']} wait_max={p['wait_seconds_max']:.3f}s"
+            )
+        if pools:
+            events.append(("worker_http_pools", {"worker_id": WORKER_ID, "pools": pools}))
+        if not events:
+            continue
+        db = db_factory()
+        try:
+            for event_type, payload in events:
+                send_job_event(db, event_type, payload)
+            db.commit()
+        except Exception as e:
+            logger.debug(f"Lane metrics event skipped: {e}")
+            db.rollback()
+        finally:
+            db.close()
+
+
+async def _wait_for_wakeup(wakeup: asyncio.Event, timeout: float) -> None:
+    """Block until a NOTIFY arrives, shutdown is requested, or timeout elapses."""
+    waiters = [
+        asyncio.create_task(wakeup.wait()),
+        asyncio.create_task(_shutdown.wait()),
+    ]
+    try:
+        await asyncio.wait(waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for w in waiters:
+            w.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+
+
 async def poll_loop():
     """
-    Main poll loop with concurrent execution.
+    Main dispatch loop with concurrent execution.
 
-    Uses a semaphore to bound the number of concurrent jobs per worker.
-    Each claimed job runs in its own asyncio task within a slot.
+    Claims as many jobs as there are free slots in one round trip. When the
+    queue is empty it blocks on LISTEN (job_queue / jobs_promoted channels)
+    and only re-polls on LISTEN_FALLBACK_INTERVAL, or POLL_INTERVAL while the
+    listener is disconnected. When all slots are busy it waits for a running
+    job to finish instead of busy-waiting.
     """
+    from app.core.pg_listener import ChannelWakeupListener
+
     _load_executors()
 
     SessionLocal = get_session_factory()
     semaphore = asyncio.Semaphore(MAX_CONCURRENT)
     active_tasks: set = set()
 
+    wakeup = asyncio.Event()
+    listener = ChannelWakeupListener([JOB_QUEUE_CHANNEL, JOBS_PROMOTED_CHANNEL], wakeup)
+    listener.start()
+    heartbeat_task = asyncio.create_task(_heartbeats.run(SessionLocal))
+    process_lane.enable_lanes()
+    metrics_task = asyncio.create_task(_lane_metrics_loop(SessionLocal))
+
     logger.info(
-        f"Worker {WORKER_ID} starting poll loop "
-        f"(interval={POLL_INTERVAL}s, max_concurrent={MAX_CONCURRENT})"
+        f"Worker {WORKER_ID} starting dispatch loop "
+        f"(poll_interval={POLL_INTERVAL}s, listen_fallback={LISTEN_FALLBACK_INTERVAL}s, "
+        f"max_concurrent={MAX_CONCURRENT}, heartbeat={HEARTBEAT_INTERVAL}s, "
+        f"cancel_check={CANCEL_CHECK_INTERVAL}s)"
     )
 
     while not _shutdown.is_set():
-        # If all slots are full, wait briefly before checking again
-        if semaphore._value == 0:
-            await asyncio.sleep(0.5)
+        free_slots = MAX_CONCURRENT - len(active_tasks)
+        if free_slots <= 0:
+            # All slots busy — wake as soon as any job finishes
+            await asyncio.wait(
+                active_tasks, timeout=POLL_INTERVAL, return_when=asyncio.FIRST_COMPLETED
+            )
             continue
 
+        # Clear before claiming so a NOTIFY that races the claim is not lost
+        wakeup.clear()
+
         db = SessionLocal()
         try:
-            job = claim_job(db)
-            if job:
-                logger.info(
-                    f"Claimed job {job.id} (type={job.job_type}, priority={job.priority})"
-                )
-                await semaphore.acquire()
-                task = asyncio.create_task(_run_slot(semaphore, job, db))
-                active_tasks.add(task)
-                task.add_done_callback(active_tasks.discard)
-            else:
-                db.close()
-                # No jobs available — wait before polling again
-                try:
-                    await asyncio.wait_for(_shutdown.wait(), timeout=POLL_INTERVAL)
-                except asyncio.TimeoutError:
-                    pass
+            job_ids = claim_jobs(db, free_slots)
         except Exception as e:
             logger.error(f"Poll loop error: {e}", exc_info=True)
-            db.close()
             await asyncio.sleep(POLL_INTERVAL)
+            continue
+        finally:
+            db.close()
+
+        for job_id in job_ids:
+            job_db = SessionLocal()
+            try:
+                job = job_db.get(JobQueue, job_id)
+            except Exception as e:
+                logger.error(f"Failed to load claimed job {job_id}: {e}")
+                job_db.close()
+                continue
+            logger.info(
+                f"Claimed job {job.id} (type={job.job_type}, priority={job.priority})"
+            )
+            await semaphore.acquire()
+            task = asyncio.create_task(_run_slot(semaphore, job, job_db))
+            active_tasks.add(task)
+            task.add_done_callback(active_tasks.discard)
+
+        if job_ids:
+            continue
+
+        # No jobs available — block on NOTIFY, polling only as a fallback
+        timeout = LISTEN_FALLBACK_INTERVAL if listener.connected else POLL_INTERVAL
+        await _wait_for_wakeup(wakeup, timeout)
+
+    listener.stop()
 
     # Graceful shutdown: drain active tasks with timeout
     if active_tasks:
@@ -488,6 +719,13 @@ async def poll_loop():
             except Exception as e:
                 logger.error(f"Drain cleanup failed: {e}")
 
+    # Keep heartbeating through the drain, then stop
+    for t in (heartbeat_task, metrics_task):
+        t.cancel()
+    await asyncio.gather(heartbeat_task, metrics_task, return_exceptions=True)
+    process_lane.shutdown_lanes(wait=False)
+    await close_shared_pools()
+
     logger.info(f"Worker {WORKER_ID} shut down cleanly")
 
 
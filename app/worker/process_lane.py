@@ -0,0 +1,249 @@
+"""
+Process-pool execution lane for CPU-bound work in the worker.
+
+The worker runs every executor as an asyncio task on one event loop, so a
+CPU-heavy stage (HTML cleaning, XBRL parsing, scoring passes) stalls the
+heartbeats and progress NOTIFYs of every other job in the process. This
+module offloads that work to a ProcessPoolExecutor:
+
+- Whole jobs: job types registered with ExecutionMode.PROCESS in the
+  worker's executor registry run their executor in a pool process with its
+  own DB session (see run_job).
+- Marked stages: code calls ``await run_cpu_bound(func, *args)`` from
+  app.core.cpu_offload. enable_lanes() installs the lane as that hook's
+  runner, so inside the worker the stage runs in the pool; everywhere else
+  (API process, tests, scripts) it runs inline exactly as before.
+
+Pool processes are started with the "spawn" method: the worker holds a
+LISTEN thread and pooled DB connections that must not be inherited by fork.
+
+Cancellation: the parent cannot interrupt a pool process, so run_job
+watches the job row and cancels its own executor once the parent has
+given up on the job (cancelled, timed out or failed). A long synchronous
+stage only stops at its next await; the lane slot stays busy until then.
+
+Env vars:
+    WORKER_PROCESS_POOL_SIZE — Processes in the CPU lane (default 2, 0 disables)
+"""
+
+import asyncio
+import enum
+import logging
+import multiprocessing
+import os
+import signal
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from app.core import cpu_offload
+
+logger = logging.getLogger(__name__)
+
+PROCESS_POOL_SIZE = int(os.getenv("WORKER_PROCESS_POOL_SIZE", "2"))
+
+# Seconds between job-status checks by a job running in the lane
+LANE_CANCEL_CHECK_INTERVAL = float(os.getenv("WORKER_CANCEL_CHECK_INTERVAL", "10"))
+
+CPU_LANE = "cpu"
+
+
+class ExecutionMode(str, enum.Enum):
+    """How a job type's executor is run by the worker."""
+
+    ASYNC = "async"  # asyncio task on the worker event loop (default)
+    PROCESS = "process"  # whole executor in the CPU process lane
+
+
+def _init_lane_process() -> None:
+    """Pool process initializer: leave signal handling to the parent worker."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    logging.basicConfig(
+        level=os.getenv("LOG_LEVEL", "INFO"),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+
+
+def _timed_call(func: Callable, args: tuple, kwargs: dict) -> tuple:
+    """Run func in the pool process and report when it actually ran."""
+    started = time.time()
+    result = func(*args, **kwargs)
+    return result, started, time.time()
+
+
+class ProcessLane:
+    """
+    A named ProcessPoolExecutor with queue-depth and utilization accounting.
+
+    Tasks are FIFO, so with ``in_flight`` submitted-but-unfinished tasks,
+    ``min(in_flight, max_workers)`` are running and the rest are queued.
+    Utilization is busy process-seconds over available process-seconds
+    since the lane started.
+    """
+
+    def __init__(self, name: str, max_workers: int):
+        self.name = name
+        self.max_workers = max_workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._started_at = time.time()
+        self.in_flight = 0
+        self.completed = 0
+        self.failed = 0
+        self.busy_seconds = 0.0
+        self.wait_seconds = 0.0
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_lane_process,
+            )
+            self._started_at = time.time()
+        return self._pool
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """Run a picklable callable in the pool and await its result."""
+        loop = asyncio.get_running_loop()
+        submitted = time.time()
+        self.in_flight += 1
+        try:
+            result, started, finished = await loop.run_in_executor(
+                self._get_pool(), _timed_call, func, args, kwargs
+            )
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self.in_flight -= 1
+
+        self.completed += 1
+        self.wait_seconds += max(0.0, started - submitted)
+        self.busy_seconds += max(0.0, finished - started)
+        return result
+
+    @property
+    def active(self) -> int:
+        return min(self.in_flight, self.max_workers)
+
+    @property
+    def queue_depth(self) -> int:
+        return max(0, self.in_flight - self.max_workers)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot of lane load for logging / worker events."""
+        elapsed = max(time.time() - self._started_at, 1e-9)
+        finished = self.completed + self.failed
+        return {
+            "lane": self.name,
+            "pool_size": self.max_workers,
+            "active": self.active,
+            "queue_depth": self.queue_depth,
+            "completed": self.completed,
+            "failed": self.failed,
+            "utilization": round(self.busy_seconds / (elapsed * self.max_workers), 4),
+            "avg_wait_seconds": round(self.wait_seconds / finished, 4) if finished else 0.0,
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=True)
+            self._pool = None
+
+
+_lanes: Dict[str, ProcessLane] = {}
+
+
+def enable_lanes(pool_size: int = PROCESS_POOL_SIZE) -> None:
+    """Create the CPU lane. Called once by the worker at startup."""
+    if pool_size > 0 and CPU_LANE not in _lanes:
+        _lanes[CPU_LANE] = ProcessLane(CPU_LANE, pool_size)
+        cpu_offload.set_cpu_runner(_lanes[CPU_LANE].run)
+        logger.info(f"Process lane '{CPU_LANE}' enabled (pool_size={pool_size})")
+
+
+def get_lane(name: str = CPU_LANE) -> Optional[ProcessLane]:
+    """Return the named lane, or None if lanes are not enabled in this process."""
+    return _lanes.get(name)
+
+
+def lane_metrics() -> list:
+    """Metrics for every enabled lane."""
+    return [lane.metrics() for lane in _lanes.values()]
+
+
+def shutdown_lanes(wait: bool = True) -> None:
+    """Shut down all lane pools (worker shutdown)."""
+    cpu_offload.set_cpu_runner(None)
+    for lane in _lanes.values():
+        lane.shutdown(wait=wait)
+    _lanes.clear()
+
+
+def resolve_mode(mode: ExecutionMode) -> ExecutionMode:
+    """Effective mode: PROCESS jobs run on the loop when no lane is enabled."""
+    if mode == ExecutionMode.PROCESS and get_lane(CPU_LANE) is None:
+        return ExecutionMode.ASYNC
+    return mode
+
+
+def _job_abandoned(session_factory, job_id: int) -> bool:
+    """True once the parent worker no longer considers the job running."""
+    from app.core.models_queue import JobQueue, QueueJobStatus
+
+    db = session_factory()
+    try:
+        job = db.get(JobQueue, job_id)
+        return job is None or job.status != QueueJobStatus.RUNNING
+    finally:
+        db.close()
+
+
+async def _run_until_abandoned(
+    executor, job, db, session_factory, interval: float = LANE_CANCEL_CHECK_INTERVAL
+) -> None:
+    """Run the executor, cancelling it if the job stops being RUNNING."""
+    task = asyncio.create_task(executor(job, db))
+    while True:
+        done, _ = await asyncio.wait({task}, timeout=interval)
+        if done:
+            task.result()
+            return
+        try:
+            abandoned = await asyncio.to_thread(_job_abandoned, session_factory, job.id)
+        except Exception as e:
+            logger.warning(f"Job {job.id}: lane status check failed: {e}")
+            continue
+        if abandoned:
+            logger.info(f"Job {job.id}: no longer running in the worker, stopping lane executor")
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            return
+
+
+def run_job(job_type: str, job_id: int) -> None:
+    """
+    Execute a whole queued job inside a pool process.
+
+    Opens its own DB session and runs the registered async executor on a
+    private event loop. Status transitions (running/success/failed) stay
+    with the parent worker's execute_job; this side only stops early when
+    the parent has marked the job finished (see _run_until_abandoned).
+    """
+    from app.core.database import get_session_factory
+    from app.core.models_queue import JobQueue, QueueJobType
+    from app.worker import main as worker_main
+
+    _init_lane_process()  # re-assert after importing the worker module
+    if not worker_main.EXECUTORS:
+        worker_main._load_executors()
+    executor = worker_main.EXECUTORS[QueueJobType(job_type)]
+
+    session_factory = get_session_factory()
+    db = session_factory()
+    try:
+        job = db.get(JobQueue, job_id)
+        asyncio.run(_run_until_abandoned(executor, job, db, session_factory))
+    finally:
+        db.close()
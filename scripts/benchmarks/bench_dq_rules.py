@@ -0,0 +1,159 @@
+"""
+Benchmark: nightly data quality rule evaluation, per-rule vs fused scans.
+
+Builds --tables synthetic tables of --rows rows each and a nightly-style
+rule set per table (range, not_null, unique, enum, comparison, freshness,
+row_count, regex), then times:
+- per-rule: evaluate_rule for every (rule, table) pair — one scan per rule,
+            as evaluate_all_rules did before
+- fused:    evaluate_rules_for_table per table — one aggregate scan for
+            all fusable rules, one shared scan for regex rules
+
+Results are checked to be identical. Scratch tables are dropped afterwards.
+
+WARNING: when pointing --database-url at Postgres use a scratch database.
+
+Usage:
+    python scripts/benchmarks/bench_dq_rules.py
+    python scripts/benchmarks/bench_dq_rules.py --database-url postgresql://... --tables 5 --rows 1000000
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from sqlalchemy import create_engine, text  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app.core.data_quality_service import (  # noqa: E402
+    evaluate_rule,
+    evaluate_rules_for_table,
+)
+from app.core.models import DataQualityRule, RuleSeverity, RuleType  # noqa: E402
+
+STATES = ["CA", "NY", "TX", "FL", "WA", "IL"]
+
+
+def _rules() -> List[DataQualityRule]:
+    specs = [
+        (RuleType.RANGE, "price", {"min": 0, "max": 1000}),
+        (RuleType.RANGE, "qty", {"min": 0}),
+        (RuleType.NOT_NULL, "state", {}),
+        (RuleType.NOT_NULL, "code", {}),
+        (RuleType.UNIQUE, "code", {}),
+        (RuleType.ENUM, "state", {"allowed": STATES}),
+        (RuleType.COMPARISON, "low", {"operator": "<=", "compare_column": "high"}),
+        (RuleType.FRESHNESS, "updated_at", {"max_age_days": 7}),
+        (RuleType.ROW_COUNT, None, {"min": 1}),
+        (RuleType.REGEX, "code", {"pattern": r"[A-Z]{3}-\d+$"}),
+    ]
+    return [
+        DataQualityRule(
+            id=i, name=f"{rule_type.value}:{column}", rule_type=rule_type,
+            column_name=column, parameters=params, severity=RuleSeverity.ERROR,
+        )
+        for i, (rule_type, column, params) in enumerate(specs, 1)
+    ]
+
+
+def _create_tables(db, n_tables: int, n_rows: int, rng: random.Random) -> List[str]:
+    names = []
+    now = datetime.utcnow()
+    for t in range(n_tables):
+        name = f"bench_dq_{t}"
+        db.execute(text(f"DROP TABLE IF EXISTS {name}"))
+        db.execute(text(
+            f"CREATE TABLE {name} (id INTEGER PRIMARY KEY, code VARCHAR(20), state VARCHAR(4),"
+            " price FLOAT, qty INTEGER, low FLOAT, high FLOAT, updated_at TIMESTAMP)"
+        ))
+        rows = []
+        for i in range(n_rows):
+            low = rng.uniform(0, 100)
+            rows.append({
+                "id": i + 1,
+                "code": None if rng.random() < 0.001 else f"ABC-{i}",
+                "state": rng.choice(STATES) if rng.random() > 0.002 else None,
+                "price": rng.uniform(-1, 1100) if rng.random() < 0.01 else rng.uniform(0, 999),
+                "qty": rng.randint(0, 50),
+                "low": low,
+                "high": low + rng.uniform(-1, 50),
+                "updated_at": now - timedelta(hours=rng.uniform(0, 48)),
+            })
+            if len(rows) == 10000:
+                _insert(db, name, rows)
+                rows = []
+        if rows:
+            _insert(db, name, rows)
+        db.commit()
+        names.append(name)
+    return names
+
+
+def _insert(db, name: str, rows: List[dict]) -> None:
+    db.execute(
+        text(
+            f"INSERT INTO {name} (id, code, state, price, qty, low, high, updated_at)"
+            " VALUES (:id, :code, :state, :price, :qty, :low, :high, :updated_at)"
+        ),
+        rows,
+    )
+
+
+def _comparable(results):
+    return [
+        {k: v for k, v in vars(r).items() if k != "execution_time_ms"} for r in results
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--database-url", default="sqlite://", help="Scratch database (default: in-memory SQLite)")
+    parser.add_argument("--tables", type=int, default=5)
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--repeat", type=int, default=3, help="Best-of repetitions")
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    db = sessionmaker(bind=engine)()
+    rules = _rules()
+    print(f"Building {args.tables} tables x {args.rows} rows ...")
+    tables = _create_tables(db, args.tables, args.rows, random.Random(args.seed))
+
+    try:
+        timings = {"per-rule": [], "fused": []}
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            per_rule = [[evaluate_rule(db, r, t) for r in rules] for t in tables]
+            db.rollback()
+            timings["per-rule"].append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            fused = [evaluate_rules_for_table(db, rules, t) for t in tables]
+            db.rollback()
+            timings["fused"].append(time.perf_counter() - started)
+
+            assert [_comparable(r) for r in fused] == [_comparable(r) for r in per_rule]
+
+        failed = sum(1 for table in fused for r in table if not r.passed)
+        print(f"{len(rules)} rules x {len(tables)} tables, {failed} failing evaluations\n")
+        print(f"{'mode':>10}{'best s':>10}{'evals/s':>10}")
+        for mode, samples in timings.items():
+            best = min(samples)
+            print(f"{mode:>10}{best:>10.2f}{len(rules) * len(tables) / best:>10.1f}")
+        print(f"\nspeedup: {min(timings['per-rule']) / min(timings['fused']):.1f}x")
+    finally:
+        for name in tables:
+            db.execute(text(f"DROP TABLE IF EXISTS {name}"))
+        db.commit()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
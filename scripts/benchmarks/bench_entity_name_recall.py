@@ -0,0 +1,197 @@
+"""
+Benchmark: EntityResolver name-only matching — trigram top-K vs exhaustive scan.
+
+Seeds --entities synthetic companies (each with 1-3 aliases) under a
+throwaway entity_type, then resolves --queries perturbed names (typos,
+dropped/added suffixes, abbreviations) through both paths:
+- exhaustive: EntityResolver(use_name_index=False) — every alias scored
+- indexed:    pg_trgm top-K candidates (--k per source) scored
+
+Reports latency (p50 / p95) per path and recall of the indexed path
+against the exhaustive one:
+- top1:    same best entity
+- matches: fraction of exhaustive above-threshold entities also returned
+
+WARNING: run against a scratch database. Rows are created under entity_type
+"bench_<run id>" and deleted afterwards.
+
+Usage:
+    DATABASE_URL=postgresql://... python scripts/benchmarks/bench_entity_name_recall.py
+    python scripts/benchmarks/bench_entity_name_recall.py --entities 100000 --queries 200 --k 50
+"""
+
+import argparse
+import random
+import statistics
+import string
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from sqlalchemy import text  # noqa: E402
+
+from app.core.database import create_tables, get_session_factory  # noqa: E402
+from app.core.entity_resolver import EntityResolver  # noqa: E402
+
+_WORDS = [
+    "acme", "summit", "harbor", "granite", "pioneer", "atlas", "beacon", "cedar",
+    "delta", "evergreen", "frontier", "golden", "horizon", "iron", "juniper",
+    "keystone", "liberty", "meridian", "northstar", "oak", "pacific", "quantum",
+    "redwood", "sterling", "titan", "union", "vanguard", "westfield", "zenith",
+]
+_KINDS = [
+    "capital", "partners", "holdings", "ventures", "technology", "systems",
+    "industries", "group", "management", "investments", "energy", "health",
+]
+_SUFFIXES = ["", " inc", " llc", " corp", " lp", " ltd"]
+
+
+def _random_name(rng: random.Random) -> str:
+    words = rng.sample(_WORDS, rng.choice([1, 2])) + [rng.choice(_KINDS)]
+    return " ".join(words) + f" {rng.randint(1, 9999)}"
+
+
+def _perturb(name: str, rng: random.Random) -> str:
+    """A query variant of an existing name: typo, suffix or word drop."""
+    roll = rng.random()
+    if roll < 0.5:
+        i = rng.randrange(len(name))
+        return name[:i] + rng.choice(string.ascii_lowercase) + name[i + 1:]
+    if roll < 0.8:
+        return name + rng.choice(_SUFFIXES[1:])
+    if roll < 0.9:
+        i = rng.randrange(len(name))
+        return name[:i] + name[i + 1:]
+    return rng.choice(_SUFFIXES[1:]).strip() + " " + name
+
+
+def _seed(entity_type: str, n: int, rng: random.Random) -> List[str]:
+    SessionLocal = get_session_factory()
+    db = SessionLocal()
+    names = [_random_name(rng) for _ in range(n)]
+    try:
+        for start in range(0, n, 5000):
+            chunk = names[start:start + 5000]
+            db.execute(
+                text(
+                    "INSERT INTO canonical_entities "
+                    "(entity_type, canonical_name, normalized_name, alias_count, source_count, "
+                    " is_verified, created_at, updated_at, created_by) "
+                    "VALUES (:t, :n, :n, 1, 1, false, NOW(), NOW(), 'benchmark')"
+                ),
+                [{"t": entity_type, "n": name} for name in chunk],
+            )
+        db.execute(
+            text(
+                "INSERT INTO entity_aliases "
+                "(canonical_entity_id, alias_name, normalized_alias, is_primary, "
+                " is_manual_override, created_at, created_by) "
+                "SELECT id, normalized_name, normalized_name, true, false, NOW(), 'benchmark' "
+                "FROM canonical_entities WHERE entity_type = :t"
+            ),
+            {"t": entity_type},
+        )
+        # Secondary aliases for about half the entities
+        db.execute(
+            text(
+                "INSERT INTO entity_aliases "
+                "(canonical_entity_id, alias_name, normalized_alias, is_primary, "
+                " is_manual_override, created_at, created_by) "
+                "SELECT id, normalized_name || ' group', normalized_name || ' group', "
+                "       false, false, NOW(), 'benchmark' "
+                "FROM canonical_entities WHERE entity_type = :t AND id % 2 = 0"
+            ),
+            {"t": entity_type},
+        )
+        db.commit()
+        db.execute(text("ANALYZE canonical_entities"))
+        db.execute(text("ANALYZE entity_aliases"))
+        db.commit()
+    finally:
+        db.close()
+    return names
+
+
+def _cleanup(entity_type: str) -> None:
+    SessionLocal = get_session_factory()
+    db = SessionLocal()
+    try:
+        db.execute(
+            text("DELETE FROM canonical_entities WHERE entity_type = :t"),
+            {"t": entity_type},
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+def _run(
+    match: Callable[[str, str], list], entity_type: str, queries: List[str]
+) -> Tuple[List[list], List[float]]:
+    results, latencies = [], []
+    for q in queries:
+        started = time.perf_counter()
+        matches = match(entity_type, q)
+        latencies.append((time.perf_counter() - started) * 1000)
+        results.append([(e.id, s) for e, s in matches])
+    return results, latencies
+
+
+def _pct(values: List[float], p: float) -> float:
+    ordered = sorted(values)
+    return ordered[max(0, int(len(ordered) * p) - 1)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--entities", type=int, default=20000, help="Synthetic entities to seed")
+    parser.add_argument("--queries", type=int, default=100, help="Perturbed names to resolve")
+    parser.add_argument("--k", type=int, default=EntityResolver.NAME_CANDIDATE_LIMIT,
+                        help="Trigram candidates per source")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    create_tables()
+    rng = random.Random(args.seed)
+    entity_type = f"bench_{uuid.uuid4().hex[:8]}"
+
+    print(f"Seeding {args.entities} entities as entity_type={entity_type} ...")
+    names = _seed(entity_type, args.entities, rng)
+    SessionLocal = get_session_factory()
+    db = SessionLocal()
+    try:
+        exhaustive = EntityResolver(db, use_name_index=False)
+        indexed = EntityResolver(db, name_candidate_limit=args.k)
+        if not indexed.ensure_name_index():
+            print("pg_trgm is not available on this database; nothing to compare.")
+            return
+
+        queries = [exhaustive.normalize_name(_perturb(rng.choice(names), rng))
+                   for _ in range(args.queries)]
+
+        base, base_ms = _run(exhaustive._match_by_name_only, entity_type, queries)
+        fast, fast_ms = _run(indexed._match_by_name_only, entity_type, queries)
+    finally:
+        db.close()
+        _cleanup(entity_type)
+
+    with_match = [i for i, r in enumerate(base) if r]
+    top1 = sum(1 for i in with_match if fast[i] and fast[i][0][0] == base[i][0][0])
+    expected = sum(len(base[i]) for i in with_match)
+    found = sum(len({e for e, _ in base[i]} & {e for e, _ in fast[i]}) for i in with_match)
+
+    print(f"{'path':<12}{'p50 ms':>10}{'p95 ms':>10}")
+    print(f"{'exhaustive':<12}{statistics.median(base_ms):>10.2f}{_pct(base_ms, 0.95):>10.2f}")
+    print(f"{'indexed':<12}{statistics.median(fast_ms):>10.2f}{_pct(fast_ms, 0.95):>10.2f}")
+    print(f"queries with an exhaustive match: {len(with_match)}/{len(queries)}")
+    if with_match:
+        print(f"recall top1:    {top1 / len(with_match):.4f}")
+        print(f"recall matches: {found / expected:.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark: CompanyNameMatcher.deduplicate_batch throughput.
+
+Deduplicates scraped-portfolio-like batches (company names with suffix,
+casing and typo variants; see bench_fuzzy_similarity.corpus) at each size
+in --sizes and reports records/sec and groups found. Up to --baseline-max
+records, the previous algorithm (compare each name with every group key,
+in input order) is timed as well and its group count shown for reference.
+
+No database is needed.
+
+Usage:
+    python scripts/benchmarks/bench_fuzzy_dedup.py
+    python scripts/benchmarks/bench_fuzzy_dedup.py --sizes 2000,10000,100000 --baseline-max 2000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from app.agentic.fuzzy_matcher import CompanyNameMatcher, similarity_ratio  # noqa: E402
+from scripts.benchmarks.bench_fuzzy_similarity import corpus  # noqa: E402
+
+
+def _baseline_groups(names: List[str], threshold: float) -> int:
+    """Group count of the previous O(n * groups) scan."""
+    keys: List[str] = []
+    for name in names:
+        if not any(similarity_ratio(name, key) >= threshold for key in keys):
+            keys.append(name)
+    return len(keys)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", default="10000,100000", help="Comma-separated batch sizes")
+    parser.add_argument("--threshold", type=float, default=0.85)
+    parser.add_argument("--baseline-max", type=int, default=2000,
+                        help="Largest batch also run through the previous algorithm")
+    parser.add_argument("--seed", type=int, default=9)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'records':>10}{'distinct':>10}{'groups':>10}{'seconds':>10}{'rec/s':>12}"
+          f"{'old groups':>12}{'old s':>10}{'speedup':>9}")
+    for n in (int(s) for s in args.sizes.split(",")):
+        # corpus() returns normalized names; re-normalizing is a no-op
+        names = corpus(n, rng)
+        records = [{"company_name": name} for name in names]
+        matcher = CompanyNameMatcher(similarity_threshold=args.threshold)
+
+        started = time.perf_counter()
+        result = matcher.deduplicate_batch(records)
+        elapsed = time.perf_counter() - started
+
+        old_groups, old_elapsed, speedup = "-", "-", "-"
+        if n <= args.baseline_max:
+            started = time.perf_counter()
+            old_groups = _baseline_groups(names, args.threshold)
+            old_elapsed = time.perf_counter() - started
+            speedup = f"{old_elapsed / elapsed:.1f}"
+            old_elapsed = f"{old_elapsed:.1f}"
+
+        print(f"{n:>10}{len(set(names)):>10}{len(result):>10}{elapsed:>10.2f}{n / elapsed:>12.0f}"
+              f"{old_groups:>12}{old_elapsed:>10}{speedup:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Benchmark: batch string-similarity backends vs the pure-Python similarity_ratio.
+
+Builds a realistic company-name corpus (multi-word names with industry
+words, legal suffixes and typo variants, normalized by CompanyNameMatcher)
+and measures candidate comparisons per second for:
+- loop:      [similarity_ratio(q, c) for c in candidates]  (current code path)
+- python / numpy / rapidfuzz: similarity_one_to_many at --threshold
+- many-to-many: --queries x corpus via similarity_many_to_many
+
+Also checks every backend agrees with the loop at or above the threshold.
+No database is needed.
+
+Usage:
+    python scripts/benchmarks/bench_fuzzy_similarity.py
+    python scripts/benchmarks/bench_fuzzy_similarity.py --sizes 1000,10000,50000 --threshold 0.85
+"""
+
+import argparse
+import random
+import string
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import numpy as np  # noqa: E402
+
+from app.agentic.fuzzy_matcher import (  # noqa: E402
+    RAPIDFUZZ_AVAILABLE,
+    CompanyNameMatcher,
+    similarity_many_to_many,
+    similarity_one_to_many,
+    similarity_ratio,
+)
+
+_FIRST = [
+    "american", "global", "pacific", "united", "first", "northern", "summit",
+    "blue", "green", "liberty", "pinnacle", "heritage", "apex", "coastal",
+    "silver", "cardinal", "sterling", "evergreen", "keystone", "meridian",
+]
+_SECOND = [
+    "health", "energy", "logistics", "software", "capital", "foods", "medical",
+    "dental", "aerospace", "materials", "robotics", "analytics", "pharma",
+    "insurance", "realty", "water", "telecom", "biosciences", "outdoor", "auto",
+]
+_THIRD = ["group", "partners", "holdings", "solutions", "systems", "services", "labs", ""]
+_SUFFIX = ["Inc.", "LLC", "Corp", "Corporation", "Ltd", "L.P.", "Co.", ""]
+
+
+def corpus(n: int, rng: random.Random) -> List[str]:
+    matcher = CompanyNameMatcher()
+    names = []
+    for _ in range(n):
+        name = " ".join(
+            w for w in (rng.choice(_FIRST), rng.choice(_SECOND), rng.choice(_THIRD)) if w
+        ).title()
+        if rng.random() < 0.3:
+            i = rng.randrange(len(name))
+            name = name[:i] + rng.choice(string.ascii_lowercase) + name[i + 1:]
+        names.append(matcher.normalize(f"{name} {rng.choice(_SUFFIX)}".strip()))
+    return names
+
+
+def _rate(func, comparisons: int, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return comparisons / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", default="1000,10000,50000", help="Corpus sizes (one-to-many)")
+    parser.add_argument("--threshold", type=float, default=0.85)
+    parser.add_argument("--queries", type=int, default=100, help="Queries for many-to-many")
+    parser.add_argument("--m2m-size", type=int, default=10000, help="Corpus size for many-to-many")
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    backends = ["python", "numpy"] + (["rapidfuzz"] if RAPIDFUZZ_AVAILABLE else [])
+    if not RAPIDFUZZ_AVAILABLE:
+        print("rapidfuzz not installed; skipping the native backend")
+
+    print(f"one-to-many (threshold={args.threshold}), comparisons/sec")
+    print(f"{'corpus':>8}{'loop':>12}" + "".join(f"{b:>12}" for b in backends) + f"{'best x':>8}")
+    for n in (int(s) for s in args.sizes.split(",")):
+        names = corpus(n, rng)
+        query = names[rng.randrange(n)]
+
+        expected = np.array([similarity_ratio(query, c) for c in names])
+        expected[expected < args.threshold] = 0.0
+        rates = [_rate(lambda: [similarity_ratio(query, c) for c in names], n, repeat=1)]
+        for backend in backends:
+            got = similarity_one_to_many(query, names, args.threshold, backend=backend)
+            assert np.allclose(got, expected), f"{backend} disagrees with similarity_ratio"
+            rates.append(_rate(
+                lambda b=backend: similarity_one_to_many(query, names, args.threshold, backend=b), n
+            ))
+        print(f"{n:>8}" + "".join(f"{r:>12.0f}" for r in rates) + f"{max(rates[1:]) / rates[0]:>8.1f}")
+
+    names = corpus(args.m2m_size, rng)
+    queries = [names[rng.randrange(len(names))] for _ in range(args.queries)]
+    comparisons = len(queries) * len(names)
+    print(f"\nmany-to-many {len(queries)} x {len(names)}, comparisons/sec")
+    for backend in backends:
+        if backend == "python":
+            continue
+        rate = _rate(
+            lambda b=backend: similarity_many_to_many(queries, names, args.threshold, backend=b),
+            comparisons,
+            repeat=1,
+        )
+        print(f"{backend:>12}{rate:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
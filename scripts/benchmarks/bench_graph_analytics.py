@@ -0,0 +1,105 @@
+"""
+Benchmark: array-backed graph analytics on a synthetic investor network.
+
+Builds a planted-partition graph (--nodes nodes in --communities equal
+communities, --edges undirected edges, --p-in of them inside a community)
+and times each step of app.network.analytics:
+- from_edges:  edge list -> symmetric CSR
+- pagerank:    weighted power iteration
+- betweenness: Brandes from --samples sampled sources
+- label_prop:  weighted label propagation
+- louvain:     Louvain modularity optimisation
+- k_hop:       batched neighborhoods of --k-hop-sources sources, k=2
+
+Community quality (modularity, community count) is printed alongside. Pass
+--skip-louvain to leave out the slowest step on very large graphs.
+
+No database is needed.
+
+Usage:
+    python scripts/benchmarks/bench_graph_analytics.py
+    python scripts/benchmarks/bench_graph_analytics.py --nodes 20000 --edges 100000 --samples 32
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from app.network.analytics import (  # noqa: E402
+    WeightedGraph,
+    betweenness,
+    k_hop,
+    label_propagation,
+    louvain,
+    modularity,
+    pagerank,
+)
+
+
+def planted_partition(n_nodes: int, n_edges: int, n_communities: int, p_in: float, rng):
+    """Edge list where a p_in share of edges stays inside a community."""
+    size = max(n_nodes // n_communities, 1)
+    source = rng.integers(0, n_nodes, n_edges)
+    inside = rng.random(n_edges) < p_in
+    block_start = (source // size) * size
+    offset = rng.integers(0, size, n_edges)
+    target = np.where(inside, np.minimum(block_start + offset, n_nodes - 1),
+                      rng.integers(0, n_nodes, n_edges))
+    keep = source != target
+    weight = rng.integers(1, 5, n_edges).astype(np.float64)
+    return source[keep], target[keep], weight[keep]
+
+
+def _timed(label: str, fn):
+    started = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<14}{elapsed:>10.2f}")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--nodes", type=int, default=200_000)
+    parser.add_argument("--edges", type=int, default=1_000_000)
+    parser.add_argument("--communities", type=int, default=500)
+    parser.add_argument("--p-in", type=float, default=0.9)
+    parser.add_argument("--samples", type=int, default=64, help="Betweenness source samples")
+    parser.add_argument("--k-hop-sources", type=int, default=1000)
+    parser.add_argument("--skip-louvain", action="store_true")
+    parser.add_argument("--seed", type=int, default=17)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    source, target, weight = planted_partition(
+        args.nodes, args.edges, args.communities, args.p_in, rng
+    )
+    print(f"nodes={args.nodes} edges={len(source)} communities={args.communities}")
+    print(f"{'step':<14}{'seconds':>10}")
+
+    graph = _timed("from_edges", lambda: WeightedGraph.from_edges(
+        "bench", 1, args.nodes, source, target, weight
+    ))
+    _timed("pagerank", lambda: pagerank(graph))
+    _timed("betweenness", lambda: betweenness(graph, samples=args.samples))
+    lpa = _timed("label_prop", lambda: label_propagation(graph))
+    results = {"label_prop": lpa}
+    if not args.skip_louvain:
+        results["louvain"] = _timed("louvain", lambda: louvain(graph))
+    sources = rng.choice(args.nodes, size=min(args.k_hop_sources, args.nodes), replace=False)
+    hoods = _timed("k_hop", lambda: k_hop(graph, sources, 2))
+
+    print()
+    for name, labels in results.items():
+        print(f"{name:<14}communities={int(labels.max()) + 1:>8}"
+              f"  modularity={modularity(graph, labels):.4f}")
+    print(f"{'k_hop':<14}mean neighborhood={np.mean([len(nodes) for nodes, _ in hoods]):.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+"""
+Benchmark: job queue dispatch latency and claim throughput.
+
+Measures, for 1, 4 and 16 simulated workers:
+- enqueue -> claim latency (p50 / p95 / max) while jobs trickle in at --rate
+- claims per second while draining a pre-filled backlog of --jobs rows
+
+Two dispatch modes are compared:
+- poll:   legacy behaviour — claim one job per round trip, sleep
+          WORKER_POLL_INTERVAL when the queue is empty
+- listen: LISTEN/NOTIFY wakeups + batch claim of all free slots
+
+Each simulated worker claims via app.worker.main.claim_jobs and "executes"
+instantly (marks the rows success), so numbers isolate dispatch overhead.
+
+WARNING: run against a scratch database. Simulated workers claim ANY pending
+job_queue row. Rows created by the run are deleted afterwards.
+
+Usage:
+    DATABASE_URL=postgresql://... python scripts/benchmarks/bench_job_dispatch.py
+    python scripts/benchmarks/bench_job_dispatch.py --workers 1,4,16 --jobs 500 --rate 25
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from sqlalchemy import text  # noqa: E402
+
+from app.core import job_queue_service  # noqa: E402
+from app.core.database import create_tables, get_session_factory  # noqa: E402
+from app.core.job_queue_service import JOB_QUEUE_CHANNEL, submit_job  # noqa: E402
+from app.core.models_queue import QueueJobType  # noqa: E402
+from app.core.pg_listener import ChannelWakeupListener  # noqa: E402
+from app.worker.main import claim_jobs  # noqa: E402
+
+
+def _complete(ids: List[int]) -> None:
+    SessionLocal = get_session_factory()
+    db = SessionLocal()
+    try:
+        db.execute(
+            text(
+                "UPDATE job_queue SET status = 'success', completed_at = NOW() "
+                "WHERE id = ANY(:ids)"
+            ),
+            {"ids": ids},
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+def _claim(limit: int, worker_id: str) -> List[int]:
+    SessionLocal = get_session_factory()
+    db = SessionLocal()
+    try:
+        return claim_jobs(db, limit, worker_id=worker_id)
+    finally:
+        db.close()
+
+
+async def _worker(
+    worker_id: str,
+    mode: str,
+    slots: int,
+    poll_interval: float,
+    enqueued_at: Dict[int, float],
+    latencies: List[float],
+    claims: List[int],
+    stop: asyncio.Event,
+) -> None:
+    wakeup = asyncio.Event()
+    listener = None
+    if mode == "listen":
+        listener = ChannelWakeupListener([JOB_QUEUE_CHANNEL], wakeup)
+        listener.start()
+
+    try:
+        while not stop.is_set():
+            wakeup.clear()
+            limit = slots if mode == "listen" else 1
+            ids = await asyncio.to_thread(_claim, limit, worker_id)
+            now = time.perf_counter()
+            if ids:
+                claims.append(len(ids))
+                for job_id in ids:
+                    if job_id in enqueued_at:
+                        latencies.append(now - enqueued_at[job_id])
+                await asyncio.to_thread(_complete, ids)
+                continue
+
+            timeout = poll_interval
+            waiters = [asyncio.create_task(stop.wait())]
+            if listener is not None:
+                waiters.append(asyncio.create_task(wakeup.wait()))
+                if listener.connected:
+                    timeout = 30.0
+            await asyncio.wait(waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            for w in waiters:
+                w.cancel()
+    finally:
+        if listener is not None:
+            listener.stop()
+
+
+def _enqueue_one(run_id: str) -> int:
+    SessionLocal = get_session_factory()
+    db = SessionLocal()
+    try:
+        out = submit_job(
+            db,
+            job_type=QueueJobType.INGESTION.value,
+            payload={"benchmark_run": run_id},
+        )
+        return out["job_queue_id"]
+    finally:
+        db.close()
+
+
+def _prefill(run_id: str, n: int) -> None:
+    SessionLocal = get_session_factory()
+    db = SessionLocal()
+    try:
+        db.execute(
+            text(
+                "INSERT INTO job_queue (job_type, status, priority, payload, created_at) "
+                "SELECT 'ingestion', 'pending', 0, CAST(:payload AS JSON), NOW() "
+                "FROM generate_series(1, :n)"
+            ),
+            {"payload": f'{{"benchmark_run": "{run_id}"}}', "n": n},
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+def _pending_count(run_id: str) -> int:
+    SessionLocal = get_session_factory()
+    db = SessionLocal()
+    try:
+        return db.execute(
+            text(
+                "SELECT COUNT(*) FROM job_queue "
+                "WHERE status = 'pending' AND payload->>'benchmark_run' = :run"
+            ),
+            {"run": run_id},
+        ).scalar()
+    finally:
+        db.close()
+
+
+def _cleanup(run_id: str) -> None:
+    SessionLocal = get_session_factory()
+    db = SessionLocal()
+    try:
+        db.execute(
+            text("DELETE FROM job_queue WHERE payload->>'benchmark_run' = :run"),
+            {"run": run_id},
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+async def _run_case(mode: str, n_workers: int, args) -> Dict[str, float]:
+    run_id = uuid.uuid4().hex[:12]
+    enqueued_at: Dict[int, float] = {}
+    latencies: List[float] = []
+    claims: List[int] = []
+    stop = asyncio.Event()
+
+    workers = [
+        asyncio.create_task(
+            _worker(
+                f"bench-{run_id}-{i}", mode, args.slots, args.poll_interval,
+                enqueued_at, latencies, claims, stop,
+            )
+        )
+        for i in range(n_workers)
+    ]
+    await asyncio.sleep(1.0)  # let listeners connect
+
+    try:
+        # Phase 1: latency under a trickle of submissions
+        for _ in range(args.latency_jobs):
+            job_id = await asyncio.to_thread(_enqueue_one, run_id)
+            enqueued_at[job_id] = time.perf_counter()
+            await asyncio.sleep(1.0 / args.rate)
+        deadline = time.perf_counter() + args.poll_interval * 3 + 5
+        while len(latencies) < args.latency_jobs and time.perf_counter() < deadline:
+            await asyncio.sleep(0.05)
+
+        # Phase 2: throughput draining a backlog
+        stop.set()
+        await asyncio.gather(*workers, return_exceptions=True)
+        await asyncio.to_thread(_prefill, run_id, args.jobs)
+        claims.clear()
+        stop = asyncio.Event()
+        started = time.perf_counter()
+        workers = [
+            asyncio.create_task(
+                _worker(
+                    f"bench-{run_id}-{i}", mode, args.slots, args.poll_interval,
+                    {}, [], claims, stop,
+                )
+            )
+            for i in range(n_workers)
+        ]
+        while sum(claims) < args.jobs:
+            await asyncio.sleep(0.05)
+            if time.perf_counter() - started > args.timeout:
+                break
+        elapsed = time.perf_counter() - started
+    finally:
+        stop.set()
+        await asyncio.gather(*workers, return_exceptions=True)
+        remaining = await asyncio.to_thread(_pending_count, run_id)
+        await asyncio.to_thread(_cleanup, run_id)
+
+    lat_ms = sorted(x * 1000 for x in latencies) or [float("nan")]
+    return {
+        "p50_ms": statistics.median(lat_ms),
+        "p95_ms": lat_ms[int(len(lat_ms) * 0.95) - 1] if len(lat_ms) > 1 else lat_ms[0],
+        "max_ms": lat_ms[-1],
+        "claims_per_sec": sum(claims) / elapsed if elapsed else 0.0,
+        "round_trips": len(claims),
+        "unclaimed": remaining,
+    }
+
+
+async def main_async(args) -> None:
+    create_tables()
+    job_queue_service.WORKER_MODE = True
+
+    modes = ["poll", "listen"] if args.mode == "both" else [args.mode]
+    worker_counts = [int(w) for w in args.workers.split(",")]
+
+    print(
+        f"{'mode':<8}{'workers':>8}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}"
+        f"{'claims/s':>12}{'trips':>8}{'left':>6}"
+    )
+    for mode in modes:
+        for n in worker_counts:
+            r = await _run_case(mode, n, args)
+            print(
+                f"{mode:<8}{n:>8}{r['p50_ms']:>10.1f}{r['p95_ms']:>10.1f}"
+                f"{r['max_ms']:>10.1f}{r['claims_per_sec']:>12.1f}"
+                f"{r['round_trips']:>8}{r['unclaimed']:>6}"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--mode", choices=["poll", "listen", "both"], default="both")
+    parser.add_argument("--workers", default="1,4,16", help="Comma-separated worker counts")
+    parser.add_argument("--slots", type=int, default=4, help="Concurrent slots per worker")
+    parser.add_argument("--jobs", type=int, default=1000, help="Backlog size for throughput")
+    parser.add_argument("--latency-jobs", type=int, default=50, help="Jobs for latency phase")
+    parser.add_argument("--rate", type=float, default=20.0, help="Submissions/sec in latency phase")
+    parser.add_argument("--poll-interval", type=float, default=2.0, help="Empty-queue poll sleep")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Max seconds per drain")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""
+Benchmark: job posting crawl-to-commit time per company.
+
+Runs JobPostingCollector.collect_company for --companies synthetic
+companies with --postings openings each (ATS detection and the HTTP fetch
+are replaced by canned Greenhouse payloads), twice:
+- initial: every posting is new
+- recrawl: --churn of the postings are gone (closed) and replaced by new ones
+
+For each crawl it prints per-company wall time from fetch to commit
+(p50 / p95 / max), the time spent in the upsert + closed-posting detection,
+and the SQL statements issued per company.
+
+WARNING: run against a scratch database. The run creates its own
+industrial_companies rows (named bench-jp-<run>-<n>) and deletes them and
+everything hanging off them afterwards.
+
+Usage:
+    DATABASE_URL=postgresql://... python scripts/benchmarks/bench_job_posting_collect.py
+    python scripts/benchmarks/bench_job_posting_collect.py --companies 5 --postings 100,1000,3000 --churn 0.1
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from sqlalchemy import event, text  # noqa: E402
+
+from app.core.database import create_tables, get_engine, get_session_factory  # noqa: E402
+from app.sources.job_postings.ats.detector import ATSResult  # noqa: E402
+from app.sources.job_postings.collector import JobPostingCollector  # noqa: E402
+from app.sources.job_postings.ingest import _ensure_tables  # noqa: E402
+
+_DEPARTMENTS = ["Engineering", "Sales", "Operations", "Finance", "Manufacturing"]
+_TITLES = ["Senior Software Engineer", "Account Executive", "Plant Manager",
+           "Financial Analyst", "Maintenance Technician", "VP of Operations"]
+
+
+def _raw_jobs(first_id: int, n: int) -> List[dict]:
+    """Greenhouse-shaped job payloads with ids first_id .. first_id + n - 1."""
+    return [
+        {
+            "id": job_id,
+            "title": _TITLES[job_id % len(_TITLES)],
+            "departments": [{"name": _DEPARTMENTS[job_id % len(_DEPARTMENTS)]}],
+            "location": {"name": "Chicago, IL"},
+            "content": "Experience with Python, SQL and AWS. PLC programming a plus.",
+            "absolute_url": f"https://boards.greenhouse.io/bench/jobs/{job_id}",
+            "updated_at": "2026-01-15T00:00:00Z",
+        }
+        for job_id in range(first_id, first_id + n)
+    ]
+
+
+class _CannedCollector(JobPostingCollector):
+    """Collector whose ATS detection and fetch return canned payloads."""
+
+    def __init__(self, jobs: Dict[int, List[dict]]):
+        super().__init__()
+        self.jobs = jobs
+        self.store_seconds = 0.0
+
+    async def _get_or_detect_ats(self, db, company_id, *args) -> ATSResult:
+        return ATSResult(ats_type="greenhouse", board_token=f"bench{company_id}")
+
+    async def _fetch_jobs(self, ats: ATSResult) -> List[dict]:
+        return self.jobs[int(ats.board_token[len("bench"):])]
+
+    def _upsert_postings(self, *args):
+        started = time.perf_counter()
+        try:
+            return super()._upsert_postings(*args)
+        finally:
+            self.store_seconds += time.perf_counter() - started
+
+    def _detect_closed_postings(self, *args):
+        started = time.perf_counter()
+        try:
+            return super()._detect_closed_postings(*args)
+        finally:
+            self.store_seconds += time.perf_counter() - started
+
+
+def _create_companies(run_id: str, n: int) -> List[int]:
+    db = get_session_factory()()
+    try:
+        ids = [
+            db.execute(
+                text(
+                    "INSERT INTO industrial_companies (name, website) "
+                    "VALUES (:name, :site) RETURNING id"
+                ),
+                {"name": f"bench-jp-{run_id}-{i}", "site": f"https://bench{i}.example.com"},
+            ).scalar()
+            for i in range(n)
+        ]
+        db.commit()
+        return ids
+    finally:
+        db.close()
+
+
+def _cleanup(company_ids: List[int]) -> None:
+    db = get_session_factory()()
+    try:
+        for table in ("job_posting_alerts", "hiring_velocity_scores", "job_posting_snapshots",
+                      "job_postings", "company_ats_config"):
+            db.execute(text(f"DELETE FROM {table} WHERE company_id = ANY(:ids)"), {"ids": company_ids})
+            db.commit()
+        db.execute(text("DELETE FROM industrial_companies WHERE id = ANY(:ids)"), {"ids": company_ids})
+        db.commit()
+    finally:
+        db.close()
+
+
+async def _crawl(label: str, company_ids: List[int], jobs: Dict[int, List[dict]]) -> None:
+    statements = [0]
+
+    def count(*_args):
+        statements[0] += 1
+
+    engine = get_engine()
+    event.listen(engine, "before_cursor_execute", count)
+    seconds, store, sql = [], [], []
+    new = closed = 0
+    try:
+        async with _CannedCollector(jobs) as collector:
+            for cid in company_ids:
+                db = get_session_factory()()
+                collector.store_seconds = 0.0
+                statements[0] = 0
+                try:
+                    result = await collector.collect_company(db, cid)
+                finally:
+                    db.close()
+                if result.error:
+                    raise RuntimeError(f"company {cid}: {result.error}")
+                seconds.append(result.duration_seconds)
+                store.append(collector.store_seconds)
+                sql.append(statements[0])
+                new += result.new_postings
+                closed += result.closed_postings
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+
+    ms = sorted(s * 1000 for s in seconds)
+    print(
+        f"{label:<20}{ms[len(ms) // 2]:>10.0f}{ms[max(int(len(ms) * 0.95) - 1, 0)]:>10.0f}"
+        f"{ms[-1]:>10.0f}{statistics.mean(store) * 1000:>12.0f}"
+        f"{statistics.mean(sql):>8.0f}{new:>8}{closed:>8}"
+    )
+
+
+async def main_async(args) -> None:
+    create_tables()
+    db = get_session_factory()()
+    try:
+        _ensure_tables(db)
+    finally:
+        db.close()
+
+    print(
+        f"{'crawl':<20}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}"
+        f"{'store ms':>12}{'SQL':>8}{'new':>8}{'closed':>8}"
+    )
+    for n in [int(p) for p in args.postings.split(",")]:
+        run_id = uuid.uuid4().hex[:8]
+        company_ids = _create_companies(run_id, args.companies)
+        try:
+            gone = int(n * args.churn)
+            await _crawl(f"initial ({n})", company_ids, {cid: _raw_jobs(0, n) for cid in company_ids})
+            await _crawl(f"recrawl ({n})", company_ids, {cid: _raw_jobs(gone, n) for cid in company_ids})
+        finally:
+            _cleanup(company_ids)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--companies", type=int, default=5, help="Companies per posting count")
+    parser.add_argument("--postings", default="100,1000,3000", help="Comma-separated openings per company")
+    parser.add_argument("--churn", type=float, default=0.1, help="Share of postings replaced on recrawl")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+Benchmark: M5 sales wide-to-long load, rows per second.
+
+Writes a synthetic sales_train_validation.csv of --items rows x --days day
+columns (plus a matching calendar.csv) and times:
+- previous:  csv.DictReader + parse_sales_row_to_long_format per row, the
+             transform the loader used before the columnar path
+             (--previous-sample items only, it is slow; no inserts)
+- columnar:  chunked pandas read, melt_sales_chunk and the COPY CSV
+             serialization, i.e. everything ingest_m5_sales does per chunk
+             except the database round trip
+- load:      with --database-url, the full ingest_m5_sales into
+             m5_items / m5_sales over COPY + merge
+
+Peak RSS is printed after each mode; it should stay flat as --items
+grows because only one chunk is held at a time.
+
+WARNING: --database-url must point at a scratch Postgres. The load creates
+the M5 tables if needed and deletes its BENCH_* rows afterwards.
+
+Usage:
+    python scripts/benchmarks/bench_m5_load.py
+    python scripts/benchmarks/bench_m5_load.py --items 30490 --database-url postgresql://...
+"""
+
+import argparse
+import asyncio
+import csv
+import random
+import resource
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import pandas as pd  # noqa: E402
+from sqlalchemy import create_engine, text  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app.core.batch_operations import _frame_to_copy_buffer  # noqa: E402
+from app.sources.kaggle import ingest, m5_metadata  # noqa: E402
+
+_STORES = ["CA_1", "CA_2", "CA_3", "CA_4", "TX_1", "TX_2", "TX_3", "WI_1", "WI_2", "WI_3"]
+_DEPTS = ["HOBBIES_1", "HOBBIES_2", "HOUSEHOLD_1", "HOUSEHOLD_2", "FOODS_1", "FOODS_2", "FOODS_3"]
+
+
+def write_files(directory: Path, n_items: int, n_days: int, seed: int):
+    rng = random.Random(seed)
+    days = [f"d_{i}" for i in range(1, n_days + 1)]
+    sales_path = directory / "sales_train_validation.csv"
+    with open(sales_path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["id", "item_id", "dept_id", "cat_id", "store_id", "state_id"] + days)
+        for i in range(n_items):
+            dept = _DEPTS[i % len(_DEPTS)]
+            store = _STORES[(i // len(_DEPTS)) % len(_STORES)]
+            item = f"BENCH_{dept}_{i:05d}"
+            counts = [rng.choice((0, 0, 0, 1, 1, 2, 3, 5, 8)) for _ in days]
+            writer.writerow(
+                [f"{item}_{store}_validation", item, dept, dept.rsplit("_", 1)[0], store, store[:2]]
+                + counts
+            )
+
+    calendar_path = directory / "calendar.csv"
+    first = date(2011, 1, 29)
+    with open(calendar_path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["date", "d"])
+        writer.writerows([(first + timedelta(days=i)).isoformat(), d] for i, d in enumerate(days))
+    return sales_path, calendar_path
+
+
+def _peak_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _report(label: str, rows: int, seconds: float) -> None:
+    print(f"{label:<12}{rows:>14,}{rows / seconds:>16,.0f}{seconds:>10.2f}{_peak_mb():>12,.0f}")
+
+
+def run_previous(sales_path: Path, calendar_path: Path, sample: int) -> None:
+    started = time.perf_counter()
+    with open(calendar_path) as f:
+        lookup = {row["d"]: row["date"] for row in csv.DictReader(f)}
+    rows = 0
+    with open(sales_path) as f:
+        reader = csv.DictReader(f)
+        days = [c for c in reader.fieldnames if c.startswith("d_")]
+        for i, row in enumerate(reader):
+            if i >= sample:
+                break
+            m5_metadata.parse_sales_row_to_items(row)
+            rows += len(m5_metadata.parse_sales_row_to_long_format(row, days, lookup))
+    _report("previous", rows, time.perf_counter() - started)
+
+
+def run_columnar(sales_path: Path, calendar_path: Path, chunk_items: int) -> None:
+    started = time.perf_counter()
+    header = pd.read_csv(sales_path, nrows=0).columns
+    days = [c for c in header if c.startswith("d_")]
+    day_dates = ingest._calendar_dates(calendar_path, days)
+    rows = 0
+    chunks = pd.read_csv(
+        sales_path,
+        usecols=m5_metadata.SALES_ID_COLUMNS + days,
+        dtype={**{c: str for c in m5_metadata.SALES_ID_COLUMNS}, **{c: "float32" for c in days}},
+        chunksize=chunk_items,
+    )
+    for chunk in chunks:
+        items, sales = m5_metadata.melt_sales_chunk(chunk, days, day_dates)
+        _frame_to_copy_buffer(items)
+        _frame_to_copy_buffer(sales)
+        rows += len(sales)
+    _report("columnar", rows, time.perf_counter() - started)
+
+
+def run_load(database_url: str, sales_path: Path, calendar_path: Path, chunk_items: int) -> None:
+    engine = create_engine(database_url)
+    db = sessionmaker(bind=engine)()
+    try:
+        for schema in (m5_metadata.M5_ITEMS_SCHEMA, m5_metadata.M5_SALES_SCHEMA):
+            for statement in m5_metadata.generate_create_table_sql(schema).split(";"):
+                if statement.strip():
+                    db.execute(text(statement))
+        db.commit()
+
+        started = time.perf_counter()
+        result = asyncio.run(
+            ingest.ingest_m5_sales(db, sales_path, calendar_path, chunk_items=chunk_items)
+        )
+        _report("load", result["sales_inserted"], time.perf_counter() - started)
+    finally:
+        db.rollback()
+        db.execute(text("DELETE FROM m5_sales WHERE item_id LIKE 'BENCH\\_%'"))
+        db.execute(text("DELETE FROM m5_items WHERE item_id LIKE 'BENCH\\_%'"))
+        db.commit()
+        db.close()
+        engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--items", type=int, default=3000, help="Wide sales rows (item-store pairs)")
+    parser.add_argument("--days", type=int, default=1941, help="Day columns per row")
+    parser.add_argument("--previous-sample", type=int, default=300,
+                        help="Items run through the previous row loop")
+    parser.add_argument("--chunk-items", type=int, default=ingest.SALES_CHUNK_ITEMS)
+    parser.add_argument("--database-url", help="Scratch Postgres for the full COPY load")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sales_path, calendar_path = write_files(Path(tmp), args.items, args.days, args.seed)
+        print(f"{args.items:,} items x {args.days:,} days, chunks of {args.chunk_items} items\n")
+        print(f"{'mode':<12}{'long rows':>14}{'rows/s':>16}{'seconds':>10}{'peak MB':>12}")
+        run_previous(sales_path, calendar_path, args.previous_sample)
+        run_columnar(sales_path, calendar_path, args.chunk_items)
+        if args.database_url:
+            run_load(args.database_url, sales_path, calendar_path, args.chunk_items)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+Benchmark: job description skills extraction, postings per second.
+
+Runs over a synthetic corpus of --postings HTML job descriptions built from
+a sentence bank that mentions skills, soft skills, certifications,
+degrees and experience:
+- previous:  every pattern of every taxonomy entry through re.search
+             (the extractor before the compiled matcher; --previous-sample
+             postings only, it is slow)
+- compiled:  extract_skills with the compiled single-pass SkillMatcher
+- processes: extract_skills_batch with N worker processes (--processes)
+
+The compiled results are checked against the previous implementation on
+the sampled postings; any difference is reported.
+
+No database needed.
+
+Usage:
+    python scripts/benchmarks/bench_skills_extractor.py
+    python scripts/benchmarks/bench_skills_extractor.py --postings 50000 --processes 1,4,8
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from app.sources.job_postings import skills_extractor  # noqa: E402
+from app.sources.job_postings.skills_extractor import (  # noqa: E402
+    CERTIFICATIONS,
+    EDUCATION_PATTERNS,
+    SOFT_SKILLS,
+    TECH_SKILLS,
+    extract_skills,
+    extract_skills_batch,
+)
+
+_SENTENCES = [
+    "<p>We are looking for a {title} to join our growing {team} team.</p>",
+    "<li>{years}+ years of experience building production systems with {skill} and {skill}.</li>",
+    "<li>Hands-on experience with {skill}, {skill} or {skill} in a cloud environment.</li>",
+    "<li>Bachelor's degree in computer science, engineering or a related field.</li>",
+    "<li>Master's degree or MBA preferred.</li>",
+    "<li>{cert} certification is a plus.</li>",
+    "<p>You will collaborate with cross-functional partners and mentor junior engineers.</p>",
+    "<li>Excellent communication skills and strong attention to detail.</li>",
+    "<p>Our stack includes {skill}, {skill}, {skill} and {skill} deployed on {skill}.</p>",
+    "<p>Benefits include medical, dental and vision coverage, a 401(k) match and paid time off.</p>",
+    "<p>We value diversity, equity and inclusion &amp; are an equal opportunity employer.</p>",
+    "<li>Own the roadmap for our manufacturing, supply chain and warehouse operations.</li>",
+]
+_SKILLS = ["Python", "Java", "SQL", "AWS", "Kubernetes", "Docker", "React", "Node.js",
+           "Terraform", "Snowflake", "Spark", "Airflow", "PostgreSQL", "Go", "C++", "Tableau",
+           "Salesforce", "SAP ERP", "Kafka", "TypeScript", "GCP", "Azure", "Linux", "PLC"]
+_CERTS = ["PMP", "CPA", "AWS Certified Solutions Architect", "Six Sigma", "CISSP", "Scrum Master"]
+_TITLES = ["Senior Software Engineer", "Data Engineer", "Plant Manager", "Financial Analyst",
+           "DevOps Engineer", "Product Manager", "Controls Engineer"]
+
+
+def make_corpus(n: int, seed: int) -> List[dict]:
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(n):
+        title = rng.choice(_TITLES)
+        body = " ".join(
+            rng.choice(_SENTENCES).format(
+                title=title,
+                team=rng.choice(["platform", "data", "operations", "finance"]),
+                years=rng.randint(2, 10),
+                skill=rng.choice(_SKILLS),
+                cert=rng.choice(_CERTS),
+            ).replace("{skill}", rng.choice(_SKILLS))
+            for _ in range(rng.randint(15, 45))
+        )
+        corpus.append({"title": title, "description_text": body})
+    return corpus
+
+
+def _previous_matches(text: str, taxonomy) -> List[str]:
+    found = []
+    for display_name, patterns in taxonomy:
+        for pat in patterns:
+            if re.search(pat, text, re.IGNORECASE):
+                found.append(display_name)
+                break
+    return found
+
+
+def previous_extract(description: str, title: str = "") -> dict:
+    """extract_skills as it was before the compiled matcher."""
+    text = skills_extractor._prepare_text(description)
+    skills = _previous_matches(text, TECH_SKILLS)
+    soft = _previous_matches(text, SOFT_SKILLS)
+    certs = _previous_matches(text, CERTIFICATIONS)
+    levels = _previous_matches(text, EDUCATION_PATTERNS)
+    education: Optional[str] = levels[0] if levels else None
+    years, years_raw = skills_extractor._extract_experience(text)
+    if title:
+        skills = list(dict.fromkeys(_previous_matches(title.lower(), TECH_SKILLS) + skills))
+    result = {}
+    for key, value in (("skills", skills), ("soft_skills", soft), ("certifications", certs),
+                       ("education", education), ("years_experience_raw", years_raw)):
+        if value:
+            result[key] = value
+    if years is not None:
+        result["years_experience"] = years
+    result["skill_count"] = len(skills) + len(soft) + len(certs)
+    return result
+
+
+def _rate(n: int, seconds: float) -> str:
+    return f"{n / seconds:>12,.0f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--postings", type=int, default=20000, help="Synthetic postings")
+    parser.add_argument("--previous-sample", type=int, default=500,
+                        help="Postings run through the previous implementation")
+    parser.add_argument("--processes", default="1,4", help="Comma-separated process counts")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    corpus = make_corpus(args.postings, args.seed)
+    sample = corpus[: args.previous_sample]
+    avg_chars = sum(len(p["description_text"]) for p in corpus) / len(corpus)
+    print(f"{len(corpus)} postings, {avg_chars:,.0f} chars on average\n")
+    print(f"{'mode':<16}{'postings':>10}{'postings/s':>12}{'seconds':>10}")
+
+    started = time.perf_counter()
+    previous = [previous_extract(p["description_text"], p["title"]) for p in sample]
+    elapsed = time.perf_counter() - started
+    print(f"{'previous':<16}{len(sample):>10}{_rate(len(sample), elapsed)}{elapsed:>10.2f}")
+
+    skills_extractor.get_matcher()  # compile outside the timed loop
+    started = time.perf_counter()
+    compiled = [extract_skills(p["description_text"], p["title"]) for p in corpus]
+    elapsed = time.perf_counter() - started
+    print(f"{'compiled':<16}{len(corpus):>10}{_rate(len(corpus), elapsed)}{elapsed:>10.2f}")
+
+    for processes in [int(p) for p in args.processes.split(",") if p]:
+        batch = [dict(p) for p in corpus]
+        started = time.perf_counter()
+        extract_skills_batch(batch, processes=processes)
+        elapsed = time.perf_counter() - started
+        label = f"processes={processes}"
+        print(f"{label:<16}{len(batch):>10}{_rate(len(batch), elapsed)}{elapsed:>10.2f}")
+
+    mismatches = sum(1 for a, b in zip(previous, compiled) if a != b)
+    print(f"\nCompiled vs previous on {len(sample)} postings: {mismatches} mismatches")
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
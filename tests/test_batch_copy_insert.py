@@ -0,0 +1,167 @@
+"""
+Unit tests for the COPY-based bulk load path in app/core/batch_operations.py.
+
+Covers COPY text serialization (JSON vs array-literal lists), staging/merge
+SQL generation, and that batch_insert(use_copy=True) reports inserted and
+updated rows from the merge's counts.
+
+All tests are fully offline (no DB, no network).
+"""
+from datetime import date, datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.core.batch_operations import (
+    _build_copy_merge_sql,
+    _build_copy_staging_sql,
+    _copy_value,
+    _rows_to_copy_buffer,
+    batch_insert,
+)
+
+
+class TestCopySerialization:
+    """COPY text-format encoding of Python values."""
+
+    def test_null_and_scalars(self):
+        assert _copy_value(None) == "\\N"
+        assert _copy_value(True) == "t"
+        assert _copy_value(False) == "f"
+        assert _copy_value(42) == "42"
+        assert _copy_value(1.5) == "1.5"
+
+    def test_dates_use_iso_format(self):
+        assert _copy_value(date(2024, 1, 31)) == "2024-01-31"
+        assert _copy_value(datetime(2024, 1, 31, 12, 30)) == "2024-01-31T12:30:00"
+
+    def test_special_characters_escaped(self):
+        assert _copy_value("a\tb\nc\\d\re") == "a\\tb\\nc\\\\d\\re"
+
+    def test_json_values_serialized(self):
+        assert _copy_value({"k": 1}) == '{"k": 1}'
+
+    def test_array_columns_use_array_literals(self):
+        assert _copy_value(["a", "b c"], as_array=True) == '{"a","b c"}'
+        assert _copy_value([1, None, [2, 3]], as_array=True) == '{"1",NULL,{"2","3"}}'
+        # Quote and backslash escaped for the array parser, then for COPY
+        assert _copy_value(['x"y\\z'], as_array=True) == '{"x\\\\"y\\\\\\\\z"}'
+        assert _copy_value(["a"]) == '["a"]'
+
+    def test_buffer_formats_lists_per_column(self):
+        rows = [{"tags": ["x", "y"], "meta": ["x", "y"]}]
+        buf = _rows_to_copy_buffer(rows, ["tags", "meta"], array_columns={"tags"})
+        assert buf.read() == '{"x","y"}\t["x", "y"]\t0\n'
+
+    def test_buffer_appends_sequence_and_missing_keys_are_null(self):
+        rows = [{"a": 1, "b": "x"}, {"a": 2}]
+        buf = _rows_to_copy_buffer(rows, ["a", "b"])
+        assert buf.read() == "1\tx\t0\n2\t\\N\t1\n"
+
+
+class TestCopySql:
+    """Staging table and merge statement generation."""
+
+    def test_staging_table_shaped_like_target(self):
+        stmts = _build_copy_staging_sql("fred_series", "_stage", ["series_id", "value"])
+        assert "CREATE TEMP TABLE \"_stage\" ON COMMIT DROP" in stmts[0]
+        assert 'SELECT "series_id", "value" FROM "fred_series" WITH NO DATA' in stmts[0]
+        assert "_copy_seq" in stmts[1]
+
+    def test_upsert_merge_dedupes_keeping_last(self):
+        sql = _build_copy_merge_sql(
+            table_name="fred_series",
+            staging_table="_stage",
+            columns=["series_id", "date", "value"],
+            conflict_columns=["series_id", "date"],
+        )
+        assert 'SELECT DISTINCT ON ("series_id", "date")' in sql
+        assert "_copy_seq DESC" in sql
+        assert 'ON CONFLICT ("series_id", "date") DO UPDATE SET "value" = EXCLUDED."value"' in sql
+        assert "RETURNING (xmax = 0) AS inserted" in sql
+        assert sql.startswith("WITH merged AS (INSERT INTO")
+
+    def test_merge_without_update_columns_does_nothing(self):
+        sql = _build_copy_merge_sql(
+            table_name="t",
+            staging_table="_stage",
+            columns=["id"],
+            conflict_columns=["id"],
+        )
+        assert 'ON CONFLICT ("id") DO NOTHING RETURNING' in sql
+
+    def test_plain_insert_preserves_order(self):
+        sql = _build_copy_merge_sql("t", "_stage", ["a", "b"])
+        assert "DISTINCT ON" not in sql
+        assert "ON CONFLICT" not in sql
+        assert "ORDER BY _copy_seq RETURNING" in sql
+
+
+class TestBatchInsertUseCopy:
+    """batch_insert(use_copy=True) keeps the BatchInsertResult contract."""
+
+    def _make_db(self, merged=(10, 0)):
+        db = MagicMock()
+        cursor = MagicMock()
+        db.connection.return_value.connection.cursor.return_value = cursor
+        db.execute.return_value.fetchone.return_value = merged
+        db.execute.return_value.fetchall.return_value = []
+        return db, cursor
+
+    def test_result_statistics_from_merge_counts(self):
+        db, cursor = self._make_db(merged=(7, 3))
+        rows = [{"a": i} for i in range(25)]
+
+        result = batch_insert(
+            db=db,
+            table_name="t",
+            rows=rows,
+            columns=["a"],
+            conflict_columns=["a"],
+            use_copy=True,
+            copy_batch_size=10,
+        )
+
+        assert result.rows_inserted == 21
+        assert result.rows_updated == 9
+        assert result.batches_processed == 3
+        assert result.errors == []
+        assert cursor.copy_expert.call_count == 3
+        assert db.commit.call_count == 3
+
+    def test_rows_committed_updated_per_chunk(self):
+        db, _ = self._make_db(merged=(4, 1))
+        rows = [{"a": i} for i in range(15)]
+
+        batch_insert(
+            db=db,
+            table_name="t",
+            rows=rows,
+            columns=["a"],
+            use_copy=True,
+            copy_batch_size=10,
+            job_id=7,
+        )
+
+        update_calls = [
+            c
+            for c in db.execute.call_args_list
+            if len(c.args) >= 2 and isinstance(c.args[1], dict) and "jid" in c.args[1]
+        ]
+        assert [c.args[1]["rows"] for c in update_calls] == [5, 10]
+
+    def test_copy_failure_rolls_back_and_records_error(self):
+        db, cursor = self._make_db()
+        cursor.copy_expert.side_effect = RuntimeError("bad data")
+
+        with pytest.raises(RuntimeError):
+            batch_insert(
+                db=db,
+                table_name="t",
+                rows=[{"a": 1}],
+                columns=["a"],
+                use_copy=True,
+            )
+
+        db.rollback.assert_called_once()
+        cursor.close.assert_called_once()
@@ -0,0 +1,202 @@
+"""
+Tests for fused data quality rule evaluation (one scan per table).
+
+Covers:
+- evaluate_rules_for_table returns the same results as evaluate_rule per rule
+- all fusable rules of a table are answered by a single aggregate query
+- sample failures are only fetched for rules that failed
+- a rule that breaks the fused query falls back to per-rule evaluation
+  without affecting the other rules
+- evaluate_rules_for_job stores one result per rule
+
+All tests are fully offline (in-memory SQLite).
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import sessionmaker
+
+from app.core.data_quality_service import (
+    evaluate_rule,
+    evaluate_rules_for_job,
+    evaluate_rules_for_table,
+)
+from app.core.models import (
+    Base,
+    DataQualityResult,
+    DataQualityRule,
+    RuleSeverity,
+    RuleType,
+)
+
+TABLE = "dq_prices"
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    recent = (datetime.utcnow() - timedelta(hours=2)).strftime("%Y-%m-%d %H:%M:%S")
+    with engine.begin() as conn:
+        conn.execute(text(
+            f"CREATE TABLE {TABLE} (id INTEGER PRIMARY KEY, code TEXT, state TEXT,"
+            " price REAL, low REAL, high REAL, updated_at TIMESTAMP)"
+        ))
+        rows = [
+            ("AB", "CA", 10.0, 1.0, 2.0),
+            ("CD", "NY", 20.0, 3.0, 4.0),
+            ("ab", "TX", None, 5.0, 6.0),
+            ("EF", None, 250.0, 9.0, 8.0),
+            ("EF", "ZZ", -5.0, None, 1.0),
+            (None, "CA", 30.0, 2.0, 2.0),
+        ]
+        for code, state, price, low, high in rows:
+            conn.execute(text(
+                f"INSERT INTO {TABLE} (code, state, price, low, high, updated_at)"
+                " VALUES (:code, :state, :price, :low, :high, :ts)"
+            ), {"code": code, "state": state, "price": price, "low": low,
+                "high": high, "ts": recent})
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def _rule(db, name, rule_type, column=None, **parameters):
+    rule = DataQualityRule(
+        name=name, rule_type=rule_type, column_name=column,
+        parameters=parameters, severity=RuleSeverity.ERROR,
+        times_evaluated=0, times_passed=0, times_failed=0,
+    )
+    db.add(rule)
+    db.commit()
+    return rule
+
+
+@pytest.fixture
+def rules(db):
+    return [
+        _rule(db, "price range", RuleType.RANGE, "price", min=0, max=100),
+        _rule(db, "price range ok", RuleType.RANGE, "price", min=-10),
+        _rule(db, "state not null", RuleType.NOT_NULL, "state"),
+        _rule(db, "id not null", RuleType.NOT_NULL, "id"),
+        _rule(db, "code unique", RuleType.UNIQUE, "code"),
+        _rule(db, "state enum", RuleType.ENUM, "state", allowed=["CA", "NY", "TX"]),
+        _rule(db, "rows", RuleType.ROW_COUNT, min=1, max=3),
+        _rule(db, "fresh", RuleType.FRESHNESS, "updated_at", max_age_hours=24),
+        _rule(db, "low <= high", RuleType.COMPARISON, "low", operator="<=", compare_column="high"),
+        _rule(db, "code format", RuleType.REGEX, "code", pattern="[A-Z]{2}$"),
+        _rule(db, "state format", RuleType.REGEX, "state", pattern="[A-Z]{2}"),
+        _rule(db, "no enum values", RuleType.ENUM, "state"),
+        _rule(db, "missing column", RuleType.NOT_NULL),
+    ]
+
+
+def _comparable(result):
+    fields = dict(vars(result))
+    fields.pop("execution_time_ms")
+    return fields
+
+
+class _StatementLog:
+    def __init__(self, db):
+        self.statements = []
+        self.engine = db.get_bind()
+        event.listen(self.engine, "before_cursor_execute", self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        if TABLE in statement:
+            self.statements.append(statement)
+
+    def close(self):
+        event.remove(self.engine, "before_cursor_execute", self._record)
+
+
+class TestEvaluateRulesForTable:
+    def test_matches_per_rule_evaluation(self, db, rules):
+        expected = [evaluate_rule(db, r, TABLE) for r in rules]
+        fused = evaluate_rules_for_table(db, rules, TABLE)
+
+        assert [_comparable(r) for r in fused] == [_comparable(r) for r in expected]
+        by_name = {r.rule_name: r for r in fused}
+        assert by_name["price range"].rows_failed == 2
+        assert by_name["code unique"].sample_failures == ["EF (x2)"]
+        assert by_name["state enum"].sample_failures == ["ZZ"]
+        assert by_name["low <= high"].rows_failed == 1
+        assert by_name["code format"].sample_failures == ["ab"]
+        assert by_name["fresh"].passed
+
+    def test_single_scan_when_all_pass(self, db, rules):
+        passing = [r for r in rules if r.name in {"price range ok", "id not null", "fresh"}]
+        log = _StatementLog(db)
+        try:
+            results = evaluate_rules_for_table(db, passing, TABLE)
+        finally:
+            log.close()
+        assert all(r.passed for r in results)
+        assert len(log.statements) == 1
+        assert "FILTER (WHERE" in log.statements[0]
+
+    def test_samples_only_for_failed_rules(self, db, rules):
+        fusable = [
+            r for r in rules
+            if r.rule_type != RuleType.REGEX and r.name not in {"no enum values", "missing column"}
+        ]
+        log = _StatementLog(db)
+        try:
+            results = evaluate_rules_for_table(db, fusable, TABLE)
+        finally:
+            log.close()
+        # one fused scan + a sample query for each failing rule that keeps samples
+        sampled = {"price range", "code unique", "state enum", "low <= high"}
+        assert {r.rule_name for r in results if r.sample_failures} == sampled
+        assert len(log.statements) == 1 + len(sampled)
+
+    def test_regex_rules_share_one_scan(self, db, rules):
+        regex = [r for r in rules if r.rule_type == RuleType.REGEX]
+        log = _StatementLog(db)
+        try:
+            evaluate_rules_for_table(db, regex, TABLE)
+        finally:
+            log.close()
+        assert len(log.statements) == 1
+
+    def test_broken_rule_falls_back(self, db, rules):
+        # SQLite reads unknown double-quoted names as strings, so fail the
+        # broken rule's aggregates explicitly
+        from app.core import data_quality_service
+
+        broken = _rule(db, "ghost column", RuleType.NOT_NULL, "no_such_column")
+        real_scan = data_quality_service._scan
+
+        def scan(session, table_name, compiled):
+            if any(c.rule is broken for c in compiled):
+                raise RuntimeError("no such column: no_such_column")
+            return real_scan(session, table_name, compiled)
+
+        batch = [rules[0], broken, rules[3]]
+        with patch.object(data_quality_service, "_scan", side_effect=scan) as scans:
+            results = evaluate_rules_for_table(db, batch, TABLE)
+
+        assert scans.call_count == 4  # fused attempt + one per rule
+        assert results[0].rows_failed == 2
+        assert results[1].passed is False
+        assert "no_such_column" in results[1].message
+        assert results[2].passed
+
+    def test_empty(self, db):
+        assert evaluate_rules_for_table(db, [], TABLE) == []
+
+
+class TestEvaluateRulesForJob:
+    def test_stores_one_result_per_rule(self, db, rules):
+        job = MagicMock(id=7, source="dq_test")
+        report = evaluate_rules_for_job(db, job, TABLE)
+
+        assert report.total_rules == len(rules)
+        assert db.query(DataQualityResult).count() == len(rules)
+        assert report.rules_passed + report.rules_failed == len(rules)
+        assert report.overall_status == "failed"
+        assert all(r.times_evaluated == 1 for r in rules)
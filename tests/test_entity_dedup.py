@@ -0,0 +1,163 @@
+"""
+Tests for blocked duplicate discovery (app/core/entity_dedup.py) and
+EntityResolver.find_duplicates.
+
+Covers:
+- Soundex and blocking keys (tokens, phonetic, 4-grams, identifiers, domain)
+- each candidate pair is emitted once; oversized blocks are skipped
+- blocked results match the exhaustive scan on a small corpus
+- ranking returns the best pairs regardless of ID order
+- process-pool scoring and incremental persistence
+
+All tests are fully offline (MagicMock sessions).
+"""
+
+from itertools import combinations
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.agentic.fuzzy_matcher import similarity_ratio
+from app.core.entity_dedup import (
+    BlockedDuplicateFinder,
+    EntityRecord,
+    blocking_keys,
+    score_pairs,
+    soundex,
+)
+
+_NAMES = [
+    "acme holdings", "acme holdngs", "acme holding", "granite peak capital",
+    "granit peak capital", "northstar ventures", "north star ventures",
+    "redwood energy", "redwod energy", "zenith health", "zenith healthcare",
+    "liberty oak", "pacific titan", "pacifc titan",
+]
+
+
+def _records(names=_NAMES):
+    return [EntityRecord(id=i + 1, normalized_name=n) for i, n in enumerate(names)]
+
+
+def _exhaustive(records, lo, hi):
+    out = []
+    for a, b in combinations(records, 2):
+        sim = similarity_ratio(a.normalized_name, b.normalized_name)
+        if lo <= sim < hi:
+            out.append((a.id, b.id, sim))
+    return sorted(out, key=lambda p: (-p[2], p[0], p[1]))
+
+
+class TestBlockingKeys:
+    """Key generation."""
+
+    @pytest.mark.parametrize("word,code", [
+        ("robert", "R163"), ("rupert", "R163"), ("tymczak", "T522"),
+        ("ashcraft", "A261"), ("a", "A000"), ("123", ""),
+    ])
+    def test_soundex(self, word, code):
+        assert soundex(word) == code
+
+    def test_keys(self):
+        record = EntityRecord(
+            id=1, normalized_name="granite peak capital", domain="granite.com",
+            identifiers=("cik:0001",),
+        )
+        keys = blocking_keys(record)
+        assert {"tok:granite", "tok:peak", "pre:gran", "suf:ital",
+                "dom:granite.com", "cik:0001"} <= keys
+        assert "tok:capital" not in keys  # stop token
+        assert any(k.startswith("snd:G653") for k in keys)
+
+
+class TestCandidatePairs:
+    """Blocks produce each pair once and respect the size cap."""
+
+    def test_pairs_are_unique(self):
+        finder = BlockedDuplicateFinder()
+        pairs = list(finder.candidate_pairs(_records()))
+        assert len(pairs) == len(set(pairs))
+        assert all(i < j for i, j in pairs)
+        assert finder.stats["candidate_pairs"] == len(pairs)
+
+    def test_oversized_block_skipped(self):
+        records = [EntityRecord(id=i, normalized_name=f"zz{i:04d}", identifiers=("cik:1",))
+                   for i in range(10)]
+        finder = BlockedDuplicateFinder(max_block_size=5)
+        list(finder.candidate_pairs(records))
+        assert finder.stats["oversized_blocks"] >= 1
+
+    def test_identifier_links_unrelated_names(self):
+        records = [
+            EntityRecord(id=1, normalized_name="alpha", identifiers=("cik:9",)),
+            EntityRecord(id=2, normalized_name="omega", identifiers=("cik:9",)),
+        ]
+        assert list(BlockedDuplicateFinder().candidate_pairs(records)) == [(0, 1)]
+
+
+class TestFind:
+    """Ranked scoring."""
+
+    def test_matches_exhaustive_scan(self):
+        records = _records()
+        expected = _exhaustive(records, 0.70, 1.01)
+        got = BlockedDuplicateFinder().find(records, 0.70, 1.01, limit=100)
+        assert got == expected
+
+    def test_limit_keeps_best_not_lowest_ids(self):
+        records = _records()
+        best = _exhaustive(records, 0.70, 0.99)[:3]
+        assert BlockedDuplicateFinder().find(records, 0.70, 0.99, limit=3) == best
+
+    def test_on_batch_receives_in_range_pairs(self):
+        batches = []
+        BlockedDuplicateFinder(chunk_size=2).find(
+            _records(), 0.70, 0.95, limit=1, on_batch=batches.append
+        )
+        flat = [p for batch in batches for p in batch]
+        assert flat and all(0.70 <= sim < 0.95 for _, _, sim in flat)
+        assert len(batches) > 1
+
+    def test_process_pool_scoring(self):
+        records = _records()
+        serial = BlockedDuplicateFinder(chunk_size=3).find(records, 0.7, 1.01, limit=100)
+        parallel = BlockedDuplicateFinder(chunk_size=3, workers=2).find(records, 0.7, 1.01, limit=100)
+        assert parallel == serial
+
+    def test_length_prefilter(self):
+        assert score_pairs([(1, "ab", 2, "abcdefghij")], 0.7) == []
+
+
+class TestResolverFindDuplicates:
+    """EntityResolver.find_duplicates wiring."""
+
+    def _db(self, rows, names):
+        db = MagicMock()
+        entity_query = MagicMock()
+        entity_query.filter.return_value = entity_query
+        entity_query.order_by.return_value.yield_per.return_value = rows
+        name_query = MagicMock()
+        name_query.filter.return_value.all.return_value = names
+        db.query.side_effect = [entity_query, name_query]
+        return db
+
+    def test_returns_candidates_and_persists(self):
+        from app.core import entity_resolver
+        from app.core.entity_resolver import EntityResolver
+
+        rows = [
+            (1, "acme holdings", "CA", None, None, None, None, None, None),
+            (2, "acme holdngs", "CA", None, None, None, None, None, None),
+            (3, "pacific titan", None, None, None, None, None, None, None),
+        ]
+        db = self._db(rows, [(1, "Acme Holdings"), (2, "Acme Holdngs Inc")])
+
+        with patch.object(entity_resolver, "batch_insert") as insert:
+            dupes = EntityResolver(db).find_duplicates("company", 0.7, 1.0, persist=True)
+
+        assert [(d.entity_a_id, d.entity_b_id) for d in dupes] == [(1, 2)]
+        assert dupes[0].entity_b_name == "Acme Holdngs Inc"
+        assert dupes[0].match_method == "name_location_match"
+        insert.assert_called_once()
+        assert insert.call_args.args[1] == "entity_duplicate_candidates"
+        assert insert.call_args.kwargs["conflict_columns"] == ["entity_a_id", "entity_b_id"]
+        assert insert.call_args.args[2][0]["entity_a_id"] == 1
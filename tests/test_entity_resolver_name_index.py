@@ -0,0 +1,188 @@
+"""
+Tests for trigram candidate retrieval in EntityResolver name-only matching.
+
+Covers:
+- resolve() only checks the trigram indexes exist; startup builds them
+  CONCURRENTLY
+- one pg_trgm top-K query replaces loading every alias / canonical name
+- only returned candidates are scored; each entity keeps its best name
+- fallback to the exhaustive scan without Postgres, on query failure,
+  or when disabled
+
+All tests are fully offline (MagicMock sessions).
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy.exc import ProgrammingError
+
+from app.core import entity_resolver
+from app.core.entity_resolver import CanonicalEntity, EntityResolver
+
+
+@pytest.fixture(autouse=True)
+def _reset_index_cache():
+    entity_resolver._name_index_ready.clear()
+    yield
+    entity_resolver._name_index_ready.clear()
+
+
+def _entity(entity_id, name):
+    return CanonicalEntity(
+        id=entity_id, entity_type="company", canonical_name=name, normalized_name=name
+    )
+
+
+def _db(dialect="postgresql", candidates=(), entities=()):
+    db = MagicMock()
+    bind = db.get_bind.return_value
+    bind.url = f"{dialect}://bench/test"
+    bind.dialect.name = dialect
+    # Both trigram indexes present and valid
+    bind.connect.return_value.__enter__.return_value.execute.return_value.scalar.return_value = 2
+    db.execute.return_value.fetchall.return_value = list(candidates)
+    db.query.return_value.filter.return_value.all.return_value = list(entities)
+    return db
+
+
+class TestEnsureNameIndex:
+    """resolve() only checks for the indexes; the DDL runs at startup."""
+
+    def _conn(self, db):
+        return db.get_bind.return_value.connect.return_value.__enter__.return_value
+
+    def test_checks_valid_indexes_once(self):
+        db = _db()
+        resolver = EntityResolver(db)
+
+        assert resolver.ensure_name_index() is True
+        assert resolver.ensure_name_index() is True
+
+        statements = [str(c.args[0]) for c in self._conn(db).execute.call_args_list]
+        assert len(statements) == 1
+        assert "pg_index" in statements[0] and "indisvalid" in statements[0]
+        assert not any("CREATE" in s for s in statements)
+        db.execute.assert_not_called()
+
+    def test_missing_index_rechecked_after_interval(self, monkeypatch):
+        db = _db()
+        conn = self._conn(db)
+        conn.execute.return_value.scalar.return_value = 1
+        clock = [1000.0]
+        monkeypatch.setattr(entity_resolver.time, "monotonic", lambda: clock[0])
+        resolver = EntityResolver(db)
+
+        assert resolver.ensure_name_index() is False
+        conn.execute.return_value.scalar.return_value = 2
+        assert resolver.ensure_name_index() is False
+        clock[0] += entity_resolver.NAME_INDEX_RECHECK_S + 1
+        assert resolver.ensure_name_index() is True
+        assert conn.execute.call_count == 2
+
+    def test_non_postgres_is_unavailable(self):
+        assert EntityResolver(_db(dialect="sqlite")).ensure_name_index() is False
+
+    def test_check_failure_is_unavailable(self):
+        db = _db()
+        db.get_bind.return_value.connect.side_effect = ProgrammingError(
+            "SELECT", {}, Exception("permission denied")
+        )
+        assert EntityResolver(db).ensure_name_index() is False
+
+
+class TestStartupIndexes:
+    """Trigram indexes are built CONCURRENTLY at startup, outside a transaction."""
+
+    def test_concurrent_build_on_autocommit_connection(self):
+        from app.core import database
+
+        engine = MagicMock()
+        engine.dialect.name = "postgresql"
+        conn = engine.connect.return_value.execution_options.return_value.__enter__.return_value
+        conn.execute.side_effect = [None, ProgrammingError("CREATE", {}, Exception("no table")), None]
+
+        database._apply_search_indexes(engine)
+
+        engine.connect.return_value.execution_options.assert_called_once_with(
+            isolation_level="AUTOCOMMIT"
+        )
+        statements = [str(c.args[0]) for c in conn.execute.call_args_list]
+        assert statements[0] == "CREATE EXTENSION IF NOT EXISTS pg_trgm"
+        assert all("CONCURRENTLY" in s and "gin_trgm_ops" in s for s in statements[1:])
+        assert len(statements) == 3
+
+    def test_skipped_outside_postgres(self):
+        from app.core import database
+
+        engine = MagicMock()
+        engine.dialect.name = "sqlite"
+        database._apply_search_indexes(engine)
+        engine.connect.assert_not_called()
+
+
+class TestIndexedNameMatch:
+    """Only top-K trigram candidates are scored with Levenshtein."""
+
+    def test_single_topk_query(self):
+        db = _db(candidates=[(1, "acme holdings")], entities=[_entity(1, "acme holdings")])
+        resolver = EntityResolver(db, name_candidate_limit=25)
+
+        matches = resolver._match_by_name_only("company", "acme holdings")
+
+        assert [(e.id, s) for e, s in matches] == [(1, 1.0)]
+        assert db.execute.call_count == 1
+        sql = str(db.execute.call_args.args[0])
+        assert "normalized_alias % :name" in sql
+        assert "normalized_name % :name" in sql
+        assert "LIMIT :k" in sql
+        assert db.execute.call_args.args[1] == {
+            "entity_type": "company",
+            "name": "acme holdings",
+            "k": 25,
+        }
+
+    def test_best_alias_per_entity_and_threshold(self):
+        db = _db(
+            candidates=[
+                (1, "acme holdngs"),  # 0.92
+                (1, "acme holdings"),  # 1.0 - best for entity 1
+                (2, "acme holding"),  # 0.92
+                (3, "acme"),  # below threshold, not loaded
+            ],
+            entities=[_entity(2, "acme holding"), _entity(1, "acme holdings")],
+        )
+        resolver = EntityResolver(db)
+
+        matches = resolver._match_by_name_only("company", "acme holdings")
+
+        assert [e.id for e, _ in matches] == [1, 2]
+        assert matches[0][1] == 1.0
+        assert 0.85 <= matches[1][1] < 1.0
+
+    def test_no_candidates_skips_entity_load(self):
+        db = _db(candidates=[])
+        assert EntityResolver(db)._match_by_name_only("company", "zzz") == []
+        db.query.assert_not_called()
+
+
+class TestExhaustiveFallback:
+    """The full alias scan is kept for non-Postgres, failures and opt-out."""
+
+    @pytest.mark.parametrize("dialect,use_index", [("sqlite", True), ("postgresql", False)])
+    def test_fallback_paths(self, dialect, use_index):
+        resolver = EntityResolver(_db(dialect=dialect), use_name_index=use_index)
+        with patch.object(resolver, "_match_by_name_exhaustive", return_value=[]) as scan, \
+                patch.object(resolver, "_match_by_name_indexed") as indexed:
+            resolver._match_by_name_only("company", "acme")
+        scan.assert_called_once_with("company", "acme")
+        indexed.assert_not_called()
+
+    def test_query_failure_rolls_back_and_scans(self):
+        db = _db()
+        resolver = EntityResolver(db)
+        db.execute.side_effect = ProgrammingError("SELECT", {}, Exception("no operator %"))
+        with patch.object(resolver, "_match_by_name_exhaustive", return_value=[]) as scan:
+            assert resolver._match_by_name_only("company", "acme") == []
+        db.rollback.assert_called_once()
+        scan.assert_called_once()
@@ -0,0 +1,97 @@
+"""
+Tests for CompanyNameMatcher.deduplicate_batch and its group-key index.
+
+Covers:
+- the length-band / q-gram prefix index finds exactly the group key a
+  full scan of all keys would (same threshold semantics)
+- grouping does not depend on input order
+- merge_func, _fuzzy_matched markers and output ordering
+
+All tests are fully offline.
+"""
+
+import random
+
+import pytest
+
+from app.agentic.fuzzy_matcher import (
+    CompanyNameMatcher,
+    _GroupKeyIndex,
+    similarity_ratio,
+)
+
+
+class TestGroupKeyIndex:
+    """Index lookups agree with comparing against every key."""
+
+    @pytest.mark.parametrize("threshold", [0.5, 0.7, 0.85, 0.95])
+    def test_matches_full_scan(self, threshold):
+        rng = random.Random(int(threshold * 100))
+        names = sorted({
+            "".join(rng.choice("abcd ") for _ in range(rng.randint(0, 14)))
+            for _ in range(300)
+        })
+        index = _GroupKeyIndex(names, threshold)
+        keys = []
+        for name in names:
+            expected = next((k for k in keys if similarity_ratio(name, k) >= threshold), None)
+            assert index.find(name) == expected
+            if expected is None:
+                index.add(name)
+                keys.append(name)
+
+
+class TestDeduplicateBatch:
+    """Grouping semantics and output."""
+
+    RECORDS = [
+        {"company_name": "Apple Inc", "n": 1},
+        {"company_name": "Microsoft Corp", "n": 2},
+        {"company_name": "Apple, Inc.", "n": 3},
+        {"company_name": "Microsoft Corporation", "n": 4},
+        {"company_name": "Zeta Labs", "n": 5},
+        {"company_name": "", "n": 6},
+    ]
+
+    def _records(self):
+        return [dict(r) for r in self.RECORDS]
+
+    def test_groups_and_order(self):
+        result = CompanyNameMatcher().deduplicate_batch(self._records())
+        assert [r["n"] for r in result] == [1, 2, 5]
+        assert result[0]["_matched_count"] == 2
+        assert result[1]["_fuzzy_matched"] is True
+        assert "_fuzzy_matched" not in result[2]
+
+    def test_grouping_independent_of_input_order(self):
+        matcher = CompanyNameMatcher(similarity_threshold=0.8)
+        names = ["acme holdings", "acme holding", "acme holdin", "acme hold",
+                 "granite peak", "granit peak", "granite peaks"]
+
+        def _merge(a, b):
+            members = a.get("members") or {a["company_name"]}
+            return {**a, "members": members | {b["company_name"]}}
+
+        rng = random.Random(1)
+        baseline = None
+        for _ in range(10):
+            rng.shuffle(names)
+            result = matcher.deduplicate_batch(
+                [{"company_name": n} for n in names], merge_func=_merge
+            )
+            groups = {frozenset(r.get("members") or {r["company_name"]}) for r in result}
+            if baseline is None:
+                baseline = groups
+            assert groups == baseline
+        assert len(baseline) == 3
+
+    def test_merge_func_in_input_order(self):
+        def _merge(a, b):
+            return {**a, "merged": a.get("merged", [a["n"]]) + [b["n"]]}
+
+        result = CompanyNameMatcher().deduplicate_batch(self._records(), merge_func=_merge)
+        assert result[0]["merged"] == [1, 3]
+        assert result[1]["merged"] == [2, 4]
+
+    def test_empty(self):
+        assert CompanyNameMatcher().deduplicate_batch([]) == []
@@ -0,0 +1,118 @@
+"""
+Tests for the shared per-host HTTP pools in app/core/http_client.py.
+
+Covers:
+- clients built on shared_transport() share one pool per origin
+- origins are keyed by scheme, host and port (default port filled in)
+- closing a client leaves the shared pool open
+- pool_stats() counts opened vs reused connections and wait time
+- BaseAPIClient uses the shared transport
+
+All tests are fully offline: each pool's transport is replaced with an
+httpx.MockTransport that replays httpcore trace events.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.core import http_client
+from app.core.http_client import (
+    BaseAPIClient,
+    close_shared_pools,
+    pool_stats,
+    shared_transport,
+)
+
+
+class _Client(BaseAPIClient):
+    SOURCE_NAME = "test"
+    BASE_URL = "https://api.example.com"
+
+
+@pytest.fixture
+def pools(monkeypatch):
+    """Fresh registry whose pools answer from a MockTransport."""
+    created = []
+    open_hosts = set()
+    host_pool = http_client._HostPool
+
+    def make_pool(http2):
+        pool = host_pool.__new__(host_pool)
+        pool.stats = http_client.PoolStats(http2=http2)
+
+        async def handler(request):
+            trace = request.extensions["trace"]
+            origin = (request.url.host, request.url.port)
+            if origin not in open_hosts:
+                open_hosts.add(origin)
+                await trace("connection.connect_tcp.started", {})
+                await trace("connection.connect_tcp.complete", {})
+            await trace("http11.send_request_headers.started", {})
+            return httpx.Response(200, json={"path": request.url.path})
+
+        pool.transport = httpx.MockTransport(handler)
+        created.append(pool)
+        return pool
+
+    monkeypatch.setattr(http_client, "_registry", http_client._PoolRegistry())
+    monkeypatch.setattr(http_client, "_HostPool", make_pool)
+    return created
+
+
+def test_clients_share_pool_per_origin(pools):
+    async def run():
+        async with httpx.AsyncClient(transport=shared_transport()) as a:
+            await a.get("https://api.example.com/one")
+        async with httpx.AsyncClient(transport=shared_transport()) as b:
+            await b.get("https://api.example.com:443/two")
+            await b.get("https://other.example.com/x")
+            await b.get("http://api.example.com/y")
+        return pool_stats()
+
+    stats = asyncio.run(run())
+    assert len(pools) == 3
+    assert set(stats) == {
+        "https://api.example.com:443",
+        "https://other.example.com:443",
+        "http://api.example.com:80",
+    }
+    example = stats["https://api.example.com:443"]
+    assert example["requests"] == 2
+    assert example["connections_opened"] == 1
+    assert example["reused"] == 1
+    assert example["wait_seconds_max"] >= 0
+
+
+def test_closing_client_keeps_pool_open(pools):
+    async def run():
+        client = _Client()
+        http = await client._get_client()
+        assert http._transport is shared_transport()
+        await http.get("https://api.example.com/a")
+        await client.close()
+        assert client._client is None
+
+        other = _Client()
+        await (await other._get_client()).get("https://api.example.com/b")
+        await other.close()
+        await close_shared_pools()
+
+    asyncio.run(run())
+    assert len(pools) == 1
+    assert pool_stats() == {}
+
+
+def test_http2_only_for_https(pools, monkeypatch):
+    monkeypatch.setattr(http_client, "HTTP2_AVAILABLE", True)
+
+    async def run():
+        async with httpx.AsyncClient(transport=shared_transport()) as client:
+            await client.get("https://api.example.com/")
+            await client.get("http://plain.example.com/")
+        return pool_stats()
+
+    stats = asyncio.run(run())
+    assert stats["https://api.example.com:443"]["http2"] is True
+    assert stats["http://plain.example.com:80"]["http2"] is False
@@ -0,0 +1,317 @@
+"""
+Tests for incremental, sketch-based data profiling.
+
+Covers:
+- HyperLogLog / KLL / TopK / ColumnSketch accuracy, merge and JSON round-trip
+- watermark column selection (serial key, then ingested_at/created_at)
+- first run sketches the whole table, later runs only read new rows and
+  match a full sketch of the table
+- deletes (row count drift), schema changes and the periodic refresh fall
+  back to a full sketch
+- tables above the sampling threshold are sketched (and extended) from a
+  BERNOULLI sample, with exact row counts and scaled null counts
+- the time budget bounds the sketch scans and counts; a pass that runs out
+  stores nothing and keeps the previous sketches
+
+All tests are fully offline (in-memory SQLite).
+"""
+
+import json
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import sessionmaker
+
+from app.core import data_profiling_service as profiling
+from app.core.data_profiling_service import (
+    PROFILE_MODE_FULL_SKETCH,
+    PROFILE_MODE_INCREMENTAL,
+    SketchBudgetExceeded,
+    _find_watermark_column,
+    _profile_with_sketches,
+    _sketch_profiles,
+)
+from app.core.models import Base, DataProfileColumn, DataProfileSnapshot
+from app.core.profile_sketches import ColumnSketch, HyperLogLog, KLLSketch, TopK
+
+TABLE = "prof_events"
+
+COLUMNS = [
+    {"name": "id", "type": "integer", "udt_name": "int4", "nullable": False,
+     "default": "nextval('prof_events_id_seq'::regclass)", "identity": False},
+    {"name": "state", "type": "character varying", "udt_name": "varchar", "nullable": True,
+     "default": None, "identity": False},
+    {"name": "amount", "type": "numeric", "udt_name": "numeric", "nullable": True,
+     "default": None, "identity": False},
+    {"name": "ingested_at", "type": "timestamp without time zone", "udt_name": "timestamp",
+     "nullable": True, "default": None, "identity": False},
+    {"name": "payload", "type": "jsonb", "udt_name": "jsonb", "nullable": True,
+     "default": None, "identity": False},
+]
+
+
+def _roundtrip(sketch):
+    return type(sketch).from_dict(json.loads(json.dumps(sketch.to_dict())))
+
+
+class TestSketches:
+    def test_hll_exact_when_small_and_close_when_large(self):
+        small = HyperLogLog()
+        small.add_hashes(pd.util.hash_array(np.arange(200, dtype=float)))
+        assert small.estimate() == 200
+
+        large = HyperLogLog()
+        large.add_hashes(pd.util.hash_array(np.arange(50_000, dtype=float)))
+        assert abs(large.estimate() - 50_000) / 50_000 < 0.05
+
+    def test_hll_merge_equals_union(self):
+        a, b, union = HyperLogLog(), HyperLogLog(), HyperLogLog()
+        left = pd.util.hash_array(np.arange(0, 30_000, dtype=float))
+        right = pd.util.hash_array(np.arange(20_000, 40_000, dtype=float))
+        a.add_hashes(left)
+        b.add_hashes(right)
+        union.add_hashes(np.concatenate([left, right]))
+        a.merge(_roundtrip(b))
+        assert a.estimate() == union.estimate()
+
+    def test_kll_quantiles(self):
+        values = np.random.default_rng(3).normal(100, 15, 100_000)
+        sketch = KLLSketch()
+        for chunk in np.array_split(values, 7):
+            part = KLLSketch()
+            part.update(chunk)
+            sketch.merge(_roundtrip(part))
+        assert sketch.n == len(values)
+        for q, expected in zip([0.25, 0.5, 0.75], np.percentile(values, [25, 50, 75])):
+            assert sketch.quantiles([q])[0] == pytest.approx(expected, abs=1.5)
+
+    def test_kll_exact_when_small(self):
+        sketch = KLLSketch()
+        sketch.update(np.array([1.0, 2.0, 3.0, 4.0]))
+        assert sketch.quantiles([0.25, 0.5]) == [1.75, 2.5]
+
+    def test_topk(self):
+        topk = TopK(capacity=3)
+        topk.update(pd.Series(["a"] * 50 + ["b"] * 30 + ["c", "d", "e", "f"]))
+        assert [t["value"] for t in topk.top(2)] == ["a", "b"]
+
+    def test_column_sketch_merge_matches_single_pass(self):
+        frame = pd.DataFrame({
+            "amount": [1.5, None, 3.0, 10.0, 2.5, None, 7.0],
+            "state": ["CA", "NY", None, "CA", "TX", "CA", "NY"],
+        })
+        for column, kind in [("amount", "numeric"), ("state", "string")]:
+            whole = ColumnSketch(kind)
+            whole.update(frame[column])
+            merged = ColumnSketch(kind)
+            merged.update(frame[column][:3])
+            tail = ColumnSketch(kind)
+            tail.update(frame[column][3:])
+            merged.merge(_roundtrip(tail))
+            assert _roundtrip(merged).summarize() == pytest.approx(whole.summarize()) \
+                if kind == "numeric" else merged.summarize() == whole.summarize()
+
+        numeric = ColumnSketch("numeric")
+        numeric.update(frame["amount"])
+        nulls, distinct, stats = numeric.summarize()
+        assert (nulls, distinct) == (2, 5)
+        assert stats["mean"] == pytest.approx(4.8)
+        assert stats["stddev"] == pytest.approx(frame["amount"].std())
+        assert stats["median"] == 3.0
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(text(
+            f"CREATE TABLE {TABLE} (id INTEGER PRIMARY KEY, state TEXT, amount REAL,"
+            " ingested_at TIMESTAMP, payload TEXT)"
+        ))
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def _insert(db, rows):
+    base = datetime(2026, 1, 1)
+    for i, (state, amount) in enumerate(rows):
+        db.execute(
+            text(
+                f"INSERT INTO {TABLE} (state, amount, ingested_at, payload)"
+                " VALUES (:state, :amount, :ts, :payload)"
+            ),
+            {"state": state, "amount": amount, "payload": None if i % 3 else "{}",
+             "ts": (base + timedelta(minutes=i)).strftime("%Y-%m-%d %H:%M:%S")},
+        )
+    db.commit()
+
+
+def _profile(db):
+    return _profile_with_sketches(db, TABLE, COLUMNS, None, "test", None, 0.0)
+
+
+def _columns(db, snapshot):
+    return {
+        c.column_name: c
+        for c in db.query(DataProfileColumn).filter_by(snapshot_id=snapshot.id)
+    }
+
+
+class _SelectLog:
+    def __init__(self, db):
+        self.statements = []
+        self.engine = db.get_bind()
+        event.listen(self.engine, "before_cursor_execute", self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().startswith("SELECT") and TABLE in statement:
+            self.statements.append((statement, parameters))
+
+    def close(self):
+        event.remove(self.engine, "before_cursor_execute", self._record)
+
+
+class TestIncrementalProfile:
+    def test_watermark_column(self):
+        assert _find_watermark_column(COLUMNS) == "id"
+        assert _find_watermark_column(COLUMNS[1:]) == "ingested_at"
+        assert _find_watermark_column(COLUMNS[1:3]) is None
+
+    def test_incremental_matches_full(self, db):
+        _insert(db, [("CA", 10.0), ("NY", None), (None, 30.0), ("CA", 5.0)])
+        first = _profile(db)
+        assert first.profile_mode == PROFILE_MODE_FULL_SKETCH
+        assert first.watermark == {"column": "id", "value": 4}
+
+        _insert(db, [("TX", 12.0), ("CA", 1.0), ("WA", None)])
+        log = _SelectLog(db)
+        try:
+            second = _profile(db)
+        finally:
+            log.close()
+        assert second.profile_mode == PROFILE_MODE_INCREMENTAL
+        assert second.row_count == 7
+        assert second.watermark["value"] == 7
+        scans = [(sql, params) for sql, params in log.statements if '"state"' in sql]
+        assert len(scans) == 1 and scans[0][1][0] == 4  # only id > 4 was read
+
+        # same table sketched from scratch gives the same profile
+        db.query(DataProfileSnapshot).delete()
+        db.commit()
+        full = _profile(db)
+        incremental, rebuilt = _columns(db, second), _columns(db, full)
+        for name in ("id", "state", "amount", "ingested_at", "payload"):
+            assert incremental[name].null_count == rebuilt[name].null_count
+            assert incremental[name].distinct_count == rebuilt[name].distinct_count
+            assert incremental[name].stats == pytest.approx(rebuilt[name].stats) \
+                if name == "amount" else incremental[name].stats == rebuilt[name].stats
+        assert second.total_null_count == full.total_null_count
+        assert incremental["state"].stats["top_values"][0] == {"value": "CA", "count": 3}
+        assert incremental["payload"].null_count == 4
+
+    def test_no_new_rows(self, db):
+        _insert(db, [("CA", 1.0)])
+        _profile(db)
+        again = _profile(db)
+        assert again.profile_mode == PROFILE_MODE_INCREMENTAL
+        assert again.row_count == 1
+
+    def test_delete_forces_full_profile(self, db):
+        _insert(db, [("CA", 1.0), ("NY", 2.0), ("TX", 3.0)])
+        _profile(db)
+        db.execute(text(f"DELETE FROM {TABLE} WHERE id = 1"))
+        _insert(db, [("WA", 4.0)])
+        snapshot = _profile(db)
+        assert snapshot.profile_mode == PROFILE_MODE_FULL_SKETCH
+        assert snapshot.row_count == 3
+        assert _columns(db, snapshot)["amount"].stats["min"] == 2.0
+
+    def test_schema_change_forces_full_profile(self, db):
+        _insert(db, [("CA", 1.0)])
+        _profile(db)
+        changed = [dict(c) for c in COLUMNS]
+        changed[2]["type"] = "double precision"
+        snapshot = _profile_with_sketches(db, TABLE, changed, None, "test", None, 0.0)
+        assert snapshot.profile_mode == PROFILE_MODE_FULL_SKETCH
+
+    def test_periodic_full_profile(self, db, monkeypatch):
+        _insert(db, [("CA", 1.0)])
+        first = _profile(db)
+        monkeypatch.setattr(profiling, "FULL_PROFILE_EVERY", 2)
+        assert _profile(db).profile_mode == PROFILE_MODE_INCREMENTAL
+        assert _profile(db).profile_mode == PROFILE_MODE_INCREMENTAL
+        assert _profile(db).profile_mode == PROFILE_MODE_FULL_SKETCH
+
+        monkeypatch.setattr(profiling, "FULL_PROFILE_EVERY", 50)
+        db.query(DataProfileSnapshot).update({"profiled_at": first.profiled_at - timedelta(days=8)})
+        db.commit()
+        assert _profile(db).profile_mode == PROFILE_MODE_FULL_SKETCH
+
+    def test_table_without_watermark(self, db):
+        assert _profile_with_sketches(db, TABLE, COLUMNS[1:3], None, None, None, 0.0) is None
+
+    def test_large_table_sketched_from_sample(self, db, monkeypatch):
+        calls = []
+        real = profiling._sketch_rows
+
+        def sampled_rows(db, table, columns, wm, low, high, sample_pct=None, deadline=None):
+            calls.append(sample_pct)
+            return real(db, table, columns, wm, low, high, deadline=deadline)  # SQLite has no TABLESAMPLE
+
+        monkeypatch.setattr(profiling, "_sketch_sample_pct", lambda db, table: 10)
+        monkeypatch.setattr(profiling, "_sketch_rows", sampled_rows)
+        _insert(db, [("CA", 1.0), ("NY", 2.0)])
+        first = _profile(db)
+        assert first.watermark == {"column": "id", "value": 2, "sample_pct": 10}
+        assert first.profile_cost["sampled"] is True
+
+        _insert(db, [("TX", 3.0)])
+        second = _profile(db)
+        assert second.profile_mode == PROFILE_MODE_INCREMENTAL
+        assert second.row_count == 3
+        assert second.watermark["sample_pct"] == 10
+        assert calls == [10, 10]
+
+    def test_sampled_sketch_scales_null_counts(self):
+        sketch = ColumnSketch("numeric")
+        sketch.update(pd.Series([1.0, None, 3.0, None]))
+        profile = _sketch_profiles(COLUMNS[2:3], {"amount": sketch}, 40)[0]
+        assert profile["null_count"] == 20
+        assert profile["null_pct"] == 50.0
+        assert profile["cardinality_ratio"] == 1.0
+
+    def test_budget_applies_to_sketch_path(self, db):
+        _insert(db, [("CA", 1.0), ("NY", 2.0)])
+        first = _profile_with_sketches(
+            db, TABLE, COLUMNS, None, "test", None, time.time(), time_budget_s=60.0
+        )
+        assert first.profile_mode == PROFILE_MODE_FULL_SKETCH
+        assert first.profile_cost["time_budget_s"] == 60.0
+
+        _insert(db, [("TX", 3.0)])
+        with pytest.raises(SketchBudgetExceeded):
+            _profile_with_sketches(
+                db, TABLE, COLUMNS, None, "test", None, time.time() - 120, time_budget_s=60.0
+            )
+        db.rollback()
+        assert db.query(DataProfileSnapshot).count() == 1
+        assert _profile(db).profile_mode == PROFILE_MODE_INCREMENTAL
+
+    def test_budget_stops_full_sketch_mid_scan(self, db, monkeypatch):
+        _insert(db, [("CA", float(i)) for i in range(5)])
+        monkeypatch.setattr(profiling, "STREAM_CHUNK_ROWS", 2)
+        now = time.time()
+        clock = iter(now + step for step in range(100))  # one second per check
+        monkeypatch.setattr(profiling, "time", SimpleNamespace(time=lambda: next(clock)))
+
+        with pytest.raises(SketchBudgetExceeded, match="after 4 rows"):
+            _profile_with_sketches(db, TABLE, COLUMNS, None, "test", None, now, time_budget_s=2.5)
+        db.rollback()
+        assert db.query(DataProfileSnapshot).count() == 0
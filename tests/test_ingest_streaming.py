@@ -0,0 +1,233 @@
+"""
+Unit tests for the streaming fetch -> parse -> insert pipeline in
+app/core/ingest_base.py (BaseSourceIngestor.stream_insert_rows and
+SimpleIngestor.run_streaming_ingestion).
+
+All tests are fully offline (no DB, no network); batch_insert is patched.
+"""
+import asyncio
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.core.batch_operations import BatchInsertResult
+from app.core.ingest_base import SimpleIngestor
+
+
+def _fake_batch_insert(inserted_pages):
+    """Build a batch_insert stand-in that records each page's rows."""
+
+    def _insert(db, table_name, rows, columns, **kwargs):
+        inserted_pages.append(list(rows))
+        result = BatchInsertResult()
+        result.rows_inserted = len(rows)
+        result.batches_processed = 1
+        result.mark_complete()
+        return result
+
+    return _insert
+
+
+async def _pages(n_pages, page_size=3):
+    for p in range(n_pages):
+        await asyncio.sleep(0)
+        yield [{"id": p * page_size + i} for i in range(page_size)]
+
+
+class TestStreamInsertRows:
+    """BaseSourceIngestor.stream_insert_rows behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_all_pages_parsed_and_inserted_in_order(self):
+        inserted = []
+        ingestor = SimpleIngestor(MagicMock())
+
+        with patch("app.core.ingest_base.batch_insert", _fake_batch_insert(inserted)):
+            result = await ingestor.stream_insert_rows(
+                pages=_pages(5),
+                parse_func=lambda page: page,
+                table_name="t",
+                columns=["id"],
+            )
+
+        assert result.rows_inserted == 15
+        assert result.batches_processed == 5
+        assert [r["id"] for page in inserted for r in page] == list(range(15))
+
+    @pytest.mark.asyncio
+    async def test_empty_pages_are_skipped(self):
+        inserted = []
+        ingestor = SimpleIngestor(MagicMock())
+
+        with patch("app.core.ingest_base.batch_insert", _fake_batch_insert(inserted)):
+            result = await ingestor.stream_insert_rows(
+                pages=_pages(3),
+                parse_func=lambda page: [] if page[0]["id"] == 3 else page,
+                table_name="t",
+                columns=["id"],
+            )
+
+        assert len(inserted) == 2
+        assert result.rows_inserted == 6
+
+    @pytest.mark.asyncio
+    async def test_fetch_is_bounded_by_queue_depth(self):
+        """A stalled insert stage stops the fetcher after filling both queues."""
+        fetched = []
+        release = asyncio.Event()
+
+        async def _tracking_pages():
+            for p in range(50):
+                fetched.append(p)
+                yield [{"id": p}]
+
+        def _blocking_insert(db, table_name, rows, columns, **kwargs):
+            asyncio.run_coroutine_threadsafe(release.wait(), loop).result()
+            result = BatchInsertResult()
+            result.rows_inserted = len(rows)
+            return result
+
+        loop = asyncio.get_running_loop()
+        ingestor = SimpleIngestor(MagicMock())
+
+        with patch("app.core.ingest_base.batch_insert", _blocking_insert):
+            task = asyncio.create_task(
+                ingestor.stream_insert_rows(
+                    pages=_tracking_pages(),
+                    parse_func=lambda page: page,
+                    table_name="t",
+                    columns=["id"],
+                    queue_size=2,
+                )
+            )
+            for _ in range(50):
+                await asyncio.sleep(0)
+            # 1 in the insert thread + 2 parsed + 1 in parse + 2 raw + 1 pending put
+            assert len(fetched) <= 7
+            release.set()
+            result = await task
+
+        assert result.rows_inserted == 50
+
+    @pytest.mark.asyncio
+    async def test_insert_failure_cancels_fetch_and_raises(self):
+        def _failing_insert(*args, **kwargs):
+            raise RuntimeError("db down")
+
+        async def _endless_pages():
+            i = 0
+            while True:
+                await asyncio.sleep(0)
+                yield [{"id": i}]
+                i += 1
+
+        ingestor = SimpleIngestor(MagicMock())
+
+        with patch("app.core.ingest_base.batch_insert", _failing_insert):
+            with pytest.raises(RuntimeError, match="db down"):
+                await ingestor.stream_insert_rows(
+                    pages=_endless_pages(),
+                    parse_func=lambda page: page,
+                    table_name="t",
+                    columns=["id"],
+                )
+
+    @pytest.mark.asyncio
+    async def test_rows_committed_is_cumulative(self):
+        ingestor = SimpleIngestor(MagicMock())
+
+        with patch("app.core.ingest_base.batch_insert", _fake_batch_insert([])), patch(
+            "app.core.ingest_base.update_rows_committed"
+        ) as mock_update:
+            await ingestor.stream_insert_rows(
+                pages=_pages(3),
+                parse_func=lambda page: page,
+                table_name="t",
+                columns=["id"],
+                job_id=11,
+            )
+
+        assert [c.args[2] for c in mock_update.call_args_list] == [3, 6, 9]
+
+
+    @pytest.mark.asyncio
+    async def test_inserts_use_own_session_on_one_thread(self):
+        seen = []
+
+        def _recording_insert(db, table_name, rows, columns, **kwargs):
+            seen.append((db, threading.get_ident()))
+            return _fake_batch_insert([])(db, table_name, rows, columns)
+
+        main_db = MagicMock()
+        ingestor = SimpleIngestor(main_db)
+        parse_threads = []
+
+        def _parse(page):
+            parse_threads.append(threading.get_ident())
+            return page
+
+        with patch("app.core.ingest_base.batch_insert", _recording_insert), patch(
+            "app.core.ingest_base.sessionmaker"
+        ) as factory:
+            await ingestor.stream_insert_rows(
+                pages=_pages(4), parse_func=_parse, table_name="t", columns=["id"],
+            )
+
+        sessions = {id(db) for db, _ in seen}
+        assert len(sessions) == 1 and seen[0][0] is not main_db
+        assert len({thread for _, thread in seen}) == 1
+        assert threading.get_ident() not in parse_threads
+        factory.return_value.return_value.close.assert_called_once()
+
+
+class TestRunStreamingIngestion:
+    """SimpleIngestor.run_streaming_ingestion job lifecycle."""
+
+    @pytest.mark.asyncio
+    async def test_success_completes_job(self):
+        ingestor = SimpleIngestor(MagicMock())
+        ingestor.start_job = MagicMock()
+        ingestor.prepare_table = MagicMock()
+        ingestor.complete_job = MagicMock()
+        ingestor.fail_job = MagicMock()
+
+        with patch("app.core.ingest_base.batch_insert", _fake_batch_insert([])), patch(
+            "app.core.ingest_base.update_rows_committed"
+        ):
+            out = await ingestor.run_streaming_ingestion(
+                job_id=1,
+                dataset_id="ds",
+                table_name="t",
+                create_sql="CREATE TABLE t (id INT)",
+                fetch_pages_func=lambda: _pages(2),
+                parse_page_func=lambda page: page,
+                columns=["id"],
+            )
+
+        assert out["rows_inserted"] == 6
+        ingestor.complete_job.assert_called_once_with(1, 6)
+        ingestor.fail_job.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_parse_error_fails_job(self):
+        ingestor = SimpleIngestor(MagicMock())
+        ingestor.start_job = MagicMock()
+        ingestor.prepare_table = MagicMock()
+        ingestor.fail_job = MagicMock()
+
+        def _bad_parse(page):
+            raise ValueError("bad page")
+
+        with pytest.raises(ValueError):
+            await ingestor.run_streaming_ingestion(
+                job_id=2,
+                dataset_id="ds",
+                table_name="t",
+                create_sql="CREATE TABLE t (id INT)",
+                fetch_pages_func=lambda: _pages(2),
+                parse_page_func=_bad_parse,
+                columns=["id"],
+            )
+
+        ingestor.fail_job.assert_called_once()
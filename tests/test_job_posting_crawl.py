@@ -0,0 +1,138 @@
+"""
+Tests for JobPostingCollector.collect_all's concurrent crawl scheduler
+(app/sources/job_postings/collector.py).
+
+Covers:
+- crawl_host groups hosted ATS boards by API host and keys Workday tenants,
+  generic scrapes and undetected companies by their own host
+- collect_all runs crawls concurrently, never more than the global limit
+  or a host's concurrent rate limit at once
+- hosted ATS crawls take a token from their host's bucket in the shared rate
+  limiter; other hosts stay out of it and are capped at the default
+  concurrent limit
+- the running summary is streamed to progress_callback after each company
+
+All tests are fully offline (MagicMock session, collect_company replaced).
+"""
+
+import asyncio
+from collections import Counter
+from unittest.mock import MagicMock
+
+from app.core.rate_limiter import DEFAULT_RATE_LIMITS, RateLimiterService
+from app.sources.job_postings.collector import (
+    CollectionResult,
+    JobPostingCollector,
+    crawl_host,
+)
+
+
+class TestCrawlHost:
+    def test_hosted_ats_share_api_host(self):
+        assert crawl_host("greenhouse", "acme", None, "acme.com") == "boards-api.greenhouse.io"
+        assert crawl_host("lever", "acme", None, None) == "api.lever.co"
+        assert crawl_host("ashby", "acme", None, None) == "api.ashbyhq.com"
+        assert crawl_host("smartrecruiters", "Acme", None, None) == "api.smartrecruiters.com"
+
+    def test_workday_tenant_host(self):
+        token = "https://acme.wd5.myworkdayjobs.com/External"
+        assert crawl_host("workday", token, None, None) == "acme.wd5.myworkdayjobs.com"
+        assert crawl_host(
+            "workday", "acme", "https://acme.wd1.myworkdayjobs.com/Careers", "acme.com"
+        ) == "acme.wd1.myworkdayjobs.com"
+
+    def test_own_host_for_generic_and_undetected(self):
+        assert crawl_host("generic", None, "https://careers.acme.com/jobs", "acme.com") == "careers.acme.com"
+        assert crawl_host(None, None, None, "www.acme.com") == "www.acme.com"
+        assert crawl_host("greenhouse", None, None, "https://acme.com") == "acme.com"
+        assert crawl_host(None, None, None, None) == "unknown"
+
+
+class _FakeCrawlCollector(JobPostingCollector):
+    def __init__(self, limiter, hosts, fail=()):
+        super().__init__(rate_limiter=limiter)
+        self.hosts = hosts
+        self.fail = set(fail)
+        self.in_flight = Counter()
+        self.peak = Counter()
+
+    async def collect_company(self, db, company_id, force_rediscover=False):
+        host = self.hosts[company_id]
+        for key in (host, "total"):
+            self.in_flight[key] += 1
+            self.peak[key] = max(self.peak[key], self.in_flight[key])
+        await asyncio.sleep(0.01)
+        for key in (host, "total"):
+            self.in_flight[key] -= 1
+        if company_id in self.fail:
+            return CollectionResult(company_id=company_id, error="boom")
+        return CollectionResult(
+            company_id=company_id, total_fetched=10, new_postings=3, updated_postings=5,
+            closed_postings=1,
+        )
+
+
+def _db(rows):
+    db = MagicMock()
+    db.execute.return_value.fetchall.return_value = rows
+    return db
+
+
+def test_collect_all_concurrent_and_polite():
+    rows = [(i, "acme.com", None, "greenhouse", f"board{i}", None) for i in range(6)]
+    rows += [(10 + i, f"site{i}.com", None, None, None, None) for i in range(4)]
+    hosts = {row[0]: crawl_host(row[3], row[4], row[5] or row[2], row[1]) for row in rows}
+
+    limiter = RateLimiterService()
+    limiter.configure_source("boards-api.greenhouse.io", 1000.0, 100, 2)
+    progress = []
+
+    async def run():
+        collector = _FakeCrawlCollector(limiter, hosts, fail={11})
+        summary = await collector.collect_all(
+            _db(rows), concurrency=3, progress_callback=progress.append
+        )
+        return collector, summary
+
+    collector, summary = asyncio.run(run())
+
+    assert collector.peak["boards-api.greenhouse.io"] == 2
+    assert 1 < collector.peak["total"] <= 3
+    assert limiter.get_stats("boards-api.greenhouse.io")["total_requests"] == 6
+    assert set(limiter.get_all_stats()) == {"boards-api.greenhouse.io"}
+    assert summary == {
+        "companies_total": 10,
+        "companies_processed": 10,
+        "total_fetched": 90,
+        "total_new": 27,
+        "total_updated": 45,
+        "total_closed": 9,
+        "errors": 1,
+    }
+    assert [p["companies_processed"] for p in progress] == list(range(1, 11))
+
+
+def test_collect_all_caps_own_hosts_at_default_limit():
+    rows = [(i, "https://acme.com", None, "generic", None, "https://jobs.acme.com") for i in range(8)]
+    hosts = {row[0]: crawl_host(row[3], row[4], row[5] or row[2], row[1]) for row in rows}
+    limiter = RateLimiterService()
+
+    async def run():
+        collector = _FakeCrawlCollector(limiter, hosts)
+        summary = await collector.collect_all(_db(rows), concurrency=16)
+        return collector, summary
+
+    collector, summary = asyncio.run(run())
+
+    assert summary["companies_processed"] == 8
+    assert collector.peak["jobs.acme.com"] == DEFAULT_RATE_LIMITS["default"]["concurrent_limit"]
+    assert limiter.get_all_stats() == {}
+
+
+def test_collect_all_empty():
+    async def run():
+        collector = _FakeCrawlCollector(RateLimiterService(), {})
+        return await collector.collect_all(_db([]))
+
+    summary = asyncio.run(run())
+    assert summary["companies_processed"] == 0
@@ -0,0 +1,98 @@
+"""
+Tests for JobPostingCollector's set-based storage (app/sources/job_postings/collector.py).
+
+Covers:
+- _upsert_postings writes each chunk with one multi-row INSERT ... ON CONFLICT
+  and splits new vs updated from the RETURNING flags
+- rows without an external id are skipped, repeated ids are written once
+  (last occurrence wins), requirements are serialized to JSON
+- the upsert keeps COALESCE semantics for mutable columns and reopens rows
+- _detect_closed_postings closes missing postings with one anti-join UPDATE
+
+All tests are fully offline (MagicMock session).
+"""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.sources.job_postings import collector as collector_module
+from app.sources.job_postings.collector import JobPostingCollector, _build_upsert_sql
+
+
+@pytest.fixture
+def collector():
+    # Skip __init__: the ATS clients are not needed for storage
+    return JobPostingCollector.__new__(JobPostingCollector)
+
+
+def _db(*returned_flags):
+    db = MagicMock()
+    db.execute.return_value.scalars.return_value.all.side_effect = [
+        list(flags) for flags in returned_flags
+    ]
+    return db
+
+
+class TestUpsertPostings:
+    def test_one_statement_per_chunk(self, collector, monkeypatch):
+        monkeypatch.setattr(collector_module, "UPSERT_BATCH_SIZE", 2)
+        jobs = [{"external_job_id": str(i), "title": f"Job {i}"} for i in range(3)]
+        db = _db([True, False], [True])
+
+        assert collector._upsert_postings(db, 7, jobs, "lever") == (2, 1)
+        assert db.execute.call_count == 2
+        first_sql, first_params = db.execute.call_args_list[0].args
+        assert str(first_sql).count("NOW(), NOW())") == 2
+        assert first_params["company_id_1"] == 7
+        assert first_params["external_job_id_1"] == "1"
+        assert first_params["ats_type_0"] == "lever"
+        assert "title_2" not in first_params
+
+    def test_skips_missing_ids_and_dedupes(self, collector):
+        jobs = [
+            {"external_job_id": "a", "title": "Old title", "ats_type": "greenhouse"},
+            {"external_job_id": "", "title": "No id"},
+            {"title": "No id either"},
+            {"external_job_id": "a", "title": "New title", "requirements": {"skills": ["sql"]}},
+        ]
+        db = _db([True])
+
+        assert collector._upsert_postings(db, 1, jobs, "workday") == (1, 0)
+        params = db.execute.call_args.args[1]
+        assert params["title_0"] == "New title"
+        assert params["ats_type_0"] == "workday"
+        assert json.loads(params["requirements_0"]) == {"skills": ["sql"]}
+        assert params["department_0"] is None
+
+    def test_no_postings_no_sql(self, collector):
+        db = _db()
+        assert collector._upsert_postings(db, 1, [{"title": "x"}], "lever") == (0, 0)
+        db.execute.assert_not_called()
+
+    def test_sql_keeps_coalesce_semantics(self):
+        sql = _build_upsert_sql(1)
+        assert "ON CONFLICT (company_id, external_job_id) DO UPDATE SET" in sql
+        assert "title = COALESCE(EXCLUDED.title, job_postings.title)" in sql
+        assert "requirements = COALESCE(EXCLUDED.requirements, job_postings.requirements)" in sql
+        assert "status = 'open'" in sql and "closed_at = NULL" in sql
+        assert "description_text = " not in sql.split("DO UPDATE SET")[1]
+        assert sql.endswith("RETURNING (xmax = 0) AS inserted")
+
+
+class TestDetectClosedPostings:
+    def test_single_anti_join(self, collector):
+        db = MagicMock()
+        db.execute.return_value.rowcount = 4
+
+        assert collector._detect_closed_postings(db, 3, {"b", "a"}) == 4
+        db.execute.assert_called_once()
+        sql, params = db.execute.call_args.args
+        assert "NOT EXISTS" in str(sql)
+        assert params == {"cid": 3, "eids": ["a", "b"]}
+
+    def test_empty_crawl_closes_nothing(self, collector):
+        db = MagicMock()
+        assert collector._detect_closed_postings(db, 3, set()) == 0
+        db.execute.assert_not_called()
@@ -0,0 +1,146 @@
+"""
+Tests for the chunked, columnar M5 sales load (app/sources/kaggle/ingest.py).
+
+Covers:
+- melt_sales_chunk yields the same items and long rows as the per-row
+  parse_sales_row_to_items / parse_sales_row_to_long_format path
+- day columns are dated through the calendar by day index
+- ingest_m5_sales reads in chunks, COPYs items and sales per chunk with
+  the right conflict handling, commits per chunk and honours limit_items
+- copy_frame's CSV serialization (NULLs, quoting, lookup tables) and the
+  merge's NOW() touch columns
+
+All tests are fully offline (MagicMock session, copy_frame replaced).
+"""
+
+import asyncio
+import csv
+import io
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from app.core.batch_operations import _build_copy_merge_sql, _frame_to_copy_buffer
+from app.sources.kaggle import ingest, m5_metadata
+
+DAYS = ["d_1", "d_2", "d_3", "d_4"]
+
+
+@pytest.fixture
+def sales_csv(tmp_path):
+    path = tmp_path / "sales_train_validation.csv"
+    rows = [
+        ["HOBBIES_1_001_CA_1_validation", "HOBBIES_1_001", "HOBBIES_1", "HOBBIES", "CA_1", "CA", 0, 2, 1, 0],
+        ["FOODS_3_090_TX_2_validation", "FOODS_3_090", "FOODS_3", "FOODS", "TX_2", "TX", 5, "", 3, 12],
+        ["FOODS_3_090_TX_2_validation", "FOODS_3_090", "FOODS_3", "FOODS", "TX_2", "TX", 1, 1, 1, 1],
+        ["HOUSEHOLD_2_516_WI_3_validation", "HOUSEHOLD_2_516", "HOUSEHOLD_2", "HOUSEHOLD", "WI_3", "WI", 0, 0, 0, 7],
+    ]
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["id", "item_id", "dept_id", "cat_id", "store_id", "state_id"] + DAYS)
+        writer.writerows(rows)
+    return path
+
+
+@pytest.fixture
+def calendar_csv(tmp_path):
+    path = tmp_path / "calendar.csv"
+    path.write_text("date,d,wm_yr_wk\n2011-01-29,d_1,11101\n2011-01-30,d_2,11101\n2011-01-31,d_3,11101\n")
+    return path
+
+
+def _records(frame):
+    return [
+        {k: (None if pd.isna(v) else v) for k, v in row.items()}
+        for row in frame.astype(object).to_dict("records")
+    ]
+
+
+def test_melt_matches_row_parser(sales_csv):
+    lookup = {"d_1": "2011-01-29", "d_3": "2011-01-31"}
+    with open(sales_csv) as f:
+        rows = list(csv.DictReader(f))
+    expected_items = [m5_metadata.parse_sales_row_to_items(r) for r in rows]
+    expected_sales = [
+        s for r in rows for s in m5_metadata.parse_sales_row_to_long_format(r, DAYS, lookup)
+    ]
+
+    chunk = pd.read_csv(sales_csv, dtype={"item_id": str, "store_id": str})
+    items, sales = m5_metadata.melt_sales_chunk(chunk, DAYS, [lookup.get(d) for d in DAYS])
+
+    assert _records(items) == expected_items
+    assert _records(sales) == expected_sales
+    assert len(sales) == 15  # one missing value dropped
+    assert isinstance(sales["item_store_id"].dtype, pd.CategoricalDtype)
+
+
+def test_calendar_dates_by_day_index(calendar_csv):
+    assert ingest._calendar_dates(calendar_csv, ["d_3", "d_1", "d_9"]) == [
+        "2011-01-31", "2011-01-29", None,
+    ]
+
+
+class TestIngestSales:
+    def _run(self, monkeypatch, sales_csv, calendar_csv, **kwargs):
+        calls = []
+
+        def fake_copy_frame(db, table, frame, **options):
+            calls.append((table, frame.copy(), options))
+            return len(frame), 0
+
+        monkeypatch.setattr(ingest, "copy_frame", fake_copy_frame)
+        updates = []
+        monkeypatch.setattr(ingest, "update_rows_committed", lambda db, jid, n: updates.append(n))
+        db = MagicMock()
+        result = asyncio.run(
+            ingest.ingest_m5_sales(db, sales_csv, calendar_path=calendar_csv, **kwargs)
+        )
+        return result, calls, db, updates
+
+    def test_chunks_copied_and_committed(self, monkeypatch, sales_csv, calendar_csv):
+        result, calls, db, updates = self._run(
+            monkeypatch, sales_csv, calendar_csv, chunk_items=3, job_id=9
+        )
+
+        assert result == {"items_inserted": 3, "sales_inserted": 15}
+        assert [c[0] for c in calls] == ["m5_items", "m5_sales"] * 2
+        # the repeated item within the first chunk is copied once
+        assert list(calls[0][1]["id"]) == ["HOBBIES_1_001_CA_1", "FOODS_3_090_TX_2"]
+        assert calls[0][2] == {"conflict_columns": ["id"], "update_columns": []}
+        assert calls[1][2] == {
+            "conflict_columns": ["item_store_id", "d"],
+            "update_columns": ["sales", "date"],
+            "touch_columns": ["ingested_at"],
+        }
+        first_sales = calls[1][1]
+        assert [r["date"] for r in _records(first_sales[:4])] == [
+            "2011-01-29", "2011-01-30", "2011-01-31", None,
+        ]
+        assert db.commit.call_count == 2
+        assert updates == [13, 18]
+
+    def test_limit_items(self, monkeypatch, sales_csv, calendar_csv):
+        result, calls, _, _ = self._run(monkeypatch, sales_csv, calendar_csv, limit_items=1)
+        assert result == {"items_inserted": 1, "sales_inserted": 4}
+        assert len(calls) == 2
+
+
+class TestCopyFrame:
+    def test_csv_buffer(self):
+        frame = pd.DataFrame({
+            "name": pd.Categorical(['say "hi"', "a,b", None]),
+            "value": [1, 2, 300],
+            "note": ["\\N", None, "x\ny"],
+            "flag": [True, False, True],
+        })
+        text = _frame_to_copy_buffer(frame).getvalue()
+        assert text == '"say ""hi""",1,"\\N",t\n"a,b",2,\\N,f\n\\N,300,"x\ny",t\n'
+        assert list(csv.reader(io.StringIO(text)))[0] == ['say "hi"', "1", "\\N", "t"]
+
+    def test_merge_touch_columns(self):
+        sql = _build_copy_merge_sql(
+            "m5_sales", "_stage", ["item_store_id", "d", "sales"],
+            conflict_columns=["item_store_id", "d"], touch_columns=["ingested_at"],
+        )
+        assert 'DO UPDATE SET "sales" = EXCLUDED."sales", "ingested_at" = NOW()' in sql
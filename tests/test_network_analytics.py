@@ -0,0 +1,184 @@
+"""
+Tests for the array-backed graph analytics engine (app.network.analytics).
+
+Covers:
+- WeightedGraph.from_edges builds symmetric CSR and sums parallel edges
+- pagerank matches a dense power iteration and ranks a star's hub first
+- betweenness: exact values on a path, sampled estimate is scaled
+- louvain / label propagation split two cliques joined by a bridge
+- batched k_hop matches a per-source BFS
+- get_analytics reuses results for the same version only
+- LPGPGraphBuilder exposes PageRank / broker / community summaries
+
+All tests are fully offline.
+"""
+
+from collections import deque
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from app.network import analytics
+from app.network.analytics import (
+    WeightedGraph,
+    betweenness,
+    get_analytics,
+    k_hop,
+    label_propagation,
+    louvain,
+    modularity,
+    pagerank,
+)
+from app.services.lp_gp_graph import GraphEdge, LPGPGraphBuilder
+
+
+def _graph(edges, n=None, weights=None, version=1, name="test"):
+    source = [u for u, _ in edges]
+    target = [v for _, v in edges]
+    n = n if n is not None else max(source + target) + 1
+    return WeightedGraph.from_edges(name, version, n, source, target, weights)
+
+
+def _two_cliques():
+    left = [(i, j) for i in range(5) for j in range(i + 1, 5)]
+    right = [(i + 5, j + 5) for i, j in left]
+    return _graph(left + right + [(4, 5)])
+
+
+@pytest.fixture(autouse=True)
+def _clean_cache():
+    analytics.clear_analytics_cache()
+    yield
+    analytics.clear_analytics_cache()
+
+
+class TestWeightedGraph:
+    def test_symmetric_and_parallel_edges_summed(self):
+        graph = _graph([(0, 1), (1, 0), (1, 2)], weights=[2.0, 3.0, 1.0])
+        assert graph.num_nodes == 3
+        assert graph.num_edges == 2
+        assert graph.indptr.tolist() == [0, 1, 3, 4]
+        assert graph.indices.tolist() == [1, 0, 2, 1]
+        assert graph.weights.tolist() == [5.0, 5.0, 1.0, 1.0]
+
+
+class TestCentrality:
+    def test_pagerank_matches_dense_power_iteration(self):
+        edges = [(0, 1), (1, 2), (2, 0), (2, 3), (4, 4)]
+        weights = [1.0, 2.0, 3.0, 1.0, 1.0]
+        graph = _graph(edges, n=6, weights=weights)
+        scores = pagerank(graph)
+
+        n, d = 6, 0.85
+        adj = np.zeros((n, n))
+        for (u, v), w in zip(edges, weights):
+            adj[u, v] += w
+            if u != v:
+                adj[v, u] += w
+        strength = adj.sum(axis=1)
+        rank = np.full(n, 1.0 / n)
+        for _ in range(500):
+            spread = np.zeros(n)
+            for i in range(n):
+                if strength[i]:
+                    spread += rank[i] * adj[i] / strength[i]
+            rank = d * (spread + rank[strength == 0].sum() / n) + (1 - d) / n
+        assert scores.sum() == pytest.approx(1.0)
+        np.testing.assert_allclose(scores, rank / rank.sum(), atol=1e-8)
+
+    def test_pagerank_star_hub_first(self):
+        scores = pagerank(_graph([(0, i) for i in range(1, 8)]))
+        assert int(np.argmax(scores)) == 0
+
+    def test_exact_betweenness_on_path(self):
+        graph = _graph([(0, 1), (1, 2), (2, 3), (3, 4)])
+        scores = betweenness(graph, samples=None, normalized=False)
+        np.testing.assert_allclose(scores, [0, 3, 4, 3, 0])
+
+    def test_bridge_has_highest_sampled_betweenness(self):
+        graph = _two_cliques()
+        exact = betweenness(graph, samples=None)
+        sampled = betweenness(graph, samples=8, seed=3)
+        assert set(np.argsort(-exact)[:2].tolist()) == {4, 5}
+        assert sampled[4] > 0 and sampled[0] == 0
+
+
+class TestCommunities:
+    @pytest.mark.parametrize("detect", [louvain, label_propagation])
+    def test_two_cliques(self, detect):
+        graph = _two_cliques()
+        labels = detect(graph)
+        assert len(set(labels[:5].tolist())) == 1
+        assert len(set(labels[5:].tolist())) == 1
+        assert labels[0] != labels[9]
+        assert modularity(graph, labels) > 0.3
+
+    def test_singletons_have_no_modularity(self):
+        graph = _graph([(0, 1)], n=3)
+        assert modularity(graph, np.arange(3)) < 0
+        labels = louvain(graph)
+        assert labels[0] == labels[1] != labels[2]
+
+
+class TestKHop:
+    def test_matches_bfs(self):
+        rng = np.random.default_rng(5)
+        edges = [tuple(e) for e in rng.integers(0, 40, size=(60, 2))]
+        graph = _graph(edges, n=40)
+        sources = [0, 7, 7, 39]
+        result = k_hop(graph, sources, 2)
+
+        for source, (nodes, hops) in zip(sources, result):
+            dist = {source: 0}
+            queue = deque([source])
+            while queue:
+                u = queue.popleft()
+                if dist[u] == 2:
+                    continue
+                for v in graph.indices[graph.indptr[u]:graph.indptr[u + 1]].tolist():
+                    if v not in dist:
+                        dist[v] = dist[u] + 1
+                        queue.append(v)
+            del dist[source]
+            assert dict(zip(nodes.tolist(), hops.tolist())) == dist
+
+
+class TestCache:
+    def test_reused_per_version(self, monkeypatch):
+        calls = []
+        real = analytics.pagerank
+        monkeypatch.setattr(analytics, "pagerank", lambda g, d: calls.append(1) or real(g, d))
+
+        graph = _two_cliques()
+        get_analytics(graph).pagerank()
+        get_analytics(graph._replace()).pagerank()
+        assert len(calls) == 1
+
+        bumped = graph._replace(version=2)
+        assert get_analytics(bumped) is not get_analytics(graph._replace(version=3))
+        get_analytics(bumped).pagerank()
+        assert len(calls) == 2
+
+
+class TestLPGPAnalytics:
+    def test_network_analytics(self):
+        builder = LPGPGraphBuilder(MagicMock())
+        edge = lambda lp, gp, s: GraphEdge(  # noqa: E731
+            lp, f"LP {lp}", "pension", gp, f"GP {gp}", 1, 0.0, "new", s
+        )
+        builder._edges = [
+            edge(1, 10, 80), edge(2, 10, 60), edge(3, 10, 40),
+            edge(3, 20, 0), edge(4, 20, 70), edge(5, 20, 50),
+        ]
+        graph = builder.to_weighted_graph()
+        assert graph.num_nodes == 7 and graph.num_edges == 6
+        assert builder.to_weighted_graph().version == graph.version
+
+        result = builder.network_analytics(limit=3)
+        assert [g["type"] for g in result["top_gps"]] == ["gp", "gp"]
+        assert len(result["top_lps"]) == 3
+        assert {b["id"] for b in result["brokers"]} == {"lp_3", "gp_10", "gp_20"}
+        assert result["total_edges"] == 6
+        assert result["modularity"] > 0
+        assert {c["anchor_gp"] for c in result["communities"]} <= {"GP 10", "GP 20"}
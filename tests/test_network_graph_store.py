@@ -0,0 +1,273 @@
+"""
+Tests for the cached, incrementally maintained co-investor graph.
+
+Covers:
+- build_graph: shared-portfolio edges (case/whitespace-insensitive company
+  match, one weight per shared company) and co-investment edges
+- CSR adjacency and precomputed degree / weighted degree / centrality
+- refresh_graph folds appended rows into the same graph and matches a
+  fresh build; deletes and updates (including in-place co_investment_count
+  increments) trigger a full rebuild
+- get_graph rebuilds a graph older than MAX_GRAPH_AGE_S; the PostgreSQL
+  watermark tracks investor row versions
+- NetworkEngine answers from the shared cache without mutating it
+
+All tests are fully offline (in-memory SQLite).
+"""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from app.network import store
+from app.network.graph import NetworkEngine
+from app.network.store import build_graph, get_graph, invalidate_graph_cache, refresh_graph
+
+DDL = [
+    "CREATE TABLE lp_fund (id INTEGER PRIMARY KEY, name TEXT, lp_type TEXT, jurisdiction TEXT)",
+    "CREATE TABLE family_offices (id INTEGER PRIMARY KEY, name TEXT, type TEXT, region TEXT)",
+    "CREATE TABLE portfolio_companies (id INTEGER PRIMARY KEY, investor_id INTEGER,"
+    " investor_type TEXT, company_name TEXT, current_holding INTEGER DEFAULT 1,"
+    " updated_at TIMESTAMP)",
+    "CREATE TABLE co_investments (id INTEGER PRIMARY KEY, primary_investor_id INTEGER,"
+    " primary_investor_type TEXT, co_investor_name TEXT, co_investor_type TEXT,"
+    " deal_name TEXT, deal_date TIMESTAMP, co_investment_count INTEGER DEFAULT 1)",
+]
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite:///:memory:")
+    with engine.begin() as conn:
+        for ddl in DDL:
+            conn.execute(text(ddl))
+        conn.execute(text(
+            "INSERT INTO lp_fund (id, name, lp_type, jurisdiction) VALUES"
+            " (1, 'CalPERS', 'public_pension', 'CA'),"
+            " (2, 'CalSTRS', 'public_pension', 'CA'),"
+            " (3, 'Yale', 'endowment', 'CT')"
+        ))
+        conn.execute(text(
+            "INSERT INTO family_offices (id, name, type, region) VALUES (1, 'Pritzker', 'single', 'US')"
+        ))
+    session = sessionmaker(bind=engine)()
+    invalidate_graph_cache()
+    yield session
+    session.close()
+    invalidate_graph_cache()
+
+
+def _hold(db, investor_id, investor_type, company, current=1):
+    db.execute(
+        text(
+            "INSERT INTO portfolio_companies (investor_id, investor_type, company_name, current_holding)"
+            " VALUES (:i, :t, :c, :h)"
+        ),
+        {"i": investor_id, "t": investor_type, "c": company, "h": current},
+    )
+    db.commit()
+
+
+def _coinvest(db, investor_id, co_name, deal, count=1, date=None):
+    db.execute(
+        text(
+            "INSERT INTO co_investments (primary_investor_id, primary_investor_type,"
+            " co_investor_name, co_investor_type, deal_name, deal_date, co_investment_count)"
+            " VALUES (:i, 'lp', :n, 'pe_firm', :d, :dt, :c)"
+        ),
+        {"i": investor_id, "n": co_name, "d": deal, "c": count, "dt": date},
+    )
+    db.commit()
+
+
+def _edges(graph):
+    return {
+        tuple(sorted((graph.node_ids[s], graph.node_ids[t]))): (w, sorted(graph.edge_companies[e]))
+        for e, (s, t, w) in enumerate(
+            zip(graph.edge_source, graph.edge_target, graph.edge_weight_list)
+        )
+    }
+
+
+def _seed(db):
+    _hold(db, 1, "lp", "Stripe")
+    _hold(db, 2, "lp", " stripe ")
+    _hold(db, 1, "lp", "SpaceX")
+    _hold(db, 2, "lp", "SpaceX")
+    _hold(db, 3, "lp", "SpaceX")
+    _hold(db, 3, "lp", "Stripe", current=0)
+    _coinvest(db, 1, "Sequoia", "Figma", count=2, date=datetime(2024, 5, 1))
+    _coinvest(db, 1, "Sequoia", "Figma", count=2, date=datetime(2023, 1, 1))
+
+
+class TestBuild:
+    def test_edges_and_metrics(self, db):
+        _seed(db)
+        graph = build_graph(db)
+        edges = _edges(graph)
+        assert edges[("lp_1", "lp_2")] == (2, ["SpaceX", "Stripe"])
+        assert edges[("lp_1", "lp_3")] == (1, ["SpaceX"])
+        assert edges[("lp_2", "lp_3")] == (1, ["SpaceX"])
+
+        ext = store.external_node_id("Sequoia")
+        eid = graph.edge_index[tuple(sorted(
+            (graph.node_index["lp_1"], graph.node_index[ext]),
+            key=lambda i: graph.node_ids[i],
+        ))]
+        assert graph.edge_weight_list[eid] == 2  # duplicate deal rows count once
+        assert graph.edge_first_date[eid] < graph.edge_last_date[eid]
+
+        arrays = graph.arrays
+        lp1 = graph.node_index["lp_1"]
+        neighbors = arrays.indices[arrays.indptr[lp1]:arrays.indptr[lp1 + 1]]
+        assert sorted(graph.node_ids[i] for i in neighbors) == sorted(["lp_2", "lp_3", ext])
+        assert arrays.degree[lp1] == 3
+        assert arrays.weighted_degree[lp1] == 5
+        assert arrays.centrality[lp1] == 1.0
+        assert arrays.degree[graph.node_index["family_office_1"]] == 0
+
+
+class TestRefresh:
+    def test_appended_rows_match_full_build(self, db):
+        _seed(db)
+        graph = build_graph(db)
+        version = graph.version
+
+        _hold(db, 3, "lp", "STRIPE")
+        _hold(db, 1, "family_office", "spacex")
+        _coinvest(db, 2, "Sequoia", "Notion")
+        refreshed = refresh_graph(db, graph)
+
+        assert refreshed is graph
+        assert refreshed.version > version
+        rebuilt = build_graph(db)
+        assert _edges(refreshed) == _edges(rebuilt)
+        for idx, nid in enumerate(refreshed.node_ids):
+            j = rebuilt.node_index[nid]
+            assert refreshed.arrays.degree[idx] == rebuilt.arrays.degree[j]
+            assert refreshed.arrays.weighted_degree[idx] == rebuilt.arrays.weighted_degree[j]
+
+    def test_unchanged_tables_keep_graph(self, db):
+        _seed(db)
+        graph = build_graph(db)
+        version = graph.version
+        assert refresh_graph(db, graph) is graph
+        assert graph.version == version
+
+    def test_delete_rebuilds(self, db):
+        _seed(db)
+        graph = build_graph(db)
+        db.execute(text("DELETE FROM portfolio_companies WHERE company_name = 'SpaceX' AND investor_id = 3"))
+        db.commit()
+        _hold(db, 3, "lp", "Klarna")
+        refreshed = refresh_graph(db, graph)
+        assert refreshed is not graph
+        assert ("lp_1", "lp_3") not in _edges(refreshed)
+
+    def test_update_rebuilds(self, db):
+        _seed(db)
+        graph = build_graph(db)
+        db.execute(text(
+            "UPDATE portfolio_companies SET current_holding = 0, updated_at = '2026-01-01'"
+            " WHERE investor_id = 2 AND company_name = 'SpaceX'"
+        ))
+        db.commit()
+        refreshed = refresh_graph(db, graph)
+        assert refreshed is not graph
+        assert _edges(refreshed)[("lp_1", "lp_2")] == (1, ["Stripe"])
+
+    def test_co_investment_count_update_rebuilds(self, db):
+        _seed(db)
+        _coinvest(db, 2, "Accel", "Canva", count=1)
+        graph = build_graph(db)
+        ext = graph.node_index[store.external_node_id("Accel")]
+        before = graph.edge_weight_list[graph.edge_index[tuple(sorted(
+            (graph.node_index["lp_2"], ext), key=lambda i: graph.node_ids[i]
+        ))]]
+
+        # What the portfolio agent's ON CONFLICT ... DO UPDATE does
+        db.execute(text(
+            "UPDATE co_investments SET co_investment_count = co_investment_count + 1"
+            " WHERE co_investor_name = 'Accel'"
+        ))
+        db.commit()
+        refreshed = refresh_graph(db, graph)
+
+        assert refreshed is not graph
+        assert before == 1
+        assert _edges(refreshed) == _edges(build_graph(db))
+        accel = [w for (a, b), (w, _) in _edges(refreshed).items()
+                 if store.external_node_id("Accel") in (a, b)]
+        assert accel == [2]
+
+    def test_max_age_rebuilds(self, db, monkeypatch):
+        _seed(db)
+        graph = get_graph(db)
+        monkeypatch.setattr(store, "REFRESH_INTERVAL_S", 0.0)
+        assert get_graph(db) is graph
+
+        monkeypatch.setattr(store, "MAX_GRAPH_AGE_S", 0.0)
+        assert get_graph(db) is not graph
+
+    def test_postgres_watermark_tracks_investor_updates(self):
+        session = MagicMock()
+        session.get_bind.return_value.dialect.name = "postgresql"
+        store._read_watermark(session)
+        sql = str(session.execute.call_args.args[0])
+        assert "MAX(xmin::text::bigint) FROM lp_fund" in sql
+        assert "MAX(xmin::text::bigint) FROM family_offices" in sql
+        assert "SUM(co_investment_count)" in sql
+
+
+class TestEngine:
+    def test_cache_shared_across_engines(self, db, monkeypatch):
+        _seed(db)
+        first = NetworkEngine(db)
+        first.build_network()
+        calls = []
+        monkeypatch.setattr(store, "build_graph", lambda session: calls.append(1))
+        second = NetworkEngine(db)
+        second.build_network()
+        assert second._graph is first._graph
+        assert calls == []
+
+    def test_queries(self, db):
+        _seed(db)
+        engine = NetworkEngine(db)
+
+        graph = engine.get_network_graph(min_weight=1)
+        assert {n["id"] for n in graph["nodes"]} == {"lp_1", "lp_2", "lp_3"}
+        assert graph["edges"][0]["weight"] == 2
+        assert graph["stats"]["total_edges"] == 4
+
+        central = engine.get_central_investors(limit=2)
+        assert [n["id"] for n in central] == ["lp_1", "lp_2"]
+        by_rank = engine.get_central_investors(limit=3, by="pagerank")
+        assert by_rank[0]["id"] == "lp_1" and by_rank[0]["pagerank"] > by_rank[2]["pagerank"]
+
+        ego = engine.get_investor_network(3, "lp", depth=1, min_weight=1)
+        assert ego["center"]["id"] == "lp_3" and ego["center"]["is_center"]
+        assert ego["stats"]["direct_connections"] == 2
+        assert ego["stats"]["total_edges"] == 3
+
+        clusters = engine.detect_clusters(method="components")
+        assert len(clusters) == 1 and clusters[0]["size"] == 3
+
+        hoods = engine.get_k_hop_neighborhoods([(3, "lp"), (9, "lp")], k=2, include_external=True)
+        assert {n["id"]: n["hops"] for n in hoods[0]["neighbors"]} == {
+            "lp_1": 1, "lp_2": 1, store.external_node_id("Sequoia"): 2,
+        }
+        assert hoods[1]["found"] is False
+
+        path = engine.find_path(2, "lp", 3, "lp")
+        assert path["found"] and path["path_length"] == 1
+        assert engine.find_path(1, "lp", 1, "family_office")["found"] is False
+
+        # Results are fresh dicts; the cached graph is not annotated
+        again = NetworkEngine(db).get_investor_network(1, "lp")
+        assert all(n["cluster_id"] is None for n in again["nodes"])
+        assert np.all(get_graph(db).arrays.degree >= 0)
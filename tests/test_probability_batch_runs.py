@@ -0,0 +1,247 @@
+"""
+Tests for sharded, checkpointed universe scoring runs (probability_batch).
+
+Covers:
+- create_batch snapshots the active universe into fixed shards
+- run_shard checkpoints a shard and skips it (or its scored companies) on rerun
+- publish_batch refuses unfinished runs and flips visibility in one step
+- get_rankings / get_company_detail never show scores of an unpublished run
+- start_universe_scan queues shard + blocked publish jobs in WORKER_MODE and
+  re-queues only unfinished shards when resuming, leaving shards whose job
+  is still active (and an active publish job) alone
+
+All tests are fully offline (in-memory SQLite).
+"""
+
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.models import Base
+from app.core.models_queue import JobQueue, QueueJobStatus
+from app.core.probability_models import (
+    BATCH_PUBLISHED,
+    BATCH_RUNNING,
+    SHARD_DONE,
+    SHARD_FAILED,
+    TxnProbBatch,
+    TxnProbBatchShard,
+    TxnProbCompany,
+    TxnProbScore,
+)
+from app.services.probability_batch import (
+    BatchNotReadyError,
+    create_batch,
+    get_batch_status,
+    publish_batch,
+    run_batch,
+    run_shard,
+    start_universe_scan,
+)
+from app.services.probability_engine import TransactionProbabilityEngine
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    for i in range(7):
+        session.add(TxnProbCompany(
+            company_name=f"Company {i}", normalized_name=f"company {i}",
+            sector="Healthcare" if i % 2 else "Technology",
+            universe_source="manual", is_active=True,
+        ))
+    session.add(TxnProbCompany(
+        company_name="Inactive", normalized_name="inactive",
+        universe_source="manual", is_active=False,
+    ))
+    session.commit()
+    yield session
+    session.close()
+
+
+def _scored_ids(db, batch_id):
+    return sorted(
+        cid for (cid,) in db.query(TxnProbScore.company_id).filter_by(batch_id=batch_id)
+    )
+
+
+class TestShards:
+    def test_create_batch_shards_active_universe(self, db):
+        batch = create_batch(db, shard_size=3)
+        shards = db.query(TxnProbBatchShard).order_by(TxnProbBatchShard.shard_index).all()
+
+        assert batch.status == BATCH_RUNNING
+        assert batch.total_companies == 7
+        assert batch.total_shards == 3
+        assert [len(s.company_ids) for s in shards] == [3, 3, 1]
+        assert sorted(sum((s.company_ids for s in shards), [])) == list(range(1, 8))
+
+    def test_invalid_shard_size(self, db):
+        with pytest.raises(ValueError):
+            create_batch(db, shard_size=0)
+
+    def test_run_shard_checkpoints(self, db):
+        batch_id = create_batch(db, shard_size=3).batch_id
+
+        result = run_shard(db, batch_id, 0)
+        assert result["status"] == SHARD_DONE
+        assert result["succeeded"] == 3
+        assert _scored_ids(db, batch_id) == [1, 2, 3]
+
+        with patch.object(TransactionProbabilityEngine, "score_companies") as score:
+            run_shard(db, batch_id, 0)
+        score.assert_not_called()
+        assert db.query(TxnProbScore).count() == 3
+
+    def test_rerun_skips_companies_already_scored(self, db):
+        batch_id = create_batch(db, shard_size=3).batch_id
+        TransactionProbabilityEngine(db).score_companies([4], batch_id)
+
+        with patch.object(
+            TransactionProbabilityEngine, "score_companies", return_value=(2, 0)
+        ) as score:
+            result = run_shard(db, batch_id, 1)
+
+        assert score.call_args.args[0] == [5, 6]
+        assert result["succeeded"] == 3
+
+    def test_failed_shard_is_recorded_and_raised(self, db):
+        batch_id = create_batch(db, shard_size=3).batch_id
+        with patch.object(
+            TransactionProbabilityEngine, "score_companies", side_effect=RuntimeError("db gone")
+        ):
+            with pytest.raises(RuntimeError):
+                run_shard(db, batch_id, 2)
+
+        shard = db.query(TxnProbBatchShard).filter_by(shard_index=2).one()
+        assert shard.status == SHARD_FAILED
+        assert "db gone" in shard.error_message
+
+    def test_unknown_shard(self, db):
+        batch_id = create_batch(db, shard_size=3).batch_id
+        with pytest.raises(ValueError):
+            run_shard(db, batch_id, 99)
+
+
+class TestPublish:
+    def test_refuses_unfinished_run(self, db):
+        batch_id = create_batch(db, shard_size=3).batch_id
+        run_shard(db, batch_id, 0)
+        with pytest.raises(BatchNotReadyError):
+            publish_batch(db, batch_id)
+        assert db.query(TxnProbBatch).one().status == BATCH_RUNNING
+
+    def test_rankings_switch_atomically(self, db):
+        engine = TransactionProbabilityEngine(db)
+        first = engine.score_universe()
+        # scored_at has second resolution on SQLite; keep the runs apart
+        db.query(TxnProbScore).update({"scored_at": datetime(2026, 1, 1)})
+        db.commit()
+        assert db.query(TxnProbBatch).filter_by(batch_id=first["batch_id"]).one().status == BATCH_PUBLISHED
+        before = engine.get_rankings(limit=100)
+        assert len(before) == 7
+
+        batch_id = create_batch(db, shard_size=3).batch_id
+        run_shard(db, batch_id, 0)
+        run_shard(db, batch_id, 1)
+
+        # half-written run stays invisible
+        assert engine.get_rankings(limit=100) == before
+        detail = engine.get_company_detail(1)
+        assert detail["latest_score"]["batch_id"] == first["batch_id"]
+
+        run_shard(db, batch_id, 2)
+        published = publish_batch(db, batch_id)
+        assert published["status"] == BATCH_PUBLISHED
+        assert published["succeeded"] == 7
+
+        after = engine.get_rankings(limit=100)
+        assert len(after) == 7
+        assert engine.get_company_detail(1)["latest_score"]["batch_id"] == batch_id
+        assert publish_batch(db, batch_id)["status"] == BATCH_PUBLISHED
+
+    def test_unbatched_scores_stay_visible(self, db):
+        engine = TransactionProbabilityEngine(db)
+        engine.score_company(1)
+        create_batch(db, shard_size=3)
+        assert [r["company_id"] for r in engine.get_rankings()] == [1]
+
+    def test_run_batch_inline(self, db):
+        batch_id = create_batch(db, shard_size=2).batch_id
+        run_shard(db, batch_id, 1)
+        result = run_batch(db, batch_id)
+        assert result["status"] == BATCH_PUBLISHED
+        assert _scored_ids(db, batch_id) == list(range(1, 8))
+
+
+class TestStartUniverseScan:
+    def test_inline_without_worker_mode(self, db):
+        with patch("app.core.job_queue_service.WORKER_MODE", False):
+            status = start_universe_scan(db, shard_size=4)
+        assert status["mode"] == "inline"
+        assert status["status"] == BATCH_PUBLISHED
+        assert status["shard_status"] == {SHARD_DONE: 2}
+
+    def test_queues_shards_and_blocked_publish(self, db):
+        with patch("app.core.job_queue_service.WORKER_MODE", True), \
+                patch("app.core.job_queue_service.notify_job_available"):
+            status = start_universe_scan(db, shard_size=3, priority=4)
+
+        jobs = db.query(JobQueue).order_by(JobQueue.id).all()
+        assert status["mode"] == "queued"
+        assert [j.payload["action"] for j in jobs] == ["score_shard"] * 3 + ["publish"]
+        assert [j.payload.get("shard_index") for j in jobs[:3]] == [0, 1, 2]
+        assert {j.payload["batch_id"] for j in jobs} == {status["batch_id"]}
+        assert [j.payload["tier"] for j in jobs] == [0, 0, 0, 1]
+        assert [QueueJobStatus(j.status) for j in jobs] == [QueueJobStatus.PENDING] * 3 + [
+            QueueJobStatus.BLOCKED
+        ]
+        assert all(j.priority == 4 for j in jobs)
+        shards = get_batch_status(db, status["batch_id"])["shards"]
+        assert [s["job_queue_id"] for s in shards] == [j.id for j in jobs[:3]]
+
+    def test_resume_requeues_unfinished_shards_only(self, db):
+        batch_id = create_batch(db, shard_size=3).batch_id
+        run_shard(db, batch_id, 0)
+        run_shard(db, batch_id, 2)
+
+        with patch("app.core.job_queue_service.WORKER_MODE", True), \
+                patch("app.core.job_queue_service.notify_job_available"):
+            status = start_universe_scan(db, batch_id=batch_id)
+
+        jobs = db.query(JobQueue).order_by(JobQueue.id).all()
+        assert status["shards_queued"] == 1
+        assert [j.payload.get("shard_index") for j in jobs] == [1, None]
+
+    def test_resume_skips_shards_with_active_jobs(self, db):
+        with patch("app.core.job_queue_service.WORKER_MODE", True), \
+                patch("app.core.job_queue_service.notify_job_available"):
+            batch_id = start_universe_scan(db, shard_size=3)["batch_id"]
+            first = db.query(JobQueue).order_by(JobQueue.id).all()
+            # shard 0 running, shard 1 failed, shard 2's job vanished
+            first[0].status = QueueJobStatus.RUNNING
+            first[1].status = QueueJobStatus.FAILED
+            db.delete(first[2])
+            db.commit()
+
+            status = start_universe_scan(db, batch_id=batch_id)
+
+        new_jobs = db.query(JobQueue).filter(JobQueue.id.notin_([j.id for j in first])).all()
+        assert status["shards_queued"] == 2
+        assert status["shards_in_flight"] == 1
+        # publish job from the first run is still blocked; no second one
+        assert sorted(j.payload.get("shard_index") for j in new_jobs) == [1, 2]
+        assert all(j.payload["action"] == "score_shard" for j in new_jobs)
+
+    def test_resume_published_or_unknown(self, db):
+        with patch("app.core.job_queue_service.WORKER_MODE", False):
+            batch_id = start_universe_scan(db, shard_size=4)["batch_id"]
+            with pytest.raises(ValueError):
+                start_universe_scan(db, batch_id=batch_id)
+            with pytest.raises(ValueError):
+                start_universe_scan(db, batch_id="txnp-missing")
@@ -0,0 +1,254 @@
+"""
+Tests for batch scoring in the Deal Probability Engine.
+
+Covers:
+- BaseSignalComputer.compute_batch default (per-company loop)
+- grouped compute_batch queries map rows back to the right companies and
+  score them exactly like compute()
+- TransactionProbabilityEngine.score_universe persists the same signals,
+  scores and alerts as calling score_company for each company
+- a chunk that fails is rescored company by company
+
+All tests are fully offline (in-memory SQLite / fake sessions).
+"""
+
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.models import Base
+from app.core.probability_models import (
+    TxnProbAlert,
+    TxnProbCompany,
+    TxnProbScore,
+    TxnProbSignal,
+)
+from app.services.probability_engine import TransactionProbabilityEngine
+from app.services.probability_signal_computers import (
+    BaseSignalComputer,
+    FounderRiskComputer,
+    InsiderActivityComputer,
+    SignalResult,
+)
+
+
+# ---------------------------------------------------------------------------
+# Fake session: evaluates the insider / leadership queries in Python
+# ---------------------------------------------------------------------------
+
+
+class _Result:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def mappings(self):
+        return self
+
+    def all(self):
+        return self._rows
+
+
+class _FakeSession:
+    """Answers both the per-company and the grouped query shapes."""
+
+    def __init__(self, insider=(), leadership=()):
+        self.insider = list(insider)
+        self.leadership = list(leadership)
+        self.queries = 0
+
+    def execute(self, stmt, params):
+        self.queries += 1
+        sql = str(stmt)
+        if "insider_transactions" in sql:
+            return _Result(self._insider(params))
+        if "leadership_changes" in sql:
+            return _Result(self._leadership(params))
+        return _Result([])
+
+    def rollback(self):
+        pass
+
+    @staticmethod
+    def _insider_row(t):
+        return {
+            "transaction_type": t["transaction_type"],
+            "value_usd": t["total_value_usd"] or 0,
+            "shares": 0,
+        }
+
+    def _insider(self, params):
+        def matches(t, cid, name):
+            return (cid is not None and t["company_id"] == cid) or t["company_name"].lower() == name.lower()
+
+        if "cids" in params:
+            return [
+                {"idx": idx, **self._insider_row(t)}
+                for idx, (cid, name) in enumerate(zip(params["cids"], params["names"]), 1)
+                for t in self.insider
+                if matches(t, cid, name)
+            ]
+        return [
+            self._insider_row(t)
+            for t in self.insider
+            if matches(t, params["company_id"], params["name"])
+        ]
+
+    def _leadership(self, params):
+        cids = params["cids"] if "cids" in params else [params["cid"]]
+        return [
+            {"company_id": r["company_id"], "change_type": "departure", "old_title": "CEO", "sig": r["sig"]}
+            for r in self.leadership
+            if r["company_id"] in cids
+        ]
+
+
+def _company(id_, name, cid=None, founded_year=None):
+    return TxnProbCompany(
+        id=id_, company_name=name, normalized_name=name.lower(),
+        canonical_company_id=cid, founded_year=founded_year,
+    )
+
+
+class TestComputeBatch:
+    """compute_batch agrees with compute() per company."""
+
+    COMPANIES = [
+        _company(1, "Acme Corp", cid=10, founded_year=1970),
+        _company(2, "Beta LLC", founded_year=2015),
+        _company(3, "Gamma Inc", cid=30),
+        _company(4, "Quiet Co"),
+    ]
+
+    def test_default_loops_compute(self):
+        class _Constant(BaseSignalComputer):
+            signal_type = "constant"
+
+            def compute(self, company):
+                return SignalResult(self.signal_type, float(company.id), 1.0)
+
+        results = _Constant(db=None).compute_batch(self.COMPANIES)
+        assert {cid: r.score for cid, r in results.items()} == {1: 1.0, 2: 2.0, 3: 3.0, 4: 4.0}
+
+    def test_insider_grouped_matches_per_company(self):
+        db = _FakeSession(insider=[
+            {"company_id": 10, "company_name": "acme corp", "transaction_type": "Buy", "total_value_usd": 500},
+            {"company_id": None, "company_name": "ACME CORP", "transaction_type": "Sale", "total_value_usd": 100},
+            {"company_id": 99, "company_name": "beta llc", "transaction_type": "S", "total_value_usd": 250},
+            {"company_id": 30, "company_name": "other", "transaction_type": "P", "total_value_usd": None},
+        ])
+        computer = InsiderActivityComputer(db)
+        expected = {c.id: computer.compute(c) for c in self.COMPANIES}
+
+        db.queries = 0
+        batch = computer.compute_batch(self.COMPANIES)
+
+        assert db.queries == 1
+        assert batch == expected
+        assert batch[1].details["transaction_count"] == 2
+        assert batch[4].confidence == 0.0
+
+    def test_founder_grouped_matches_per_company(self):
+        db = _FakeSession(leadership=[
+            {"company_id": 10, "sig": 9},
+            {"company_id": 10, "sig": 4},
+            {"company_id": 30, "sig": 5},
+        ])
+        computer = FounderRiskComputer(db)
+        expected = {c.id: computer.compute(c) for c in self.COMPANIES}
+
+        db.queries = 0
+        batch = computer.compute_batch(self.COMPANIES)
+
+        assert db.queries == 1
+        assert batch == expected
+        assert "leadership_changes" in batch[3].data_sources
+
+
+# ---------------------------------------------------------------------------
+# Engine: batch vs per-company persistence
+# ---------------------------------------------------------------------------
+
+
+def _seeded_session():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    for i, (name, sector, state, founded) in enumerate([
+        ("Alpha Health", "Healthcare", "CA", 1975),
+        ("Bravo Tech", "Technology", "NY", 2012),
+        ("Charlie Industrial", "Industrial", None, None),
+        ("Delta Health", "Healthcare", "TX", 1995),
+        ("Echo Unknown", None, None, None),
+    ]):
+        db.add(TxnProbCompany(
+            company_name=name, normalized_name=name.lower(), sector=sector,
+            hq_state=state, founded_year=founded, universe_source="manual",
+            is_active=True,
+        ))
+    db.add(TxnProbCompany(
+        company_name="Inactive Co", normalized_name="inactive co",
+        universe_source="manual", is_active=False,
+    ))
+    db.commit()
+    return db
+
+
+def _snapshot(db):
+    signals = sorted((
+        (s.company_id, s.signal_type, s.score, s.previous_score, s.velocity,
+         s.acceleration, s.confidence, s.signal_details, s.data_sources)
+        for s in db.query(TxnProbSignal).all()
+    ), key=repr)
+    scores = sorted((
+        (s.company_id, s.probability, s.raw_composite_score, s.grade, s.confidence,
+         s.signal_count, s.active_signal_count, s.convergence_factor,
+         s.top_signals, s.signal_chain)
+        for s in db.query(TxnProbScore).all()
+    ), key=repr)
+    alerts = sorted((a.company_id, a.alert_type) for a in db.query(TxnProbAlert).all())
+    return signals, scores, alerts
+
+
+class TestScoreUniverse:
+    """score_universe == score_company for every active company."""
+
+    def test_matches_per_company_path(self):
+        batch_db = _seeded_session()
+        single_db = _seeded_session()
+        try:
+            for _ in range(2):  # second run exercises previous score / velocity
+                stats = TransactionProbabilityEngine(batch_db).score_universe(batch_size=2)
+                assert stats["total_companies"] == 5
+                assert stats["succeeded"] == 5
+                assert stats["failed"] == 0
+
+                engine = TransactionProbabilityEngine(single_db)
+                for c in single_db.query(TxnProbCompany).filter_by(is_active=True).all():
+                    engine.score_company(c.id)
+
+            assert _snapshot(batch_db) == _snapshot(single_db)
+            assert batch_db.query(TxnProbSignal).count() == 5 * 12 * 2
+        finally:
+            batch_db.close()
+            single_db.close()
+
+    def test_shared_batch_id(self):
+        db = _seeded_session()
+        try:
+            stats = TransactionProbabilityEngine(db).score_universe(batch_size=3)
+            batch_ids = {s.batch_id for s in db.query(TxnProbScore).all()}
+            assert batch_ids == {stats["batch_id"]}
+        finally:
+            db.close()
+
+    def test_failed_chunk_falls_back_per_company(self):
+        db = _seeded_session()
+        try:
+            engine = TransactionProbabilityEngine(db)
+            with patch.object(engine, "_score_chunk", side_effect=RuntimeError("boom")):
+                stats = engine.score_universe(batch_size=2)
+            assert stats["succeeded"] == 5
+            assert db.query(TxnProbScore).count() == 5
+        finally:
+            db.close()
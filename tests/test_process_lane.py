@@ -0,0 +1,187 @@
+"""
+Tests for the worker CPU process lane (app/worker/process_lane.py).
+
+Covers:
+- run_cpu_bound (app.core.cpu_offload) runs inline when no lane is enabled
+  (API/tests/scripts) and through the lane once the worker enables it
+- a real spawn-based pool executes work and reports metrics
+- queue depth / active accounting
+- execution mode declared on executor registration routes execute_job
+  through the lane
+- a lane job stops its executor once the parent stops treating it as running
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.core import cpu_offload
+from app.core.models_queue import QueueJobType
+from app.worker import process_lane
+
+
+@pytest.fixture(autouse=True)
+def _no_lanes():
+    process_lane.shutdown_lanes()
+    yield
+    process_lane.shutdown_lanes()
+
+
+class TestRunCpuBound:
+    """run_cpu_bound dispatch."""
+
+    @pytest.mark.asyncio
+    async def test_inline_without_lane(self):
+        calls = []
+
+        def _work(x):
+            calls.append(x)
+            return x * 2
+
+        assert await cpu_offload.run_cpu_bound(_work, 21) == 42
+        assert calls == [21]
+
+    @pytest.mark.asyncio
+    async def test_runs_in_pool_and_records_metrics(self):
+        process_lane.enable_lanes(pool_size=1)
+
+        result = await cpu_offload.run_cpu_bound(pow, 2, 10)
+
+        assert result == 1024
+        metrics = process_lane.lane_metrics()
+        assert len(metrics) == 1
+        assert metrics[0]["lane"] == "cpu"
+        assert metrics[0]["pool_size"] == 1
+        assert metrics[0]["completed"] == 1
+        assert metrics[0]["queue_depth"] == 0
+        assert metrics[0]["active"] == 0
+
+    def test_disabled_when_pool_size_zero(self):
+        process_lane.enable_lanes(pool_size=0)
+        assert process_lane.get_lane() is None
+        assert cpu_offload.get_cpu_runner() is None
+
+    def test_shutdown_removes_runner(self):
+        process_lane.enable_lanes(pool_size=1)
+        assert cpu_offload.get_cpu_runner() is not None
+        process_lane.shutdown_lanes()
+        assert cpu_offload.get_cpu_runner() is None
+
+
+class TestProcessLaneAccounting:
+    """Queue depth and active counts derive from in-flight tasks."""
+
+    def test_queue_depth_beyond_pool_size(self):
+        lane = process_lane.ProcessLane("cpu", max_workers=2)
+        lane.in_flight = 5
+        assert lane.active == 2
+        assert lane.queue_depth == 3
+        m = lane.metrics()
+        assert m["queue_depth"] == 3
+        assert m["active"] == 2
+        assert m["utilization"] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_failure_counted(self):
+        lane = process_lane.ProcessLane("cpu", max_workers=1)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        future.set_exception(ValueError("bad"))
+
+        with patch.object(loop, "run_in_executor", return_value=future), \
+                patch.object(lane, "_get_pool"):
+            with pytest.raises(ValueError):
+                await lane.run(len, "abc")
+
+        assert lane.failed == 1
+        assert lane.in_flight == 0
+
+
+class TestExecutionMode:
+    """Execution mode declared when the executor is registered."""
+
+    def test_registry_declares_modes(self):
+        import app.worker.main as wm
+
+        wm._load_executors()
+        assert wm.EXECUTION_MODES[QueueJobType.TXN_PROBABILITY] == process_lane.ExecutionMode.ASYNC
+        assert wm.EXECUTION_MODES[QueueJobType.PEOPLE] == process_lane.ExecutionMode.ASYNC
+        assert set(wm.EXECUTION_MODES) == set(wm.EXECUTORS)
+
+    def test_process_when_lane_enabled(self):
+        process_lane.enable_lanes(pool_size=1)
+        mode = process_lane.resolve_mode(process_lane.ExecutionMode.PROCESS)
+        assert mode == process_lane.ExecutionMode.PROCESS
+
+    def test_async_when_lane_disabled(self):
+        mode = process_lane.resolve_mode(process_lane.ExecutionMode.PROCESS)
+        assert mode == process_lane.ExecutionMode.ASYNC
+
+    @pytest.mark.asyncio
+    async def test_execute_job_routes_process_jobs_to_lane(self):
+        import app.worker.main as wm
+
+        db = MagicMock()
+        job = MagicMock()
+        job.id = 55
+        job.job_type = QueueJobType.PEOPLE.value
+        job.payload = {}
+        db.get.return_value = job
+
+        in_loop_executor = AsyncMock()
+        lane = MagicMock()
+        lane.run = AsyncMock(return_value=None)
+
+        with patch.dict(wm.EXECUTORS, {QueueJobType.PEOPLE: in_loop_executor}), \
+                patch.dict(wm.EXECUTION_MODES,
+                           {QueueJobType.PEOPLE: process_lane.ExecutionMode.PROCESS}), \
+                patch.object(process_lane, "get_lane", return_value=lane), \
+                patch.object(wm, "send_job_event"):
+            await wm.execute_job(job, db)
+
+        lane.run.assert_awaited_once_with(process_lane.run_job, "people", 55)
+        in_loop_executor.assert_not_called()
+        assert job.status == wm.QueueJobStatus.SUCCESS
+
+
+class TestLaneCancellation:
+    """A job running in the lane stops once the parent gives up on it."""
+
+    @pytest.mark.asyncio
+    async def test_executor_cancelled_when_job_no_longer_running(self):
+        job = MagicMock()
+        job.id = 9
+        checks = []
+        cancelled = []
+
+        async def _slow_executor(j, d):
+            try:
+                await asyncio.sleep(3600)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        def _abandoned(session_factory, job_id):
+            checks.append(job_id)
+            return len(checks) >= 2
+
+        with patch.object(process_lane, "_job_abandoned", side_effect=_abandoned):
+            await process_lane._run_until_abandoned(
+                _slow_executor, job, MagicMock(), MagicMock(), interval=0.01
+            )
+
+        assert checks == [9, 9]
+        assert cancelled == [True]
+
+    @pytest.mark.asyncio
+    async def test_finished_executor_result_propagates(self):
+        job = MagicMock()
+
+        async def _failing(j, d):
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await process_lane._run_until_abandoned(
+                _failing, job, MagicMock(), MagicMock(), interval=0.01
+            )
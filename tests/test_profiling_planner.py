@@ -0,0 +1,143 @@
+"""
+Tests for the wide-scan profiling planner in data_profiling_service.
+
+Covers:
+- column groups respect MAX_COLUMNS_PER_SCAN and spread numeric columns
+- one aggregate query covers every column of a group, with a layout that
+  maps each column to its slice of the result row
+- string top values for a whole group come from one GROUPING SETS query
+- a failing wide scan is retried per column
+- the time budget stops profiling and records the skipped columns
+
+The SQL uses PostgreSQL aggregates (PERCENTILE_CONT, GROUPING SETS), so the
+session is mocked; all tests are fully offline.
+"""
+
+from unittest.mock import MagicMock
+
+from app.core import data_profiling_service as profiling
+from app.core.data_profiling_service import (
+    _build_wide_stats_sql,
+    _new_cost,
+    _plan_column_groups,
+    _profile_column_group,
+    _profile_columns,
+)
+
+
+def _col(name, udt):
+    return {"name": name, "type": udt, "udt_name": udt, "nullable": True}
+
+
+COLUMNS = [
+    _col("id", "int4"),
+    _col("state", "varchar"),
+    _col("amount", "numeric"),
+    _col("as_of", "date"),
+    _col("payload", "jsonb"),
+]
+
+
+def _mock_db(*results):
+    """Session whose execute() returns the given results in order."""
+    db = MagicMock()
+    db.get_bind.return_value.dialect.name = "sqlite"
+    outcomes = []
+    for r in results:
+        if isinstance(r, Exception):
+            outcomes.append(r)
+        else:
+            res = MagicMock()
+            res.fetchone.return_value = r
+            res.fetchall.return_value = r
+            outcomes.append(res)
+    db.execute.side_effect = outcomes
+    return db
+
+
+def _sql(call):
+    return str(call.args[0])
+
+
+class TestPlanner:
+    def test_single_group_for_narrow_table(self):
+        groups = _plan_column_groups(COLUMNS)
+        assert len(groups) == 1
+        assert {c["name"]: c["kind"] for c in groups[0]} == {
+            "id": "numeric", "state": "string", "amount": "numeric",
+            "as_of": "temporal", "payload": "skip",
+        }
+
+    def test_wide_table_split_and_balanced(self):
+        columns = [_col(f"n{i}", "float8") for i in range(20)]
+        columns += [_col(f"s{i}", "text") for i in range(130)]
+        groups = _plan_column_groups(columns, max_columns=32)
+        assert len(groups) == 5
+        assert all(len(g) <= 32 for g in groups)
+        assert sorted(c["name"] for g in groups for c in g) == sorted(c["name"] for c in columns)
+        assert [sum(c["kind"] == "numeric" for c in g) for g in groups] == [4] * 5
+
+    def test_wide_sql_layout(self):
+        group = _plan_column_groups(COLUMNS)[0]
+        sql, layout = _build_wide_stats_sql(group, '"t"')
+        assert sql.count("\nFROM ") == 1
+        assert sql.count("PERCENTILE_CONT") == 6
+        assert 'COUNT(DISTINCT "payload")' not in sql
+        widths = {c["name"]: w for c, (_, w) in zip(group, layout)}
+        assert widths == {"id": 9, "state": 5, "amount": 9, "as_of": 5, "payload": 1}
+        offsets = [o for o, _ in layout]
+        assert offsets[0] == 1
+        assert all(a + w == b for (a, w), b in zip(layout, offsets[1:]))
+
+
+class TestProfileGroup:
+    def test_one_stats_scan_and_one_top_values_scan(self):
+        group = [c for c in _plan_column_groups(COLUMNS)[0] if c["name"] in ("state", "payload")]
+        db = _mock_db(
+            (10, 8, 3, 2, 6, 4.5, 7),       # COUNT(*), state x5, payload x1
+            [(0, "CA", 5), (0, "NY", 2)],   # top values for state
+        )
+        cost = _new_cost()
+        total, profiles = _profile_column_group(db, group, '"t"', None, cost)
+
+        assert total == 10
+        assert db.execute.call_count == 2
+        assert "GROUPING SETS" in _sql(db.execute.call_args_list[1])
+        by_name = {p["column_name"]: p for p in profiles}
+        assert by_name["state"]["null_count"] == 2
+        assert by_name["state"]["distinct_count"] == 3
+        assert by_name["state"]["stats"]["max_length"] == 6
+        assert by_name["state"]["stats"]["top_values"] == [
+            {"value": "CA", "count": 5}, {"value": "NY", "count": 2},
+        ]
+        assert by_name["payload"]["null_count"] == 3
+        assert by_name["payload"]["distinct_count"] is None
+        assert cost["queries"] == 2
+
+    def test_failed_wide_scan_retried_per_column(self):
+        group = [c for c in _plan_column_groups(COLUMNS)[0] if c["name"] in ("amount", "as_of")]
+        db = _mock_db(
+            RuntimeError("bad column"),
+            (4, 4, 4, 1.0, 9.0, 5.0, 3.0, 2.0, 5.0, 8.0),
+            RuntimeError("bad column"),
+        )
+        total, profiles = _profile_column_group(db, group, '"t"', None, _new_cost())
+
+        assert total == 4
+        assert [p["column_name"] for p in profiles] == ["amount"]
+        assert profiles[0]["stats"]["median"] == 5.0
+        assert db.rollback.call_count == 2
+
+
+class TestTimeBudget:
+    def test_exhausted_budget_skips_remaining_groups(self, monkeypatch):
+        monkeypatch.setattr(profiling, "MAX_COLUMNS_PER_SCAN", 2)
+        db = _mock_db()
+        total, profiles, cost = _profile_columns(
+            db, "t", COLUMNS, '"t"', start_time=0.0, time_budget_s=1.0, parallel_groups=1
+        )
+        assert total is None and profiles == []
+        assert cost["budget_exhausted"] is True
+        assert sorted(cost["skipped_columns"]) == sorted(c["name"] for c in COLUMNS)
+        assert cost["column_groups"] == 3
+        db.execute.assert_not_called()
@@ -0,0 +1,156 @@
+"""
+Tests for the router registry behind app.main (app/api/router_registry.py).
+
+Covers:
+- eager loading mounts every router of the profile in registry order
+- lazy loading mounts a router on the first request under its path, together
+  with every router sharing a path segment, and keeps registry order
+- OpenAPI / docs requests mount everything
+- deployment profiles select routers by area
+- every registered router's routes live under its declared paths
+- StartupProfile attributes time to phases
+
+All tests are fully offline.
+"""
+
+import importlib
+import sys
+import types
+
+import pytest
+from fastapi import APIRouter, Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import router_registry
+from app.api.router_registry import (
+    API,
+    CORE,
+    INGEST,
+    ROUTERS,
+    RouterSpec,
+    mount_routers,
+    select_routers,
+)
+from app.core.startup_profile import StartupProfile
+
+PACKAGE = "tests_fake_routers"
+
+
+def _fake_module(name, paths):
+    router = APIRouter()
+    for path in paths:
+        router.add_api_route(path, lambda name=name: {"router": name}, methods=["GET"])
+    module = types.ModuleType(f"{PACKAGE}.{name}")
+    module.router = router
+    return module
+
+
+@pytest.fixture
+def fake_routers(monkeypatch):
+    modules = {
+        "first": _fake_module("first", ["/shared/{item}", "/one"]),
+        "second": _fake_module("second", ["/shared/special", "/two"]),
+        "alone": _fake_module("alone", ["/alone"]),
+        "open": _fake_module("open", ["/open"]),
+    }
+    for name, module in modules.items():
+        monkeypatch.setitem(sys.modules, module.__name__, module)
+    return [
+        RouterSpec("first", ("shared", "one"), API, package=PACKAGE),
+        RouterSpec("second", ("shared", "two"), INGEST, package=PACKAGE),
+        RouterSpec("alone", ("alone",), API, package=PACKAGE),
+        RouterSpec("open", ("open",), CORE, public=True, package=PACKAGE),
+    ]
+
+
+class TestMounting:
+    def test_eager_mounts_all(self, fake_routers):
+        app = FastAPI()
+        registry = mount_routers(app, routers=fake_routers)
+        assert registry.pending == 0
+        client = TestClient(app)
+        # registry order decides precedence: first's /shared/{item} wins
+        assert client.get("/api/v1/shared/special").json() == {"router": "first"}
+        assert client.get("/api/v1/alone").status_code == 200
+
+    def test_lazy_mounts_on_first_request(self, fake_routers):
+        app = FastAPI()
+        registry = mount_routers(app, loading="lazy", routers=fake_routers)
+        assert registry.pending == 4
+        client = TestClient(app)
+
+        assert client.get("/api/v1/two").json() == {"router": "second"}
+        # "second" shares /shared with "first", so both mounted, in order
+        assert registry.pending == 2
+        assert client.get("/api/v1/shared/special").json() == {"router": "first"}
+
+        assert client.get("/api/v1/missing").status_code == 404
+        assert registry.pending == 2
+        assert client.get("/api/v1/alone").status_code == 200
+        assert registry.pending == 1
+
+    def test_openapi_mounts_everything(self, fake_routers):
+        app = FastAPI()
+        registry = mount_routers(app, loading="lazy", routers=fake_routers)
+        paths = TestClient(app).get("/openapi.json").json()["paths"]
+        assert registry.pending == 0
+        assert {"/api/v1/one", "/api/v1/two", "/api/v1/alone", "/api/v1/open"} <= set(paths)
+
+    def test_auth_dependencies_skip_public_routers(self, fake_routers):
+        calls = []
+        app = FastAPI()
+        mount_routers(
+            app, routers=fake_routers, dependencies=[Depends(lambda: calls.append(1))]
+        )
+        client = TestClient(app)
+        client.get("/api/v1/open")
+        assert calls == []
+        client.get("/api/v1/alone")
+        assert calls == [1]
+
+    def test_profiles(self, fake_routers):
+        assert [s.module for s in select_routers("ingest", fake_routers)] == ["second", "open"]
+        assert [s.module for s in select_routers("api", fake_routers)] == ["first", "alone", "open"]
+        with pytest.raises(ValueError):
+            select_routers("nope", fake_routers)
+
+
+class TestRegistry:
+    def test_unique_modules(self):
+        paths = [spec.import_path for spec in ROUTERS]
+        assert len(paths) == len(set(paths))
+        assert {spec.area for spec in ROUTERS} == {CORE, INGEST, API}
+
+    def test_routes_live_under_declared_paths(self):
+        for spec in ROUTERS:
+            router = getattr(importlib.import_module(spec.import_path), spec.attr)
+            if spec.module == "graphql":
+                continue  # mounted whole under /graphql
+            for route in router.routes:
+                full = spec.prefix + route.path
+                assert any(
+                    full == path or full.startswith(path + "/") for path in spec.paths
+                ), f"{spec.module}: {full} not under {spec.paths}"
+
+    def test_lazy_lookup_by_path(self):
+        registry = router_registry.RouterRegistry(ROUTERS)
+        component = registry._by_path["/api/v1/site-intel"]
+        modules = {registry.specs[i].module for i in registry._components[component]}
+        assert {"site_intel_power", "site_intel_sites"} <= modules
+        assert registry._by_path["/graphql"] != component
+
+
+class TestStartupProfile:
+    def test_phases(self, monkeypatch):
+        clock = iter([0.0, 1.5, 4.0])
+        monkeypatch.setattr("app.core.startup_profile.time.perf_counter", lambda: next(clock))
+        profile = StartupProfile()
+        profile.mark("imports")
+        profile.mark("migrations")
+        assert profile.report() == {
+            "total_seconds": 4.0,
+            "phases": [
+                {"phase": "imports", "seconds": 1.5},
+                {"phase": "migrations", "seconds": 2.5},
+            ],
+        }
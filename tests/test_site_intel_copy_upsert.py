@@ -0,0 +1,51 @@
+"""
+Tests for BaseCollector.bulk_upsert(use_copy=True)
+(app/sources/site_intel/base_collector.py).
+
+Covers:
+- Python-side column defaults (scalar and callable) are filled in for
+  records that omit those columns, as insert(model).values() would
+- values present in a record are never overwritten
+- duplicate keys keep the first record
+
+All tests are fully offline (MagicMock session, copy_insert replaced).
+"""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+from app.core import batch_operations
+from app.core.models_site_intel import Substation
+from app.sources.site_intel.power.hifld_collector import HIFLDInfraCollector
+
+
+def test_copy_upsert_fills_column_defaults(monkeypatch):
+    calls = []
+
+    def fake_copy_insert(**kwargs):
+        calls.append(kwargs)
+        result = MagicMock(rows_inserted=len(kwargs["rows"]), rows_updated=0)
+        return result
+
+    monkeypatch.setattr(batch_operations, "copy_insert", fake_copy_insert)
+    collector = HIFLDInfraCollector(db=MagicMock())
+    explicit = datetime(2024, 1, 1)
+    records = [
+        {"hifld_id": "1", "name": "A"},
+        {"hifld_id": "2", "name": "B", "source": "mirror", "collected_at": explicit},
+        {"hifld_id": "1", "name": "A again"},
+    ]
+
+    before = datetime.utcnow()
+    assert collector.bulk_upsert(
+        Substation, records, unique_columns=["hifld_id"], update_columns=["name"], use_copy=True
+    ) == (2, 0)
+
+    rows = calls[0]["rows"]
+    assert [r["name"] for r in rows] == ["A", "B"]
+    assert rows[0]["source"] == "hifld"
+    assert rows[0]["collected_at"] >= before
+    assert rows[1]["source"] == "mirror"
+    assert rows[1]["collected_at"] == explicit
+    assert {"source", "collected_at"} <= set(calls[0]["columns"])
+    assert "source" not in records[0]  # caller's dicts untouched
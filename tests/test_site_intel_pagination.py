@@ -0,0 +1,190 @@
+"""
+Tests for BaseCollector.iter_pages / fetch_all_pages
+(app/sources/site_intel/base_collector.py).
+
+Covers:
+- pages after the first are fetched concurrently (bounded) when the response
+  carries a total count or the API pages by offset, and yielded in order
+- every concurrent page goes through apply_rate_limit
+- offset walks stop at the first short page; page-number walks without a
+  total stay one page at a time and never fetch past the last page
+- offsets follow a server-capped first page (exceededTransferLimit)
+- stopping the iteration early cancels prefetched pages
+- HIFLD upserts substations page by page as they arrive
+
+All tests are fully offline (MagicMock session, fake fetch).
+"""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.sources.site_intel.base_collector import BaseCollector
+from app.sources.site_intel.power.hifld_collector import HIFLDInfraCollector
+from app.sources.site_intel.types import CollectionConfig, SiteIntelDomain, SiteIntelSource
+
+
+class _Collector(BaseCollector):
+    domain = SiteIntelDomain.POWER
+    source = SiteIntelSource.HIFLD
+    rate_limit_delay = 0
+
+    def get_default_base_url(self):
+        return "https://example.test"
+
+    async def collect(self, config):
+        raise NotImplementedError
+
+
+class _FakeApi:
+    """Serves n_items records, tracking calls and requests in flight."""
+
+    def __init__(self, n_items, cap=None, total_key=None, offset_key=None):
+        self.n_items = n_items
+        self.cap = cap
+        self.total_key = total_key
+        self.offset_key = offset_key
+        self.calls = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def __call__(self, endpoint, params=None):
+        self.calls.append(dict(params))
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+
+        size = params["per_page"]
+        if self.offset_key:
+            start = params[self.offset_key]
+        else:
+            start = (params["page"] - 1) * size
+        count = min(size, self.cap or size)
+        items = list(range(start, min(start + count, self.n_items)))
+        response = {"data": items}
+        if self.cap and count < size and start + count < self.n_items:
+            response["exceededTransferLimit"] = True
+        if self.total_key:
+            response[self.total_key] = self.n_items
+        return response
+
+
+def _pages(collector, api, **kwargs):
+    async def run():
+        return [page async for page in collector.iter_pages("/items", fetch=api, **kwargs)]
+
+    return asyncio.run(run())
+
+
+@pytest.fixture
+def collector():
+    return _Collector(db=MagicMock())
+
+
+def test_total_count_pages_fetched_concurrently_in_order(collector):
+    api = _FakeApi(950, total_key="total")
+    rate_limited = []
+
+    async def apply_rate_limit():
+        rate_limited.append(1)
+
+    collector.apply_rate_limit = apply_rate_limit
+    pages = _pages(collector, api, per_page=100, total_key="total", max_concurrent=3)
+
+    assert [p[0] for p in pages] == list(range(0, 950, 100))
+    assert sum(len(p) for p in pages) == 950
+    assert api.peak == 3
+    assert len(api.calls) == 10
+    assert len(rate_limited) == 9
+
+
+def test_offset_walk_stops_at_short_page(collector):
+    api = _FakeApi(450, offset_key="offset")
+    pages = _pages(collector, api, per_page=100, offset_key="offset", max_concurrent=4)
+
+    assert sum(len(p) for p in pages) == 450
+    assert api.peak > 1
+    offsets = [c["offset"] for c in api.calls]
+    assert offsets == [0, 100, 200, 300, 400]
+    assert all("page" not in c for c in api.calls)
+
+
+def test_page_numbers_without_total_stay_sequential(collector):
+    api = _FakeApi(250)
+    pages = _pages(collector, api, per_page=100, max_concurrent=4)
+
+    assert [len(p) for p in pages] == [100, 100, 50]
+    assert api.peak == 1
+    assert [c["page"] for c in api.calls] == [1, 2, 3]
+
+
+def test_offsets_follow_capped_first_page(collector):
+    api = _FakeApi(2500, cap=1000, offset_key="resultOffset")
+    pages = _pages(collector, api, per_page=2000, offset_key="resultOffset")
+
+    assert [len(p) for p in pages] == [1000, 1000, 500]
+    assert [c["resultOffset"] for c in api.calls][:3] == [0, 1000, 2000]
+
+
+def test_max_pages(collector):
+    api = _FakeApi(10_000, total_key="total")
+    pages = _pages(collector, api, per_page=100, total_key="total", max_pages=5)
+    assert len(pages) == 5
+    assert len(api.calls) == 5
+
+
+def test_early_stop_cancels_prefetch(collector):
+    api = _FakeApi(10_000, offset_key="offset")
+
+    async def run():
+        pages = collector.iter_pages("/items", fetch=api, per_page=100, offset_key="offset")
+        async for _ in pages:
+            break
+        await pages.aclose()
+        calls = len(api.calls)
+        await asyncio.sleep(0.05)
+        return calls
+
+    calls = asyncio.run(run())
+    assert len(api.calls) == calls <= 1 + collector.page_concurrency
+
+
+def test_fetch_all_pages_leaves_params_alone(collector, monkeypatch):
+    api = _FakeApi(120)
+    monkeypatch.setattr(collector, "fetch_json", api)
+    params = {"state": "TX"}
+
+    items = asyncio.run(collector.fetch_all_pages("/items", params=params, per_page=50))
+
+    assert items == list(range(120))
+    assert params == {"state": "TX"}
+    assert api.calls[0] == {"state": "TX", "page": 1, "per_page": 50}
+
+
+def test_hifld_upserts_each_page(monkeypatch):
+    collector = HIFLDInfraCollector(db=MagicMock())
+    collector.rate_limit_delay = 0
+    n_features = 2300
+
+    async def fake_fetch(self, url, params=None, **kwargs):
+        start = params["resultOffset"]
+        stop = min(start + params["resultRecordCount"], n_features)
+        return {"features": [
+            {"attributes": {"ID": str(i), "NAME": f"Sub {i}", "STATE": "TX"}}
+            for i in range(start, stop)
+        ]}
+
+    monkeypatch.setattr(BaseCollector, "fetch_json", fake_fetch)
+    upserts = []
+    monkeypatch.setattr(
+        collector, "bulk_upsert", lambda model, records, **kw: upserts.append(len(records)) or (len(records), 0)
+    )
+    monkeypatch.setattr(collector, "update_progress", lambda *a, **kw: None)
+
+    config = CollectionConfig(domain=SiteIntelDomain.POWER, source=SiteIntelSource.HIFLD)
+    result = asyncio.run(collector._collect_substations(config))
+
+    assert result == {"processed": n_features, "inserted": n_features}
+    assert upserts == [1000, 1000, 300]
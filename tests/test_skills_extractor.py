@@ -0,0 +1,150 @@
+"""
+Tests for the compiled skills extractor (app/sources/job_postings/skills_extractor.py).
+
+Covers:
+- keyword prefixes derived from taxonomy patterns
+- SkillMatcher matches exactly what running every pattern with re.search does
+- extract_skills output (title skills first, education, experience)
+- extract_skills_batch inline and across worker processes
+- backfill_requirements pages by id and writes each batch with one UPDATE
+
+All tests are fully offline (MagicMock session).
+"""
+
+import random
+import re
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.sources.job_postings import skills_extractor
+from app.sources.job_postings.skills_extractor import (
+    CERTIFICATIONS,
+    EDUCATION_PATTERNS,
+    SOFT_SKILLS,
+    TECH_SKILLS,
+    SkillMatcher,
+    _literal_prefix,
+    backfill_requirements,
+    extract_skills,
+    extract_skills_batch,
+)
+
+TAXONOMIES = {
+    "skills": TECH_SKILLS,
+    "soft_skills": SOFT_SKILLS,
+    "certifications": CERTIFICATIONS,
+    "education": EDUCATION_PATTERNS,
+}
+
+
+def _search_all(text, taxonomy):
+    found = []
+    for name, patterns in taxonomy:
+        if any(re.search(p, text, re.IGNORECASE) for p in patterns):
+            found.append(name)
+    return found
+
+
+@pytest.mark.parametrize("pattern, expected", [
+    (r"\bpython\b", ("python", True)),
+    (r"\bJS\b", ("js", True)),
+    (r"\bc\+\+\b", ("c++", True)),
+    (r"\bph\.?d\b", ("ph", True)),
+    (r"\bmaster'?s?\s+degree\b", ("master", True)),
+    (r"\breact(?:\.js|js)?\b", ("react", True)),
+    (r"\baz-\d{3}\b", ("az-", True)),
+    (r"(\d+)\+?\s*years", ("", False)),
+    (r"\bfoo|bar", ("", False)),
+    (r"(?:foo|bar)baz", ("", False)),
+    (r"security\+", ("security+", False)),
+])
+def test_literal_prefix(pattern, expected):
+    assert _literal_prefix(pattern) == expected
+
+
+class TestSkillMatcher:
+    def test_same_as_searching_every_pattern(self):
+        vocab = ["python", "java", "javascript", "JS", "c++", "c#", "go", "backend", "R",
+                 "statistics", "ios", "cisco", "github", "git", "m.s.", "degree", "ph.d",
+                 "mba", "b.s.", "aws", "certified", "az-104", "security+", "soc 2", "sap",
+                 "erp", "react", "native", "node.js", "ci/cd", "leadership", "teamwork",
+                 "self-starter", "Kubernetes", "k8s", "ml", "model", "the", "and", "with"]
+        rng = random.Random(3)
+        matcher = SkillMatcher(TAXONOMIES)
+        for _ in range(500):
+            text = " ".join(rng.choice(vocab) for _ in range(rng.randint(1, 60)))
+            expected = {c: _search_all(text, t) for c, t in TAXONOMIES.items()}
+            assert matcher.match(text) == expected, text
+
+    def test_categories_and_invalid_patterns(self):
+        matcher = SkillMatcher({"a": [("Bad", [r"\b(unclosed"]), ("Py", [r"\bpython\b"])]})
+        assert matcher.match("PYTHON dev") == {"a": ["Py"]}
+        assert SkillMatcher(TAXONOMIES).match("python", ("skills",)) == {"skills": ["Python"]}
+
+
+class TestExtractSkills:
+    def test_full_extraction(self):
+        desc = (
+            "<p>We use <b>AWS</b> &amp; Kubernetes.</p><ul><li>5+ years of experience "
+            "with Python</li><li>Bachelor's degree required, PMP a plus</li>"
+            "<li>Strong leadership</li></ul>"
+        )
+        assert extract_skills(desc, "Senior Python Engineer") == {
+            "skills": ["Python", "AWS", "Kubernetes"],
+            "soft_skills": ["Leadership"],
+            "certifications": ["PMP"],
+            "education": "bachelors",
+            "years_experience": 5,
+            "years_experience_raw": "5+ years of experience",
+            "skill_count": 5,
+        }
+
+    def test_empty(self):
+        assert extract_skills("") == {}
+        assert extract_skills("no keywords here") == {"skill_count": 0}
+
+    def test_batch_inline_and_processes(self, monkeypatch):
+        postings = [
+            {"description_text": "Python and SQL", "title": "Data Engineer"},
+            {"description_text": "", "title": "Empty"},
+            {"description_text": "nothing relevant"},
+        ] * 3
+        inline = extract_skills_batch([dict(p) for p in postings])
+        assert inline[0]["requirements"]["skills"] == ["Python", "SQL"]
+        assert "requirements" not in inline[1] and "requirements" not in inline[2]
+
+        monkeypatch.setattr(skills_extractor, "PROCESS_CHUNK_SIZE", 2)
+        pooled = extract_skills_batch([dict(p) for p in postings], processes=2)
+        assert pooled == inline
+
+
+class TestBackfill:
+    def test_pages_by_id_and_updates_once_per_batch(self):
+        db = MagicMock()
+        db.execute.return_value.fetchall.side_effect = [
+            [(1, "Engineer", "Python"), (4, None, "nothing")],
+            [(9, "Analyst", "SQL and Tableau")],
+            [],
+        ]
+        progress = []
+
+        assert backfill_requirements(
+            db, company_id=5, batch_size=2, progress_callback=lambda *a: progress.append(a)
+        ) == (3, 2)
+        assert progress == [(2, 1), (3, 2)]
+
+        calls = db.execute.call_args_list
+        selects = [c for c in calls if "SELECT" in str(c.args[0])]
+        updates = [c for c in calls if "UPDATE" in str(c.args[0])]
+        assert [c.args[1]["last_id"] for c in selects] == [0, 4, 9]
+        assert selects[0].args[1]["cid"] == 5
+        assert [c.args[1]["ids"] for c in updates] == [[1], [9]]
+        assert db.commit.call_count == 2
+
+    def test_limit(self):
+        db = MagicMock()
+        db.execute.return_value.fetchall.side_effect = [[(1, "", "Python"), (2, "", "Java")]]
+        assert backfill_requirements(db, limit=2, batch_size=5) == (2, 2)
+        select = db.execute.call_args_list[0]
+        assert select.args[1]["lim"] == 2
@@ -147,7 +147,7 @@ class TestPerJobTimeout:
 
         EXECUTORS[QueueJobType.INGESTION] = slow_executor
 
-        async def mock_heartbeat(factory, job_id):
+        async def mock_heartbeat(job_id, cancel_event):
             await asyncio.sleep(3600)
 
         with patch("app.core.source_config_service.get_timeout_seconds", return_value=0.1):
@@ -156,7 +156,7 @@ class TestPerJobTimeout:
                 mock_session = MagicMock()
                 mock_session_factory.return_value = mock_session
                 mock_factory.return_value = mock_session_factory
-                with patch("app.worker.main._heartbeat_loop", side_effect=mock_heartbeat):
+                with patch("app.worker.main._wait_for_cancel", side_effect=mock_heartbeat):
                     with patch("app.worker.main.send_job_event"):
                         await execute_job(job, db)
 
@@ -0,0 +1,188 @@
+"""
+Tests for UnifiedSiteScorer.score_locations (batched compare_locations).
+
+Covers:
+- _PointLayer.select returns exactly the rows a BETWEEN bbox filter would
+- score_locations gives the same result as score_location for every point
+  (overlapping radii, multiple states, empty areas, NULL columns)
+- points far apart are scored per grid tile, so each layer fetch covers a
+  bounded box instead of the union of all points
+- compare_locations ranks the batch results
+
+All tests are fully offline (in-memory SQLite).
+"""
+
+import random
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from app.services import unified_site_scorer
+from app.services.unified_site_scorer import (
+    SCORE_TILE_DEGREES,
+    UnifiedSiteScorer,
+    _bbox_params,
+    _PointLayer,
+    _tile_points,
+)
+
+_SCHEMA = [
+    "CREATE TABLE power_plant (id INTEGER PRIMARY KEY, latitude REAL, longitude REAL,"
+    " nameplate_capacity_mw REAL, state TEXT)",
+    "CREATE TABLE substation (id INTEGER PRIMARY KEY, latitude REAL, longitude REAL)",
+    "CREATE TABLE broadband_availability (id INTEGER PRIMARY KEY, latitude REAL, longitude REAL,"
+    " provider_name TEXT, max_download_mbps REAL, technology TEXT)",
+    "CREATE TABLE internet_exchange (id INTEGER PRIMARY KEY, latitude REAL, longitude REAL,"
+    " network_count INTEGER)",
+    "CREATE TABLE data_center_facility (id INTEGER PRIMARY KEY, latitude REAL, longitude REAL,"
+    " power_mw REAL)",
+    "CREATE TABLE foreign_trade_zone (id INTEGER PRIMARY KEY, latitude REAL, longitude REAL)",
+    "CREATE TABLE electricity_price (id INTEGER PRIMARY KEY, geography_type TEXT,"
+    " geography_id TEXT, state TEXT, sector TEXT, avg_price_cents_kwh REAL,"
+    " period_year INTEGER, period_month INTEGER)",
+    "CREATE TABLE labor_market_area (id INTEGER PRIMARY KEY, state TEXT, area_type TEXT,"
+    " unemployment_rate REAL, employment INTEGER, labor_force INTEGER)",
+    "CREATE TABLE opportunity_zone (id INTEGER PRIMARY KEY, state TEXT)",
+    "CREATE TABLE incentive_program (id INTEGER PRIMARY KEY, state TEXT)",
+    "CREATE TABLE flood_zone (id INTEGER PRIMARY KEY, state TEXT, is_high_risk BOOLEAN)",
+]
+
+_POINTS = [
+    {"lat": 39.0, "lng": -77.5},
+    {"lat": 39.3, "lng": -77.2},   # overlaps the first
+    {"lat": 33.4, "lng": -112.0},
+    {"lat": 45.0, "lng": -100.0},  # nothing nearby
+    {"lat": 39.0, "lng": -77.5},   # duplicate
+]
+
+
+def _scatter(rng, n, centers, spread=2.0):
+    for _ in range(n):
+        lat, lng = rng.choice(centers)
+        yield lat + rng.uniform(-spread, spread), lng + rng.uniform(-spread, spread)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite:///:memory:")
+    rng = random.Random(7)
+    centers = [(39.0, -77.5), (33.4, -112.0)]
+    with engine.begin() as conn:
+        for ddl in _SCHEMA:
+            conn.execute(text(ddl))
+        for lat, lng in _scatter(rng, 200, centers):
+            conn.execute(text(
+                "INSERT INTO power_plant (latitude, longitude, nameplate_capacity_mw, state)"
+                " VALUES (:lat, :lng, :mw, :state)"
+            ), {"lat": lat, "lng": lng, "mw": rng.choice([None, 50.0, 400.0, 1200.0]),
+                "state": "VA" if lng > -90 else "AZ"})
+        for lat, lng in _scatter(rng, 150, centers):
+            conn.execute(text("INSERT INTO substation (latitude, longitude) VALUES (:lat, :lng)"),
+                         {"lat": lat, "lng": lng})
+            conn.execute(text("INSERT INTO foreign_trade_zone (latitude, longitude) VALUES (:lat, :lng)"),
+                         {"lat": lat + 0.5, "lng": lng})
+        for lat, lng in _scatter(rng, 300, centers):
+            conn.execute(text(
+                "INSERT INTO broadband_availability (latitude, longitude, provider_name,"
+                " max_download_mbps, technology) VALUES (:lat, :lng, :p, :mbps, :tech)"
+            ), {"lat": lat, "lng": lng, "p": rng.choice(["A", "B", "C", None]),
+                "mbps": rng.choice([None, 100.0, 940.0, 2000.0]),
+                "tech": rng.choice(["Fiber", "Cable", None])})
+        for lat, lng in _scatter(rng, 20, centers):
+            conn.execute(text(
+                "INSERT INTO internet_exchange (latitude, longitude, network_count)"
+                " VALUES (:lat, :lng, :n)"
+            ), {"lat": lat, "lng": lng, "n": rng.choice([None, 12, 80])})
+            conn.execute(text(
+                "INSERT INTO data_center_facility (latitude, longitude, power_mw)"
+                " VALUES (:lat, :lng, :mw)"
+            ), {"lat": lat, "lng": lng, "mw": rng.choice([None, 10.0, 36.5])})
+        for state, price, unemp in [("VA", 7.2, 2.9), ("AZ", 8.1, 4.1)]:
+            conn.execute(text(
+                "INSERT INTO electricity_price (geography_type, geography_id, state, sector,"
+                " avg_price_cents_kwh, period_year, period_month)"
+                " VALUES ('state', :s, :s, 'industrial', :p, 2025, 6)"
+            ), {"s": state, "p": price})
+            conn.execute(text(
+                "INSERT INTO labor_market_area (state, area_type, unemployment_rate,"
+                " employment, labor_force) VALUES (:s, 'state', :u, 4000000, 4200000)"
+            ), {"s": state, "u": unemp})
+            conn.execute(text("INSERT INTO incentive_program (state) VALUES (:s)"), {"s": state})
+        conn.execute(text("INSERT INTO opportunity_zone (state) VALUES ('VA')"))
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+class TestPointLayer:
+    """Latitude-sorted bbox selection."""
+
+    def test_select_matches_between_filter(self):
+        rng = random.Random(3)
+        rows = [(rng.uniform(30, 40), rng.uniform(-80, -70), i) for i in range(500)]
+        rows += [(None, -75.0, 500), (35.0, None, 501)]
+        layer = _PointLayer(rows)
+        for _ in range(50):
+            bbox = _bbox_params(rng.uniform(30, 40), rng.uniform(-80, -70), rng.choice([5, 50, 200]))
+            expected = [
+                r for r in rows
+                if r[0] is not None and r[1] is not None
+                and bbox["lat_min"] <= r[0] <= bbox["lat_max"]
+                and bbox["lng_min"] <= r[1] <= bbox["lng_max"]
+            ]
+            assert layer.select(bbox) == expected
+
+    def test_empty(self):
+        assert _PointLayer([]).select(_bbox_params(0, 0, 50)) == []
+
+
+class TestScoreLocations:
+    """Batch results are identical to per-point scoring."""
+
+    @pytest.mark.parametrize("radius", [25, 50, 150])
+    @pytest.mark.parametrize("use_case", ["general", "datacenter"])
+    def test_matches_score_location(self, db, radius, use_case):
+        scorer = UnifiedSiteScorer(db)
+        batch = scorer.score_locations(_POINTS, radius_miles=radius, use_case=use_case)
+        single = [
+            scorer.score_location(p["lat"], p["lng"], radius_miles=radius, use_case=use_case)
+            for p in _POINTS
+        ]
+        assert batch == single
+        assert batch[0].raw_metrics["state_detected"] == "VA"
+        assert batch[2].raw_metrics["state_detected"] == "AZ"
+        assert batch[3].raw_metrics["state_detected"] is None
+        assert batch[0].raw_metrics["power_plant_count"] > 0
+        assert batch[0].raw_metrics["connectivity_broadband_providers"] > 0
+
+    def test_layers_fetched_per_tile(self, db, monkeypatch):
+        assert _tile_points([(p["lat"], p["lng"]) for p in _POINTS], SCORE_TILE_DEGREES) == [
+            [0, 1, 4], [2], [3],
+        ]
+        boxes = []
+        real_fetch = _PointLayer.fetch.__func__
+
+        def _fetch(cls, db, table, columns, bbox, order_by=""):
+            boxes.append(bbox)
+            return real_fetch(cls, db, table, columns, bbox, order_by)
+
+        monkeypatch.setattr(unified_site_scorer._PointLayer, "fetch", classmethod(_fetch))
+        UnifiedSiteScorer(db).score_locations(_POINTS, radius_miles=50)
+
+        assert len(boxes) == 3 * 7
+        max_span = SCORE_TILE_DEGREES + 2 * 200 / 69.0
+        assert all(b["lat_max"] - b["lat_min"] <= max_span for b in boxes)
+
+    def test_workforce_details_not_shared(self, db):
+        batch = UnifiedSiteScorer(db).score_locations(_POINTS[:2])
+        assert batch[0].factors[2].details is not batch[1].factors[2].details
+
+    def test_compare_locations_sorted(self, db):
+        results = UnifiedSiteScorer(db).compare_locations(_POINTS)
+        scores = [r.score for r in results]
+        assert scores == sorted(scores, reverse=True)
+        assert len(results) == len(_POINTS)
+
+    def test_empty(self, db):
+        assert UnifiedSiteScorer(db).score_locations([]) == []
@@ -0,0 +1,162 @@
+"""
+Tests for LISTEN/NOTIFY-driven worker dispatch.
+
+Covers:
+- submit_job sends a NOTIFY for claimable (pending) jobs only
+- claim_jobs claims up to N jobs in one round trip, highest priority first
+- _wait_for_wakeup returns promptly on NOTIFY instead of sleeping
+- poll_loop claims all free slots at once and blocks on wakeups when idle
+"""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.core.models_queue import QueueJobStatus
+
+
+class TestSubmitJobNotify:
+    """submit_job wakes workers via pg_notify in worker mode."""
+
+    def _submit(self, status=None):
+        from app.core import job_queue_service
+
+        db = MagicMock()
+
+        def _refresh(job):
+            job.id = 99
+
+        db.refresh.side_effect = _refresh
+        with patch.object(job_queue_service, "WORKER_MODE", True):
+            result = job_queue_service.submit_job(
+                db, job_type="site_intel", payload={}, status=status
+            )
+        return db, result
+
+    def test_pending_job_sends_notify(self):
+        db, result = self._submit()
+        assert result == {"mode": "queued", "job_queue_id": 99}
+        notify_calls = [c for c in db.execute.call_args_list if "pg_notify" in str(c.args[0])]
+        assert len(notify_calls) == 1
+        assert notify_calls[0].args[1]["channel"] == "job_queue"
+        assert notify_calls[0].args[1]["payload"] == "site_intel:99"
+
+    def test_blocked_job_does_not_notify(self):
+        db, _ = self._submit(status=QueueJobStatus.BLOCKED)
+        assert not any("pg_notify" in str(c.args[0]) for c in db.execute.call_args_list)
+
+    def test_notify_failure_is_swallowed(self):
+        from app.core.job_queue_service import notify_job_available
+
+        db = MagicMock()
+        db.execute.side_effect = RuntimeError("not postgres")
+        notify_job_available(db, "pe", 1)
+        db.rollback.assert_called_once()
+
+
+class TestClaimJobs:
+    """Batch claim via UPDATE ... RETURNING with SKIP LOCKED."""
+
+    def test_claims_up_to_limit_in_one_statement(self):
+        from app.worker.main import claim_jobs
+
+        db = MagicMock()
+        db.execute.return_value.fetchall.return_value = [
+            (3, 0, datetime(2024, 1, 1, 0, 0, 2)),
+            (1, 5, datetime(2024, 1, 1, 0, 0, 9)),
+            (2, 0, datetime(2024, 1, 1, 0, 0, 1)),
+        ]
+
+        ids = claim_jobs(db, 3, worker_id="w1")
+
+        assert ids == [1, 2, 3]
+        assert db.execute.call_count == 1
+        sql = str(db.execute.call_args.args[0])
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert "LIMIT :limit" in sql
+        assert db.execute.call_args.args[1]["limit"] == 3
+        assert db.execute.call_args.args[1]["worker_id"] == "w1"
+        db.commit.assert_called_once()
+
+    def test_zero_limit_skips_round_trip(self):
+        from app.worker.main import claim_jobs
+
+        db = MagicMock()
+        assert claim_jobs(db, 0) == []
+        db.execute.assert_not_called()
+
+    def test_claim_job_wraps_batch_claim(self):
+        from app.worker.main import claim_job
+
+        db = MagicMock()
+        db.execute.return_value.fetchall.return_value = []
+        assert claim_job(db) is None
+
+
+class TestWaitForWakeup:
+    """Idle workers block on NOTIFY rather than sleeping a fixed interval."""
+
+    @pytest.mark.asyncio
+    async def test_returns_on_notify(self):
+        from app.worker.main import _wait_for_wakeup
+
+        wakeup = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.05, wakeup.set)
+
+        started = loop.time()
+        await _wait_for_wakeup(wakeup, timeout=5.0)
+        assert loop.time() - started < 1.0
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_timeout(self):
+        from app.worker.main import _wait_for_wakeup
+
+        started = asyncio.get_running_loop().time()
+        await _wait_for_wakeup(asyncio.Event(), timeout=0.05)
+        assert asyncio.get_running_loop().time() - started < 1.0
+
+
+class TestPollLoopDispatch:
+    """poll_loop claims all free slots in one call and waits for NOTIFY when idle."""
+
+    @pytest.mark.asyncio
+    async def test_claims_free_slots_then_waits(self):
+        import app.worker.main as wm
+
+        shutdown = asyncio.Event()
+        claim_limits = []
+        responses = [[10, 11], []]
+
+        def _claim(db, limit):
+            claim_limits.append(limit)
+            return responses.pop(0) if responses else []
+
+        executed = []
+
+        async def _execute(job, db):
+            executed.append(job.id)
+
+        async def _wait(wakeup, timeout):
+            shutdown.set()
+
+        session = MagicMock()
+        session.get.side_effect = lambda model, job_id: MagicMock(id=job_id, priority=0)
+        listener = MagicMock(connected=True)
+
+        with patch.object(wm, "_shutdown", shutdown), \
+                patch.object(wm, "MAX_CONCURRENT", 4), \
+                patch.object(wm, "_load_executors"), \
+                patch.object(wm, "get_session_factory", return_value=lambda: session), \
+                patch.object(wm, "claim_jobs", side_effect=_claim), \
+                patch.object(wm, "execute_job", side_effect=_execute), \
+                patch.object(wm, "_wait_for_wakeup", side_effect=_wait), \
+                patch("app.core.pg_listener.ChannelWakeupListener", return_value=listener):
+            await wm.poll_loop()
+
+        assert claim_limits[0] == 4
+        assert sorted(executed) == [10, 11]
+        listener.start.assert_called_once()
+        listener.stop.assert_called_once()
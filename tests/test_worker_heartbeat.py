@@ -0,0 +1,179 @@
+"""
+Tests for the consolidated worker heartbeat (HeartbeatManager).
+
+Covers:
+- one UPDATE ... RETURNING per heartbeat for all running jobs
+- cancel-only checks use a single SELECT between heartbeats
+- beat() only reports cancelled jobs; mark_cancelled() sets their events on
+  the loop and execute_job stops the executor
+- cancel check interval is independent of (and capped by) the heartbeat interval
+"""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.core.models_queue import QueueJobStatus, QueueJobType
+
+
+def _db_returning(rows):
+    db = MagicMock()
+    db.execute.return_value.fetchall.return_value = rows
+    return db
+
+
+class TestHeartbeatManagerBeat:
+    """HeartbeatManager.beat issues one statement for every tracked job."""
+
+    def test_heartbeat_updates_all_jobs_in_one_statement(self):
+        from app.worker.main import HeartbeatManager
+
+        hb = HeartbeatManager(heartbeat_interval=30, cancel_check_interval=10)
+        for job_id in (1, 2, 3):
+            hb.register(job_id)
+        db = _db_returning([(1, "running", None), (2, "running", None), (3, "running", None)])
+
+        cancelled = hb.beat(db, write_heartbeat=True)
+
+        assert cancelled == []
+        assert db.execute.call_count == 1
+        sql = str(db.execute.call_args.args[0])
+        assert "UPDATE job_queue SET heartbeat_at = NOW()" in sql
+        assert "RETURNING id, status, error_message" in sql
+        assert db.execute.call_args.args[1] == {"ids": [1, 2, 3]}
+        db.commit.assert_called_once()
+
+    def test_cancel_check_only_reads_status(self):
+        from app.worker.main import HeartbeatManager
+
+        hb = HeartbeatManager()
+        hb.register(5)
+        db = _db_returning([(5, "running", None)])
+
+        hb.beat(db, write_heartbeat=False)
+
+        sql = str(db.execute.call_args.args[0])
+        assert sql.strip().startswith("SELECT")
+        assert "UPDATE" not in sql
+
+    def test_cancelled_job_event_is_set(self):
+        from app.worker.main import HeartbeatManager
+
+        hb = HeartbeatManager()
+        running = hb.register(1)
+        cancelled_event = hb.register(2)
+        db = _db_returning([
+            (1, "running", None),
+            (2, QueueJobStatus.FAILED.value, "Cancelled by user"),
+        ])
+
+        cancelled = hb.beat(db, write_heartbeat=True)
+
+        assert cancelled == [2]
+        assert not cancelled_event.is_set()  # beat() runs off-loop; no Event access
+        assert hb.mark_cancelled(cancelled) == [2]
+        assert cancelled_event.is_set()
+        assert not running.is_set()
+        assert hb.mark_cancelled(cancelled) == []
+
+    def test_failed_without_cancel_message_is_not_cancelled(self):
+        from app.worker.main import HeartbeatManager
+
+        hb = HeartbeatManager()
+        event = hb.register(1)
+        assert hb.beat(_db_returning([(1, "failed", "boom")]), write_heartbeat=True) == []
+        assert not event.is_set()
+
+    def test_no_jobs_no_round_trip(self):
+        from app.worker.main import HeartbeatManager
+
+        hb = HeartbeatManager()
+        db = MagicMock()
+        assert hb.beat(db, write_heartbeat=True) == []
+        db.execute.assert_not_called()
+
+    def test_unregister_stops_tracking(self):
+        from app.worker.main import HeartbeatManager
+
+        hb = HeartbeatManager()
+        hb.register(1)
+        hb.unregister(1)
+        assert hb.job_ids == []
+
+    def test_cancel_interval_capped_by_heartbeat_interval(self):
+        from app.worker.main import HeartbeatManager
+
+        hb = HeartbeatManager(heartbeat_interval=5, cancel_check_interval=60)
+        assert hb.cancel_check_interval == 5
+
+
+class TestHeartbeatManagerRun:
+    """The run loop alternates cancel checks and heartbeat writes."""
+
+    @pytest.mark.asyncio
+    async def test_run_writes_heartbeat_every_n_cancel_checks(self):
+        from app.worker.main import HeartbeatManager
+
+        hb = HeartbeatManager(heartbeat_interval=0.03, cancel_check_interval=0.01)
+        hb.register(1)
+        writes = []
+
+        def _beat(db, write_heartbeat, job_ids):
+            assert job_ids == [1]
+            writes.append(write_heartbeat)
+            return []
+
+        db = MagicMock()
+        with patch.object(hb, "beat", side_effect=_beat):
+            task = asyncio.create_task(hb.run(lambda: db))
+            while len(writes) < 6:
+                await asyncio.sleep(0.005)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        assert writes[:6] == [False, False, True, False, False, True]
+        db.close.assert_called_once()
+
+
+class TestExecuteJobCancellation:
+    """execute_job stops the executor when the shared heartbeat flags cancellation."""
+
+    @pytest.mark.asyncio
+    async def test_cancel_event_stops_executor(self):
+        import app.worker.main as wm
+
+        db = MagicMock()
+        job = MagicMock()
+        job.id = 321
+        job.job_type = QueueJobType.INGESTION.value
+        job.payload = {}
+        job.status = None
+        db.get.return_value = job
+
+        started = asyncio.Event()
+        executor_cancelled = []
+
+        async def _slow_executor(j, d):
+            started.set()
+            try:
+                await asyncio.sleep(3600)
+            except asyncio.CancelledError:
+                executor_cancelled.append(True)
+                raise
+
+        hb = wm.HeartbeatManager()
+        with patch.dict(wm.EXECUTORS, {QueueJobType.INGESTION: _slow_executor}), \
+                patch.object(wm, "_heartbeats", hb), \
+                patch.object(wm, "send_job_event"):
+            run = asyncio.create_task(wm.execute_job(job, db))
+            await started.wait()
+            hb.mark_cancelled(
+                hb.beat(_db_returning([(321, "failed", "Cancelled by user")]), write_heartbeat=True)
+            )
+            await run
+
+        assert executor_cancelled == [True]
+        assert job.status == QueueJobStatus.FAILED
+        assert job.error_message == "Cancelled by user"
+        assert hb.job_ids == []